@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 异步抓取引擎
+功能: 在单个事件循环中并发抓取列表页、详情页和发布时间页面，按主机限制并发连接数，统一超时
+"""
+
+import asyncio
+import logging
+from functools import partial
+from urllib.parse import urlsplit
+
+# aiohttp 支持（可选）
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logging.warning("aiohttp 未安装，异步抓取将回退到线程中执行 requests")
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+class FetchResponse:
+    """与 requests.Response 用法一致的轻量响应对象（status_code / content / text / encoding / url）"""
+
+    def __init__(self, url, status_code, content=b'', encoding=None, headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding
+        self.headers = headers or {}
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class AsyncFetcher:
+    """共享连接池的异步抓取器：按主机限制并发、统一超时，可在一个事件循环中驱动所有来源"""
+
+    def __init__(self, headers=None, per_host_limit=4, total_limit=16, timeout=15, cache_responses=False):
+        self.headers = dict(headers or {'User-Agent': DEFAULT_USER_AGENT})
+        self.per_host_limit = per_host_limit
+        self.total_limit = total_limit
+        self.timeout = timeout
+        self.cache_responses = cache_responses  # 同一URL只请求一次（并发请求共享同一个任务）
+        self._host_semaphores = {}
+        self._responses = {}
+        self._session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        if self._session is not None:
+            return
+        if AIOHTTP_AVAILABLE:
+            connector = aiohttp.TCPConnector(limit=self.total_limit, limit_per_host=self.per_host_limit)
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        else:
+            import requests
+            adapter = requests.adapters.HTTPAdapter(pool_connections=self.total_limit,
+                                                    pool_maxsize=self.per_host_limit)
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+
+    async def close(self):
+        if self._session is None:
+            return
+        if AIOHTTP_AVAILABLE:
+            await self._session.close()
+        else:
+            self._session.close()
+        self._session = None
+
+    def _semaphore(self, url):
+        host = urlsplit(url).netloc.lower()
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def get(self, url, timeout=None, params=None, headers=None):
+        """抓取单个URL，返回 FetchResponse；网络错误或超时直接抛出"""
+        if not self.cache_responses or params is not None or headers is not None:
+            return await self._fetch(url, timeout, params, headers)
+
+        task = self._responses.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url, timeout, None, None))
+            task.add_done_callback(lambda t: self._forget_failed(url, t))
+            self._responses[url] = task
+        # shield: 某个调用方超时被取消时不影响其他等待同一URL的调用方
+        return await asyncio.shield(task)
+
+    def _forget_failed(self, url, task):
+        # 失败的请求不缓存，下次调用重新请求
+        if task.cancelled() or task.exception() is not None:
+            self._responses.pop(url, None)
+
+    async def _fetch(self, url, timeout, params, headers):
+        await self.open()
+        timeout = timeout or self.timeout
+        async with self._semaphore(url):
+            if AIOHTTP_AVAILABLE:
+                async with self._session.get(url, params=params, headers=headers,
+                                             timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                    content = await resp.read()
+                    return FetchResponse(str(resp.url), resp.status, content, resp.charset, dict(resp.headers))
+
+            loop = asyncio.get_running_loop()
+            resp = await loop.run_in_executor(
+                None, partial(self._session.get, url, params=params, headers=headers, timeout=timeout))
+            encoding = resp.encoding if resp.encoding != 'ISO-8859-1' else None
+            return FetchResponse(resp.url, resp.status_code, resp.content, encoding, dict(resp.headers))
+
+    async def get_until(self, url, requirements, timeout=None, chunk_size=None):
+        """流式抓取，requirements 中的标记全部出现即关闭连接（见 stream_reader），返回内容为已读取前缀的 FetchResponse"""
+        from stream_reader import make_scanner, read_until, CHUNK_SIZE, MAX_PAGE_BYTES
+
+        await self.open()
+        timeout = timeout or self.timeout
+        async with self._semaphore(url):
+            if not AIOHTTP_AVAILABLE:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    None, partial(read_until, self._session, url, requirements, timeout=timeout,
+                                  chunk_size=chunk_size or CHUNK_SIZE))
+
+            async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                scanner = make_scanner(requirements)
+                truncated = stopped = False
+                if resp.status == 200:
+                    async for chunk in resp.content.iter_chunked(chunk_size or CHUNK_SIZE):
+                        if len(scanner.buffer) >= MAX_PAGE_BYTES:
+                            # 已达上限且还有后续数据：页面被截断（与 stream_reader.read_until 一致）
+                            truncated = stopped = True
+                            break
+                        if scanner.feed(chunk):
+                            stopped = True
+                            break
+                if stopped:
+                    resp.close()  # 剩余内容不再下载
+                result = FetchResponse(str(resp.url), resp.status, bytes(scanner.buffer), resp.charset,
+                                       dict(resp.headers))
+                result.truncated = truncated
+                return result
+
+    async def get_or_none(self, url, timeout=None, **kwargs):
+        """抓取单个URL，失败时记录日志并返回 None"""
+        try:
+            return await self.get(url, timeout=timeout, **kwargs)
+        except Exception as e:
+            logging.warning(f"异步抓取失败 {url}: {e}")
+            return None
+
+    async def get_many(self, urls, timeout=None):
+        """并发抓取多个URL，按输入顺序返回响应列表（失败项为 None）"""
+        return await asyncio.gather(*(self.get_or_none(url, timeout=timeout) for url in urls))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+订阅源解析基准测试 - feedparser vs feed_reader.iter_entries
+
+用法:
+    python3 bench_feed_reader.py [已保存的订阅源文件或目录 ...] [--rounds 200]
+
+不提供文件时使用合成的 YouTube 频道 Atom 源（15 条，每条带较长的 media:description）。
+比较：feedparser 完整解析取前10条 / 流式读取前10条 / 流式读取到时间窗口为止，并确认前10条结果一致。
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime, timezone, timedelta
+
+import feedparser
+
+from feed_reader import iter_entries, parse_feed_date
+
+
+def synthetic_youtube_feed(entries=15):
+    now = datetime.now(timezone.utc)
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+             'xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">',
+             '<title>TVB娛樂新聞台</title><link rel="alternate" href="https://www.youtube.com/channel/UCxxxx"/>']
+    for i in range(entries):
+        published = (now - timedelta(hours=3 * i)).strftime('%Y-%m-%dT%H:%M:%S+00:00')
+        parts.append(f'''<entry><id>yt:video:vid{i:08d}</id><yt:videoId>vid{i:08d}</yt:videoId>
+<title>王敏奕 娛樂新聞 第{i}集</title><link rel="alternate" href="https://www.youtube.com/watch?v=vid{i:08d}"/>
+<author><name>TVB</name></author><published>{published}</published><updated>{published}</updated>
+<media:group><media:title>王敏奕 娛樂新聞 第{i}集</media:title>
+<media:description>{'節目內容簡介。' * 200}</media:description>
+<media:thumbnail url="https://i.ytimg.com/vi/vid{i:08d}/hqdefault.jpg" width="480" height="360"/>
+<media:community><media:starRating count="10" average="5.00" min="1" max="5"/><media:statistics views="1000"/></media:community>
+</media:group></entry>''')
+    parts.append('</feed>')
+    return '\n'.join(parts).encode('utf-8')
+
+
+def load_feeds(paths):
+    feeds = []
+    for path in paths:
+        files = [os.path.join(path, name) for name in sorted(os.listdir(path))] if os.path.isdir(path) else [path]
+        for name in files:
+            with open(name, 'rb') as f:
+                feeds.append((name, f.read()))
+    return feeds
+
+
+def with_feedparser(content):
+    result = []
+    for entry in feedparser.parse(content).entries[:10]:
+        published = parse_feed_date(entry.get('published', entry.get('updated', '')))
+        if published is not None:
+            result.append((entry.title, entry.link, published))
+    return result
+
+
+def timed(func, feeds, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _, content in feeds:
+            func(content)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='订阅源解析基准测试')
+    parser.add_argument('feeds', nargs='*', help='已保存的订阅源文件或目录')
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--window-hours', type=float, default=6, help='时间窗口（小时）')
+    args = parser.parse_args()
+
+    feeds = load_feeds(args.feeds) if args.feeds else [('<合成YouTube源>', synthetic_youtube_feed())]
+    since = datetime.now(timezone.utc) - timedelta(hours=args.window_hours)
+    print(f"📄 订阅源: {len(feeds)} 个，共 {sum(len(c) for _, c in feeds) // 1024} KB，轮数: {args.rounds}")
+
+    for name, content in feeds:
+        expected = with_feedparser(content)
+        actual = [tuple(entry) for entry in iter_entries(content, limit=10)]
+        if expected != actual:
+            print(f"❌ 结果不一致: {name}\n   feedparser: {expected[:2]}\n   iter_entries: {actual[:2]}")
+            sys.exit(1)
+    print("✅ 前10条结果与 feedparser 一致")
+
+    print(f"   feedparser 完整解析:        {timed(with_feedparser, feeds, args.rounds):.3f}s")
+    print(f"   iter_entries 前10条:        {timed(lambda c: list(iter_entries(c, limit=10)), feeds, args.rounds):.3f}s")
+    print(f"   iter_entries 截止时间窗口:  "
+          f"{timed(lambda c: list(iter_entries(c, limit=10, since=since)), feeds, args.rounds):.3f}s")
+
+
+if __name__ == '__main__':
+    main()
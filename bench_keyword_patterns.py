@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+关键词正则基准测试 - 比较旧的“每次调用拼接正则”与 keyword_regexes 缓存版本
+
+用法:
+    python3 bench_keyword_patterns.py [已保存的页面文件或目录 ...] [--keyword 王敏奕] [--rounds 200]
+
+不提供页面时使用合成页面。两种方式的匹配结果必须一致，否则报错退出。
+"""
+import os
+import re
+import sys
+import time
+import argparse
+
+from keyword_match import keyword_regexes
+
+
+def legacy_patterns(keyword):
+    """旧实现：每次调用时把未转义的关键词拼接进正则（原明周/文匯報/香港01的解析正则）"""
+    return [
+        r'\{[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*"url":\s*"([^"]*?)"[^}]*\}',
+        r'\{[^}]*"url":\s*"([^"]*?)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*\}',
+        r'<a[^>]*href="([^"]*?)"[^>]*>([^<]*' + keyword + r'[^<]*?)</a>',
+        r'href="([^"]*?)"[^>]*title="([^"]*' + keyword + r'[^"]*?)"',
+        r'"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*"canonicalUrl":\s*"([^"]*?)"',
+        r'"canonicalUrl":\s*"([^"]*?)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"',
+    ]
+
+
+# 与 legacy_patterns 相同的模式，写成 keyword_regexes 使用的模板
+CACHED_TEMPLATES = [
+    r'\{[^}]*"title":\s*"([^"]*{keyword}[^"]*?)"[^}]*"url":\s*"([^"]*?)"[^}]*\}',
+    r'\{[^}]*"url":\s*"([^"]*?)"[^}]*"title":\s*"([^"]*{keyword}[^"]*?)"[^}]*\}',
+    r'<a[^>]*href="([^"]*?)"[^>]*>([^<]*{keyword}[^<]*?)</a>',
+    r'href="([^"]*?)"[^>]*title="([^"]*{keyword}[^"]*?)"',
+    r'"title":\s*"([^"]*{keyword}[^"]*?)"[^}]*"canonicalUrl":\s*"([^"]*?)"',
+    r'"canonicalUrl":\s*"([^"]*?)"[^}]*"title":\s*"([^"]*{keyword}[^"]*?)"',
+]
+
+
+def synthetic_page(keyword, items=2000):
+    parts = ['<html><body>']
+    for i in range(items):
+        if i % 50 == 0:
+            parts.append(f'<a href="/ent/{i}.html">{keyword}出席活動第{i}篇報道</a>')
+            parts.append(f'<script>{{"title": "{keyword}近況第{i}篇", "url": "/article/{i}"}}</script>')
+        else:
+            parts.append(f'<div class="item"><a href="/news/{i}.html" title="其他新聞{i}">其他新聞標題第{i}篇</a></div>')
+    parts.append('</body></html>')
+    return '\n'.join(parts)
+
+
+def load_pages(paths):
+    pages = []
+    for path in paths:
+        files = [os.path.join(path, name) for name in sorted(os.listdir(path))] if os.path.isdir(path) else [path]
+        for name in files:
+            with open(name, 'rb') as f:
+                pages.append((name, f.read().decode('utf-8', errors='replace')))
+    return pages
+
+
+def run_legacy(pages, keyword):
+    found = []
+    for _, content in pages:
+        for pattern in legacy_patterns(keyword):
+            found.append(len(re.findall(pattern, content, re.IGNORECASE)))
+    return found
+
+
+def run_cached(pages, keyword):
+    found = []
+    for _, content in pages:
+        for pattern in keyword_regexes(CACHED_TEMPLATES, keyword, re.IGNORECASE):
+            found.append(sum(1 for _ in pattern.finditer(content)))
+    return found
+
+
+def timed(func, pages, keyword, rounds, purge=False):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if purge:
+            re.purge()
+        func(pages, keyword)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='关键词正则基准测试')
+    parser.add_argument('pages', nargs='*', help='已保存的页面文件或目录')
+    parser.add_argument('--keyword', default='王敏奕')
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages) if args.pages else [('<合成页面>', synthetic_page(args.keyword))]
+    print(f"📄 页面数: {len(pages)}，关键词: {args.keyword}，轮数: {args.rounds}")
+
+    if run_legacy(pages, args.keyword) != run_cached(pages, args.keyword):
+        print("❌ 两种实现的匹配结果不一致")
+        sys.exit(1)
+
+    # 扫描页面本身的耗时两者相同；差异在于每次调用的正则构建/查找/编译
+    tiny = [('<空页面>', '')]
+    rounds = args.rounds * 50
+    print(f"⏱  仅构建正则（{rounds} 次调用）:")
+    print(f"   旧实现（re 内部缓存命中）: {timed(run_legacy, tiny, args.keyword, rounds):.4f}s")
+    print(f"   缓存版本:                 {timed(run_cached, tiny, args.keyword, rounds):.4f}s")
+    print(f"⏱  re 缓存被挤出时（{args.rounds} 次调用，每次重新编译）:")
+    print(f"   旧实现: {timed(run_legacy, tiny, args.keyword, args.rounds, purge=True):.4f}s")
+    print(f"   缓存版本: {timed(run_cached, tiny, args.keyword, args.rounds, purge=True):.4f}s")
+    print(f"⏱  完整解析（{args.rounds} 轮）:")
+    print(f"   旧实现: {timed(run_legacy, pages, args.keyword, args.rounds):.4f}s")
+    print(f"   缓存版本: {timed(run_cached, pages, args.keyword, args.rounds):.4f}s")
+
+
+if __name__ == '__main__':
+    main()
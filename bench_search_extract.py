@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+搜索结果提取基准测试 - 旧的整页回溯正则 vs search_extract 线性扫描
+
+用法:
+    python3 bench_search_extract.py [--size 1500] [--keyword 王敏奕]
+
+每个旧正则配一个病态输入（旧正则在该输入上耗时随页面大小平方增长）；
+另在正常页面上确认旧正则提取出的 (标题, 链接) 新实现全部能找到。
+"""
+import re
+import sys
+import time
+import argparse
+
+from search_extract import extract_json_items, extract_anchor_items
+
+
+def legacy_patterns(keyword):
+    """原明報/明周/文匯報/香港01搜索页解析正则（名称, 正则, flags, 标题分组在前）"""
+    return [
+        ('JSON title→url', r'\{[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*"url":\s*"([^"]*?)"[^}]*\}', re.I, True),
+        ('JSON url→title', r'\{[^}]*"url":\s*"([^"]*?)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*\}', re.I, False),
+        ('HK01 title→canonicalUrl', r'"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*"canonicalUrl":\s*"([^"]*?)"', re.I, True),
+        ('<a> 文本', r'<a[^>]*href="([^"]*?)"[^>]*>([^<]*' + keyword + r'[^<]*?)</a>', re.I, False),
+        ('href…title 属性', r'href="([^"]*?)"[^>]*title="([^"]*' + keyword + r'[^"]*?)"', re.I, False),
+        ('明周 DOTALL 子元素', r'href="([^"]*?)"[^>]*>.*?<[^>]*>([^<]*' + keyword + r'[^<]*?)</[^>]*>', re.I | re.S, False),
+    ]
+
+
+def pathological_inputs(keyword, size):
+    """与 legacy_patterns 一一对应的病态输入"""
+    return [
+        '{' + f'"title": "{keyword}", ' * size,            # 对象从不闭合，每个 '{' 都扫描到页尾再回溯
+        '{' + '"url": "/a", "title": "x", ' * size,
+        f'"title": "{keyword}", "a": 1, ' * size,           # 没有 canonicalUrl
+        '<a href="/a" ' * size,                              # 标签从不闭合
+        'href="/a" ' * size,                                 # 没有 title 属性
+        '<div href="/a">' * size + '<b>',                    # 每个 href 都用 .*? 扫描到页尾
+    ]
+
+
+def new_engine(index, content, keyword):
+    if index in (0, 1):
+        return extract_json_items(content, keyword)
+    if index == 2:
+        return extract_json_items(content, keyword, url_key='canonicalUrl', require_object=False)
+    return extract_anchor_items(content, keyword)
+
+
+def normal_page(keyword, items=500):
+    parts = ['<html><body>']
+    for i in range(items):
+        if i % 25 == 0:
+            parts.append(f'<a href="/ent/{i}.html">{keyword}出席活動第{i}篇報道</a>')
+            parts.append(f'<a href="/post/{i}.html"><h3>{keyword}專訪第{i}篇</h3></a>')
+            parts.append(f'<script>var d = {{"title": "{keyword}近況第{i}篇", "url": "/article/{i}"}};</script>')
+        else:
+            parts.append(f'<div class="item"><a href="/news/{i}.html" title="其他新聞{i}">其他新聞標題第{i}篇</a></div>')
+    parts.append('</body></html>')
+    return '\n'.join(parts)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='搜索结果提取基准测试')
+    parser.add_argument('--size', type=int, default=1500, help='病态输入的重复次数（<a> 文本正则为立方级，3000 次约需 150 秒）')
+    parser.add_argument('--keyword', default='王敏奕')
+    args = parser.parse_args()
+    keyword = args.keyword
+
+    # 正常页面：结果一致性（明報/文匯報的模式；香港01模式用于病态输入）
+    page = normal_page(keyword)
+    patterns = legacy_patterns(keyword)
+    legacy = set()
+    for _, pattern, flags, title_first in patterns[:2] + patterns[3:5]:
+        for match in re.findall(pattern, page, flags):
+            title, url = match if title_first else (match[1], match[0])
+            legacy.add((title.strip(), url))
+    engine = {(t.strip(), u) for t, u in extract_json_items(page, keyword) + extract_anchor_items(page, keyword)}
+    if not legacy <= engine:
+        print(f"❌ 新实现漏掉了旧正则的结果: {legacy - engine}")
+        sys.exit(1)
+    print(f"✅ 正常页面: 旧正则 {len(legacy)} 条全部找到；新实现另外识别子元素中的标题 {len(engine - legacy)} 条")
+
+    # 明周 DOTALL 模式的 .*? 会越过链接边界，把某个 href 与后面其他元素里的标题配对
+    _, pattern, flags, _ = patterns[5]
+    mispaired = {(m[1].strip(), m[0]) for m in re.findall(pattern, page, flags)} - engine
+    print(f"ℹ️  明周子元素正则在正常页面上另有 {len(mispaired)} 条链接与标题错配（新实现不会产生）")
+
+    print(f"⏱  病态输入（重复 {args.size} 次）:")
+    for index, ((name, pattern, flags, _), content) in enumerate(zip(legacy_patterns(keyword),
+                                                                  pathological_inputs(keyword, args.size))):
+        old_time, _ = timed(lambda: re.findall(pattern, content, flags))
+        new_time, _ = timed(lambda: new_engine(index, content, keyword))
+        print(f"   {name:<24} {len(content) // 1024:>5} KB  旧正则 {old_time:8.3f}s  新实现 {new_time:8.4f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 有限并发工具
+功能: 在有限线程池（或事件循环中的有限协程）中并发执行详情页/发布时间等抓取任务，按输入顺序产出结果，调用方可随时提前停止
+"""
+
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def iter_bounded(func, items, max_workers=4, deadline=None):
+    """并发执行 func(item)，按输入顺序产出 (item, result, error)
+
+    - 同时最多 max_workers 个任务在执行（滑动窗口），调用方 break 后剩余任务立即取消，
+      因此达到配额后最多浪费 max_workers-1 次请求
+    - deadline 为整体时限(秒)，超时后不再等待，未完成的任务直接丢弃
+    - func 抛出的异常不会中断迭代，而是作为 error 产出
+    """
+    items = list(items)
+    if not items:
+        return
+
+    end_time = time.monotonic() + deadline if deadline else None
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))),
+                                  thread_name_prefix='vvnews-detail')
+    futures = []
+    next_index = 0
+
+    try:
+        for position, item in enumerate(items):
+            # 补足窗口：保持最多 max_workers 个任务在执行
+            while next_index < len(items) and next_index < position + max_workers:
+                futures.append(executor.submit(func, items[next_index]))
+                next_index += 1
+
+            future = futures[position]
+            timeout = None
+            if end_time is not None:
+                timeout = max(0, end_time - time.monotonic())
+            done, _ = wait([future], timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                logging.warning(f"并发任务超过总时限 {deadline} 秒，丢弃剩余 {len(items) - position} 个任务")
+                return
+
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, e
+    finally:
+        # 调用方提前停止或超时：取消尚未开始的任务，不等待正在执行的任务
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def gather_bounded(func, items, max_workers=4, deadline=None):
+    """iter_bounded 的异步版本：并发执行协程 func(item)，最多 max_workers 个同时进行
+
+    返回按输入顺序排列的 [(item, result, error)]；deadline 为整体时限(秒)，超时未完成的任务被取消（返回前等待其结束）且不出现在结果中。
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        if pending:
+            logging.warning(f"并发任务超过总时限 {deadline} 秒，丢弃剩余 {len(pending)} 个任务")
+    finally:
+        # 超时或调用方被取消：取消未完成的任务并等待其真正结束，避免任务在后台继续运行或泄漏
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    results = []
+    for item, task in zip(items, tasks):
+        if task not in done:
+            continue
+        error = task.exception()
+        results.append((item, None if error else task.result(), error))
+    return results
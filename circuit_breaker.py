@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 熔断器
+功能: 按 (来源, 策略URL) 记录连续失败次数，持续失败的端点进入熔断状态并按指数退避跳过，
+      到期后只放行一次探测请求（半开，经状态存储原子占用），探测成功才恢复；
+      探测进行中其他调用方直接跳过该端点，不排队等待探测结果
+"""
+
+import time
+import logging
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """基于状态存储的持久化熔断器，多个机器人进程共享同一份端点状态"""
+
+    NAMESPACE = 'circuit_breaker'
+
+    def __init__(self, state, failure_threshold=3, base_backoff=1800, max_backoff=86400, probe_timeout=300):
+        self.state = state
+        self.failure_threshold = failure_threshold  # 连续失败多少次后熔断
+        self.base_backoff = base_backoff  # 首次熔断时长(秒)，之后每次翻倍
+        self.max_backoff = max_backoff
+        self.probe_timeout = probe_timeout  # 半开探测的占用时长，超时后允许其他进程再次探测
+
+    def _key(self, source, url):
+        return f'{source}|{url}'
+
+    def _load(self, source, url):
+        return self.state.get(self.NAMESPACE, self._key(source, url)) or {
+            'status': CLOSED, 'failures': 0, 'opens': 0, 'retry_at': 0}
+
+    def _save(self, source, url, record):
+        self.state.set(self.NAMESPACE, self._key(source, url), record, ttl=self.max_backoff * 7)
+
+    def allow(self, source, url):
+        """是否可以请求该端点；熔断到期时只有一个调用方能占用探测机会（放行并转为半开）
+
+        没有占到探测机会的调用方（其他线程、进程或同一轮中的其他关键词）返回 False，
+        本次直接跳过该端点，不等待探测结果；probe_timeout 后探测未结束则允许再次探测。
+        """
+        record = self._load(source, url)
+        if record['status'] == CLOSED:
+            return True
+
+        now = time.time()
+        if now < record['retry_at']:
+            logging.info(f"{source} 端点熔断中，跳过: {url}")
+            return False
+
+        # 到期：比较并写入占用探测机会，记录在读取之后被其他调用方改过则说明探测已被占用
+        probe = dict(record, status=HALF_OPEN, retry_at=now + self.probe_timeout)
+        if not self.state.compare_and_set(self.NAMESPACE, self._key(source, url), record, probe,
+                                          ttl=self.max_backoff * 7):
+            logging.info(f"{source} 端点正在由其他任务半开探测，跳过: {url}")
+            return False
+        logging.info(f"{source} 端点半开探测: {url}")
+        return True
+
+    def record_success(self, source, url):
+        record = self._load(source, url)
+        if record['status'] != CLOSED:
+            logging.info(f"{source} 端点恢复: {url}")
+        if record['status'] != CLOSED or record['failures']:
+            self._save(source, url, {'status': CLOSED, 'failures': 0, 'opens': 0, 'retry_at': 0})
+
+    def record_failure(self, source, url, reason=''):
+        record = self._load(source, url)
+        record['failures'] += 1
+        if record['status'] == HALF_OPEN or record['failures'] >= self.failure_threshold:
+            backoff = min(self.base_backoff * (2 ** record['opens']), self.max_backoff)
+            record['opens'] += 1
+            record['status'] = OPEN
+            record['retry_at'] = time.time() + backoff
+            logging.warning(f"{source} 端点熔断 {backoff / 60:.0f} 分钟（连续失败 {record['failures']} 次，{reason}）: {url}")
+        self._save(source, url, record)
+
+    def record_response(self, source, url, status_code):
+        """按 HTTP 状态记录结果：4xx/5xx 视为失败"""
+        if status_code >= 400:
+            self.record_failure(source, url, f'HTTP {status_code}')
+        else:
+            self.record_success(source, url)
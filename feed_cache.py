@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 条件请求缓存
+功能: 为 RSS/Atom 源保存 ETag / Last-Modified 以及上次解析出的条目（状态存储），
+      下次请求带上 If-None-Match / If-Modified-Since；返回 304 时直接复用已解析的条目，不再下载和解析
+"""
+
+import logging
+
+
+def _header(headers, name):
+    """大小写不敏感地读取响应头（requests 与 aiohttp 的响应头转成 dict 后大小写不一）"""
+    name = name.lower()
+    for key, value in (headers or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+class ConditionalFeedCache:
+    """按 URL 保存验证器和条目：request_headers() 生成条件请求头，entries_from() 处理 200/304 响应"""
+
+    NAMESPACE = 'feed_validators'
+
+    def __init__(self, state, ttl=7 * 86400):
+        self.state = state
+        self.ttl = ttl
+
+    def request_headers(self, url):
+        record = self.state.get(self.NAMESPACE, url)
+        headers = {}
+        if record:
+            if record.get('etag'):
+                headers['If-None-Match'] = record['etag']
+            if record.get('last_modified'):
+                headers['If-Modified-Since'] = record['last_modified']
+        return headers
+
+    def entries_from(self, url, response, parse):
+        """304 返回缓存的条目；200 用 parse(content) 解析并保存验证器；其他状态返回 None"""
+        if response.status_code == 304:
+            record = self.state.get(self.NAMESPACE, url)
+            logging.debug(f"订阅源未变化(304)，复用已解析条目: {url}")
+            return record['entries'] if record else []
+        if response.status_code != 200:
+            return None
+
+        entries = parse(response.content)
+        etag = _header(response.headers, 'ETag')
+        last_modified = _header(response.headers, 'Last-Modified')
+        if etag or last_modified:
+            self.state.set(self.NAMESPACE, url, {
+                'etag': etag, 'last_modified': last_modified, 'entries': entries}, ttl=self.ttl)
+        return entries
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 流式订阅源读取器
+功能: 用 iterparse 逐条读取 Atom / RSS 2.0 条目，只取 标题、链接、发布时间 三个字段，
+      按需惰性产出，达到条数上限或遇到早于时间窗口的条目即停止，不解析剩余内容
+"""
+
+import io
+import logging
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# published 为带时区的 datetime
+FeedEntry = namedtuple('FeedEntry', ['title', 'link', 'published'])
+
+ENTRY_TAGS = ('entry', 'item')
+
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def parse_feed_date(text):
+    """解析 Atom 的 ISO 8601 或 RSS 的 RFC 822 时间，无时区时按 UTC；失败返回 None"""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        value = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            value = parsedate_to_datetime(text)
+        except (TypeError, ValueError, IndexError):
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _read_entry(elem):
+    title = link = published = updated = None
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == 'title':
+            title = (child.text or '').strip()
+        elif name == 'link':
+            href = child.get('href')
+            if href is not None:
+                # Atom: 优先 rel="alternate"（或未标注 rel）的链接
+                if link is None or child.get('rel', 'alternate') == 'alternate':
+                    link = href
+            elif child.text:
+                link = child.text.strip()
+        elif name in ('published', 'pubDate'):
+            published = parse_feed_date(child.text)
+        elif name == 'updated':
+            updated = parse_feed_date(child.text)
+    return FeedEntry(title or '', link or '', published or updated)
+
+
+def iter_entries(source, limit=None, since=None):
+    """逐条产出 FeedEntry（source 为 bytes 或文件对象），没有发布时间的条目跳过
+
+    limit: 最多产出的条数；since: 遇到发布时间早于 since 的条目即停止，只适用于按时间倒序排列的源（如 YouTube 频道）。
+    XML 格式错误时记录日志并停止，已产出的条目仍然有效。
+    """
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    count = 0
+    try:
+        for _, elem in ET.iterparse(stream, events=('end',)):
+            if _local_name(elem.tag) not in ENTRY_TAGS:
+                continue
+            entry = _read_entry(elem)
+            elem.clear()
+            if entry.published is None:
+                continue
+            if since is not None and entry.published < since:
+                return
+            yield entry
+            count += 1
+            if limit is not None and count >= limit:
+                return
+    except ET.ParseError as e:
+        logging.warning(f"订阅源XML解析失败，已读取 {count} 条: {e}")
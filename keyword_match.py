@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 多关键词匹配
+功能: Aho-Corasick 自动机，一次扫描页面文本即可找出监控列表中出现的所有关键词，
+      关键词数量增加时扫描成本基本不变；
+      另提供原始字节预过滤，在解码和解析 HTML 之前判断页面是否可能包含关键词；
+      以及按关键词缓存的提取正则注册表（关键词经过转义，每个模式只编译一次）
+"""
+
+import re
+from collections import deque, namedtuple
+from functools import lru_cache
+from urllib.parse import quote, quote_plus
+
+# 页面可能使用的字符编码（香港站点仍有少量 Big5 页面）
+PREFILTER_ENCODINGS = ('utf-8', 'big5')
+
+# 提取正则模板中的关键词占位符
+KEYWORD_PLACEHOLDER = '{keyword}'
+
+# 关键词的常用派生形式：小写形式、URL 编码形式（UTF-8）
+KeywordForms = namedtuple('KeywordForms', ['keyword', 'lower', 'quoted'])
+
+
+def normalize_keywords(keywords):
+    """把单个关键词或关键词列表统一成去重后的列表（保持顺序），支持逗号分隔的字符串"""
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    result = []
+    for keyword in keywords or []:
+        keyword = keyword.strip()
+        if keyword and keyword not in result:
+            result.append(keyword)
+    return result
+
+
+def encoded_forms(keyword):
+    """关键词在未解码页面中可能出现的字节形式：原始编码、百分号编码、HTML 实体、JSON \\u 转义"""
+    forms = set()
+    for encoding in PREFILTER_ENCODINGS:
+        try:
+            forms.add(keyword.encode(encoding))
+        except UnicodeEncodeError:
+            continue
+        forms.add(quote(keyword, encoding=encoding).encode('ascii'))
+        forms.add(quote_plus(keyword, encoding=encoding).encode('ascii'))
+    forms.add(''.join(f'&#{ord(c)};' for c in keyword).encode('ascii'))
+    forms.add(''.join(f'&#x{ord(c):x};' for c in keyword).encode('ascii'))
+    forms.add(''.join(c if ord(c) < 128 else f'\\u{ord(c):04x}' for c in keyword).encode('ascii'))
+    return forms
+
+
+class KeywordMatcher:
+    """大小写不敏感的 Aho-Corasick 多模式匹配器"""
+
+    def __init__(self, keywords):
+        self.keywords = normalize_keywords(keywords)
+        self._goto = [{}]  # 每个状态的转移表
+        self._fail = [0]
+        self._output = [set()]  # 到达该状态时匹配成功的关键词
+
+        for keyword in self.keywords:
+            state = 0
+            for char in keyword.lower():
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(set())
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].add(keyword)
+
+        # 字节预过滤：所有关键词的所有编码形式合并成一个正则（在 C 层扫描，无需解码）
+        self._form_keywords = {}
+        for keyword in self.keywords:
+            for form in encoded_forms(keyword):
+                self._form_keywords.setdefault(form.lower(), keyword)
+        forms = sorted(self._form_keywords, key=len, reverse=True)
+        self._bytes_pattern = re.compile(b'|'.join(re.escape(f) for f in forms), re.IGNORECASE) if forms else None
+
+        # 广度优先构建失败指针
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def find_all(self, text, stop_when_all=True):
+        """返回 text 中出现的关键词集合；全部关键词都已出现时提前结束扫描"""
+        found = set()
+        if not text or not self.keywords:
+            return found
+
+        goto, fail, output = self._goto, self._fail, self._output
+        total = len(self.keywords)
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+                if stop_when_all and len(found) == total:
+                    break
+        return found
+
+    def contains_any(self, text):
+        return bool(self.find_all(text))
+
+    def find_in_bytes(self, data):
+        """在未解码的响应字节中查找关键词（任一编码形式命中即算出现），返回关键词集合"""
+        found = set()
+        if not data or self._bytes_pattern is None:
+            return found
+        total = len(self.keywords)
+        for match in self._bytes_pattern.finditer(data):
+            found.add(self._form_keywords[match.group(0).lower()])
+            if len(found) == total:
+                break
+        return found
+
+
+@lru_cache(maxsize=None)
+def keyword_forms(keyword):
+    """关键词的派生形式，每个关键词只计算一次"""
+    return KeywordForms(keyword, keyword.lower(), quote(keyword, encoding='utf-8'))
+
+
+@lru_cache(maxsize=512)
+def keyword_regex(template, keyword, flags=0):
+    """编译关键词相关的提取正则：模板中的 {keyword} 替换为 re.escape 后的关键词；
+    同一 (模板, 关键词, flags) 只编译一次"""
+    return re.compile(template.replace(KEYWORD_PLACEHOLDER, re.escape(keyword)), flags)
+
+
+def keyword_regexes(templates, keyword, flags=0):
+    """批量获取 keyword_regex，顺序与 templates 一致"""
+    return [keyword_regex(template, keyword, flags) for template in templates]
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 链接提取
+功能: 只提取页面中的 <a href> 链接 (href, 文本, title, alt)，不构建完整的 BeautifulSoup 树；
+      优先使用 lxml 的 C 解析器增量解析并随时释放已处理的节点，未安装 lxml 时回退到标准库分词器
+"""
+
+import re
+import logging
+from collections import namedtuple
+from html.parser import HTMLParser
+
+# lxml 支持（可选）
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    logging.warning("lxml 未安装，链接提取将使用较慢的标准库解析器")
+
+# text 与 BeautifulSoup 的 get_text() 一致（所有后代文本直接拼接）；parts 为各个文本节点
+Link = namedtuple('Link', ['href', 'text', 'title', 'alt', 'parts'])
+
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+_CHUNK_SIZE = 64 * 1024
+
+
+def _to_text(content):
+    """bytes 按 <meta charset> 声明解码（默认 UTF-8），str 原样返回"""
+    if isinstance(content, str):
+        return content
+    match = _META_CHARSET.search(content[:4096])
+    encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return content.decode(encoding, errors='replace')
+    except LookupError:
+        return content.decode('utf-8', errors='replace')
+
+
+def _extract_with_lxml(text):
+    links = []
+    parser = etree.HTMLPullParser(events=('start', 'end'))
+    anchor_depth = 0
+
+    for start in range(0, len(text), _CHUNK_SIZE):
+        parser.feed(text[start:start + _CHUNK_SIZE])
+        for event, elem in parser.read_events():
+            if not isinstance(elem.tag, str):
+                continue
+            if event == 'start':
+                if elem.tag == 'a':
+                    anchor_depth += 1
+                continue
+
+            if elem.tag == 'a':
+                anchor_depth -= 1
+                href = elem.get('href')
+                if href is not None:
+                    parts = tuple(elem.itertext())
+                    links.append(Link(href, ''.join(parts), elem.get('title', ''), elem.get('alt', ''), parts))
+                elem.clear(keep_tail=True)
+            elif anchor_depth == 0:
+                # 链接之外的节点处理完即释放，保持内存占用与页面大小无关
+                elem.clear(keep_tail=True)
+    parser.close()
+    return links
+
+
+class _AnchorTokenizer(HTMLParser):
+    """标准库流式分词器：只记录 <a> 的属性和其中的文本"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+        self._open = []  # 尚未闭合的 [位置, href, title, alt, 文本列表]
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            attrs = dict(attrs)
+            self.links.append(None)
+            self._open.append([len(self.links) - 1, attrs.get('href'), attrs.get('title') or '',
+                               attrs.get('alt') or '', []])
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._open:
+            self._close(self._open.pop())
+
+    def handle_data(self, data):
+        for anchor in self._open:
+            anchor[4].append(data)
+
+    def _close(self, anchor):
+        position, href, title, alt, parts = anchor
+        if href is not None:
+            self.links[position] = Link(href, ''.join(parts), title, alt, tuple(parts))
+
+    def finish(self):
+        self.close()
+        while self._open:
+            self._close(self._open.pop())
+        return [link for link in self.links if link is not None]
+
+
+def _extract_with_tokenizer(text):
+    tokenizer = _AnchorTokenizer()
+    for start in range(0, len(text), _CHUNK_SIZE):
+        tokenizer.feed(text[start:start + _CHUNK_SIZE])
+    return tokenizer.finish()
+
+
+def extract_links(content):
+    """返回页面中所有带 href 属性的链接 [Link]，顺序与文档顺序一致；content 可以是 bytes 或 str"""
+    text = _to_text(content)
+    if not text:
+        return []
+    if LXML_AVAILABLE:
+        try:
+            return _extract_with_lxml(text)
+        except (etree.ParserError, ValueError) as e:
+            logging.debug(f"lxml 链接提取失败，改用标准库解析器: {e}")
+    return _extract_with_tokenizer(text)
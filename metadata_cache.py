@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 元数据缓存
+功能: 两级缓存——进程内 LRU 在前，状态存储(SQLite)在后并带过期时间；
+      已解析过的页面元数据（YouTube 视频标题/发布时间等）跨运行复用，不再重复抓取大页面；
+      可选的负缓存记录"页面上没有该元数据"，在较短的时间内不再重复抓取；
+      可选的 cacheable 判断只缓存完整的记录，不完整的记录返回给调用方但不写入缓存；
+      同一 key 的并发加载（多线程或多个协程）合并为一次，其他调用方等待并共享结果
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+
+MISSING = False  # 负缓存标记：已抓取过但没有结果
+
+
+class MetadataCache:
+    """按 key 缓存 JSON 可序列化的元数据：先查内存 LRU，未命中再查状态存储，命中后回填 LRU"""
+
+    def __init__(self, state, namespace, ttl, maxsize=256, negative_ttl=None, cacheable=None):
+        self.state = state
+        self.namespace = namespace
+        self.ttl = ttl  # 持久化层的保留时间(秒)，None 表示永久保存
+        self.negative_ttl = negative_ttl  # 负缓存的保留时间(秒)，None 表示不缓存无结果的情况
+        self.cacheable = cacheable  # cacheable(value) 为假的记录不写入缓存，已缓存的也视为未命中；None 表示都缓存
+        self.maxsize = maxsize
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}  # 正在同步加载的 key -> 锁
+        self._pending = {}  # 正在异步加载的 key -> Task
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+
+    def get(self, key):
+        """返回缓存的值，未命中返回 None，已知无结果（负缓存）返回 MISSING"""
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                return value
+
+        value = self.state.get(self.namespace, key)
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    def set(self, key, value):
+        self._remember(key, value)
+        self.state.set(self.namespace, key, value, ttl=self.ttl)
+
+    def set_missing(self, key):
+        """记录 key 没有结果，negative_ttl 内不再调用 loader"""
+        if self.negative_ttl is None:
+            return
+        self._remember(key, MISSING)
+        self.state.set(self.namespace, key, MISSING, ttl=self.negative_ttl)
+
+    def _is_cacheable(self, value):
+        return self.cacheable is None or bool(self.cacheable(value))
+
+    def _store(self, key, value):
+        if value is None:
+            self.set_missing(key)
+        elif self._is_cacheable(value):
+            self.set(key, value)
+
+    def _cached(self, key):
+        """返回 (是否命中, 值)；负缓存命中时值为 None"""
+        value = self.get(key)
+        if value is MISSING:
+            return True, None
+        if value is not None and not self._is_cacheable(value):
+            return False, None
+        return value is not None, value
+
+    def _load(self, key, loader):
+        """加锁调用 loader()：同一 key 同时只有一个线程加载，等待的线程在锁内重新查缓存"""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                found, value = self._cached(key)
+                if found:
+                    return value
+                value = loader()
+                self._store(key, value)
+                return value
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+
+    async def _load_async(self, key, loader):
+        """同一 key 同时只运行一个 loader() 协程，其他调用方等待同一个任务"""
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_loader_async(key, loader))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        # shield: 某个调用方被取消时不影响其他等待同一 key 的调用方
+        return await asyncio.shield(task)
+
+    async def _run_loader_async(self, key, loader):
+        value = await loader()
+        self._store(key, value)
+        return value
+
+    def get_or_load(self, key, loader):
+        """命中则返回缓存值；否则调用 loader()，结果不为 None 时写入两级缓存，为 None 时写入负缓存
+
+        负缓存命中时返回 None；loader 抛出的异常（网络错误等）直接传出，不写入任何缓存。
+        多个线程同时加载同一 key 时只调用一次 loader。
+        """
+        found, value = self._cached(key)
+        if found:
+            return value
+        return self._load(key, loader)
+
+    async def get_or_load_async(self, key, loader):
+        """get_or_load 的异步版本，loader() 返回协程；并发加载同一 key 的协程共享一次 loader 调用"""
+        found, value = self._cached(key)
+        if found:
+            return value
+        return await self._load_async(key, loader)
+
+
+class ArticleMetadataCache(MetadataCache):
+    """各来源共用的文章元数据缓存（标题、发布时间、是否包含关键词等），按文章URL缓存并统计命中率
+
+    与关键词有关的结果（如"页面是否包含关键词"）用 scope=关键词 分区缓存。
+    正结果保留 ttl，页面可访问但没有所需元数据的负结果保留 negative_ttl，网络错误不缓存。
+    """
+
+    NAMESPACE = 'article_metadata'
+
+    def __init__(self, state, ttl, negative_ttl, maxsize=1024):
+        super().__init__(state, self.NAMESPACE, ttl, maxsize=maxsize, negative_ttl=negative_ttl)
+        self._counts = {'hits': 0, 'negative_hits': 0, 'misses': 0, 'errors': 0}
+
+    @staticmethod
+    def key(url, scope=None):
+        return f'{scope}|{url}' if scope else url
+
+    def _count(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    def _lookup(self, key):
+        """返回 (是否命中, 值)；负缓存命中时值为 None"""
+        value = self.get(key)
+        if value is MISSING:
+            self._count('negative_hits')
+            return True, None
+        if value is not None:
+            self._count('hits')
+            return True, value
+        self._count('misses')
+        return False, None
+
+    def get_or_load(self, url, loader, scope=None):
+        """命中则返回缓存的元数据（负缓存为 None）；否则调用 loader() 并写入缓存，loader 的异常计数后传出"""
+        key = self.key(url, scope)
+        found, value = self._lookup(key)
+        if found:
+            return value
+        try:
+            return self._load(key, loader)
+        except Exception:
+            self._count('errors')
+            raise
+
+    async def get_or_load_async(self, url, loader, scope=None):
+        """get_or_load 的异步版本，loader() 返回协程；同一URL的并发加载合并为一次"""
+        key = self.key(url, scope)
+        found, value = self._lookup(key)
+        if found:
+            return value
+        try:
+            return await self._load_async(key, loader)
+        except Exception:
+            self._count('errors')
+            raise
+
+    def stats(self):
+        """返回命中统计 dict（hits / negative_hits / misses / errors / hit_rate）"""
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts['hits'] + counts['negative_hits'] + counts['misses']
+        counts['hit_rate'] = round((counts['hits'] + counts['negative_hits']) / lookups, 3) if lookups else None
+        return counts
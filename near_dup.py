@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 近似重复标题检测
+功能: 对规范化后的标题做字符 n-gram MinHash，用 LSH 分桶查找候选，
+      把各媒体转载的同一新闻（标题略有不同、繁简不同）合并为一条
+"""
+
+import re
+import hashlib
+import logging
+import unicodedata
+
+# 繁简转换支持（可选）
+try:
+    from opencc import OpenCC
+    _S2T = OpenCC('s2t')
+    OPENCC_AVAILABLE = True
+except ImportError:
+    _S2T = None
+    OPENCC_AVAILABLE = False
+
+# 未安装 opencc 时使用的常用简->繁对照（覆盖新闻标题中的高频字）
+_SIMPLIFIED = '东网报闻娱乐视电剧发时为与这个们来说对会后将过还现开关国长门问间岛艺节剧演员获奖爱恋见让认识谈话钟头亲妈爷儿孙经纪约签场观众动态晒摄诉称记录亿万元谢语热传专导红无实体听学结晓庆礼两边运进给买卖车飞机兴欢'
+_TRADITIONAL = '東網報聞娛樂視電劇發時為與這個們來說對會後將過還現開關國長門問間島藝節劇演員獲獎愛戀見讓認識談話鐘頭親媽爺兒孫經紀約簽場觀眾動態曬攝訴稱記錄億萬元謝語熱傳專導紅無實體聽學結曉慶禮兩邊運進給買賣車飛機興歡'
+_S2T_TABLE = str.maketrans(_SIMPLIFIED, _TRADITIONAL)
+
+# 标题末尾的媒体名称后缀，例如 "｜香港01"、" - 東網"；只去掉已知的媒体/网站名称，
+# 其他 " - xxx" 可能是标题正文（如 "王敏奕 - 宣布婚讯"），必须保留
+SITE_NAMES = [
+    '香港01', 'HK01', '東網on.cc', 'on.cc 東網', '東網', '东网', 'on.cc', 'oncc',
+    '星島頭條', '星岛头条', '星島日報', '星岛日报', '星島娛樂', '星岛娱乐', '星島', '星岛', '頭條日報', '头条日报',
+    '明報新聞網', '明报新闻网', '明報', '明报', '明周文化', '明周', 'MPWeekly',
+    '香港文匯報', '香港文汇报', '文匯報', '文汇报', '文匯網', '文汇网',
+    'TVB News', 'TVB新聞', 'TVB新闻', '無綫新聞', '无线新闻', 'TVB', 'am730', 'YouTube', 'Google News', 'Yahoo新聞', 'Yahoo新闻',
+]
+_SITE_SUFFIX = re.compile(
+    r'\s*[|｜\-–—]\s*(?:' + '|'.join(re.escape(name) for name in SITE_NAMES) + r')\s*$', re.IGNORECASE)
+MIN_SHINGLES = 5  # 二元组少于此数的标题（如只剩人名）不参与近似匹配，也不写入历史
+_NON_WORD = re.compile(r'[\W_]+', re.UNICODE)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalize_title(title):
+    """规范化标题：全半角统一、繁简统一、去掉媒体后缀和标点空白"""
+    text = unicodedata.normalize('NFKC', title or '').strip()
+    # "标题｜頻道｜香港01" 之类可能有多个后缀，逐个去掉
+    stripped = _SITE_SUFFIX.sub('', text)
+    while stripped != text:
+        text, stripped = stripped, _SITE_SUFFIX.sub('', stripped)
+    text = _S2T.convert(text) if OPENCC_AVAILABLE else text.translate(_S2T_TABLE)
+    return _NON_WORD.sub('', text).lower()
+
+
+def shingles(title, n=2):
+    """字符 n-gram 集合（中文标题用二元组效果最好）"""
+    text = normalize_title(title)
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """固定种子的 MinHash，签名在不同进程之间保持一致，可持久化比较"""
+
+    def __init__(self, num_perm=32, seed=1):
+        self.num_perm = num_perm
+        self._params = []
+        for i in range(num_perm):
+            digest = hashlib.blake2b(f'{seed}:{i}'.encode(), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], 'big') % (_MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:], 'big') % _MERSENNE_PRIME
+            self._params.append((a, b))
+
+    def signature(self, shingle_set):
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+                  for s in shingle_set]
+        if not hashes:
+            return [_MAX_HASH] * self.num_perm
+        return [min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in self._params]
+
+
+class NearDuplicateIndex:
+    """MinHash LSH 近似重复索引
+
+    - 本轮运行的新闻保存在内存桶中，用于把各媒体的同一新闻合并
+    - 已通知过的标题按 LSH 桶写入状态数据库，查询只读取同桶候选，历史增长时仍是亚线性
+    - 候选最终用 Jaccard 相似度确认，避免桶碰撞造成误合并
+    """
+
+    def __init__(self, state=None, threshold=0.5, num_perm=32, bands=8, min_shingles=MIN_SHINGLES):
+        if num_perm % bands:
+            raise ValueError("num_perm 必须能被 bands 整除")
+        self.state = state
+        self.threshold = threshold
+        self.min_shingles = min_shingles
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self.reset()
+
+    def reset(self):
+        """清空本轮运行的内存索引（历史记录不受影响）"""
+        self._buckets = {}
+        self._items = []
+
+    def is_indexable(self, title):
+        """规范化后的标题是否足够长，可以参与近似匹配（太短的标题容易误合并）"""
+        return len(shingles(title)) >= self.min_shingles
+
+    def band_keys(self, title):
+        signature = self.hasher.signature(shingles(title))
+        return [f'{band}:' + '-'.join(map(str, signature[band * self.rows:(band + 1) * self.rows]))
+                for band in range(self.bands)]
+
+    def _is_similar(self, title, other_title):
+        return jaccard(shingles(title), shingles(other_title)) >= self.threshold
+
+    def find_in_run(self, title):
+        """返回本轮中与 title 近似重复的新闻，没有返回 None"""
+        if not self.is_indexable(title):
+            return None
+        checked = set()
+        for key in self.band_keys(title):
+            for index in self._buckets.get(key, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                item = self._items[index]
+                if self._is_similar(title, item.get('title', '')):
+                    return item
+        return None
+
+    def find_in_history(self, title):
+        """返回历史上已通知过的近似重复标题 (url, title)，没有返回 None"""
+        if self.state is None or not self.is_indexable(title):
+            return None
+        for url, other_title in self.state.find_titles(self.band_keys(title)):
+            if self._is_similar(title, other_title):
+                return url, other_title
+        return None
+
+    def add(self, item):
+        """把新闻加入本轮内存索引"""
+        index = len(self._items)
+        self._items.append(item)
+        if not self.is_indexable(item.get('title', '')):
+            return
+        for key in self.band_keys(item.get('title', '')):
+            self._buckets.setdefault(key, []).append(index)
+
+    def persist(self, items, ttl):
+        """把本轮通知的新闻标题写入历史索引"""
+        if self.state is None:
+            return
+        for item in items:
+            title = item.get('title', '')
+            if self.is_indexable(title):
+                self.state.add_title(item.get('canonical_url') or item.get('url', ''), title,
+                                     self.band_keys(title), ttl)
+        logging.debug(f"近似重复索引写入 {len(items)} 条标题")
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 新闻来源共用逻辑
+功能: vvnews_bot.py 与 vvnews_bot_auto.py 共用的来源配置与页面解析：
+      明報/明周/文匯報的站内搜索配置、解析和搜索流程（同步/异步），
+      TVB 列表页/搜索页/主页解析，东网列表页URL，YouTube 频道RSS URL，
+      以及URL补全、去重和响应解码等小工具。
+      抓取方式由调用方传入（各版本的抓取、熔断和页面缓存不同），本模块只负责流程和解析
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from urllib.parse import unquote
+
+from bs4 import BeautifulSoup
+
+from keyword_match import keyword_forms
+from link_extract import extract_links
+from search_extract import extract_search_items
+from url_canon import canonicalize_url
+
+TVB_BASE_URL = 'https://www.tvb.com'
+
+TVB_LIST_URLS = [
+    "https://www.tvb.com/artiste-news-c",
+    "https://www.tvb.com/news",
+    "https://www.tvb.com/entertainment",
+    "https://news.tvb.com/"
+]
+
+# 已知的TVB新闻URL（按关键词，针对动态加载页面，可以根据需要扩展）
+TVB_KNOWN_URLS = {
+    '王敏奕': [
+        "https://www.tvb.com/artiste-news-c/%E9%99%B3%E7%80%85%E5%8A%9B%E6%92%90%E7%8E%8B%E6%95%8F%E5%A5%95%E6%96%B0%E4%BD%9C%E9%A3%B2%E5%88%B0%E9%9D%A2%E7%B4%85%E7%B4%85--12%E5%B9%B4%E5%A5%BD%E5%8F%8B%E9%80%8F%E9%9C%B2%E5%BE%9E%E6%9C%AA%E5%90%B5%E9%81%8E%E6%9E%B6%E5%A7%8A%E5%A6%B9%E6%83%85%E6%B7%B1-1008140"
+    ],
+}
+
+
+def absolute_url(base_url, href):
+    """将站内相对链接补全为绝对URL"""
+    if href and not href.startswith('http'):
+        if href.startswith('/'):
+            return base_url + href
+        return base_url + '/' + href
+    return href
+
+
+def decoded_text(response):
+    """按响应编码解码页面；未声明编码（requests 默认 ISO-8859-1）时按 UTF-8 解码，不修改响应对象（页面缓存中的响应由多个关键词共用）"""
+    encoding = response.encoding if response.encoding not in (None, 'ISO-8859-1') else 'utf-8'
+    return response.content.decode(encoding, errors='replace')
+
+
+def dedupe_by_url(results, limit=None):
+    """按规范化URL去重并限制数量（保留首次出现的结果）"""
+    seen_urls = set()
+    unique_results = []
+    for result in results:
+        url = canonicalize_url(result.get('url', ''))
+        if url and url not in seen_urls:
+            seen_urls.add(url)
+            unique_results.append(result)
+    return unique_results[:limit] if limit else unique_results
+
+
+def news_site_config(site, keyword):
+    """明報/明周/文匯報共用的搜索配置：搜索URL、备用选择器和主页回退"""
+    if site == 'mingpao':
+        return {
+            'source': '明報',
+            'base_url': 'https://ol.mingpao.com',
+            'search_urls': [
+                f"https://ol.mingpao.com/search?q={keyword}",
+                f"https://www.mingpao.com/search?q={keyword}",
+                f"https://ol.mingpao.com/ldy/search.php?keyword={keyword}"
+            ],
+            'selectors': [
+                'a[href*="/news/"]',
+                'a[href*="/article/"]',
+                '.search-result a',
+                '.news-item a',
+                'h3 a, h2 a, h1 a'
+            ],
+            'home_url': "https://ol.mingpao.com/ldy/main.php",
+            'home_href_patterns': ['/news/', '/article/', '/ldy/'],
+        }
+    if site == 'mpweekly':
+        return {
+            'source': '明周',
+            'base_url': 'https://www.mpweekly.com',
+            'search_urls': [
+                f"https://www.mpweekly.com/search?q={keyword}",
+                f"https://www.mpweekly.com/search?keyword={keyword}",
+                f"https://www.mpweekly.com/?s={keyword}"
+            ],
+            'selectors': [
+                'a[href*="/entertainment/"]',
+                'a[href*="/article/"]',
+                'a[href*="/post/"]',
+                '.search-result a',
+                '.article-item a',
+                '.post-item a',
+                'h3 a, h2 a, h1 a'
+            ],
+            'home_url': "https://www.mpweekly.com/entertainment/",
+            'home_href_patterns': ['/entertainment/', '/article/', '/post/'],
+        }
+    if site == 'wenweipo':
+        return {
+            'source': '香港文匯報',
+            'base_url': 'https://www.wenweipo.com',
+            'search_urls': [
+                f"https://www.wenweipo.com/search?q={keyword}",
+                f"https://www.wenweipo.com/search?keyword={keyword}",
+                f"https://www.wenweipo.com/?s={keyword}"
+            ],
+            'selectors': [
+                'a[href*="/ent/"]',
+                'a[href*="/article/"]',
+                'a[href*="/news/"]',
+                '.search-result a',
+                '.article-item a',
+                'h3 a, h2 a, h1 a'
+            ],
+            'home_url': "https://www.wenweipo.com/ent",
+            'home_href_patterns': ['/ent/', '/article/', '/news/'],
+        }
+    raise ValueError(f"未知新闻站点: {site}")
+
+
+def parse_search_results(keyword, content, config):
+    """解析站内搜索结果页面：先提取内嵌JSON和HTML链接，再用CSS选择器作为备用"""
+    results = []
+    source = config['source']
+
+    # 内嵌JSON与HTML链接（线性时间提取，避免大页面上的正则回溯）
+    for title, url in extract_search_items(content, keyword):
+        url = absolute_url(config['base_url'], url)
+        if title and url:
+            results.append({
+                'title': title.strip(),
+                'url': url,
+                'source': source
+            })
+
+    # BeautifulSoup方法作为备用
+    if not results:
+        soup = BeautifulSoup(content, 'html.parser')
+        for selector in config['selectors']:
+            for article in soup.select(selector):
+                title = article.get_text().strip()
+                if keyword.lower() in title.lower() and len(title) > 10:
+                    article_url = absolute_url(config['base_url'], article.get('href', ''))
+                    if article_url and title:
+                        results.append({
+                            'title': title,
+                            'url': article_url,
+                            'source': source
+                        })
+            if results:
+                break
+
+    return results
+
+
+def parse_home_links(keyword, content, config):
+    """从站点主页/娱乐主页中查找包含关键词的链接"""
+    results = []
+
+    for link in extract_links(content):
+        text = link.text.strip()
+        title_attr = link.title.strip()
+
+        for check_text in [text, title_attr]:
+            if check_text and keyword.lower() in check_text.lower() and len(check_text) > 10:
+                href = link.href
+                if href and any(pattern in href for pattern in config['home_href_patterns']):
+                    results.append({
+                        'title': check_text,
+                        'url': absolute_url(config['base_url'], href),
+                        'source': config['source']
+                    })
+                    break
+
+    return results
+
+
+def _page_ok(response, keyword, page_filter):
+    return (response is not None and response.status_code == 200 and
+            (page_filter is None or page_filter(response, keyword)))
+
+
+def search_news_site(site, keyword, fetch, page_filter=None):
+    """按 站内搜索URL -> 主页链接 的顺序搜索明報/明周/文匯報
+
+    fetch(source, url) 返回响应或 None；page_filter(response, keyword) 可在解析前跳过不含关键词的页面
+    """
+    results = []
+    config = news_site_config(site, keyword)
+    source = config['source']
+
+    try:
+        logging.info(f"搜索{source}: {keyword}")
+
+        for search_url in config['search_urls']:
+            try:
+                response = fetch(source, search_url)
+                if _page_ok(response, keyword, page_filter):
+                    results = parse_search_results(keyword, response.text, config)
+
+                    # 如果找到结果就停止尝试其他搜索URL
+                    if results:
+                        break
+
+            except Exception as e:
+                logging.warning(f"{source}搜索URL {search_url} 失败: {str(e)}")
+                continue
+
+        # 如果搜索URL都失败，尝试从主页抓取
+        if not results:
+            try:
+                main_response = fetch(source, config['home_url'])
+                if _page_ok(main_response, keyword, page_filter):
+                    results = parse_home_links(keyword, main_response.text, config)
+            except Exception as e:
+                logging.debug(f"{source}主页抓取失败: {e}")
+
+        results = dedupe_by_url(results, 10)
+
+        logging.info(f"{source} 搜索完成，找到 {len(results)} 条结果")
+        return results
+
+    except Exception as e:
+        logging.error(f"搜索{source}时出错: {e}")
+        return results
+
+
+async def search_news_site_async(site, keyword, fetch_many, page_filter=None):
+    """明報/明周/文匯報（异步版本）- 搜索URL与主页并发抓取，按原优先级解析
+
+    await fetch_many(source, urls) 按顺序返回响应列表（失败为 None）
+    """
+    results = []
+    config = news_site_config(site, keyword)
+    source = config['source']
+
+    try:
+        logging.info(f"[异步] 搜索{source}: {keyword}")
+
+        urls = config['search_urls'] + [config['home_url']]
+        responses = await fetch_many(source, urls)
+
+        for search_url, response in zip(config['search_urls'], responses):
+            if not _page_ok(response, keyword, page_filter):
+                continue
+            try:
+                results = parse_search_results(keyword, response.text, config)
+            except Exception as e:
+                logging.warning(f"[异步] {source}搜索URL {search_url} 解析失败: {e}")
+                continue
+            if results:
+                break
+
+        home_response = responses[-1]
+        if not results and _page_ok(home_response, keyword, page_filter):
+            results = parse_home_links(keyword, home_response.text, config)
+
+        results = dedupe_by_url(results, 10)
+
+        logging.info(f"[异步] {source} 搜索完成，找到 {len(results)} 条结果")
+        return results
+
+    except Exception as e:
+        logging.error(f"[异步] 搜索{source}时出错: {e}")
+        return results
+
+
+def tvb_search_urls(keyword):
+    return [
+        f"https://www.tvb.com/search?q={keyword}",
+        f"https://www.tvb.com/search?keyword={keyword}",
+        f"https://www.tvb.com/?s={keyword}",
+        f"https://news.tvb.com/search?q={keyword}"
+    ]
+
+
+def decode_tvb_title(url):
+    """从TVB文章URL的slug中解码标题（slug格式: 标题--副标题-ID）"""
+    title_part = url.split('/')[-1]
+    if '--' in title_part:
+        title_encoded = title_part.split('--')[0]
+    else:
+        title_encoded = title_part.split('-')[0] if '-' in title_part else title_part
+
+    return unquote(title_encoded, encoding='utf-8')
+
+
+def make_tvb_result(title, url, keyword):
+    # 发布时间由各版本在去重后统一获取
+    return {
+        'title': title,
+        'url': url,
+        'source': 'TVB',
+        'keyword': keyword
+    }
+
+
+def _is_tvb_title(text):
+    """过滤页面配置/JSON数据混入的标题"""
+    return (len(text) > 10 and len(text) < 200 and
+            not text.startswith('{') and 'props' not in text.lower())
+
+
+def parse_tvb_listing(keyword, content):
+    """策略1: 解析TVB新闻列表页面，通过URL中的编码关键词识别文章"""
+    results = []
+
+    # 关键词的URL编码形式（按关键词缓存）
+    encoded_keyword = keyword_forms(keyword).quoted
+
+    for link in extract_links(content):
+        href = link.href
+
+        # 检查URL是否包含关键词（编码形式）
+        if (encoded_keyword in href or keyword in href or
+            (href and (keyword in unquote(href, encoding='utf-8', errors='ignore')))):
+
+            full_url = absolute_url(TVB_BASE_URL, href)
+
+            # 尝试从URL解码标题
+            try:
+                decoded_title = decode_tvb_title(href)
+
+                # 如果解码标题包含关键词，添加到结果
+                if keyword in decoded_title and len(decoded_title) > 5:
+                    results.append(make_tvb_result(decoded_title, full_url, keyword))
+                    logging.info(f"找到TVB新闻: {decoded_title[:40]}...")
+                    continue
+            except Exception:
+                pass
+
+            # 如果无法从URL解码，尝试从链接文本获取
+            link_text = link.text.strip()
+            if link_text and keyword.lower() in link_text.lower() and len(link_text) > 5:
+                results.append(make_tvb_result(link_text, full_url, keyword))
+                logging.info(f"找到TVB新闻: {link_text[:40]}...")
+
+    return results
+
+
+def tvb_known_url_result(keyword, test_url):
+    """策略2: 已知URL仍可访问时，从URL解码标题生成结果；解码失败使用默认标题"""
+    try:
+        decoded_title = decode_tvb_title(test_url)
+    except Exception as e:
+        logging.debug(f"解码TVB标题失败: {e}")
+        logging.info(f"验证已知TVB新闻（使用默认标题）")
+        return make_tvb_result(f'TVB新闻: {keyword}相关报道', test_url, keyword)
+    if keyword in decoded_title:
+        logging.info(f"验证已知TVB新闻: {decoded_title}")
+        return make_tvb_result(decoded_title, test_url, keyword)
+    return None
+
+
+def parse_tvb_search(keyword, content):
+    """策略3: 解析TVB搜索页面（只解析HTML结构，避免抓取JSON数据）"""
+    results = []
+    soup = BeautifulSoup(content, 'html.parser')
+
+    article_selectors = [
+        'a[href*="/news/"]',
+        'a[href*="/entertainment/"]',
+        'a[href*="/article/"]',
+        '.search-result a',
+        '.article-item a',
+        '.news-item a',
+        'h3 a, h2 a, h1 a',
+        '.news-title a',
+        '.headline a'
+    ]
+
+    for selector in article_selectors:
+        for article in soup.select(selector):
+            title = article.get_text().strip()
+            if keyword.lower() in title.lower() and _is_tvb_title(title):
+                article_url = absolute_url(TVB_BASE_URL, article.get('href', ''))
+                if article_url and title:
+                    results.append(make_tvb_result(title, article_url, keyword))
+        if results:
+            break
+
+    return results
+
+
+def parse_tvb_home(keyword, content):
+    """策略3备用: 从TVB主页查找包含关键词的链接，避免JSON数据"""
+    results = []
+
+    for link in extract_links(content):
+        text = link.text.strip()
+        title_attr = link.title.strip()
+
+        for check_text in [text, title_attr]:
+            if check_text and keyword.lower() in check_text.lower() and _is_tvb_title(check_text):
+                href = link.href
+                if href and any(pattern in href for pattern in ['/news/', '/entertainment/', '/article/']):
+                    results.append(make_tvb_result(check_text, absolute_url(TVB_BASE_URL, href), keyword))
+                    break
+
+    return results
+
+
+def oncc_dates_to_check():
+    """生成最近7天的日期字符串 (YYYYMMDD，北京时间) 用于匹配东网URL"""
+    today = datetime.now(timezone(timedelta(hours=8)))
+    return [(today - timedelta(days=i)).strftime('%Y%m%d') for i in range(7)]
+
+
+def oncc_listing_urls(dates_to_check):
+    """东网列表页面：固定频道页 + 最近3天的日期目录"""
+    oncc_urls = [
+        "https://hk.on.cc/hk/entertainment/index.html",  # 娱乐首页
+        "https://hk.on.cc/hk/bkn/cnt/entertainment/",    # BKN娱乐目录 - 重点
+        "https://hk.on.cc/hk/bkn/cnt/",                  # BKN内容目录
+        "https://hk.on.cc/hk/bkn/",                      # BKN主页
+        "https://hk.on.cc/hk/news/",                     # 新闻主页
+        "https://hk.on.cc/"                              # 主页
+    ]
+
+    # 基于日期的直接搜索：只检查最近3天，避免过多请求
+    date_based_urls = []
+    for date_str in dates_to_check[:3]:
+        date_based_urls.extend([
+            f"https://hk.on.cc/hk/bkn/cnt/entertainment/{date_str}/",
+            f"https://hk.on.cc/hk/bkn/cnt/news/{date_str}/",
+        ])
+
+    return oncc_urls + date_based_urls
+
+
+def youtube_rss_url(channel_id):
+    return f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 单次运行页面缓存
+功能: 同一次运行中每个URL只抓取一次（并发请求同一URL时等待首个请求完成），
+      页面中出现的关键词直接在原始字节上扫描一次，供所有关键词共享，未命中的页面不再解码和解析
+"""
+
+import logging
+import threading
+
+from keyword_match import KeywordMatcher
+from stream_reader import read_until
+
+
+class PageCache:
+    """线程安全的运行内响应缓存；请求异常不缓存，下次调用会重试"""
+
+    def __init__(self, session, keywords=()):
+        self.session = session
+        self._lock = threading.Lock()
+        self.reset(keywords)
+
+    def reset(self, keywords=()):
+        """开始新一轮运行：清空缓存并更新关键词列表"""
+        with self._lock:
+            self.matcher = KeywordMatcher(keywords)
+            self._responses = {}
+            self._url_locks = {}
+            self._keywords_found = {}
+            self._extra_matchers = {}
+
+    def _url_lock(self, url):
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def get(self, url, timeout=15):
+        """抓取URL；本轮已抓取过则直接返回缓存的响应"""
+        with self._url_lock(url):
+            response = self._responses.get(url)
+            if response is None:
+                response = self.session.get(url, timeout=timeout)
+                self._responses[url] = response
+            else:
+                logging.debug(f"页面缓存命中: {url}")
+            return response
+
+    def get_until(self, url, requirements, timeout=15):
+        """流式抓取URL，标记全部出现即停止（见 stream_reader.read_until）；本轮已抓取过则直接返回缓存的前缀"""
+        with self._url_lock(url):
+            key = ('prefix', url)
+            response = self._responses.get(key)
+            if response is None:
+                response = read_until(self.session, url, requirements, timeout=timeout)
+                self._responses[key] = response
+            else:
+                logging.debug(f"页面缓存命中: {url}")
+            return response
+
+    def keywords_in(self, response):
+        """返回响应原始字节中出现的监控关键词集合（同一URL的响应只扫描一次）"""
+        key = response.url
+        found = self._keywords_found.get(key)
+        if found is None:
+            found = self.matcher.find_in_bytes(response.content)
+            self._keywords_found[key] = found
+        return found
+
+    def has_keyword(self, response, keyword):
+        """字节预过滤：页面中是否可能出现 keyword（任一编码形式）；False 时可跳过解析"""
+        if keyword in self.matcher.keywords:
+            return keyword in self.keywords_in(response)
+        matcher = self._extra_matchers.get(keyword)
+        if matcher is None:
+            matcher = self._extra_matchers[keyword] = KeywordMatcher([keyword])
+        return bool(matcher.find_in_bytes(response.content))
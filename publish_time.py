@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 发布时间提取引擎
+功能: 各来源共用的文章发布时间解析——meta 标签、JSON-LD 在原始 HTML 中查找，
+      "發佈時間：…"、相对时间、日期文本只在可见文本中查找（属性值、链接和脚本中的日期不算），按优先级取最佳结果；
+      配合 stream_reader 流式读取，找到结构化或带标签的时间即关闭连接，
+      每次查询通常只下载几 KB，而不是整篇文章页面
+"""
+
+import re
+from html import unescape
+from datetime import datetime, timezone, timedelta
+
+from stream_reader import read_until
+
+BEIJING_TZ = timezone(timedelta(hours=8))
+
+HEAD_CHUNK_SIZE = 8 * 1024
+MAX_SCAN_BYTES = 512 * 1024  # 没有结构化或带标签的时间时，最多读取的字节数
+BODY_OVERLAP = 256  # 可见文本按块解析时与上一块重叠的字符数，避免标签与时间被块边界分开
+TEXT_HOLDBACK = 32  # 结束在可见文本末尾这么多字符以内的匹配（后面可能还有时钟部分）留到下一块再确认
+
+# 优先级：数值越小越可靠；同一优先级取文档中最先出现的
+PRIORITY_STRUCTURED = 0  # meta 标签 / JSON-LD / 内嵌 JSON 字段
+PRIORITY_LABELLED = 1    # 带"發佈時間"等标签的日期文本
+PRIORITY_RELATIVE = 2    # "3小时前" / "2 days ago"
+PRIORITY_DATE_TEXT = 3   # 页面中任意位置的日期文本
+
+_META_NAMES = r'(?:article:published_time|og:published_time|article:published|pubdate|publishdate|datePublished|uploadDate|video:release_date)'
+_JSON_NAMES = r'(?:datePublished|publishDate|uploadDate)'
+
+# 日期前后不能紧挨数字、字母或 URL 字符（如 "/2024/01/05/abc"、"id=20240105"）
+_DATE = (r'(?<![0-9A-Za-z_/=.%&?#-])(?P<{p}y>20\d{{2}})\s*[-/年]\s*(?P<{p}mo>1[0-2]|0?[1-9])\s*[-/月]\s*'
+         r'(?P<{p}d>3[01]|[12]\d|0?[1-9])(?![0-9A-Za-z_/])日?')
+_CLOCK = r'(?P<{p}h>2[0-3]|[01]?\d):(?P<{p}mi>[0-5]\d)(?::[0-5]\d)?'
+
+# 结构化时间：在原始 HTML 中查找
+STRUCTURED_PATTERN = re.compile('|'.join([
+    r'<meta[^>]+(?:property|name|itemprop)=["\']' + _META_NAMES + r'["\'][^>]*?content=["\'](?P<meta>[^"\']+)["\']',
+    r'<meta[^>]+content=["\'](?P<meta_rev>[^"\']+)["\'][^>]*?(?:property|name|itemprop)=["\']' + _META_NAMES + r'["\']',
+    r'"' + _JSON_NAMES + r'"\s*:\s*"(?P<json>[^"]+)"',
+    r'"publishedTimeText"\s*:\s*(?:\{"simpleText"\s*:\s*)?"(?P<rel_json>[^"]+)"',
+]), re.IGNORECASE)
+
+# 文本时间：只在可见文本中查找
+TEXT_PATTERN = re.compile('|'.join([
+    r'(?:發佈時間|發布時間|发布时间|更新時間|更新时间)\s*[：:]\s*(?:'
+    + _CLOCK.format(p='lc') + r'\s+' + _DATE.format(p='lc') + '|'
+    + _DATE.format(p='ld') + r'(?:\s+' + _CLOCK.format(p='ld') + ')?)',
+    r'(?<!\d)(?P<rel_n>\d+)\s*(?P<rel_unit>分鐘|分钟|小時|小时|天|週|周|星期|minutes?|hours?|days?|weeks?)\s*(?:前|ago)',
+    _DATE.format(p='t') + r'(?:\s+' + _CLOCK.format(p='t') + ')?',
+]), re.IGNORECASE)
+
+_RELATIVE_UNITS = {
+    '分鐘': 'minutes', '分钟': 'minutes', 'minute': 'minutes',
+    '小時': 'hours', '小时': 'hours', 'hour': 'hours',
+    '天': 'days', 'day': 'days',
+    '週': 'weeks', '周': 'weeks', '星期': 'weeks', 'week': 'weeks',
+}
+
+# 不可见内容（脚本、样式、注释；未闭合时到文本末尾）与标签（未闭合的标签到文本末尾）
+_INVISIBLE = re.compile(r'<(script|style)\b.*?(?:</\1\s*>|\Z)|<!--.*?(?:-->|\Z)', re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r'<[^>]*(?:>|\Z)')
+_WHITESPACE = re.compile(r'\s+')
+
+# 流式解析时的安全分段：不在脚本/样式/注释内部，也不在标签或文本节点中间切开
+_BLOCK_OPEN = re.compile(rb'<(script|style)\b|<!--', re.IGNORECASE)
+_BLOCK_CLOSE = {
+    b'script': re.compile(rb'</script\s*>', re.IGNORECASE),
+    b'style': re.compile(rb'</style\s*>', re.IGNORECASE),
+    None: re.compile(rb'-->'),
+}
+
+
+def parse_datetime(raw):
+    """解析 ISO 8601 / "YYYY-MM-DD HH:MM" 等时间字符串，无时区时按北京时间；失败返回 None"""
+    raw = raw.strip()
+    try:
+        value = datetime.fromisoformat(raw.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            value = datetime.strptime(raw[:16], '%Y-%m-%d %H:%M')
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=BEIJING_TZ)
+    return value.astimezone(BEIJING_TZ)
+
+
+def _parse_relative(text, now):
+    match = re.search(r'(\d+)\s*(分鐘|分钟|小時|小时|天|週|周|星期|minute|hour|day|week)', text, re.IGNORECASE)
+    if not match:
+        return None
+    unit = _RELATIVE_UNITS[match.group(2).lower()]
+    return now - timedelta(**{unit: int(match.group(1))})
+
+
+def _date_from_groups(groups, prefix):
+    try:
+        return datetime(int(groups[prefix + 'y']), int(groups[prefix + 'mo']), int(groups[prefix + 'd']),
+                        int(groups.get(prefix + 'h') or 0), int(groups.get(prefix + 'mi') or 0),
+                        tzinfo=BEIJING_TZ)
+    except (TypeError, ValueError):
+        return None
+
+
+def _structured_value(match, now):
+    groups = match.groupdict()
+    raw = groups['meta'] or groups['meta_rev'] or groups['json']
+    if raw:
+        return parse_datetime(raw)
+    # YouTube 的 publishedTimeText 可能是相对时间，也可能是日期
+    return _parse_relative(groups['rel_json'], now) or parse_datetime(groups['rel_json'])
+
+
+def _text_value(match, now):
+    """把可见文本中的一个匹配转换为 (优先级, 北京时间)，无法解析返回 None"""
+    groups = match.groupdict()
+    if groups['lcy'] or groups['ldy']:
+        value = _date_from_groups(groups, 'lc' if groups['lcy'] else 'ld')
+        return (PRIORITY_LABELLED, value) if value else None
+    if groups['rel_n']:
+        value = _parse_relative(match.group(0), now)
+        return (PRIORITY_RELATIVE, value) if value else None
+    value = _date_from_groups(groups, 't')
+    return (PRIORITY_DATE_TEXT, value) if value else None
+
+
+def visible_text(html):
+    """去掉脚本、样式、注释和标签（属性值随标签一起去掉），返回解码实体、合并空白后的可见文本"""
+    return _WHITESPACE.sub(' ', unescape(_TAG.sub(' ', _INVISIBLE.sub(' ', html))))
+
+
+def _find_structured(html, now):
+    for match in STRUCTURED_PATTERN.finditer(html):
+        value = _structured_value(match, now)
+        if value:
+            return PRIORITY_STRUCTURED, value
+    return None
+
+
+def _find_in_text(text, now, max_priority, limit=None):
+    """可见文本中优先级不低于 max_priority 的最佳时间；找到带标签的时间即返回。limit: 只接受在此位置之前结束的匹配"""
+    best = None
+    for match in TEXT_PATTERN.finditer(text):
+        if limit is not None and match.end() > limit:
+            break
+        found = _text_value(match, now)
+        if found is None or found[0] > max_priority:
+            continue
+        if found[0] == PRIORITY_LABELLED:
+            return found
+        if best is None or found[0] < best[0]:
+            best = found
+    return best
+
+
+def find_publish_time(text, now=None, max_priority=PRIORITY_LABELLED):
+    """在 HTML（或纯文本）中查找发布时间，返回 (优先级, 北京时间 datetime)；没有找到返回 None
+
+    结构化时间（meta / JSON-LD）在原始 HTML 中查找，找到即返回；其余格式只在可见文本中查找。
+    max_priority 为可接受的最低可靠程度：默认只接受结构化和带标签的时间，
+    PRIORITY_RELATIVE / PRIORITY_DATE_TEXT 才会回退到相对时间和任意日期文本。
+    """
+    now = now or datetime.now(BEIJING_TZ)
+    found = _find_structured(text, now)
+    if found is None and max_priority >= PRIORITY_LABELLED:
+        found = _find_in_text(visible_text(text), now, max_priority)
+    return found
+
+
+def parse_publish_time(text, now=None, max_priority=PRIORITY_LABELLED):
+    """在页面文本中查找发布时间，返回北京时间 datetime，找不到返回 None"""
+    found = find_publish_time(text, now, max_priority)
+    return found[1] if found else None
+
+
+def _safe_end(buffer, start, end):
+    """buffer[start:end] 中可以安全解析到的位置：最后一个 '>' 之后，且不在未闭合的脚本/样式/注释内部"""
+    limit = end
+    position = start
+    while True:
+        opener = _BLOCK_OPEN.search(buffer, position, end)
+        if opener is None:
+            break
+        name = opener.group(1).lower() if opener.group(1) else None
+        closer = _BLOCK_CLOSE[name].search(buffer, opener.end(), end)
+        if closer is None:
+            limit = opener.start()
+            break
+        position = closer.end()
+    return max(start, buffer.rfind(b'>', start, limit) + 1)
+
+
+class PublishTimeScanner:
+    """供 stream_reader.read_until / AsyncFetcher.get_until 使用的扫描器：边下载边解析发布时间
+
+    - 每读到一块数据就解析到最后一个完整的标签为止（未闭合的脚本等到闭合后再解析）
+    - 找到结构化或带标签的时间即完成；只有相对时间或日期文本时继续读取，
+      读完或达到 max_bytes 后才回退到其中最好的结果（受 max_priority 限制）
+    """
+
+    def __init__(self, max_bytes=MAX_SCAN_BYTES, now=None, max_priority=PRIORITY_LABELLED):
+        self.buffer = bytearray()
+        self.max_bytes = max_bytes
+        self.max_priority = max_priority
+        self.now = now or datetime.now(BEIJING_TZ)
+        self._found = None
+        self._parsed = 0  # 已解析到的位置
+        self._text_tail = ''  # 上一段可见文本的末尾
+        self._done = False
+
+    @property
+    def done(self):
+        return self._done
+
+    def _parse_until(self, end, final=False):
+        # final: 读取结束，留待下一块确认的末尾匹配也要处理
+        if end <= self._parsed and not final:
+            return
+        html = bytes(self.buffer[self._parsed:end]).decode('utf-8', errors='ignore')
+        self._parsed = end
+        found = _find_structured(html, self.now)
+        if found is None and self.max_priority >= PRIORITY_LABELLED:
+            # 末尾 TEXT_HOLDBACK 个字符内结束的匹配会随重叠部分在下一块中重新匹配
+            text = self._text_tail + visible_text(html)
+            self._text_tail = text[-BODY_OVERLAP:]
+            found = _find_in_text(text, self.now, self.max_priority,
+                                  limit=None if final else len(text) - TEXT_HOLDBACK)
+        if found and (self._found is None or found[0] < self._found[0]):
+            self._found = found
+
+    def feed(self, chunk):
+        """追加一块数据，返回是否已找到可靠的发布时间（或已达到读取上限）"""
+        self.buffer += chunk
+        self._parse_until(_safe_end(self.buffer, self._parsed, len(self.buffer)))
+        if self._found is not None and self._found[0] <= PRIORITY_LABELLED:
+            self._done = True
+        elif len(self.buffer) >= self.max_bytes:
+            self._done = True
+        return self._done
+
+    @property
+    def publish_time(self):
+        """已读取内容中找到的发布时间（北京时间），没有返回 None；会先解析尚未解析的剩余部分"""
+        self._parse_until(len(self.buffer), final=True)
+        return self._found[1] if self._found else None
+
+
+def iso_and_readable(publish_time):
+    """返回 (ISO时间, 北京时间可读格式)，publish_time 为 None 时返回 (None, None)"""
+    if publish_time is None:
+        return None, None
+    return publish_time.isoformat(), publish_time.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def fetch_publish_time(session, url, timeout=10, max_bytes=MAX_SCAN_BYTES, max_priority=PRIORITY_LABELLED):
+    """流式读取文章页并返回发布时间（北京时间），页面不可访问或没有时间返回 None，网络错误直接抛出"""
+    scanner = PublishTimeScanner(max_bytes=max_bytes, max_priority=max_priority)
+    response = read_until(session, url, scanner, timeout=timeout, chunk_size=HEAD_CHUNK_SIZE)
+    if response.status_code != 200:
+        return None
+    return scanner.publish_time
+
+
+async def fetch_publish_time_async(fetcher, url, timeout=10, max_bytes=MAX_SCAN_BYTES, max_priority=PRIORITY_LABELLED):
+    """fetch_publish_time 的异步版本（使用 AsyncFetcher）"""
+    scanner = PublishTimeScanner(max_bytes=max_bytes, max_priority=max_priority)
+    response = await fetcher.get_until(url, scanner, timeout=timeout, chunk_size=HEAD_CHUNK_SIZE)
+    if response.status_code != 200:
+        return None
+    return scanner.publish_time
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 搜索结果提取
+功能: 以线性时间从搜索页中提取 (标题, 链接)，替代原先在整页上运行的 [^}]* / .*?(DOTALL) 正则：
+      - 内嵌 JSON: 从关键词出现的位置出发，在有界窗口内定位所在的扁平对象及其 title/url 字段
+      - HTML: 基于 extract_links 的链接流，检查链接文本节点和 title 属性
+      每个关键词出现位置只做窗口大小以内的工作，大段内联脚本不会再引发灾难性回溯
+      （Python 3.11 的 re 虽已支持占有量词和固化分组，但它们只消除单次尝试内的回溯：
+      正则搜索仍要从每个 '{' / '<a' 位置各尝试一次，未闭合时整体仍是平方级，且 .*? 跨元素配对的问题依旧）
+"""
+
+import re
+from functools import lru_cache
+
+from keyword_match import keyword_forms, keyword_regex
+from link_extract import extract_links
+
+# 关键词出现位置向两侧查找所在 JSON 对象的最大距离（字符）
+JSON_WINDOW = 4096
+
+
+@lru_cache(maxsize=None)
+def _field_pattern(key):
+    """"key": "value" 形式的字段；[^"]* 后紧跟 " 不会回溯"""
+    return re.compile(r'"%s":\s*"([^"]*)"' % re.escape(key), re.IGNORECASE)
+
+
+def _key_precedes(text, lo, quote_pos, key):
+    """quote_pos 处的字符串值是否紧跟在 "key": 之后（允许中间有空白）"""
+    end = quote_pos
+    while end > lo and text[end - 1].isspace():
+        end -= 1
+    return text.endswith(f'"{key}":', lo, end)
+
+
+def extract_json_items(text, keyword, url_key='url', title_key='title', require_object=True, window=JSON_WINDOW):
+    """提取内嵌 JSON 中标题包含关键词（大小写不敏感）的 (标题, 链接)
+
+    标题和链接必须位于同一个扁平对象片段内（两者之间没有 '}'）；require_object 为 True 时片段还必须以 '{' 开始、
+    以 '}' 结束。链接优先取标题之后最近的字段，其次取标题之前最近的字段。
+    """
+    items = []
+    seen_titles = set()
+    url_pattern = _field_pattern(url_key)
+
+    for match in keyword_regex('{keyword}', keyword, re.IGNORECASE).finditer(text):
+        start, end = match.span()
+        lo = max(0, start - window)
+        hi = min(len(text), end + window)
+
+        # 关键词所在的字符串值
+        open_quote = text.rfind('"', lo, start)
+        close_quote = text.find('"', end, hi)
+        if open_quote < 0 or close_quote < 0 or open_quote in seen_titles:
+            continue
+        if not _key_precedes(text, lo, open_quote, title_key):
+            continue
+
+        # 所在的扁平对象片段：上一个 '}' 之后到下一个 '}' 之前
+        segment_start = text.rfind('}', lo, open_quote) + 1 or lo
+        segment_end = text.find('}', close_quote, hi)
+        if require_object:
+            segment_start = text.find('{', segment_start, open_quote)
+            if segment_start < 0 or segment_end < 0:
+                continue
+        elif segment_end < 0:
+            segment_end = hi
+
+        url_match = url_pattern.search(text, close_quote + 1, segment_end)
+        if url_match is None:
+            before = list(url_pattern.finditer(text, segment_start, open_quote))
+            url_match = before[-1] if before else None
+        if url_match is None:
+            continue
+
+        seen_titles.add(open_quote)
+        items.append((text[open_quote + 1:close_quote], url_match.group(1)))
+    return items
+
+
+def extract_anchor_items(content, keyword):
+    """提取链接内文本节点或 title 属性包含关键词的 (标题, 链接)；标题可以直接写在 <a> 里，也可以包在子元素里"""
+    lower = keyword_forms(keyword).lower
+    text_items, title_items = [], []
+    for link in extract_links(content):
+        if not link.href:
+            continue
+        for part in link.parts:
+            if lower in part.lower():
+                text_items.append((part, link.href))
+                break
+        if lower in link.title.lower():
+            title_items.append((link.title, link.href))
+    return text_items + title_items
+
+
+def extract_search_items(content, keyword, url_key='url'):
+    """搜索结果页：先取内嵌 JSON 中的条目，再取 HTML 链接"""
+    return extract_json_items(content, keyword, url_key=url_key) + extract_anchor_items(content, keyword)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 流式 Sitemap 读取器
+功能: 用 iterparse 边下载边解析 sitemap（支持 sitemap 索引与 .xml.gz），逐个清理元素，
+      用堆只保留最新的 k 条，避免把整个大文件读入内存后再排序
+"""
+
+import io
+import gzip
+import heapq
+import logging
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone, timedelta
+
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+BEIJING_TZ = timezone(timedelta(hours=8))
+
+
+def parse_lastmod(text, default_tz=BEIJING_TZ):
+    """解析 sitemap 的 lastmod（W3C 日期时间），失败返回 None"""
+    if not text:
+        return None
+    try:
+        value = datetime.fromisoformat(text.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=default_tz)
+    return value.astimezone(default_tz)
+
+
+def open_xml_stream(fileobj, url=''):
+    """包装输入流：自动识别 gzip（.xml.gz 或 gzip 魔数）"""
+    buffered = fileobj if isinstance(fileobj, io.BufferedReader) else io.BufferedReader(fileobj)
+    if url.endswith('.gz') or buffered.peek(2)[:2] == b'\x1f\x8b':
+        return gzip.GzipFile(fileobj=buffered)
+    return buffered
+
+
+def scan_sitemap(fileobj, k, url_filter=None, since=None, fallback_time=None):
+    """流式扫描单个 sitemap 或 sitemap 索引
+
+    返回 (top_entries, child_sitemaps)：
+      top_entries    - 按 lastmod 倒序的最多 k 个 (url, lastmod)，只包含通过 url_filter 且晚于 since 的条目
+      child_sitemaps - 若为索引文件，返回晚于 since（或无 lastmod）的子 sitemap [(url, lastmod)]
+    lastmod 缺失或无法解析时调用 fallback_time(url) 取得替代时间，返回 None 则跳过该条目
+    """
+    heap = []  # 最小堆，堆顶是当前保留条目中最旧的一条
+    child_sitemaps = []
+    sequence = 0  # 时间相同时保持稳定顺序
+    root = None
+
+    for event, elem in ET.iterparse(fileobj, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            continue
+
+        if elem.tag not in (SITEMAP_NS + 'url', SITEMAP_NS + 'sitemap'):
+            continue
+
+        loc = (elem.findtext(SITEMAP_NS + 'loc') or '').strip()
+        lastmod = parse_lastmod(elem.findtext(SITEMAP_NS + 'lastmod'))
+
+        if loc and elem.tag == SITEMAP_NS + 'sitemap':
+            if lastmod is None or since is None or lastmod > since:
+                child_sitemaps.append((loc, lastmod))
+        elif loc and (url_filter is None or url_filter(loc)):
+            if lastmod is None and fallback_time is not None:
+                lastmod = fallback_time(loc)
+            if lastmod is not None and (since is None or lastmod > since):
+                sequence += 1
+                item = (lastmod, -sequence, loc)
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+        # 已处理的元素立即释放，保持内存占用与文件大小无关
+        elem.clear()
+        if root is not None:
+            root.clear()
+
+    top_entries = [(loc, lastmod) for lastmod, _, loc in sorted(heap, reverse=True)]
+    return top_entries, child_sitemaps
+
+
+def newest_child_sitemaps(child_sitemaps, n):
+    """按 lastmod 倒序取前 n 个子 sitemap（无 lastmod 的视为最新）"""
+    latest = datetime.max.replace(tzinfo=BEIJING_TZ)
+    return sorted(child_sitemaps, key=lambda c: c[1] or latest, reverse=True)[:n]
+
+
+def merge_top_entries(entry_lists, k):
+    """合并多个子 sitemap 的结果，保留最新的 k 条"""
+    return heapq.nlargest(k, (entry for entries in entry_lists for entry in entries), key=lambda e: e[1])
+
+
+class SitemapReader:
+    """基于 requests.Session 的流式 sitemap 读取器"""
+
+    def __init__(self, session, timeout=15, max_children=5):
+        self.session = session
+        self.timeout = timeout
+        self.max_children = max_children  # 索引文件最多展开的子 sitemap 数
+
+    def _scan_url(self, url, k, url_filter, since, fallback_time):
+        response = self.session.get(url, timeout=self.timeout, stream=True)
+        try:
+            if response.status_code != 200:
+                logging.warning(f"Sitemap 请求失败 {url}: HTTP {response.status_code}")
+                return [], []
+            response.raw.decode_content = True  # 处理 Content-Encoding: gzip
+            return scan_sitemap(open_xml_stream(response.raw, url), k, url_filter, since, fallback_time)
+        finally:
+            response.close()
+
+    def read_top(self, url, k, url_filter=None, since=None, fallback_time=None):
+        """读取 sitemap（或索引）中最新的 k 条 (url, lastmod)，按时间倒序"""
+        top_entries, child_sitemaps = self._scan_url(url, k, url_filter, since, fallback_time)
+        if not child_sitemaps:
+            return top_entries
+
+        # 索引文件：只展开最新的若干个子 sitemap
+        entry_lists = [top_entries]
+        for child_url, _ in newest_child_sitemaps(child_sitemaps, self.max_children):
+            try:
+                entry_lists.append(self._scan_url(child_url, k, url_filter, since, fallback_time)[0])
+            except Exception as e:
+                logging.warning(f"读取子 Sitemap 失败 {child_url}: {e}")
+        return merge_top_entries(entry_lists, k)
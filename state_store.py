@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 持久化状态存储
+功能: 基于 SQLite (WAL 模式) 保存跨运行的状态（水位线、已发现新闻、缓存等），支持多个机器人进程并发访问
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+
+DEFAULT_DB_PATH = os.path.join('.', 'results', 'vvnews_state.db')
+
+
+class StateStore:
+    """跨进程共享的键值状态存储：按 (namespace, key) 保存 JSON 值，支持过期时间"""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.getenv('VVNEWS_STATE_DB', DEFAULT_DB_PATH)
+        self._local = threading.local()
+        self._uri = False
+
+        try:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            self._init_schema()
+        except (OSError, sqlite3.Error) as e:
+            # 磁盘不可写时退回进程内共享内存数据库，保证机器人照常运行
+            logging.warning(f"状态数据库不可用，改用内存存储: {self.db_path} -> {e}")
+            self.db_path = 'file:vvnews_state?mode=memory&cache=shared'
+            self._uri = True
+            self._local = threading.local()
+            self._init_schema()
+
+    def _conn(self):
+        """每个线程使用独立连接（sqlite3 连接不能跨线程共享）"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, uri=self._uri)
+            if not self._uri:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        self._conn().execute('''
+            CREATE TABLE IF NOT EXISTS kv (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        ''')
+        # 已发现新闻：按规范化 URL 索引，跨进程去重
+        self._conn().execute('''
+            CREATE TABLE IF NOT EXISTS seen_items (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                source TEXT,
+                first_seen REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        ''')
+        self._conn().execute('CREATE INDEX IF NOT EXISTS idx_seen_expires ON seen_items (expires_at)')
+        # 已通知标题的 LSH 桶：近似重复检测只读取同桶候选
+        self._conn().execute('''
+            CREATE TABLE IF NOT EXISTS title_bands (
+                band_key TEXT NOT NULL,
+                url TEXT NOT NULL,
+                title TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (band_key, url)
+            )
+        ''')
+        self._conn().execute('CREATE INDEX IF NOT EXISTS idx_title_bands_url ON title_bands (url)')
+
+    def get(self, namespace, key, default=None):
+        """读取值；不存在或已过期返回 default"""
+        try:
+            row = self._conn().execute(
+                'SELECT value, expires_at FROM kv WHERE namespace = ? AND key = ?',
+                (namespace, key)).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"读取状态失败 {namespace}/{key}: {e}")
+            return default
+        if row is None:
+            return default
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return default
+        return json.loads(value)
+
+    def set(self, namespace, key, value, ttl=None):
+        """写入值；ttl 为过期秒数，None 表示永久保存"""
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        try:
+            self._conn().execute(
+                'INSERT OR REPLACE INTO kv (namespace, key, value, expires_at, updated_at) VALUES (?, ?, ?, ?, ?)',
+                (namespace, key, json.dumps(value, ensure_ascii=False), expires_at, now))
+        except sqlite3.Error as e:
+            logging.warning(f"写入状态失败 {namespace}/{key}: {e}")
+
+    def compare_and_set(self, namespace, key, expected, value, ttl=None):
+        """原子地比较并写入：当前值（未过期）等于 expected 时写入 value 并返回 True，否则返回 False
+
+        多个线程或机器人进程同时修改同一个键时只有一个能成功。数据库不可用时返回 False。
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        try:
+            cursor = self._conn().execute(
+                'UPDATE kv SET value = ?, expires_at = ?, updated_at = ? '
+                'WHERE namespace = ? AND key = ? AND value = ? AND (expires_at IS NULL OR expires_at > ?)',
+                (json.dumps(value, ensure_ascii=False), expires_at, now,
+                 namespace, key, json.dumps(expected, ensure_ascii=False), now))
+            return cursor.rowcount == 1
+        except sqlite3.Error as e:
+            logging.warning(f"比较并写入状态失败 {namespace}/{key}: {e}")
+            return False
+
+    def delete(self, namespace, key):
+        try:
+            self._conn().execute('DELETE FROM kv WHERE namespace = ? AND key = ?', (namespace, key))
+        except sqlite3.Error as e:
+            logging.warning(f"删除状态失败 {namespace}/{key}: {e}")
+
+    def purge_expired(self):
+        """清理已过期的记录，返回删除条数"""
+        now = time.time()
+        try:
+            conn = self._conn()
+            deleted = conn.execute(
+                'DELETE FROM kv WHERE expires_at IS NOT NULL AND expires_at <= ?', (now,)).rowcount
+            deleted += conn.execute('DELETE FROM seen_items WHERE expires_at <= ?', (now,)).rowcount
+            deleted += conn.execute('DELETE FROM title_bands WHERE expires_at <= ?', (now,)).rowcount
+            return deleted
+        except sqlite3.Error as e:
+            logging.warning(f"清理过期状态失败: {e}")
+            return 0
+
+    def claim_seen(self, url, ttl, title='', source=''):
+        """原子登记一条新闻：首次出现（或旧记录已过期）返回 True，已登记过返回 False
+
+        多个机器人进程同时运行时，同一 URL 只有一个进程能登记成功。
+        数据库不可用时返回 True（宁可重复通知也不漏发）。
+        """
+        now = time.time()
+        try:
+            conn = self._conn()
+            conn.execute('DELETE FROM seen_items WHERE url = ? AND expires_at <= ?', (url, now))
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO seen_items (url, title, source, first_seen, expires_at) VALUES (?, ?, ?, ?, ?)',
+                (url, title, source, now, now + ttl))
+            return cursor.rowcount == 1
+        except sqlite3.Error as e:
+            logging.warning(f"登记新闻失败 {url}: {e}")
+            return True
+
+    def release_seen(self, urls):
+        """撤销登记（例如邮件发送失败），下次运行可重新通知"""
+        try:
+            self._conn().executemany('DELETE FROM seen_items WHERE url = ?', [(url,) for url in urls])
+        except sqlite3.Error as e:
+            logging.warning(f"撤销新闻登记失败: {e}")
+
+    def add_title(self, url, title, band_keys, ttl):
+        """登记已通知新闻的标题及其 LSH 桶"""
+        expires_at = time.time() + ttl
+        try:
+            self._conn().executemany(
+                'INSERT OR REPLACE INTO title_bands (band_key, url, title, expires_at) VALUES (?, ?, ?, ?)',
+                [(key, url, title, expires_at) for key in band_keys])
+        except sqlite3.Error as e:
+            logging.warning(f"登记标题失败 {url}: {e}")
+
+    def find_titles(self, band_keys):
+        """返回与任一桶相同的未过期标题 [(url, title)]"""
+        if not band_keys:
+            return []
+        placeholders = ','.join('?' * len(band_keys))
+        try:
+            return self._conn().execute(
+                f'SELECT DISTINCT url, title FROM title_bands WHERE band_key IN ({placeholders}) AND expires_at > ?',
+                (*band_keys, time.time())).fetchall()
+        except sqlite3.Error as e:
+            logging.warning(f"查询标题失败: {e}")
+            return []
+
+    def release_titles(self, urls):
+        """撤销标题登记（例如邮件发送失败）"""
+        try:
+            self._conn().executemany('DELETE FROM title_bands WHERE url = ?', [(url,) for url in urls])
+        except sqlite3.Error as e:
+            logging.warning(f"撤销标题登记失败: {e}")
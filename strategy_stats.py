@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 自适应策略排序
+功能: 记录每个来源各个搜索策略的命中数与耗时（指数移动平均，持久化到状态存储），
+      按“每秒期望命中数”重新排列策略级联，让每个来源逐渐收敛到最便宜且有效的路径
+"""
+
+import random
+import logging
+
+
+class StrategyStats:
+    """按 (来源, 策略) 统计命中率与耗时，并给出级联顺序"""
+
+    NAMESPACE = 'strategy_stats'
+
+    def __init__(self, state, alpha=0.3, min_runs=3, explore_rate=0.1, min_seconds=0.5):
+        self.state = state
+        self.alpha = alpha  # 移动平均权重，越大越看重最近几次运行
+        self.min_runs = min_runs  # 样本不足的策略保持默认位置
+        self.explore_rate = explore_rate  # 按默认顺序运行的概率，让排在后面的策略偶尔更新统计
+        self.min_seconds = min_seconds  # 耗时下限，避免极快的失败请求得到过高分数
+
+    def _key(self, source, strategy):
+        return f'{source}|{strategy}'
+
+    def get(self, source, strategy):
+        return self.state.get(self.NAMESPACE, self._key(source, strategy)) or {
+            'runs': 0, 'hits': 0.0, 'seconds': 0.0}
+
+    def record(self, source, strategy, hits, seconds):
+        """记录一次策略执行：命中条数与耗时(秒)"""
+        stats = self.get(source, strategy)
+        if stats['runs'] == 0:
+            stats['hits'], stats['seconds'] = float(hits), float(seconds)
+        else:
+            stats['hits'] += self.alpha * (hits - stats['hits'])
+            stats['seconds'] += self.alpha * (seconds - stats['seconds'])
+        stats['runs'] += 1
+        self.state.set(self.NAMESPACE, self._key(source, strategy), stats)
+
+    def score(self, stats):
+        """每秒期望命中数"""
+        return stats['hits'] / max(stats['seconds'], self.min_seconds)
+
+    def order(self, source, strategies):
+        """返回重新排序后的 [(策略名, 可调用对象)]
+
+        样本足够的策略按分数从高到低排列；样本不足的策略保留在默认位置，保证冷启动时行为不变。
+        """
+        strategies = list(strategies)
+        if random.random() < self.explore_rate:
+            return strategies
+
+        measured = []
+        for position, (name, _) in enumerate(strategies):
+            stats = self.get(source, name)
+            if stats['runs'] >= self.min_runs:
+                measured.append((position, self.score(stats)))
+
+        # 只在已测量的位置之间交换，未测量的策略位置不变
+        positions = [position for position, _ in measured]
+        ranked = sorted(measured, key=lambda m: (-m[1], m[0]))
+        ordered = list(strategies)
+        for position, (original, _) in zip(positions, ranked):
+            ordered[position] = strategies[original]
+
+        if ordered != strategies:
+            logging.info(f"{source} 策略顺序: {' -> '.join(name for name, _ in ordered)}")
+        return ordered
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews 流式页面读取
+功能: 分块下载页面并增量查找所需的标记（如 "publishDate":"…"、ytInitialData 脚本结束处），
+      所有标记都已出现时立即关闭连接，只保留已读取的前缀，大页面不再整页下载和驻留内存
+"""
+
+import logging
+
+from async_fetch import FetchResponse
+
+CHUNK_SIZE = 64 * 1024
+MAX_PAGE_BYTES = 8 * 1024 * 1024  # 找不到标记时最多读取的字节数
+
+
+class MarkerScanner:
+    """增量查找若干组标记：每组是按顺序出现的字节串序列（如 (开始标记, 结束标记)），所有组都找到即完成"""
+
+    def __init__(self, requirements):
+        self.buffer = bytearray()
+        # 每组的 [标记序列, 下一个待找标记的下标, 下次查找的起始位置]
+        self._progress = [[tuple(markers), 0, 0] for markers in requirements]
+
+    @property
+    def done(self):
+        return all(index == len(markers) for markers, index, _ in self._progress)
+
+    def feed(self, chunk):
+        """追加一块数据，返回是否所有标记都已找到（每个字节只被每组标记扫描一次）"""
+        self.buffer += chunk
+        for progress in self._progress:
+            markers, index, position = progress
+            while index < len(markers):
+                found = self.buffer.find(markers[index], position)
+                if found < 0:
+                    # 标记可能跨块：下次从可能的起点继续
+                    position = max(position, len(self.buffer) - len(markers[index]) + 1)
+                    break
+                position = found + len(markers[index])
+                index += 1
+            progress[1], progress[2] = index, position
+        return self.done
+
+
+def make_scanner(requirements):
+    """requirements 为标记组列表时创建 MarkerScanner；已经是扫描器（带 feed() 和 buffer，如 PublishTimeScanner）时原样返回"""
+    return requirements if hasattr(requirements, 'feed') else MarkerScanner(requirements)
+
+
+def _response_encoding(response):
+    return response.encoding if response.encoding != 'ISO-8859-1' else None
+
+
+def read_until(session, url, requirements, timeout=15, max_bytes=MAX_PAGE_BYTES, chunk_size=CHUNK_SIZE):
+    """流式抓取 url，直到 requirements 中的标记全部出现（或读完/达到 max_bytes）
+
+    requirements 也可以是扫描器对象（见 make_scanner），由其 feed() 决定何时停止。
+    返回 FetchResponse，content 为已读取的前缀；truncated 属性只在达到 max_bytes 而页面还有剩余内容时为 True
+    （标记全部找到而提前结束、或恰好读完整个页面时为 False）。
+    """
+    response = session.get(url, timeout=timeout, stream=True)
+    try:
+        scanner = make_scanner(requirements)
+        truncated = False
+        if response.status_code == 200:
+            for chunk in response.iter_content(chunk_size):
+                if len(scanner.buffer) >= max_bytes:
+                    # 已达上限且还有后续数据：页面被截断
+                    truncated = True
+                    break
+                if scanner.feed(chunk):
+                    break
+        result = FetchResponse(response.url, response.status_code, bytes(scanner.buffer),
+                               _response_encoding(response), dict(response.headers))
+        result.truncated = truncated
+        if truncated:
+            logging.debug(f"流式读取达到上限 {url}: 已读取 {len(scanner.buffer) // 1024} KB")
+        return result
+    finally:
+        # 提前结束时关闭连接（剩余内容不再下载）
+        response.close()
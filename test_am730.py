@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""am730 测试（vvnews_bot.py）：候选文章的发布时间经文章元数据缓存并发获取，按候选顺序取时间窗口内的结果"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+import vvnews_bot
+from publish_time import BEIJING_TZ
+
+KEYWORD = '王敏奕'
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.setenv('VVNEWS_STATE_DB', str(tmp_path / 'state.db'))
+    return vvnews_bot.VVNewsBot()
+
+
+def recent():
+    return (datetime.now(BEIJING_TZ) - timedelta(hours=1)).isoformat()
+
+
+def old():
+    return (datetime.now(BEIJING_TZ) - timedelta(days=10)).isoformat()
+
+
+def links(*names):
+    return [(f'{KEYWORD}{name}新聞標題', f'https://www.am730.com.hk/{name}') for name in names]
+
+
+def test_publish_times_are_cached_including_pages_without_a_time(bot, monkeypatch):
+    records = {'a': {'publish_time': recent()}, 'b': None, 'c': {'publish_time': old()}}
+    loads = []
+    lock = threading.Lock()
+
+    def load(url, timeout):
+        with lock:
+            loads.append(url)
+        return records[url.rsplit('/', 1)[-1]]
+
+    monkeypatch.setattr(bot, '_load_article_publish_time', load)
+
+    first = bot._collect_am730_results(KEYWORD, links('a', 'b', 'c'), 6, set())
+    second = bot._collect_am730_results(KEYWORD, links('a', 'b', 'c'), 6, set())
+
+    assert [r['url'] for r in first] == ['https://www.am730.com.hk/a']
+    assert second == first
+    assert sorted(loads) == sorted(url for _, url in links('a', 'b', 'c'))
+
+
+def test_network_errors_are_not_cached(bot, monkeypatch):
+    calls = []
+
+    def load(url, timeout):
+        calls.append(url)
+        if len(calls) == 1:
+            raise ConnectionError('boom')
+        return {'publish_time': recent()}
+
+    monkeypatch.setattr(bot, '_load_article_publish_time', load)
+
+    assert bot._collect_am730_results(KEYWORD, links('a'), 6, set()) == []
+    assert len(bot._collect_am730_results(KEYWORD, links('a'), 6, set())) == 1
+    assert len(calls) == 2
+
+
+def test_results_keep_candidate_order_and_skip_seen_urls(bot, monkeypatch):
+    monkeypatch.setattr(bot, '_load_article_publish_time', lambda url, timeout: {'publish_time': recent()})
+    seen = {'https://www.am730.com.hk/b'}
+
+    results = bot._collect_am730_results(KEYWORD, links('a', 'b', 'c', 'a', 'd'), 2, seen)
+
+    assert [r['url'] for r in results] == ['https://www.am730.com.hk/a', 'https://www.am730.com.hk/c']
+    assert 'https://www.am730.com.hk/c' in seen
+
+
+def test_async_path_shares_the_cache(bot, monkeypatch):
+    monkeypatch.setattr(bot, '_load_article_publish_time', lambda url, timeout: {'publish_time': recent()})
+    bot._collect_am730_results(KEYWORD, links('a'), 6, set())
+
+    async def load_async(url, fetcher, timeout):
+        raise AssertionError('cached article fetched again')
+
+    monkeypatch.setattr(bot, '_load_article_publish_time_async', load_async)
+
+    results = asyncio.run(bot._collect_am730_results_async(KEYWORD, links('a'), 6, set(), fetcher=None))
+
+    assert [r['url'] for r in results] == ['https://www.am730.com.hk/a']
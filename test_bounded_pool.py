@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""bounded_pool 测试：iter_bounded / gather_bounded 的顺序、错误、时限与取消"""
+
+import asyncio
+import threading
+import time
+
+from bounded_pool import iter_bounded, gather_bounded
+
+
+def test_iter_bounded_yields_in_input_order_with_errors():
+    def work(n):
+        time.sleep(0.01 * (5 - n))
+        if n == 2:
+            raise ValueError('boom')
+        return n * 10
+
+    out = list(iter_bounded(work, range(5), max_workers=3))
+    assert [item for item, _, _ in out] == [0, 1, 2, 3, 4]
+    assert [result for _, result, _ in out] == [0, 10, None, 30, 40]
+    assert isinstance(out[2][2], ValueError)
+
+
+def test_iter_bounded_limits_concurrency():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def work(n):
+        with lock:
+            running.append(n)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(n)
+        return n
+
+    list(iter_bounded(work, range(8), max_workers=2))
+    assert max(peak) <= 2
+
+
+def test_iter_bounded_deadline_drops_slow_items():
+    out = list(iter_bounded(lambda n: time.sleep(0.5 if n else 0) or n, [0, 1, 2], max_workers=3, deadline=0.1))
+    assert [item for item, _, _ in out] == [0]
+
+
+def test_gather_bounded_order_errors_and_limit():
+    state = {'running': 0, 'peak': 0}
+
+    async def work(n):
+        state['running'] += 1
+        state['peak'] = max(state['peak'], state['running'])
+        await asyncio.sleep(0.01 * (4 - n))
+        state['running'] -= 1
+        if n == 1:
+            raise KeyError(n)
+        return n
+
+    out = asyncio.run(gather_bounded(work, range(4), max_workers=2))
+    assert [(item, result) for item, result, _ in out] == [(0, 0), (1, None), (2, 2), (3, 3)]
+    assert isinstance(out[1][2], KeyError)
+    assert state['peak'] <= 2
+
+
+def test_gather_bounded_awaits_cancelled_tasks_on_deadline():
+    finished = []
+
+    async def work(n):
+        try:
+            await asyncio.sleep(0 if n == 0 else 5)
+            return n
+        finally:
+            finished.append(n)
+
+    async def main():
+        out = await gather_bounded(work, range(3), max_workers=3, deadline=0.05)
+        # 返回时被取消的任务已经执行完清理代码，而不是留在事件循环中
+        assert sorted(finished) == [0, 1, 2]
+        assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+        return out
+
+    out = asyncio.run(main())
+    assert [item for item, _, _ in out] == [0]
+
+
+def test_gather_bounded_cancels_tasks_when_caller_is_cancelled():
+    finished = []
+
+    async def work(n):
+        try:
+            await asyncio.sleep(5)
+        finally:
+            finished.append(n)
+
+    async def main():
+        caller = asyncio.ensure_future(gather_bounded(work, range(3), max_workers=2))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        try:
+            await caller
+        except asyncio.CancelledError:
+            pass
+        # 已开始的任务执行了清理代码，排队中的任务未开始即被取消
+        assert sorted(finished) == [0, 1]
+        assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""circuit_breaker 测试：连续失败熔断、指数退避、半开探测与恢复"""
+
+import threading
+
+import pytest
+
+import circuit_breaker
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from state_store import StateStore
+
+SOURCE, URL = 'oncc', 'https://hk.on.cc/search'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def breaker(tmp_path, clock):
+    return CircuitBreaker(StateStore(str(tmp_path / 'state.db')), failure_threshold=3,
+                          base_backoff=100, max_backoff=250, probe_timeout=10)
+
+
+def status(breaker):
+    return breaker._load(SOURCE, URL)['status']
+
+
+def test_opens_after_threshold_consecutive_failures(breaker):
+    for _ in range(2):
+        breaker.record_failure(SOURCE, URL)
+    assert breaker.allow(SOURCE, URL)
+    breaker.record_failure(SOURCE, URL)
+    assert status(breaker) == OPEN
+    assert not breaker.allow(SOURCE, URL)
+    # 其他端点不受影响
+    assert breaker.allow(SOURCE, 'https://hk.on.cc/other')
+    assert breaker.allow('hk01', URL)
+
+
+def test_success_resets_failure_count(breaker):
+    breaker.record_failure(SOURCE, URL)
+    breaker.record_failure(SOURCE, URL)
+    breaker.record_success(SOURCE, URL)
+    breaker.record_failure(SOURCE, URL)
+    assert status(breaker) == CLOSED
+
+
+def test_half_open_probe_once_then_recover(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure(SOURCE, URL)
+    clock.now += 101
+    assert breaker.allow(SOURCE, URL)
+    assert status(breaker) == HALF_OPEN
+    # 探测进行中，其他调用方继续跳过
+    assert not breaker.allow(SOURCE, URL)
+    breaker.record_success(SOURCE, URL)
+    assert status(breaker) == CLOSED
+    assert breaker.allow(SOURCE, URL)
+
+
+def test_only_one_caller_claims_the_probe_after_a_stale_read(tmp_path, clock):
+    path = str(tmp_path / 'shared.db')
+    first = CircuitBreaker(StateStore(path), failure_threshold=1, base_backoff=100)
+    second = CircuitBreaker(StateStore(path), failure_threshold=1, base_backoff=100)
+    first.record_failure(SOURCE, URL)
+    clock.now += 101
+
+    # 两个进程都已读到"熔断到期"的记录，second 先占用了探测机会
+    stale = first._load(SOURCE, URL)
+    assert second.allow(SOURCE, URL)
+    first._load = lambda source, url: dict(stale)
+    assert not first.allow(SOURCE, URL)
+
+
+def test_concurrent_threads_claim_one_probe(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure(SOURCE, URL)
+    clock.now += 101
+    barrier = threading.Barrier(8)
+    allowed = []
+
+    def call():
+        barrier.wait()
+        allowed.append(breaker.allow(SOURCE, URL))
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(allowed) == [False] * 7 + [True]
+
+
+def test_failed_probe_reopens_with_doubled_capped_backoff(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure(SOURCE, URL)
+    backoffs = []
+    for _ in range(3):
+        retry_at = breaker._load(SOURCE, URL)['retry_at']
+        backoffs.append(retry_at - clock.now)
+        clock.now = retry_at + 1
+        assert breaker.allow(SOURCE, URL)
+        breaker.record_failure(SOURCE, URL)
+        assert status(breaker) == OPEN
+    assert backoffs == [100, 200, 250]  # 每次探测失败退避翻倍，受 max_backoff 限制
+
+
+def test_record_response_by_status_code(breaker):
+    for _ in range(3):
+        breaker.record_response(SOURCE, URL, 503)
+    assert status(breaker) == OPEN
+    breaker.record_response(SOURCE, 'https://hk.on.cc/ok', 200)
+    assert breaker._load(SOURCE, 'https://hk.on.cc/ok')['failures'] == 0
+
+
+def test_state_shared_between_instances(tmp_path, clock):
+    path = str(tmp_path / 'shared.db')
+    first = CircuitBreaker(StateStore(path), failure_threshold=1)
+    first.record_failure(SOURCE, URL)
+    assert not CircuitBreaker(StateStore(path)).allow(SOURCE, URL)
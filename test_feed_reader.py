@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""feed_reader 测试：时间解析、Atom / RSS 条目读取、条数与时间窗口提前停止、格式错误容错"""
+
+import io
+from datetime import datetime, timedelta, timezone
+
+from feed_reader import FeedEntry, iter_entries, parse_feed_date
+
+UTC = timezone.utc
+
+
+def atom(entries):
+    body = ''.join(
+        f'<entry><title>{title}</title>'
+        f'<link rel="related" href="https://x/related"/><link rel="alternate" href="{link}"/>'
+        f'<published>{published}</published></entry>'
+        for title, link, published in entries)
+    return f'<feed xmlns="http://www.w3.org/2005/Atom">{body}</feed>'.encode()
+
+
+def rss(items):
+    body = ''.join(f'<item><title>{title}</title><link>{link}</link><pubDate>{date}</pubDate></item>'
+                   for title, link, date in items)
+    return f'<rss version="2.0"><channel><title>頻道</title>{body}</channel></rss>'.encode()
+
+
+def test_parse_feed_date():
+    assert parse_feed_date('2025-08-21T06:00:00Z') == datetime(2025, 8, 21, 6, tzinfo=UTC)
+    assert parse_feed_date('2025-08-21T14:00:00+08:00') == datetime(2025, 8, 21, 6, tzinfo=UTC)
+    assert parse_feed_date('Thu, 21 Aug 2025 06:00:00 GMT') == datetime(2025, 8, 21, 6, tzinfo=UTC)
+    assert parse_feed_date('2025-08-21T06:00:00') == datetime(2025, 8, 21, 6, tzinfo=UTC)  # 无时区按 UTC
+    assert parse_feed_date('yesterday') is None
+    assert parse_feed_date(None) is None
+
+
+def test_atom_entries_prefer_alternate_link():
+    data = atom([('王敏奕新劇', 'https://www.youtube.com/watch?v=a', '2025-08-21T06:00:00+00:00')])
+    assert list(iter_entries(data)) == [
+        FeedEntry('王敏奕新劇', 'https://www.youtube.com/watch?v=a', datetime(2025, 8, 21, 6, tzinfo=UTC))]
+
+
+def test_rss_items_and_updated_fallback():
+    data = rss([('王敏奕專訪', 'https://x/1', 'Thu, 21 Aug 2025 06:00:00 GMT')])
+    assert [entry.link for entry in iter_entries(io.BytesIO(data))] == ['https://x/1']
+
+    updated_only = (b'<feed xmlns="http://www.w3.org/2005/Atom"><entry><title>t</title>'
+                    b'<link href="https://x/2"/><updated>2025-08-21T06:00:00Z</updated></entry>'
+                    b'<entry><title>no date</title><link href="https://x/3"/></entry></feed>')
+    assert [entry.link for entry in iter_entries(updated_only)] == ['https://x/2']
+
+
+def test_limit_and_since_stop_early():
+    base = datetime(2025, 8, 21, 12, tzinfo=UTC)
+    data = atom([(f't{i}', f'https://x/{i}', (base - timedelta(hours=i)).isoformat()) for i in range(5)])
+    assert [entry.title for entry in iter_entries(data, limit=2)] == ['t0', 't1']
+    assert [entry.title for entry in iter_entries(data, since=base - timedelta(hours=2))] == ['t0', 't1', 't2']
+
+
+def test_malformed_xml_keeps_entries_read_so_far():
+    data = atom([('t0', 'https://x/0', '2025-08-21T06:00:00Z')])[:-len('</feed>')] + b'<entry><title>broken'
+    assert [entry.title for entry in iter_entries(data)] == ['t0']
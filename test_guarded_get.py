@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""熔断器保护的抓取测试：多个关键词共享同一次请求时，每轮每个URL只按实际网络请求计数一次"""
+
+import asyncio
+
+import pytest
+
+import vvnews_bot_auto
+
+KEYWORDS = ['王敏奕', '陳瀅', '張曦雯']
+URL = 'https://www.mingpao.com/search?q=x'
+
+
+class FakeResponse:
+    def __init__(self, url, status_code):
+        self.url = url
+        self.status_code = status_code
+        self.content = b''
+
+
+class FakeSession:
+    def __init__(self, status_code=503, error=None):
+        self.status_code = status_code
+        self.error = error
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return FakeResponse(url, self.status_code)
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.setenv('VVNEWS_STATE_DB', str(tmp_path / 'state.db'))
+    monkeypatch.setenv('VVNEWS_KEYWORDS', ','.join(KEYWORDS))
+    return vvnews_bot_auto.VVNewsBotAuto()
+
+
+def failures(bot):
+    return bot.breaker._load('明報', URL)['failures']
+
+
+def run_round(bot):
+    bot._start_search_round(KEYWORDS)
+    return [bot._guarded_get('明報', URL) for _ in KEYWORDS]
+
+
+def test_cache_hits_do_not_count_towards_breaker(bot):
+    session = bot.page_cache.session = FakeSession(503)
+    run_round(bot)
+    assert session.calls == 1
+    assert failures(bot) == 1
+    run_round(bot)
+    assert failures(bot) == 2
+    assert bot.breaker.allow('明報', URL)  # 未达到阈值（3 次），不因关键词数量提前熔断
+
+
+def test_request_errors_counted_once_per_round(bot):
+    bot.page_cache.session = FakeSession(error=ConnectionError('down'))
+    bot._start_search_round(KEYWORDS)
+    for _ in KEYWORDS:
+        with pytest.raises(ConnectionError):
+            bot._guarded_get('明報', URL)
+    assert failures(bot) == 1
+
+
+def test_async_counts_once_per_round(bot):
+    class Fetcher:
+        def __init__(self):
+            self.calls = 0
+
+        async def get_many(self, urls, timeout=None):
+            self.calls += 1
+            return [FakeResponse(url, 503) for url in urls]
+
+    fetcher = Fetcher()
+
+    async def main():
+        await asyncio.gather(*(bot._guarded_get_many('明報', [URL], fetcher) for _ in KEYWORDS))
+
+    bot._start_search_round(KEYWORDS)
+    asyncio.run(main())
+    assert failures(bot) == 1
+    bot._start_search_round(KEYWORDS)
+    asyncio.run(main())
+    assert failures(bot) == 2
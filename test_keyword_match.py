@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""keyword_match 测试：关键词规范化、Aho-Corasick 多关键词匹配、字节预过滤与正则注册表"""
+
+import json
+from urllib.parse import quote
+
+import pytest
+
+from keyword_match import KeywordMatcher, keyword_regex, normalize_keywords
+
+KEYWORDS = ['王敏奕', '陳瀅', 'Vivian']
+
+
+def test_normalize_keywords():
+    assert normalize_keywords(' 王敏奕, 陳瀅,,王敏奕 ') == ['王敏奕', '陳瀅']
+    assert normalize_keywords(['a', ' a', 'b']) == ['a', 'b']
+    assert normalize_keywords(None) == []
+
+
+def test_find_all_overlapping_and_case_insensitive():
+    matcher = KeywordMatcher(['he', 'she', 'hers', 'VIVIAN'])
+    assert matcher.find_all('ushers', stop_when_all=False) == {'he', 'she', 'hers'}
+    assert matcher.find_all('vivian 新劇') == {'VIVIAN'}
+    assert matcher.find_all('') == set()
+    assert KeywordMatcher([]).find_all('abc') == set()
+
+
+def test_find_all_stops_when_every_keyword_found():
+    matcher = KeywordMatcher(KEYWORDS)
+    assert matcher.find_all('王敏奕與陳瀅合作，Vivian 表示') == set(KEYWORDS)
+    assert matcher.contains_any('陳瀅')
+    assert not matcher.contains_any('其他藝人')
+
+
+@pytest.mark.parametrize('data', [
+    '王敏奕新劇'.encode('utf-8'),
+    '王敏奕新劇'.encode('big5'),
+    quote('王敏奕').encode(),
+    ''.join(f'&#{ord(c)};' for c in '王敏奕').encode(),
+    ''.join(f'&#x{ord(c):x};' for c in '王敏奕').encode(),
+    json.dumps({'title': '王敏奕'}).encode(),  # \u 转义
+])
+def test_find_in_bytes_matches_every_encoded_form(data):
+    assert KeywordMatcher(KEYWORDS).find_in_bytes(data) == {'王敏奕'}
+
+
+def test_find_in_bytes_case_insensitive_and_misses():
+    matcher = KeywordMatcher(KEYWORDS)
+    assert matcher.find_in_bytes(b'<p>VIVIAN</p>') == {'Vivian'}
+    assert matcher.find_in_bytes('別的新聞'.encode()) == set()
+    assert matcher.find_in_bytes(b'') == set()
+
+
+def test_keyword_regex_escapes_and_caches():
+    pattern = keyword_regex(r'<a[^>]*>([^<]*{keyword}[^<]*)</a>', 'a.b+')
+    assert pattern.search('<a href="/x">a.b+ news</a>').group(1) == 'a.b+ news'
+    assert pattern.search('<a href="/x">aXbb news</a>') is None
+    assert keyword_regex(r'<a[^>]*>([^<]*{keyword}[^<]*)</a>', 'a.b+') is pattern
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""metadata_cache 测试：两级缓存、负缓存、并发加载合并（线程与协程）与命中统计"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from metadata_cache import ArticleMetadataCache, MetadataCache
+from state_store import StateStore
+
+
+@pytest.fixture
+def state(tmp_path):
+    return StateStore(str(tmp_path / 'state.db'))
+
+
+def test_get_or_load_persists_across_instances(state):
+    cache = MetadataCache(state, 'youtube_video', ttl=60)
+    assert cache.get_or_load('v1', lambda: {'title': '王敏奕'}) == {'title': '王敏奕'}
+    assert MetadataCache(state, 'youtube_video', ttl=60).get_or_load('v1', lambda: 1 / 0) == {'title': '王敏奕'}
+
+
+def test_negative_cache_only_when_configured(state):
+    calls = []
+    loader = lambda: calls.append(1)  # 返回 None
+    MetadataCache(state, 'a', ttl=60).get_or_load('k', loader)
+    MetadataCache(state, 'a', ttl=60).get_or_load('k', loader)
+    assert len(calls) == 2
+    cache = MetadataCache(state, 'b', ttl=60, negative_ttl=60)
+    assert cache.get_or_load('k', loader) is None
+    assert cache.get_or_load('k', loader) is None
+    assert len(calls) == 3
+
+
+def test_records_failing_cacheable_are_returned_but_not_cached(state):
+    has_time = lambda record: bool(record.get('publish_time'))
+    partial = {'title': '王敏奕新劇', 'publish_time': None}
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return partial
+
+    cache = MetadataCache(state, 'youtube_video', ttl=60, cacheable=has_time)
+    assert cache.get_or_load('v1', loader) == partial
+    assert cache.get_or_load('v1', loader) == partial
+    assert len(calls) == 2
+
+    complete = {'title': '王敏奕新劇', 'publish_time': '2025-08-22T09:30:00+08:00'}
+    assert cache.get_or_load('v1', lambda: complete) == complete
+    assert cache.get_or_load('v1', loader) == complete
+    assert len(calls) == 2
+
+
+def test_previously_stored_records_failing_cacheable_are_reloaded(state):
+    MetadataCache(state, 'youtube_video', ttl=60).set('v1', {'title': '舊記錄', 'publish_time': None})
+    cache = MetadataCache(state, 'youtube_video', ttl=60, cacheable=lambda record: bool(record.get('publish_time')))
+    complete = {'title': '新記錄', 'publish_time': '2025-08-22T09:30:00+08:00'}
+
+    assert asyncio.run(cache.get_or_load_async('v1', lambda: asyncio.sleep(0, complete))) == complete
+
+
+def test_loader_errors_not_cached(state):
+    cache = MetadataCache(state, 'ns', ttl=60, negative_ttl=60)
+    with pytest.raises(ConnectionError):
+        cache.get_or_load('k', lambda: (_ for _ in ()).throw(ConnectionError()))
+    assert cache.get_or_load('k', lambda: 'ok') == 'ok'
+
+
+def test_concurrent_threads_share_one_load(state):
+    cache = MetadataCache(state, 'ns', ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load('k', loader))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ['value'] * 5
+    assert len(calls) == 1
+
+
+def test_concurrent_coroutines_share_one_load(state):
+    cache = MetadataCache(state, 'ns', ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {'title': '王敏奕'}
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_load_async('k', loader) for _ in range(5)))
+
+    assert asyncio.run(main()) == [{'title': '王敏奕'}] * 5
+    assert len(calls) == 1
+    assert not cache._pending
+
+
+def test_async_error_propagates_to_all_waiters_and_is_not_cached(state):
+    cache = MetadataCache(state, 'ns', ttl=60)
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ConnectionError()
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_load_async('k', failing) for _ in range(3)),
+                                    return_exceptions=True)
+
+    assert all(isinstance(r, ConnectionError) for r in asyncio.run(main()))
+
+    async def ok():
+        return 'ok'
+
+    assert asyncio.run(cache.get_or_load_async('k', ok)) == 'ok'
+
+
+def test_article_cache_stats_and_async_coalescing(state):
+    cache = ArticleMetadataCache(state, ttl=60, negative_ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return '2025-08-21T14:00:00+08:00'
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_load_async('https://a/1', loader) for _ in range(3)))
+
+    assert set(asyncio.run(main())) == {'2025-08-21T14:00:00+08:00'}
+    assert len(calls) == 1
+    assert cache.get_or_load('https://a/1', lambda: 1 / 0) == '2025-08-21T14:00:00+08:00'
+    assert cache.get_or_load('https://a/2', lambda: None, scope='王敏奕') is None
+    assert cache.get_or_load('https://a/2', lambda: 1 / 0, scope='王敏奕') is None
+    stats = cache.stats()
+    assert (stats['hits'], stats['negative_hits'], stats['misses']) == (1, 1, 4)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""near_dup 测试：标题规范化、媒体后缀、繁简统一与近似重复索引"""
+
+import pytest
+
+from near_dup import MIN_SHINGLES, NearDuplicateIndex, normalize_title, shingles
+
+
+@pytest.mark.parametrize('title, expected', [
+    ('王敏奕新劇首播收視創新高｜香港01', '王敏奕新劇首播收視創新高'),
+    ('王敏奕新劇首播收視創新高 - 東網', '王敏奕新劇首播收視創新高'),
+    ('王敏奕新劇首播收視創新高 | 星島頭條', '王敏奕新劇首播收視創新高'),
+    ('王敏奕新劇首播收視創新高 — TVB新聞', '王敏奕新劇首播收視創新高'),
+    ('王敏奕新劇首播收視創新高｜即時娛樂｜香港01', '王敏奕新劇首播收視創新高即時娛樂'),
+])
+def test_known_site_suffixes_stripped(title, expected):
+    assert normalize_title(title) == expected
+
+
+def test_unknown_tail_after_dash_is_kept():
+    assert normalize_title('王敏奕 - 宣布婚訊男友曝光') == '王敏奕宣布婚訊男友曝光'
+    assert normalize_title('王敏奕 - 新劇首播收視創新高') == '王敏奕新劇首播收視創新高'
+
+
+def test_simplified_and_traditional_are_equal():
+    assert normalize_title('王敏奕新剧首播 - 东网') == normalize_title('王敏奕新劇首播 - 東網')
+
+
+def test_different_stories_with_shared_prefix_do_not_merge():
+    index = NearDuplicateIndex()
+    first = {'title': '王敏奕 - 新劇首播收視創新高', 'url': 'https://a/1'}
+    index.add(first)
+    assert index.find_in_run('王敏奕 - 宣布婚訊男友曝光') is None
+    assert index.find_in_run('王敏奕新劇首播收視創新高｜香港01') is first
+
+
+class FakeState:
+    def __init__(self):
+        self.titles = []
+
+    def add_title(self, url, title, band_keys, ttl):
+        self.titles.append((url, title, set(band_keys)))
+
+    def find_titles(self, band_keys):
+        return [(url, title) for url, title, keys in self.titles if keys & set(band_keys)]
+
+
+def test_short_titles_neither_match_nor_persist():
+    short = '王敏奕｜香港01'
+    assert len(shingles(short)) < MIN_SHINGLES
+    state = FakeState()
+    index = NearDuplicateIndex(state)
+    index.add({'title': short, 'url': 'https://a/1'})
+    assert index.find_in_run(short) is None
+    index.persist([{'title': short, 'url': 'https://a/1'},
+                   {'title': '王敏奕新劇首播收視創新高', 'url': 'https://a/2'}], ttl=60)
+    assert [url for url, _, _ in state.titles] == ['https://a/2']
+    assert index.find_in_history(short) is None
+    assert index.find_in_history('王敏奕新劇首播收視創新高｜香港01') == ('https://a/2', '王敏奕新劇首播收視創新高')
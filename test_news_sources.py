@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""news_sources 测试：站内搜索流程（同步/异步）、TVB 解析和URL去重"""
+
+import asyncio
+from types import SimpleNamespace
+from urllib.parse import quote
+
+from news_sources import (dedupe_by_url, news_site_config, parse_tvb_listing, search_news_site,
+                          search_news_site_async, tvb_known_url_result)
+
+KEYWORD = '王敏奕'
+SEARCH_PAGE = f'<a href="/news/1">{KEYWORD}宣布婚訊 好友到賀</a><a href="/news/1?utm_source=x">{KEYWORD}宣布婚訊 好友到賀</a>'
+HOME_PAGE = f'<a href="/ldy/2" title="{KEYWORD}新劇開拍 首度擔正女主角">看</a>'
+
+
+def page(text, status=200):
+    return SimpleNamespace(text=text, status_code=status)
+
+
+def test_search_news_site_stops_at_first_search_page_with_results():
+    config = news_site_config('mingpao', KEYWORD)
+    pages = {config['search_urls'][0]: page('', 404), config['search_urls'][1]: page(SEARCH_PAGE)}
+    fetched = []
+
+    def fetch(source, url):
+        fetched.append(url)
+        return pages.get(url)
+
+    results = search_news_site('mingpao', KEYWORD, fetch)
+
+    assert fetched == config['search_urls'][:2]
+    assert [r['url'] for r in results] == ['https://ol.mingpao.com/news/1']
+    assert results[0]['source'] == '明報'
+
+
+def test_search_news_site_falls_back_to_home_page():
+    config = news_site_config('mingpao', KEYWORD)
+
+    results = search_news_site('mingpao', KEYWORD,
+                               lambda source, url: page(HOME_PAGE) if url == config['home_url'] else None)
+
+    assert [r['url'] for r in results] == ['https://ol.mingpao.com/ldy/2']
+
+
+def test_search_news_site_skips_pages_rejected_by_filter():
+    results = search_news_site('mingpao', KEYWORD, lambda source, url: page(SEARCH_PAGE),
+                               page_filter=lambda response, keyword: False)
+
+    assert results == []
+
+
+def test_search_news_site_survives_fetch_errors():
+    def fetch(source, url):
+        raise ConnectionError('boom')
+
+    assert search_news_site('wenweipo', KEYWORD, fetch) == []
+
+
+def test_search_news_site_async_matches_sync_priority():
+    config = news_site_config('mpweekly', KEYWORD)
+    pages = {config['search_urls'][2]: page(SEARCH_PAGE), config['home_url']: page(HOME_PAGE)}
+
+    async def fetch_many(source, urls):
+        return [pages.get(url) for url in urls]
+
+    results = asyncio.run(search_news_site_async('mpweekly', KEYWORD, fetch_many))
+
+    assert [r['url'] for r in results] == ['https://www.mpweekly.com/news/1']
+
+
+def test_parse_tvb_listing_decodes_title_from_url():
+    slug = quote(f'{KEYWORD}新劇開拍') + '--' + quote('副標題') + '-1008140'
+    content = f'<a href="/artiste-news-c/{slug}">圖片</a><a href="/news/other">無關</a>'
+
+    results = parse_tvb_listing(KEYWORD, content)
+
+    assert results == [{
+        'title': f'{KEYWORD}新劇開拍',
+        'url': f'https://www.tvb.com/artiste-news-c/{slug}',
+        'source': 'TVB',
+        'keyword': KEYWORD,
+    }]
+
+
+def test_tvb_known_url_result_requires_keyword_in_title():
+    url = 'https://www.tvb.com/artiste-news-c/' + quote('別人的新聞') + '-1'
+
+    assert tvb_known_url_result(KEYWORD, url) is None
+
+
+def test_dedupe_by_url_uses_canonical_url_and_limit():
+    results = [{'url': 'https://www.hk01.com/a?utm_source=x'}, {'url': 'https://hk01.com/a'},
+               {'url': 'https://www.hk01.com/b'}, {'url': ''}]
+
+    assert [r['url'] for r in dedupe_by_url(results)] == ['https://www.hk01.com/a?utm_source=x',
+                                                          'https://www.hk01.com/b']
+    assert len(dedupe_by_url(results, 1)) == 1
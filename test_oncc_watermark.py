@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""東網 Sitemap 水位线测试：按关键词记录检查结果，每轮结束时统一推进，配额提前停止和出错的URL不被跳过，列表页已满足的关键词不阻塞推进，替代时间不作为水位线"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+import vvnews_bot_auto
+from sitemap_reader import BEIJING_TZ, parse_lastmod
+
+KEYWORDS = ['王敏奕', '陳瀅']
+
+
+def at(hour):
+    return datetime(2025, 8, 21, hour, tzinfo=BEIJING_TZ)
+
+
+# Sitemap 候选按时间倒序（与 SitemapReader.read_top 一致）
+ENTRIES = [(f'https://hk.on.cc/hk/bkn/cnt/entertainment/{hour}.html', at(hour)) for hour in (14, 13, 12, 11)]
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.setenv('VVNEWS_STATE_DB', str(tmp_path / 'state.db'))
+    monkeypatch.setenv('VVNEWS_KEYWORDS', ','.join(KEYWORDS))
+    bot = vvnews_bot_auto.VVNewsBotAuto()
+    bot._start_search_round(KEYWORDS)
+    bot._read_oncc_sitemap = lambda dates_to_check: ENTRIES
+    bot._oncc_sitemap_entries = ENTRIES
+    return bot
+
+
+def watermark(bot):
+    return parse_lastmod(bot.state.get('sitemap_watermark', 'oncc'))
+
+
+def articles(matches=(), failures=()):
+    """模拟文章页：matches 中的 (关键词, URL) 包含关键词，failures 中的 (关键词, URL) 抛出网络错误"""
+    def article(keyword, url):
+        if (keyword, url) in failures:
+            raise ConnectionError(url)
+        return {'has_keyword': (keyword, url) in matches, 'title': url, 'clean_title': url}
+    return article
+
+
+def run_round(bot, article):
+    bot._oncc_article = article
+    for keyword in KEYWORDS:
+        bot._oncc_sitemap_strategy(keyword, [])
+    # 所有关键词任务结束前水位线不变，同一轮的关键词读到的是同一个水位线
+    assert watermark(bot) is None
+    bot._advance_oncc_watermark(KEYWORDS)
+
+
+def test_advances_to_newest_when_every_keyword_checked_everything(bot):
+    run_round(bot, articles())
+    assert watermark(bot) == at(14)
+
+
+def test_quota_stop_keeps_unchecked_urls_for_next_run(bot):
+    bot.oncc_result_quota = 1
+    # 第一个关键词在最新的URL上达到配额，其余URL没有检查；另一个关键词检查完所有URL
+    run_round(bot, articles(matches={(KEYWORDS[0], ENTRIES[0][0])}))
+    assert watermark(bot) is None
+
+
+def test_quota_stop_only_blocks_urls_it_did_not_check(bot):
+    bot.oncc_result_quota = 1
+    # 在第三新的URL达到配额：更旧的URL未检查，不能越过
+    run_round(bot, articles(matches={(KEYWORDS[0], ENTRIES[2][0])}))
+    assert watermark(bot) is None
+
+    bot._start_search_round(KEYWORDS)
+    bot._oncc_sitemap_entries = ENTRIES
+    # 在最旧的URL上达到配额：所有URL都已检查过
+    run_round(bot, articles(matches={(KEYWORDS[0], ENTRIES[3][0])}))
+    assert watermark(bot) == at(14)
+
+
+def test_failed_check_is_not_counted_as_checked(bot):
+    run_round(bot, articles(failures={(KEYWORDS[1], ENTRIES[1][0])}))
+    # 13点的URL对第二个关键词检查出错：水位线只推进到比它更旧的部分
+    assert watermark(bot) == at(12)
+
+
+def test_keyword_that_never_ran_sitemap_blocks_advance(bot):
+    bot._oncc_article = articles()
+    bot._oncc_sitemap_strategy(KEYWORDS[0], [])
+    bot._advance_oncc_watermark(KEYWORDS)
+    assert watermark(bot) is None
+
+
+def search_round(bot, article, listing):
+    """按 search_oncc 的策略级联跑一轮：listing 中的关键词由列表页策略直接找到结果"""
+    bot._oncc_article = article
+    bot._oncc_listing_strategy = lambda keyword, dates: [{'url': f'https://hk.on.cc/{keyword}'}] if keyword in listing else []
+    bot._oncc_search_strategy = lambda keyword: []
+    bot._oncc_text_strategy = lambda keyword: []
+    bot.strategy_stats.order = lambda source, strategies: strategies
+    for keyword in KEYWORDS:
+        bot.search_oncc(keyword)
+    bot._advance_oncc_watermark(KEYWORDS)
+
+
+def test_keyword_satisfied_by_listing_does_not_stall_watermark(bot):
+    search_round(bot, articles(), listing={KEYWORDS[1]})
+    assert watermark(bot) == at(14)
+
+
+def test_keyword_satisfied_by_sitemap_quota_still_blocks_unchecked_urls(bot):
+    bot.oncc_result_quota = 1
+    search_round(bot, articles(matches={(KEYWORDS[0], ENTRIES[0][0])}), listing={KEYWORDS[1]})
+    assert watermark(bot) is None
+
+
+def test_fallback_time_entries_do_not_move_watermark(bot):
+    fallback_url = 'https://hk.on.cc/hk/bkn/cnt/entertainment/20250821/nolastmod.html'
+    fallback_time = bot._oncc_sitemap_options(['20250821'])['fallback_time'](fallback_url)
+    entries = [(fallback_url, fallback_time)] + ENTRIES
+    bot._read_oncc_sitemap = lambda dates_to_check: entries
+    bot._oncc_sitemap_entries = entries
+    run_round(bot, articles())
+    assert watermark(bot) == at(14)
+
+
+def test_async_round_records_per_keyword_and_advances_once(bot):
+    calls = []
+
+    async def load(dates_to_check, fetcher):
+        calls.append(1)
+        return ENTRIES
+
+    async def article(keyword, url, fetcher):
+        await asyncio.sleep(0)
+        if (keyword, url) == (KEYWORDS[0], ENTRIES[0][0]):
+            raise ConnectionError(url)
+        return {'has_keyword': False}
+
+    class Fetcher:
+        per_host_limit = 2
+
+    bot._load_oncc_sitemap_async = load
+    bot._oncc_article_async = article
+
+    async def main():
+        await asyncio.gather(*(bot._oncc_sitemap_strategy_async(keyword, [], Fetcher()) for keyword in KEYWORDS))
+
+    asyncio.run(main())
+    assert calls == [1]  # 所有关键词共用同一次Sitemap读取
+    assert watermark(bot) is None
+    bot._advance_oncc_watermark(KEYWORDS)
+    assert watermark(bot) == at(13)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""publish_time 测试：各格式的优先级、属性值与链接中的日期不算、流式扫描器的提前停止与回退"""
+
+from datetime import datetime
+
+import pytest
+
+from publish_time import (BEIJING_TZ, HEAD_CHUNK_SIZE, PRIORITY_DATE_TEXT, PRIORITY_LABELLED, PRIORITY_RELATIVE,
+                          PRIORITY_STRUCTURED, PublishTimeScanner, find_publish_time, parse_publish_time,
+                          visible_text)
+
+NOW = datetime(2025, 8, 22, 12, 0, tzinfo=BEIJING_TZ)
+LABELLED_TIME = datetime(2025, 8, 22, 9, 30, tzinfo=BEIJING_TZ)
+FILLER = '<p>' + '內文' * 20 + '</p>'
+
+
+def page(head='', body=''):
+    return f'<html><head><title>t</title>{head}</head><body>{body}</body></html>'
+
+
+def scan(html, chunk_size=HEAD_CHUNK_SIZE, **kwargs):
+    """按块喂给扫描器（模拟 read_until），返回 (发布时间, 停止前读取的字节数)"""
+    scanner = PublishTimeScanner(now=NOW, **kwargs)
+    data = html.encode('utf-8')
+    for start in range(0, len(data), chunk_size):
+        if scanner.feed(data[start:start + chunk_size]):
+            break
+    return scanner.publish_time, len(scanner.buffer)
+
+
+@pytest.mark.parametrize('html, expected', [
+    (page('<meta property="article:published_time" content="2025-08-22T03:00:00+08:00">'),
+     datetime(2025, 8, 22, 3, tzinfo=BEIJING_TZ)),
+    (page('<meta content="2025-08-21T19:00:00Z" itemprop="datePublished">'),
+     datetime(2025, 8, 22, 3, tzinfo=BEIJING_TZ)),
+    (page('<script type="application/ld+json">{"datePublished": "2025-08-22 03:00"}</script>'),
+     datetime(2025, 8, 22, 3, tzinfo=BEIJING_TZ)),
+    ('{"publishedTimeText":{"simpleText":"3小時前"}}', datetime(2025, 8, 22, 9, tzinfo=BEIJING_TZ)),
+])
+def test_structured_formats(html, expected):
+    assert find_publish_time(html, NOW) == (PRIORITY_STRUCTURED, expected)
+
+
+@pytest.mark.parametrize('text', ['發佈時間：09:30 2025-08-22', '更新時間: 2025年8月22日 09:30', '发布时间：2025/08/22 09:30'])
+def test_labelled_formats(text):
+    assert find_publish_time(page(body=text), NOW) == (PRIORITY_LABELLED, LABELLED_TIME)
+
+
+def test_structured_beats_labelled_anywhere():
+    html = page(body='發佈時間：2025-08-20 10:00' + FILLER
+                + '<script type="application/ld+json">{"datePublished":"2025-08-22T09:30:00+08:00"}</script>')
+    assert find_publish_time(html, NOW) == (PRIORITY_STRUCTURED, LABELLED_TIME)
+
+
+def test_relative_and_bare_dates_only_when_allowed():
+    html = page(body='<aside>熱門：3小時前</aside><p>2025年8月20日 活動</p>')
+    assert find_publish_time(html, NOW) is None
+    assert find_publish_time(html, NOW, max_priority=PRIORITY_RELATIVE) == (
+        PRIORITY_RELATIVE, datetime(2025, 8, 22, 9, tzinfo=BEIJING_TZ))
+    assert find_publish_time(page(body='<p>2025年8月20日 活動</p>'), NOW, max_priority=PRIORITY_DATE_TEXT) == (
+        PRIORITY_DATE_TEXT, datetime(2025, 8, 20, tzinfo=BEIJING_TZ))
+    # 只接受结构化时间时，带标签的文本也不算
+    assert parse_publish_time(page(body='發佈時間：2025-08-22 09:30'), NOW, max_priority=PRIORITY_STRUCTURED) is None
+
+
+@pytest.mark.parametrize('body', [
+    '<a href="https://news.example.com/2024/01/05/abc">相關新聞</a>',
+    '<img src="/img/2024-01-05.jpg" alt="x">',
+    '<p>網址：https://news.example.com/2024/01/05/abc</p>',
+    '<p>id=20240105 編號 2024-01-05x</p>',
+    '<script>var d = "2024-01-05 10:00";</script><style>/* 2024-01-05 */</style><!-- 2024-01-05 -->',
+])
+def test_dates_in_attributes_urls_and_scripts_ignored(body):
+    assert find_publish_time(page(body=body), NOW, max_priority=PRIORITY_DATE_TEXT) is None
+
+
+def test_visible_text_handles_unterminated_tags_and_entities():
+    assert visible_text('<p>發佈時間&#65306;2025-08-22</p><a href="/2024/01/05').split() == ['發佈時間：2025-08-22']
+    assert visible_text('<p>a</p><script>var x = "2024-01-05"').split() == ['a']
+
+
+def test_scanner_canonical_link_does_not_win_over_labelled_body():
+    # 回归：head 中 canonical 链接的路径日期曾在 </head> 之后被当作发布时间
+    html = page('<link rel="canonical" href="https://news.example.com/2024/01/05/abc">',
+                FILLER * 100 + '<div class="time">發佈時間：2025-08-22 09:30</div>' + FILLER * 100)
+    assert scan(html, max_priority=PRIORITY_DATE_TEXT)[0] == LABELLED_TIME
+    assert scan(html)[0] == LABELLED_TIME
+    assert find_publish_time(html, NOW, max_priority=PRIORITY_DATE_TEXT)[1] == LABELLED_TIME
+
+
+def test_scanner_keeps_reading_past_sidebar_relative_time():
+    # 回归：侧栏的"3小時前"曾让扫描器在正文第一块就停止
+    html = page(body='<aside>' + '<a href="/x">其他新聞 3小時前</a>' * 5 + '</aside>'
+                + FILLER * 300 + '<p>發佈時間：2025-08-22 09:30</p>' + FILLER * 300)
+    publish_time, read = scan(html, max_priority=PRIORITY_DATE_TEXT)
+    assert publish_time == LABELLED_TIME
+    assert read < len(html.encode('utf-8'))  # 找到带标签的时间即停止
+
+
+def test_scanner_falls_back_only_after_cap_or_eof():
+    html = page(body='<aside>其他新聞 3小時前</aside>' + FILLER * 300)
+    assert scan(html) == (None, len(html.encode('utf-8')))
+    publish_time, read = scan(html, max_priority=PRIORITY_RELATIVE)
+    assert publish_time == datetime(2025, 8, 22, 9, tzinfo=BEIJING_TZ)
+    assert read == len(html.encode('utf-8'))
+    _, read = scan(html, max_priority=PRIORITY_RELATIVE, max_bytes=10 * 1024)
+    assert read <= 10 * 1024 + HEAD_CHUNK_SIZE
+
+
+def test_scanner_stops_in_head_on_meta_time():
+    html = page('<meta property="article:published_time" content="2025-08-22T09:30:00+08:00">', FILLER * 500)
+    publish_time, read = scan(html)
+    assert publish_time == LABELLED_TIME
+    assert read == HEAD_CHUNK_SIZE
+
+
+@pytest.mark.parametrize('chunk_size', [7, 64, 1000])
+def test_scanner_chunk_boundaries(chunk_size):
+    html = page(body='<script>var t = "2024-01-05";</script>' + FILLER
+                + '<p>發佈時間：<span>2025-08-22</span> <b>09:30</b></p>')
+    assert scan(html, chunk_size=chunk_size)[0] == LABELLED_TIME
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""search_extract 测试：内嵌 JSON 与 HTML 链接中的搜索结果提取，以及病态输入下的线性耗时"""
+
+import time
+
+from search_extract import extract_anchor_items, extract_json_items, extract_search_items
+
+
+def test_json_title_then_url_in_same_object():
+    text = '{"items":[{"title":"王敏奕新劇首播","url":"https://www.mingpao.com/a/1"},' \
+           '{"title":"其他新聞","url":"https://www.mingpao.com/a/2"}]}'
+    assert extract_json_items(text, '王敏奕') == [('王敏奕新劇首播', 'https://www.mingpao.com/a/1')]
+
+
+def test_json_url_before_title_and_custom_keys():
+    text = '[{"canonicalUrl": "https://www.hk01.com/x/1", "title": "王敏奕宣布婚訊"}]'
+    assert extract_json_items(text, '王敏奕', url_key='canonicalUrl') == [
+        ('王敏奕宣布婚訊', 'https://www.hk01.com/x/1')]
+
+
+def test_json_does_not_pair_across_objects_or_non_title_fields():
+    text = '[{"title":"王敏奕新劇"},{"url":"https://x/unrelated"}] {"summary":"王敏奕","url":"https://x/2"}'
+    assert extract_json_items(text, '王敏奕') == []
+
+
+def test_json_keyword_case_insensitive_and_each_title_once():
+    text = '{"title":"Vivian 與 VIVIAN","url":"https://x/1"}'
+    assert extract_json_items(text, 'vivian') == [('Vivian 與 VIVIAN', 'https://x/1')]
+
+
+def test_anchor_text_child_element_and_title_attribute():
+    html = ('<a href="/a/1">王敏奕新劇首播</a>'
+            '<a href="/a/2"><span>熱門</span><h3>王敏奕宣布婚訊</h3></a>'
+            '<a href="/a/3" title="王敏奕出席活動"><img src="x.jpg"></a>'
+            '<a>王敏奕無連結</a>')
+    assert extract_anchor_items(html, '王敏奕') == [
+        ('王敏奕新劇首播', '/a/1'), ('王敏奕宣布婚訊', '/a/2'), ('王敏奕出席活動', '/a/3')]
+
+
+def test_anchor_href_not_paired_with_later_element():
+    # 旧的 mpweekly 正则会把 /a/1 与后面无关元素中的标题配对
+    html = '<a href="/a/1">其他</a><div><h3>王敏奕新劇</h3></div>'
+    assert extract_anchor_items(html, '王敏奕') == []
+
+
+def test_search_items_json_first_then_anchors():
+    html = ('<script>var d={"title":"王敏奕新劇","url":"https://x/json"};</script>'
+            '<a href="https://x/html">王敏奕專訪</a>')
+    assert extract_search_items(html, '王敏奕') == [('王敏奕新劇', 'https://x/json'), ('王敏奕專訪', 'https://x/html')]
+
+
+def test_pathological_inputs_stay_fast():
+    unclosed_braces = '{"title":"王敏奕' * 3000
+    unterminated_tags = '<a href="x" ' * 3000 + '王敏奕'
+    started = time.monotonic()
+    extract_json_items(unclosed_braces, '王敏奕')
+    extract_search_items(unterminated_tags, '王敏奕')
+    assert time.monotonic() - started < 2
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""sitemap_reader 测试：lastmod 解析、流式扫描取最新 k 条、索引文件与 gzip"""
+
+import gzip
+import io
+from datetime import datetime
+
+from sitemap_reader import (BEIJING_TZ, SitemapReader, merge_top_entries, newest_child_sitemaps,
+                            open_xml_stream, parse_lastmod, scan_sitemap)
+
+
+def urlset(entries):
+    body = ''.join(
+        f'<url><loc>{loc}</loc>' + (f'<lastmod>{lastmod}</lastmod>' if lastmod else '') + '</url>'
+        for loc, lastmod in entries)
+    return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{body}</urlset>'.encode()
+
+
+def index(children):
+    body = ''.join(f'<sitemap><loc>{loc}</loc><lastmod>{lastmod}</lastmod></sitemap>' for loc, lastmod in children)
+    return f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{body}</sitemapindex>'.encode()
+
+
+def at(hour, minute=0):
+    return datetime(2025, 8, 21, hour, minute, tzinfo=BEIJING_TZ)
+
+
+def test_parse_lastmod():
+    assert parse_lastmod('2025-08-21T14:47:10+08:00') == datetime(2025, 8, 21, 14, 47, 10, tzinfo=BEIJING_TZ)
+    assert parse_lastmod('2025-08-21T06:00:00Z') == at(14)
+    assert parse_lastmod('2025-08-21T14:00:00') == at(14)  # 无时区按北京时间
+    assert parse_lastmod('not a date') is None
+    assert parse_lastmod(None) is None
+
+
+def test_scan_keeps_newest_k_after_since_with_filter():
+    data = urlset([
+        ('https://hk.on.cc/ent/1', '2025-08-21T10:00:00+08:00'),
+        ('https://hk.on.cc/news/2', '2025-08-21T13:00:00+08:00'),
+        ('https://hk.on.cc/ent/3', '2025-08-21T12:00:00+08:00'),
+        ('https://hk.on.cc/ent/4', '2025-08-21T11:00:00+08:00'),
+        ('https://hk.on.cc/ent/5', '2025-08-21T08:00:00+08:00'),
+    ])
+    top, children = scan_sitemap(io.BytesIO(data), 2, url_filter=lambda u: '/ent/' in u, since=at(9))
+    assert top == [('https://hk.on.cc/ent/3', at(12)), ('https://hk.on.cc/ent/4', at(11))]
+    assert children == []
+
+
+def test_scan_fallback_time_for_missing_lastmod():
+    data = urlset([('https://hk.on.cc/ent/20250821/a', None), ('https://hk.on.cc/ent/old', None)])
+    top, _ = scan_sitemap(io.BytesIO(data), 5,
+                          fallback_time=lambda u: at(12) if '20250821' in u else None)
+    assert top == [('https://hk.on.cc/ent/20250821/a', at(12))]
+
+
+def test_scan_index_returns_children_newer_than_since():
+    data = index([('https://x/s1.xml', '2025-08-21T12:00:00+08:00'), ('https://x/s0.xml', '2025-08-20T12:00:00+08:00')])
+    top, children = scan_sitemap(io.BytesIO(data), 5, since=at(0))
+    assert top == []
+    assert children == [('https://x/s1.xml', at(12))]
+
+
+def test_open_xml_stream_detects_gzip():
+    data = urlset([('https://x/1', '2025-08-21T12:00:00+08:00')])
+    top, _ = scan_sitemap(open_xml_stream(io.BytesIO(gzip.compress(data))), 5)
+    assert top == [('https://x/1', at(12))]
+
+
+def test_newest_children_and_merge():
+    children = [('a', at(10)), ('b', None), ('c', at(12))]
+    assert [url for url, _ in newest_child_sitemaps(children, 2)] == ['b', 'c']
+    merged = merge_top_entries([[('u1', at(10))], [('u2', at(12)), ('u3', at(9))]], 2)
+    assert merged == [('u2', at(12)), ('u1', at(10))]
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b''):
+        self.status_code = status_code
+        self.raw = io.BytesIO(content)
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def get(self, url, timeout=None, stream=False):
+        self.requested.append(url)
+        if url in self.pages:
+            return FakeResponse(200, self.pages[url])
+        return FakeResponse(404)
+
+
+def test_reader_expands_newest_children_only():
+    session = FakeSession({
+        'https://x/index.xml': index([('https://x/new.xml', '2025-08-21T12:00:00+08:00'),
+                                      ('https://x/mid.xml', '2025-08-21T11:00:00+08:00'),
+                                      ('https://x/old.xml', '2025-08-21T10:00:00+08:00')]),
+        'https://x/new.xml': urlset([('https://x/a', '2025-08-21T12:00:00+08:00')]),
+        'https://x/mid.xml': urlset([('https://x/b', '2025-08-21T11:00:00+08:00')]),
+    })
+    top = SitemapReader(session, max_children=2).read_top('https://x/index.xml', 5)
+    assert top == [('https://x/a', at(12)), ('https://x/b', at(11))]
+    assert 'https://x/old.xml' not in session.requested
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""state_store 测试：键值读写与过期、新闻登记、标题桶"""
+
+import time
+
+import pytest
+
+from state_store import StateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return StateStore(str(tmp_path / 'state.db'))
+
+
+def test_get_set_roundtrip_and_default(store):
+    assert store.get('ns', 'missing', 'dflt') == 'dflt'
+    store.set('ns', 'key', {'a': [1, '王敏奕']})
+    assert store.get('ns', 'key') == {'a': [1, '王敏奕']}
+    store.set('other', 'key', 1)
+    assert store.get('ns', 'key') == {'a': [1, '王敏奕']}
+
+
+def test_ttl_expiry_and_purge(store):
+    store.set('ns', 'short', 1, ttl=0.05)
+    store.set('ns', 'forever', 2)
+    time.sleep(0.1)
+    assert store.get('ns', 'short') is None
+    assert store.get('ns', 'forever') == 2
+    assert store.purge_expired() == 1
+    assert store.get('ns', 'forever') == 2
+
+
+def test_delete(store):
+    store.set('ns', 'key', 1)
+    store.delete('ns', 'key')
+    assert store.get('ns', 'key') is None
+
+
+def test_values_shared_between_instances(tmp_path):
+    path = str(tmp_path / 'shared.db')
+    StateStore(path).set('sitemap_watermark', 'oncc', '2025-08-21T14:47:10+08:00')
+    assert StateStore(path).get('sitemap_watermark', 'oncc') == '2025-08-21T14:47:10+08:00'
+
+
+def test_claim_seen_once_until_released_or_expired(store):
+    assert store.claim_seen('https://a/1', ttl=60) is True
+    assert store.claim_seen('https://a/1', ttl=60) is False
+    store.release_seen(['https://a/1'])
+    assert store.claim_seen('https://a/1', ttl=60) is True
+
+    assert store.claim_seen('https://a/2', ttl=0.05) is True
+    time.sleep(0.1)
+    assert store.claim_seen('https://a/2', ttl=60) is True
+
+
+def test_compare_and_set_only_when_value_unchanged(store):
+    store.set('circuit_breaker', 'k', {'status': 'open', 'retry_at': 1})
+    assert store.compare_and_set('circuit_breaker', 'k', {'status': 'open', 'retry_at': 1}, {'status': 'half_open'})
+    assert store.get('circuit_breaker', 'k') == {'status': 'half_open'}
+    assert not store.compare_and_set('circuit_breaker', 'k', {'status': 'open', 'retry_at': 1}, {'status': 'x'})
+    assert not store.compare_and_set('circuit_breaker', 'missing', None, {'status': 'x'})
+
+    store.set('circuit_breaker', 'old', 1, ttl=0.05)
+    time.sleep(0.1)
+    assert not store.compare_and_set('circuit_breaker', 'old', 1, 2)
+
+
+def test_title_bands(store):
+    store.add_title('https://a/1', '标题一', ['b1', 'b2'], ttl=60)
+    store.add_title('https://a/2', '标题二', ['b3'], ttl=60)
+    assert sorted(store.find_titles(['b2', 'b3'])) == [
+        ('https://a/1', '标题一'), ('https://a/2', '标题二')]
+    assert store.find_titles([]) == []
+    store.release_titles(['https://a/1'])
+    assert store.find_titles(['b1', 'b2']) == []
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""stream_reader 测试：增量标记查找、提前停止与 truncated 标记（同步与异步 get_until）"""
+
+import asyncio
+
+import pytest
+
+import stream_reader
+from async_fetch import AIOHTTP_AVAILABLE, AsyncFetcher
+from stream_reader import MarkerScanner, read_until
+
+MARKERS = [(b'ytInitialData', b'</script>')]
+
+
+def test_scanner_finds_ordered_markers_across_chunks():
+    scanner = MarkerScanner(MARKERS + [(b'"publishDate"',)])
+    assert not scanner.feed(b'<script>var ytInit')
+    assert not scanner.feed(b'ialData = {};</scr')
+    assert not scanner.feed(b'ipt>')
+    assert scanner.feed(b'"publishDate":"2025-08-21"')
+    # 结束标记出现在开始标记之前不算
+    assert not MarkerScanner(MARKERS).feed(b'</script> ytInitialData')
+
+
+class FakeResponse:
+    def __init__(self, chunks):
+        self.url = 'https://www.youtube.com/watch?v=abc'
+        self.status_code = 200
+        self.encoding = 'utf-8'
+        self.headers = {}
+        self.chunks = chunks
+        self.read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, chunks):
+        self.response = FakeResponse(chunks)
+
+    def get(self, url, timeout=None, stream=False):
+        return self.response
+
+
+def test_markers_found_stops_without_truncated():
+    session = FakeSession([b'ytInitialData', b'</script>', b'rest', b'rest'])
+    result = read_until(session, 'https://x', MARKERS)
+    assert result.content == b'ytInitialData</script>'
+    assert result.truncated is False
+    assert session.response.read == 2 and session.response.closed
+
+
+def test_page_ending_exactly_at_cap_is_not_truncated():
+    result = read_until(FakeSession([b'a' * 4, b'b' * 4]), 'https://x', MARKERS, max_bytes=8)
+    assert result.content == b'aaaabbbb'
+    assert result.truncated is False
+
+
+def test_cap_with_remaining_data_is_truncated():
+    session = FakeSession([b'a' * 4, b'b' * 4, b'c' * 4, b'd' * 4])
+    result = read_until(session, 'https://x', MARKERS, max_bytes=8)
+    assert result.content == b'aaaabbbb'
+    assert result.truncated is True
+    assert session.response.read == 3
+
+
+@pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason='需要 aiohttp')
+@pytest.mark.parametrize('body, cap, content, truncated', [
+    # 标记在第二块中找到即停止（content 为整块前缀）
+    (b'ytInitialData</script>' + b'x' * 64, 1024, b'ytInitialData</script>' + b'x' * 10, False),
+    (b'a' * 64, 64, b'a' * 64, False),
+    (b'a' * 256, 64, b'a' * 64, True),
+])
+def test_async_get_until_truncated(monkeypatch, body, cap, content, truncated):
+    from aiohttp import web
+
+    monkeypatch.setattr(stream_reader, 'MAX_PAGE_BYTES', cap)
+
+    async def handler(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        try:
+            for start in range(0, len(body), 16):
+                await response.write(body[start:start + 16])
+                await asyncio.sleep(0.01)
+        except ConnectionError:
+            pass  # 客户端提前关闭连接
+        return response
+
+    async def main():
+        app = web.Application()
+        app.router.add_get('/', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            async with AsyncFetcher() as fetcher:
+                return await fetcher.get_until(f'http://127.0.0.1:{port}/', MARKERS, chunk_size=16)
+        finally:
+            await runner.cleanup()
+
+    result = asyncio.run(main())
+    assert result.content == content
+    assert result.truncated is truncated
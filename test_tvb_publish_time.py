@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""TVB 发布时间测试：URL 路径中的日期只认独占路径段的合法日期，文章页没有时间时才使用；解析出错时不阻塞等待同一URL的调用方"""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+import vvnews_bot_auto
+from publish_time import BEIJING_TZ
+
+TODAY = datetime(2025, 8, 22, 12, 0, tzinfo=BEIJING_TZ)
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.setenv('VVNEWS_STATE_DB', str(tmp_path / 'state.db'))
+    bot = vvnews_bot_auto.VVNewsBotAuto()
+    bot.get_beijing_time = lambda: TODAY
+    return bot
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://news.tvb.com/tc/entertainment/20250821/abc', datetime(2025, 8, 21, tzinfo=BEIJING_TZ)),
+    ('https://news.tvb.com/tc/entertainment/20250822', datetime(2025, 8, 22, tzinfo=BEIJING_TZ)),
+    ('https://www.tvb.com/artiste-news-c/王敏奕新劇--1008140', None),
+    ('https://www.tvb.com/artiste-news-c/20241234', None),  # 不是合法日期的文章ID
+    ('https://www.tvb.com/artiste-news-c/title--20250821123', None),
+    ('https://www.tvb.com/artiste-news-c/x-20250821', None),  # 不是独占的路径段
+    ('https://news.tvb.com/tc/entertainment/20250823/abc', None),  # 晚于今天
+    ('https://news.tvb.com/search?date=20250821', None),  # 只看路径
+])
+def test_tvb_url_date(bot, url, expected):
+    assert bot._tvb_url_date(url) == expected
+
+
+def test_page_time_preferred_over_url_date(bot):
+    url = 'https://news.tvb.com/tc/entertainment/20250821/abc'
+    page_time = datetime(2025, 8, 21, 18, 30, tzinfo=BEIJING_TZ)
+    bot._article_publish_time = lambda article_url, timeout=10: page_time
+    assert bot._load_tvb_publish_time(url) == page_time
+
+    bot._article_publish_time = lambda article_url, timeout=10: None
+    assert bot._load_tvb_publish_time(url) == datetime(2025, 8, 21, tzinfo=BEIJING_TZ)
+    assert bot._load_tvb_publish_time('https://www.tvb.com/artiste-news-c/20241234') is None
+
+
+def test_failed_sync_resolution_releases_waiters_and_the_url(bot):
+    url = 'https://www.tvb.com/artiste-news-c/abc'
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_load(article_url):
+        started.set()
+        release.wait(5)
+        raise RuntimeError('boom')
+
+    bot._load_tvb_publish_time = failing_load
+    errors = []
+
+    def call():
+        try:
+            bot.extract_tvb_publish_time(url)
+        except RuntimeError as e:
+            errors.append(e)
+
+    owner = threading.Thread(target=call)
+    owner.start()
+    assert started.wait(5)
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    assert not owner.is_alive() and not waiter.is_alive()
+    assert len(errors) == 2
+    assert url not in bot._tvb_publish_times
+
+    page_time = datetime(2025, 8, 21, 18, 30, tzinfo=BEIJING_TZ)
+    bot._load_tvb_publish_time = lambda article_url: page_time
+    assert bot.extract_tvb_publish_time(url) == page_time.isoformat()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""url_canon 测试：主机别名、跟踪参数、路径编码、YouTube 与 Google News 规则"""
+
+import base64
+
+import pytest
+
+from url_canon import (HOST_ALIASES, HOST_TRACKING_PARAMS, TRACKING_PARAMS, TRACKING_PREFIXES,
+                       URLCanonicalizer, canonicalize_url, decode_google_news_url, is_google_news_url)
+
+
+@pytest.mark.parametrize('alias, host', [
+    ('stheadline.com', 'www.stheadline.com'),
+    ('m.stheadline.com', 'www.stheadline.com'),
+    ('hk01.com', 'www.hk01.com'),
+    ('m.hk01.com', 'www.hk01.com'),
+    ('mingpao.com', 'www.mingpao.com'),
+    ('m.mingpao.com', 'www.mingpao.com'),
+    ('mpweekly.com', 'www.mpweekly.com'),
+    ('m.mpweekly.com', 'www.mpweekly.com'),
+    ('wenweipo.com', 'www.wenweipo.com'),
+    ('m.wenweipo.com', 'www.wenweipo.com'),
+    ('tvb.com', 'www.tvb.com'),
+    ('m.tvb.com', 'www.tvb.com'),
+    ('youtube.com', 'www.youtube.com'),
+    ('m.youtube.com', 'www.youtube.com'),
+])
+def test_each_host_alias(alias, host):
+    assert HOST_ALIASES[alias] == host
+    assert canonicalize_url(f'http://{alias}/article/123') == f'https://{host}/article/123'
+
+
+def test_alias_table_is_fully_covered():
+    # 新增别名时需要在上面的用例中补充测试
+    assert len(HOST_ALIASES) == 14
+
+
+@pytest.mark.parametrize('host', [
+    'std.stheadline.com', 'news.mingpao.com', 'ol.mingpao.com', 'www.mingpao.com',
+    'news.tvb.com', 'www.tvb.com', 'hk.on.cc', 'on.cc', 'music.youtube.com',
+])
+def test_distinct_sites_are_not_merged(host):
+    assert canonicalize_url(f'https://{host}/a/b') == f'https://{host}/a/b'
+
+
+def test_host_normalization():
+    assert canonicalize_url('HTTPS://WWW.HK01.COM:443/article/1') == 'https://www.hk01.com/article/1'
+    assert canonicalize_url('http://www.hk01.com.:80/article/1') == 'https://www.hk01.com/article/1'
+    assert canonicalize_url('//www.hk01.com/article/1') == 'https://www.hk01.com/article/1'
+
+
+@pytest.mark.parametrize('param', sorted(TRACKING_PARAMS))
+def test_global_tracking_params_stripped_everywhere(param):
+    assert canonicalize_url(f'https://hk.on.cc/a?id=1&{param}=x') == 'https://hk.on.cc/a?id=1'
+
+
+@pytest.mark.parametrize('prefix', TRACKING_PREFIXES)
+def test_tracking_prefixes_stripped(prefix):
+    url = f'https://www.hk01.com/a?{prefix}source=x&{prefix.upper()}campaign=y&page=2'
+    assert canonicalize_url(url) == 'https://www.hk01.com/a?page=2'
+
+
+@pytest.mark.parametrize('host, param', [
+    (host, param) for host, params in sorted(HOST_TRACKING_PARAMS.items()) for param in sorted(params)])
+def test_host_scoped_params(host, param):
+    assert canonicalize_url(f'https://{host}/search?{param}=x&q=1') == f'https://{host}/search?q=1'
+    # 其他站点上的同名参数保留
+    assert canonicalize_url(f'https://www.mpweekly.com/search?{param}=x') == \
+        f'https://www.mpweekly.com/search?{param}=x'
+
+
+@pytest.mark.parametrize('param', ['source', 'from', 'src', 'share', 'ref', 'oc'])
+def test_generic_keys_kept_on_news_sites(param):
+    url = f'https://std.stheadline.com/realtime/section-list.php?{param}=12'
+    assert canonicalize_url(url) == url
+
+
+def test_query_sorted_and_fragment_dropped():
+    assert canonicalize_url('https://www.hk01.com/a?b=2&a=1#top') == 'https://www.hk01.com/a?a=1&b=2'
+
+
+def test_chinese_slug_raw_and_encoded_are_equal():
+    raw = 'https://www.tvb.com/artiste-news-c/王敏奕新劇--1008140'
+    encoded = 'https://www.tvb.com/artiste-news-c/%E7%8E%8B%E6%95%8F%E5%A5%95%E6%96%B0%E5%8A%87--1008140'
+    assert canonicalize_url(raw) == canonicalize_url(encoded) == encoded
+
+
+def test_path_slashes():
+    assert canonicalize_url('https://www.hk01.com//article//1/') == 'https://www.hk01.com/article/1'
+    assert canonicalize_url('https://www.hk01.com') == 'https://www.hk01.com/'
+
+
+def test_youtube_rules():
+    expected = 'https://www.youtube.com/watch?v=abcdefghijk'
+    assert canonicalize_url('https://youtu.be/abcdefghijk?si=xyz') == expected
+    assert canonicalize_url('https://m.youtube.com/watch?v=abcdefghijk&list=PL1&t=10') == expected
+    assert canonicalize_url('https://www.youtube.com/shorts/abcdefghijk') == expected
+
+
+def test_non_http_untouched():
+    assert canonicalize_url('mailto:a@b.c') == 'mailto:a@b.c'
+    assert canonicalize_url('') == ''
+
+
+def google_news_url(target):
+    article_id = base64.urlsafe_b64encode(b'\x08\x13\x22' + bytes([len(target)]) + target.encode()).decode().rstrip('=')
+    return f'https://news.google.com/rss/articles/{article_id}?oc=5'
+
+
+def test_decode_google_news_url():
+    url = google_news_url('https://www.hk01.com/article/1')
+    assert is_google_news_url(url)
+    assert decode_google_news_url(url) == 'https://www.hk01.com/article/1'
+    assert decode_google_news_url('https://news.google.com/topics/abc') is None
+
+
+class FakeState:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, namespace, key, default=None):
+        return self.data.get((namespace, key), default)
+
+    def set(self, namespace, key, value, ttl=None):
+        self.data[(namespace, key)] = value
+
+
+class FakeSession:
+    def __init__(self, final_url):
+        self.final_url = final_url
+        self.calls = 0
+
+    def head(self, url, allow_redirects=True, timeout=None):
+        self.calls += 1
+        return type('Response', (), {'url': self.final_url})()
+
+
+def test_canonicalizer_resolves_and_caches_redirects():
+    session = FakeSession('https://m.hk01.com/article/9?utm_source=gn')
+    state = FakeState()
+    url = 'https://news.google.com/rss/articles/AAAA?oc=5'
+    canonicalizer = URLCanonicalizer(session=session, state=state)
+
+    assert canonicalizer.canonicalize(url, follow_redirects=False) == 'https://news.google.com/rss/articles/AAAA'
+    assert session.calls == 0
+    assert canonicalizer.canonicalize(url) == 'https://www.hk01.com/article/9'
+    assert canonicalizer.canonicalize(url) == 'https://www.hk01.com/article/9'
+    assert session.calls == 1
+
+    # 持久缓存跨实例复用
+    other = URLCanonicalizer(session=FakeSession('https://x/y'), state=state)
+    assert other.canonicalize(url, follow_redirects=False) == 'https://www.hk01.com/article/9'
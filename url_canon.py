@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews URL 规范化
+功能: 把同一篇新闻的不同URL写法统一成一个去重键（主机别名、中文slug编码、跟踪参数、
+      Google News 跳转链接），在去重和详情页抓取之前使用
+"""
+
+import re
+import base64
+import logging
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote, unquote
+
+# 各站点主机别名 -> 规范主机：只合并路径完全相同的写法（裸域名 / www、m. 移动版），
+# 不同子站（如 std.stheadline.com、news.mingpao.com、news.tvb.com）是不同的网站，不能合并
+HOST_ALIASES = {
+    'stheadline.com': 'www.stheadline.com',
+    'm.stheadline.com': 'www.stheadline.com',
+    'hk01.com': 'www.hk01.com',
+    'm.hk01.com': 'www.hk01.com',
+    'mingpao.com': 'www.mingpao.com',
+    'm.mingpao.com': 'www.mingpao.com',
+    'mpweekly.com': 'www.mpweekly.com',
+    'm.mpweekly.com': 'www.mpweekly.com',
+    'wenweipo.com': 'www.wenweipo.com',
+    'm.wenweipo.com': 'www.wenweipo.com',
+    'tvb.com': 'www.tvb.com',
+    'm.tvb.com': 'www.tvb.com',
+    'youtube.com': 'www.youtube.com',
+    'm.youtube.com': 'www.youtube.com',
+}
+
+# 只用于跟踪的参数（精确匹配）与前缀，所有站点都去掉
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'yclid', 'mc_cid', 'mc_eid', '_ga',
+    'spm', 'ocid', 'cmpid',
+}
+TRACKING_PREFIXES = ('utm_', 'itm_', 'pk_')
+
+# 只在特定站点上是跟踪/界面参数的通用键（其他站点上同名参数可能决定页面内容，保留）
+HOST_TRACKING_PARAMS = {
+    'www.youtube.com': {'feature', 'si', 'pp'},
+    'news.google.com': {'hl', 'gl', 'ceid', 'oc'},
+}
+
+# 路径中保留不编码的字符（与 RFC 3986 pchar 一致）
+PATH_SAFE = "/:@!$&'()*+,;=-._~"
+
+GOOGLE_NEWS_HOSTS = {'news.google.com'}
+GOOGLE_NEWS_ARTICLE = re.compile(r'/(?:rss/)?articles/([A-Za-z0-9_-]+)')
+EMBEDDED_URL = re.compile(rb'https?://[\x21-\x7e]+')
+
+
+def _canonical_host(netloc):
+    host = netloc.lower().rsplit('@', 1)[-1]
+    if host.endswith(':80') or host.endswith(':443'):
+        host = host.rsplit(':', 1)[0]
+    host = host.rstrip('.')
+    return HOST_ALIASES.get(host, host)
+
+
+def _is_tracking_param(key, host_tracking):
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES) or key in host_tracking
+
+
+def canonicalize_url(url):
+    """不联网的规范化：统一主机、解码再编码路径、去掉跟踪参数与锚点、参数排序"""
+    url = (url or '').strip()
+    if not url:
+        return url
+    if url.startswith('//'):
+        url = 'https:' + url
+
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https'):
+        return url
+    host = _canonical_host(parts.netloc)
+
+    # 统一百分号编码：原始中文 slug 与已编码 slug 得到同一结果
+    path = quote(unquote(parts.path), safe=PATH_SAFE) or '/'
+    path = re.sub(r'/{2,}', '/', path)
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    host_tracking = HOST_TRACKING_PARAMS.get(host, ())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not _is_tracking_param(k.lower(), host_tracking)]
+
+    # 站点规则
+    if host == 'youtu.be':
+        video_id = path.strip('/')
+        host, path, query = 'www.youtube.com', '/watch', [('v', video_id)]
+    elif host == 'www.youtube.com':
+        shorts = re.match(r'/shorts/([\w-]{11})$', path)
+        if shorts:
+            path, query = '/watch', [('v', shorts.group(1))]
+        elif path == '/watch':
+            query = [(k, v) for k, v in query if k == 'v']
+
+    return urlunsplit(('https', host, path, urlencode(sorted(query), quote_via=quote), ''))
+
+
+def is_google_news_url(url):
+    try:
+        return _canonical_host(urlsplit(url).netloc) in GOOGLE_NEWS_HOSTS
+    except ValueError:
+        return False
+
+
+def decode_google_news_url(url):
+    """离线解码 Google News 文章链接（旧版 CBMi... 格式内嵌原文URL），失败返回 None"""
+    match = GOOGLE_NEWS_ARTICLE.search(urlsplit(url).path)
+    if not match:
+        return None
+    article_id = match.group(1)
+    try:
+        decoded = base64.urlsafe_b64decode(article_id + '=' * (-len(article_id) % 4))
+    except (ValueError, TypeError):
+        return None
+    embedded = EMBEDDED_URL.search(decoded)
+    if not embedded:
+        return None
+    return embedded.group(0).decode('ascii', errors='ignore')
+
+
+class URLCanonicalizer:
+    """带 Google News 跳转解析的规范化器；解析结果缓存在状态存储中，跨运行复用"""
+
+    CACHE_NAMESPACE = 'google_news_redirect'
+
+    def __init__(self, session=None, state=None, timeout=5, cache_ttl=30 * 86400):
+        self.session = session
+        self.state = state
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._memory = {}
+
+    def resolve_google_news(self, url, follow_redirects=True):
+        """把 Google News 链接解析成原文URL：内存缓存 -> 持久缓存 -> 离线解码 -> 跟随跳转
+
+        follow_redirects 为 False 时不发请求，离线无法解析的链接返回 None（也不缓存失败结果）。
+        """
+        key = GOOGLE_NEWS_ARTICLE.search(urlsplit(url).path)
+        key = key.group(1) if key else url
+        if key in self._memory:
+            return self._memory[key]
+
+        target = self.state.get(self.CACHE_NAMESPACE, key) if self.state else None
+        if target is None:
+            target = decode_google_news_url(url)
+        if target is None and not follow_redirects:
+            return None
+        if target is None and self.session is not None:
+            try:
+                response = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+                if not is_google_news_url(response.url):
+                    target = response.url
+            except Exception as e:
+                logging.debug(f"解析Google News跳转失败 {url}: {e}")
+        if target and self.state:
+            self.state.set(self.CACHE_NAMESPACE, key, target, ttl=self.cache_ttl)
+
+        self._memory[key] = target
+        return target
+
+    def canonicalize(self, url, follow_redirects=True):
+        """返回去重用的规范URL；Google News 链接尽量还原为原文URL（follow_redirects 为 False 时不发请求）"""
+        if is_google_news_url(url):
+            url = self.resolve_google_news(url, follow_redirects) or url
+        return canonicalize_url(url)
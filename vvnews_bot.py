@@ -7,6 +7,7 @@ VVNews 王敏奕新闻机器人 - 原始版本 (完整9个新闻源)
 """
 
 import requests
+import asyncio
 import feedparser
 import re
 import json
@@ -18,6 +19,16 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from bs4 import BeautifulSoup
 import logging
+from state_store import StateStore
+from youtube_channels import ChannelResolver
+from publish_time import PRIORITY_DATE_TEXT, fetch_publish_time, fetch_publish_time_async, iso_and_readable
+from async_fetch import AsyncFetcher
+from bounded_pool import iter_bounded, gather_bounded
+from metadata_cache import ArticleMetadataCache
+from news_sources import (TVB_KNOWN_URLS, TVB_LIST_URLS, decoded_text, dedupe_by_url, oncc_dates_to_check,
+                          oncc_listing_urls, parse_tvb_home, parse_tvb_listing, parse_tvb_search,
+                          search_news_site, search_news_site_async, tvb_known_url_result, tvb_search_urls,
+                          youtube_rss_url)
 
 # Gmail API 支持（可选）
 try:
@@ -37,10 +48,25 @@ class VVNewsBot:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        self.state = StateStore()
+        # @handle → channel_id 长期缓存（与其他版本共用同一状态数据库）
+        self.channel_resolver = ChannelResolver(self.session, self.state)
+        # 文章发布时间缓存（与 vvnews_bot_auto.py 共用）：有时间的文章长期缓存，页面上没有时间的短期负缓存后再重试
+        self.article_cache = ArticleMetadataCache(
+            self.state, ttl=float(os.getenv('VVNEWS_ARTICLE_CACHE_DAYS', '30')) * 86400,
+            negative_ttl=float(os.getenv('VVNEWS_ARTICLE_NEGATIVE_HOURS', '6')) * 3600)
+        # 文章发布时间并发查询：并发上限与单页候选的总时限(秒)
+        self.detail_workers = int(os.getenv('VVNEWS_DETAIL_WORKERS', '4'))
+        self.publish_time_deadline = float(os.getenv('VVNEWS_PUBLISH_TIME_DEADLINE', '30'))
         
         # 搜索时间范围 (小时)
         self.search_hours = search_hours
         
+        # 异步抓取引擎（可选）：所有来源在一个事件循环中运行，按主机限制并发连接
+        self.use_async = os.getenv('VVNEWS_ASYNC', 'false').lower() == 'true'
+        self.per_host_limit = int(os.getenv('VVNEWS_PER_HOST_LIMIT', '4'))
+        self.source_timeout = float(os.getenv('VVNEWS_SOURCE_TIMEOUT', '120'))  # 单个来源超时(秒)
+        
         # 邮件配置
         self.email_config = {
             'smtp_server': 'smtp.gmail.com',
@@ -56,133 +82,244 @@ class VVNewsBot:
             'gmail_api_enabled': os.getenv('GMAIL_API_ENABLED', 'false').lower() == 'true'
         }
     
+    # 香港01 娱乐版块（用户指定的URL）与备用频道
+    HK01_ZONE_URL = "https://www.hk01.com/zone/2/娛樂"
+    HK01_CHANNELS = [
+        ("https://www.hk01.com/channel/22/即時娛樂", "即时娱乐频道"),
+        ("https://www.hk01.com/zone/1/港闻", "港闻版块"),
+        ("https://www.hk01.com/latest", "最新新闻"),
+        ("https://www.hk01.com/hot", "热门新闻")
+    ]
+
+    def _parse_hk01_zone(self, keyword, content):
+        """从娱乐版块页面中查找包含关键词的文章链接（最多5条）"""
+        results = []
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # 查找包含关键词的文章链接
+        links = soup.find_all('a', href=True)
+        seen_urls = set()
+
+        for link in links:
+            href = link.get('href', '')
+            text = link.get_text().strip()
+            title_attr = link.get('title', '').strip()
+
+            # 检查链接文本或标题属性是否包含关键词
+            for check_text in [text, title_attr]:
+                if (check_text and
+                    keyword.lower() in check_text.lower() and
+                    len(check_text) > 10 and
+                    ('/article/' in href or '/news/' in href)):
+
+                    # 构建完整URL
+                    if href.startswith('/'):
+                        full_url = f'https://www.hk01.com{href}'
+                    elif href.startswith('http'):
+                        full_url = href
+                    else:
+                        continue
+
+                    # 去重检查
+                    if full_url in seen_urls:
+                        continue
+                    seen_urls.add(full_url)
+
+                    result = {
+                        'title': check_text,
+                        'url': full_url,
+                        'source': '香港01',
+                        'keyword': keyword
+                    }
+
+                    results.append(result)
+                    logging.info(f"找到香港01娱乐文章: {check_text[:50]}...")
+                    break
+
+            # 限制结果数量
+            if len(results) >= 5:
+                break
+
+        return results
+
+    def _parse_hk01_channel(self, keyword, content, channel_name):
+        """从备用频道页面中查找包含关键词的文章链接（最多3条）"""
+        results = []
+        soup = BeautifulSoup(content, 'html.parser')
+        links = soup.find_all('a', href=True)
+
+        for link in links:
+            href = link.get('href', '')
+            text = link.get_text().strip()
+
+            if (keyword.lower() in text.lower() and
+                len(text) > 10 and
+                ('/article/' in href or '/news/' in href)):
+
+                if href.startswith('/'):
+                    full_url = f'https://www.hk01.com{href}'
+                else:
+                    full_url = href
+
+                # 简单去重
+                if not any(r['url'] == full_url for r in results):
+                    result = {
+                        'title': text,
+                        'url': full_url,
+                        'source': '香港01',
+                        'keyword': keyword
+                    }
+
+                    results.append(result)
+                    logging.info(f"在{channel_name}找到文章: {text[:50]}...")
+
+                    if len(results) >= 3:
+                        break
+
+        return results
+
     def search_hk01(self, keyword):
         """搜索香港01 - 使用娱乐版块的优化方法（同步自auto版本）"""
         results = []
-        
+
         try:
             logging.info(f"搜索香港01: {keyword}")
-            
-            # 方法1: 搜索娱乐版块（用户指定的URL）
-            entertainment_url = "https://www.hk01.com/zone/2/娛樂"
-            logging.info(f"检查香港01娱乐版块: {entertainment_url}")
-            
-            response = self.session.get(entertainment_url, timeout=15)
-            
+
+            # 方法1: 搜索娱乐版块
+            logging.info(f"检查香港01娱乐版块: {self.HK01_ZONE_URL}")
+
+            response = self.session.get(self.HK01_ZONE_URL, timeout=15)
+
             if response.status_code == 200:
                 content = response.text
-                
+
                 # 检查页面是否包含关键词
                 if keyword in content:
                     logging.info(f"在娱乐版块找到关键词: {keyword}")
-                    soup = BeautifulSoup(content, 'html.parser')
-                    
-                    # 查找包含关键词的文章链接
-                    links = soup.find_all('a', href=True)
-                    seen_urls = set()
-                    
-                    for link in links:
-                        href = link.get('href', '')
-                        text = link.get_text().strip()
-                        title_attr = link.get('title', '').strip()
-                        
-                        # 检查链接文本或标题属性是否包含关键词
-                        for check_text in [text, title_attr]:
-                            if (check_text and 
-                                keyword.lower() in check_text.lower() and 
-                                len(check_text) > 10 and
-                                ('/article/' in href or '/news/' in href)):
-                                
-                                # 构建完整URL
-                                if href.startswith('/'):
-                                    full_url = f'https://www.hk01.com{href}'
-                                elif href.startswith('http'):
-                                    full_url = href
-                                else:
-                                    continue
-                                
-                                # 去重检查
-                                if full_url in seen_urls:
-                                    continue
-                                seen_urls.add(full_url)
-                                
-                                result = {
-                                    'title': check_text,
-                                    'url': full_url,
-                                    'source': '香港01',
-                                    'keyword': keyword
-                                }
-                                
-                                results.append(result)
-                                logging.info(f"找到香港01娱乐文章: {check_text[:50]}...")
-                                break
-                        
-                        # 限制结果数量
-                        if len(results) >= 5:
-                            break
+                    results = self._parse_hk01_zone(keyword, content)
                 else:
                     logging.info("娱乐版块未包含关键词，尝试其他频道")
-            
+
             # 方法2: 如果娱乐版块没有找到，尝试其他相关频道
             if not results:
-                other_channels = [
-                    ("https://www.hk01.com/channel/22/即時娛樂", "即时娱乐频道"),
-                    ("https://www.hk01.com/zone/1/港闻", "港闻版块"),
-                    ("https://www.hk01.com/latest", "最新新闻"),
-                    ("https://www.hk01.com/hot", "热门新闻")
-                ]
-                
-                for channel_url, channel_name in other_channels:
+                for channel_url, channel_name in self.HK01_CHANNELS:
                     try:
                         logging.info(f"检查香港01{channel_name}: {channel_url}")
                         channel_response = self.session.get(channel_url, timeout=10)
-                        
+
                         if channel_response.status_code == 200 and keyword in channel_response.text:
-                            soup = BeautifulSoup(channel_response.text, 'html.parser')
-                            links = soup.find_all('a', href=True)
-                            
-                            for link in links:
-                                href = link.get('href', '')
-                                text = link.get_text().strip()
-                                
-                                if (keyword.lower() in text.lower() and 
-                                    len(text) > 10 and
-                                    ('/article/' in href or '/news/' in href)):
-                                    
-                                    if href.startswith('/'):
-                                        full_url = f'https://www.hk01.com{href}'
-                                    else:
-                                        full_url = href
-                                    
-                                    # 简单去重
-                                    if not any(r['url'] == full_url for r in results):
-                                        result = {
-                                            'title': text,
-                                            'url': full_url,
-                                            'source': '香港01',
-                                            'keyword': keyword
-                                        }
-                                        
-                                        results.append(result)
-                                        logging.info(f"在{channel_name}找到文章: {text[:50]}...")
-                                        
-                                        if len(results) >= 3:
-                                            break
-                            
+                            results = self._parse_hk01_channel(keyword, channel_response.text, channel_name)
+
                             # 如果找到结果就不再搜索其他频道
                             if results:
                                 break
-                                
+
                     except Exception as e:
                         logging.warning(f"搜索{channel_name}失败: {e}")
                         continue
-            
+
             logging.info(f"香港01 搜索完成，找到 {len(results)} 条结果")
             return results
         except Exception as e:
             logging.error(f"搜索香港01时出错: {e}")
             return results
 
+    async def search_hk01_async(self, keyword, fetcher):
+        """搜索香港01（异步版本）- 娱乐版块没有结果时并发抓取备用频道，按原顺序取第一个有结果的频道"""
+        results = []
+
+        try:
+            logging.info(f"[异步] 搜索香港01: {keyword}")
+
+            response = await fetcher.get(self.HK01_ZONE_URL, timeout=15)
+            if response.status_code == 200 and keyword in response.text:
+                results = self._parse_hk01_zone(keyword, response.text)
+
+            if not results:
+                responses = await fetcher.get_many([url for url, _ in self.HK01_CHANNELS], timeout=10)
+                for (channel_url, channel_name), channel_response in zip(self.HK01_CHANNELS, responses):
+                    if (channel_response is not None and channel_response.status_code == 200 and
+                            keyword in channel_response.text):
+                        results = self._parse_hk01_channel(keyword, channel_response.text, channel_name)
+                        if results:
+                            break
+
+            logging.info(f"[异步] 香港01 搜索完成，找到 {len(results)} 条结果")
+            return results
+        except Exception as e:
+            logging.error(f"[异步] 搜索香港01时出错: {e}")
+            return results
+
+    def _am730_candidate_pages(self, keyword):
+        return [
+            f"https://www.am730.com.hk/search?search={keyword}",  # 官方搜索页（参数版）
+            f"https://www.am730.com.hk/search/{keyword}",         # 备用路径版
+            "https://www.am730.com.hk/%E5%A8%9B%E6%A8%82",
+            "https://www.am730.com.hk/",
+        ]
+
+    def _am730_page_links(self, keyword, content):
+        """返回页面中标题包含关键词的 am730 文章 (标题, URL)，按出现顺序"""
+        links = []
+        soup = BeautifulSoup(content, 'lxml')
+        for a in soup.find_all('a'):
+            title = (a.get_text() or '').strip()
+            href = a.get('href') or ''
+            if not title or not href:
+                continue
+            if keyword not in title:
+                continue
+            if href.startswith('/'):
+                url = f"https://www.am730.com.hk{href}"
+            elif href.startswith('http'):
+                url = href
+            else:
+                continue
+            if 'am730.com.hk' not in url:
+                continue
+            links.append((title, url))
+        return links
+
+    def _am730_google_links(self, keyword, content):
+        """返回 Google site: 搜索结果中的 am730 链接 (标题, URL)，按出现顺序"""
+        links = []
+        soup = BeautifulSoup(content, 'lxml')
+        for a in soup.select('a'):
+            href = a.get('href') or ''
+            text = (a.get_text() or '').strip()
+            if not href or not text:
+                continue
+            if href.startswith('/url?q='):
+                try:
+                    real = href.split('/url?q=')[1].split('&')[0]
+                except Exception:
+                    continue
+            elif href.startswith('http'):
+                real = href
+            else:
+                continue
+            if 'am730.com.hk' not in real:
+                continue
+            if keyword not in text and keyword not in real:
+                continue
+            links.append((text[:120], real))
+        return links
+
+    def _am730_result(self, keyword, title, url, pub_iso, pub_readable):
+        """文章页无法解析时间或不在时间窗口内时返回 None，避免误报"""
+        if not pub_iso:
+            return None
+        if not self.is_within_time_range({'publish_time': pub_iso}):
+            return None
+        return {
+            'title': title,
+            'url': url,
+            'source': 'am730',
+            'keyword': keyword,
+            'publish_time': pub_iso,
+            'publish_time_readable': pub_readable
+        }
+
     def search_am730(self, keyword):
         """搜索 am730 娱乐新闻，优先站内页面，回退到简单匹配
         逻辑：尝试站内搜索/娱乐频道页，收集包含关键词的标题链接
@@ -190,57 +327,16 @@ class VVNewsBot:
         results = []
         try:
             logging.info(f"搜索 am730: {keyword}")
-            candidate_pages = [
-                f"https://www.am730.com.hk/search?search={keyword}",  # 官方搜索页（参数版）
-                f"https://www.am730.com.hk/search/{keyword}",         # 备用路径版
-                "https://www.am730.com.hk/%E5%A8%9B%E6%A8%82",
-                "https://www.am730.com.hk/",
-            ]
             seen = set()
             max_items = 6
-            for page in candidate_pages:
+            for page in self._am730_candidate_pages(keyword):
                 try:
                     resp = self.session.get(page, timeout=12)
                     if resp.status_code != 200:
                         continue
-                    soup = BeautifulSoup(resp.text, 'lxml')
-                    for a in soup.find_all('a'):
-                        title = (a.get_text() or '').strip()
-                        href = a.get('href') or ''
-                        if not title or not href:
-                            continue
-                        if keyword not in title:
-                            continue
-                        if href.startswith('/'):
-                            url = f"https://www.am730.com.hk{href}"
-                        elif href.startswith('http'):
-                            url = href
-                        else:
-                            continue
-                        if 'am730.com.hk' not in url:
-                            continue
-                        if url in seen:
-                            continue
-                        # 进入文章页提取发布时间并过滤24小时内
-                        pub_iso, pub_readable = self._extract_am730_publish_time(url)
-                        if not pub_iso:
-                            # 若文章页无法解析时间，则跳过，避免误报
-                            continue
-                        # 构造临时对象进行时间窗口校验
-                        temp_item = {'publish_time': pub_iso}
-                        if not self.is_within_time_range(temp_item):
-                            continue
-                        seen.add(url)
-                        results.append({
-                            'title': title,
-                            'url': url,
-                            'source': 'am730',
-                            'keyword': keyword,
-                            'publish_time': pub_iso,
-                            'publish_time_readable': pub_readable
-                        })
-                        if len(results) >= max_items:
-                            break
+                    # 本页候选的发布时间并发获取并过滤时间窗口（已缓存的文章不再请求）
+                    results.extend(self._collect_am730_results(
+                        keyword, self._am730_page_links(keyword, resp.text), max_items - len(results), seen))
                 except Exception:
                     continue
                 if len(results) >= max_items:
@@ -259,6 +355,87 @@ class VVNewsBot:
             logging.error(f"搜索 am730 时出错: {e}")
             return results
 
+    def _am730_candidates(self, links, seen):
+        """去掉已采用和重复的候选链接，保持顺序"""
+        candidates = []
+        candidate_urls = set()
+        for title, url in links:
+            if url not in seen and url not in candidate_urls:
+                candidate_urls.add(url)
+                candidates.append((title, url))
+        return candidates
+
+    def _collect_am730_results(self, keyword, links, need, seen):
+        """并发获取候选文章的发布时间，按候选顺序返回时间范围内的结果，达到 need 条即停止"""
+        results = []
+        if need <= 0:
+            return results
+        for (title, url), publish_time, error in iter_bounded(
+                lambda candidate: self._extract_am730_publish_time(candidate[1]),
+                self._am730_candidates(links, seen), max_workers=self.detail_workers,
+                deadline=self.publish_time_deadline):
+            if error is not None:
+                continue
+            result = self._am730_result(keyword, title, url, *publish_time)
+            if result is None:
+                continue
+            seen.add(url)
+            results.append(result)
+            if len(results) >= need:
+                break
+        return results
+
+    async def _collect_am730_results_async(self, keyword, links, need, seen, fetcher):
+        """_collect_am730_results 的异步版本"""
+        results = []
+        if need <= 0:
+            return results
+        for (title, url), publish_time, error in await gather_bounded(
+                lambda candidate: self._extract_am730_publish_time_async(candidate[1], fetcher),
+                self._am730_candidates(links, seen), max_workers=self.detail_workers,
+                deadline=self.publish_time_deadline):
+            if error is not None:
+                continue
+            result = self._am730_result(keyword, title, url, *publish_time)
+            if result is None:
+                continue
+            seen.add(url)
+            results.append(result)
+            if len(results) >= need:
+                break
+        return results
+
+    async def search_am730_async(self, keyword, fetcher):
+        """搜索 am730（异步版本）- 站内页面与文章发布时间并发抓取，结果顺序与同步版本一致"""
+        results = []
+        try:
+            logging.info(f"[异步] 搜索 am730: {keyword}")
+            seen = set()
+            max_items = 6
+            links = []
+            for resp in await fetcher.get_many(self._am730_candidate_pages(keyword), timeout=12):
+                if resp is not None and resp.status_code == 200:
+                    links.extend(self._am730_page_links(keyword, resp.text))
+            results = await self._collect_am730_results_async(keyword, links, max_items, seen, fetcher)
+            if len(results) < 2:
+                try:
+                    resp = await fetcher.get("https://www.google.com/search",
+                                             params={'q': f"site:am730.com.hk {keyword}", 'hl': 'zh-TW'},
+                                             headers={'User-Agent': self.session.headers.get('User-Agent', '')},
+                                             timeout=8)
+                    if resp.status_code == 200:
+                        results.extend(await self._collect_am730_results_async(
+                            keyword, self._am730_google_links(keyword, resp.text),
+                            max_items - len(results), seen, fetcher))
+                except Exception:
+                    pass
+
+            logging.info(f"[异步] am730 搜索完成，找到 {len(results)} 条结果")
+            return results
+        except Exception as e:
+            logging.error(f"[异步] 搜索 am730 时出错: {e}")
+            return results
+
     def _search_am730_via_google(self, keyword, need=3, seen=None):
         """回退：通过 Google site:am730.com.hk 搜索关键字页面"""
         if seen is None:
@@ -273,143 +450,155 @@ class VVNewsBot:
             resp = self.session.get(url, params={'q': q, 'hl': 'zh-TW'}, headers=headers, timeout=8)
             if resp.status_code != 200:
                 return results
-            soup = BeautifulSoup(resp.text, 'lxml')
-            for a in soup.select('a'):
-                href = a.get('href') or ''
-                text = (a.get_text() or '').strip()
-                if not href or not text:
-                    continue
-                if href.startswith('/url?q='):
-                    try:
-                        real = href.split('/url?q=')[1].split('&')[0]
-                    except Exception:
-                        continue
-                elif href.startswith('http'):
-                    real = href
-                else:
-                    continue
-                if 'am730.com.hk' not in real:
-                    continue
-                if keyword not in text and keyword not in real:
-                    continue
-                if real in seen:
-                    continue
-                pub_iso, pub_readable = self._extract_am730_publish_time(real)
-                if not pub_iso:
-                    continue
-                if not self.is_within_time_range({'publish_time': pub_iso}):
-                    continue
-                seen.add(real)
-                results.append({
-                    'title': text[:120],
-                    'url': real,
-                    'source': 'am730',
-                    'keyword': keyword,
-                    'publish_time': pub_iso,
-                    'publish_time_readable': pub_readable
-                })
-                if len(results) >= need:
-                    break
-            return results
+            return self._collect_am730_results(keyword, self._am730_google_links(keyword, resp.text), need, seen)
         except Exception:
             return results
 
+    def _load_article_publish_time(self, article_url, timeout):
+        publish_time = fetch_publish_time(self.session, article_url, timeout=timeout)
+        return {'publish_time': publish_time.isoformat()} if publish_time else None
+
+    async def _load_article_publish_time_async(self, article_url, fetcher, timeout):
+        publish_time = await fetch_publish_time_async(fetcher, article_url, timeout=timeout)
+        return {'publish_time': publish_time.isoformat()} if publish_time else None
+
     def _extract_am730_publish_time(self, article_url):
-        """从 am730 文章页提取发布时间 (iso, readable)"""
+        """从 am730 文章页提取发布时间 (iso, readable)，经文章元数据缓存，已查询过的文章不再抓取"""
         try:
-            resp = self.session.get(article_url, timeout=8)
-            if resp.status_code != 200:
-                return None, None
-            html = resp.text
-            patterns = [
-                r'<meta[^>]+property=["\']article:published_time["\'][^>]+content=["\']([^"\']+)["\']',
-                r'"datePublished"\s*:\s*"([^"]+)"',
-                r'<meta[^>]+name=["\']pubdate["\'][^>]+content=["\']([^"\']+)["\']',
-            ]
-            from datetime import timezone, timedelta
-            for pat in patterns:
-                m = re.search(pat, html, re.IGNORECASE)
-                if m:
-                    raw = m.group(1).strip()
-                    try:
-                        dt = datetime.fromisoformat(raw.replace('Z', '+00:00'))
-                    except Exception:
-                        # 尝试常见格式：YYYY-MM-DD HH:MM
-                        try:
-                            dt = datetime.strptime(raw[:16], '%Y-%m-%d %H:%M')
-                            dt = dt.replace(tzinfo=timezone(timedelta(hours=8)))
-                        except Exception:
-                            continue
-                    beijing_tz = timezone(timedelta(hours=8))
-                    dt_bj = dt.astimezone(beijing_tz)
-                    return dt.isoformat(), dt_bj.strftime('%Y-%m-%d %H:%M:%S')
+            record = self.article_cache.get_or_load(
+                article_url, lambda: self._load_article_publish_time(article_url, 8))
+            return iso_and_readable(datetime.fromisoformat(record['publish_time']) if record else None)
         except Exception:
             return None, None
-        return None, None
-    
+
+    async def _extract_am730_publish_time_async(self, article_url, fetcher):
+        """_extract_am730_publish_time 的异步版本"""
+        try:
+            record = await self.article_cache.get_or_load_async(
+                article_url, lambda: self._load_article_publish_time_async(article_url, fetcher, 8))
+            return iso_and_readable(datetime.fromisoformat(record['publish_time']) if record else None)
+        except Exception:
+            return None, None
+
+    def _google_news_url(self, keyword):
+        """根据搜索时间范围构建 Google News 搜索URL（带 when 参数）"""
+        if self.search_hours <= 1:
+            when_param = "when:1h"
+        elif self.search_hours <= 24:
+            when_param = "when:1d"
+        elif self.search_hours <= 168:  # 7天
+            when_param = "when:7d"
+        else:
+            when_param = ""  # 无时间限制
+
+        if when_param:
+            return f"https://news.google.com/search?q={keyword} {when_param}&hl=zh-TW&gl=HK&ceid=HK:zh-TW"
+        return f"https://news.google.com/search?q={keyword}&hl=zh-TW&gl=HK&ceid=HK:zh-TW"
+
+    def _parse_google_news(self, keyword, content):
+        results = []
+        soup = BeautifulSoup(content, 'html.parser')
+        articles = soup.find_all('article')
+
+        for article in articles[:10]:  # 限制结果数量
+            title_elem = article.find('h3')
+            if title_elem and keyword.lower() in title_elem.get_text().lower():
+                title = title_elem.get_text().strip()
+                link_elem = article.find('a')
+                if link_elem:
+                    article_url = 'https://news.google.com' + link_elem.get('href', '')
+
+                    results.append({
+                        'title': title,
+                        'url': article_url,
+                        'source': 'Google News',
+                        'keyword': keyword
+                    })
+        return results
+
     def search_google_news(self, keyword):
         """搜索Google News - 带时间过滤"""
         results = []
-        
+
         try:
             logging.info(f"搜索Google新闻: {keyword} (过去{self.search_hours}小时)")
-            
-            # 根据搜索时间范围添加when参数
-            if self.search_hours <= 1:
-                when_param = "when:1h"
-            elif self.search_hours <= 24:
-                when_param = "when:1d"
-            elif self.search_hours <= 168:  # 7天
-                when_param = "when:7d"
-            else:
-                when_param = ""  # 无时间限制
-            
-            # 构建搜索URL
-            if when_param:
-                url = f"https://news.google.com/search?q={keyword} {when_param}&hl=zh-TW&gl=HK&ceid=HK:zh-TW"
-            else:
-                url = f"https://news.google.com/search?q={keyword}&hl=zh-TW&gl=HK&ceid=HK:zh-TW"
-                
-            response = self.session.get(url, timeout=15)
-            
+
+            response = self.session.get(self._google_news_url(keyword), timeout=15)
+
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                articles = soup.find_all('article')
-                
-                for article in articles[:10]:  # 限制结果数量
-                    title_elem = article.find('h3')
-                    if title_elem and keyword.lower() in title_elem.get_text().lower():
-                        title = title_elem.get_text().strip()
-                        link_elem = article.find('a')
-                        if link_elem:
-                            article_url = 'https://news.google.com' + link_elem.get('href', '')
-                            
-                            results.append({
-                                'title': title,
-                                'url': article_url,
-                                'source': 'Google News',
-                                'keyword': keyword
-                            })
-            
+                results = self._parse_google_news(keyword, response.text)
+
             logging.info(f"Google News 搜索完成，找到 {len(results)} 条结果")
             return results
-            
+
         except Exception as e:
             logging.error(f"搜索Google News时出错: {e}")
             return results
-    
+
+    async def search_google_news_async(self, keyword, fetcher):
+        """搜索Google News（异步版本）"""
+        results = []
+
+        try:
+            logging.info(f"[异步] 搜索Google新闻: {keyword} (过去{self.search_hours}小时)")
+
+            response = await fetcher.get(self._google_news_url(keyword), timeout=15)
+
+            if response.status_code == 200:
+                results = self._parse_google_news(keyword, response.text)
+
+            logging.info(f"[异步] Google News 搜索完成，找到 {len(results)} 条结果")
+            return results
+
+        except Exception as e:
+            logging.error(f"[异步] 搜索Google News时出错: {e}")
+            return results
+
+    def _youtube_channel_handles(self):
+        """返回需要搜索的频道标识（YOUTUBE_CHANNEL_IDS 环境变量，默认两个TVB频道handle）"""
+        env_ids = os.getenv('YOUTUBE_CHANNEL_IDS', '').strip()
+        if env_ids:
+            return [x.strip() for x in env_ids.split(',') if x.strip()]
+        return ['@TVBENews', '@TVB']
+
+    def _match_youtube_entries(self, feed, keyword, max_per_channel=5):
+        """从频道RSS中选出标题包含关键词且在时间窗口内的视频"""
+        from datetime import datetime as _dt
+        now_ts = _dt.utcnow()
+        cutoff_hours = float(os.getenv('SEARCH_HOURS', str(self.search_hours)))
+        results = []
+
+        for entry in feed.entries[:max_per_channel]:
+            title = entry.get('title', '')
+            link = entry.get('link', '')
+            published_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+            publish_time_iso = None
+            publish_time_readable = None
+            within_window = True
+            if published_parsed:
+                publish_dt = _dt(*published_parsed[:6])  # UTC
+                publish_time_iso = publish_dt.isoformat()
+                publish_time_readable = publish_dt.strftime('%Y-%m-%d %H:%M:%S')
+                diff_hours = (now_ts - publish_dt).total_seconds() / 3600.0
+                within_window = diff_hours <= cutoff_hours
+
+            if keyword.lower() in title.lower() and within_window:
+                results.append({
+                    'title': title,
+                    'url': link,
+                    'source': 'YouTube',
+                    'publish_time': publish_time_iso,
+                    'publish_time_readable': publish_time_readable,
+                    'keyword': keyword
+                })
+        return results
+
     def search_youtube(self, keyword):
         """搜索YouTube - 使用RSS优先策略（同步auto版，支持多频道与时间窗）"""
         results = []
         try:
-            env_ids = os.getenv('YOUTUBE_CHANNEL_IDS', '').strip()
-            if env_ids:
-                raw_ids = [x.strip() for x in env_ids.split(',') if x.strip()]
-            else:
-                raw_ids = ['@TVBENews', '@TVB']
-
             channel_ids = []
-            for ident in raw_ids:
+            for ident in self._youtube_channel_handles():
                 cid = self._resolve_youtube_channel_id(ident)
                 if cid:
                     channel_ids.append(cid)
@@ -418,42 +607,14 @@ class VVNewsBot:
                 logging.warning("未解析到有效的YouTube频道ID，跳过YouTube搜索")
                 return results
 
-            from datetime import datetime as _dt
-            now_ts = _dt.utcnow()
-            cutoff_hours = float(os.getenv('SEARCH_HOURS', str(self.search_hours)))
-            max_per_channel = 5
-
             for channel_id in channel_ids:
-                rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+                rss_url = youtube_rss_url(channel_id)
                 try:
                     feed = feedparser.parse(rss_url)
                 except Exception as e:
                     logging.warning(f"解析RSS失败: {rss_url} -> {e}")
                     continue
-
-                for entry in feed.entries[:max_per_channel]:
-                    title = entry.get('title', '')
-                    link = entry.get('link', '')
-                    published_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
-                    publish_time_iso = None
-                    publish_time_readable = None
-                    within_window = True
-                    if published_parsed:
-                        publish_dt = _dt(*published_parsed[:6])  # UTC
-                        publish_time_iso = publish_dt.isoformat()
-                        publish_time_readable = publish_dt.strftime('%Y-%m-%d %H:%M:%S')
-                        diff_hours = (now_ts - publish_dt).total_seconds() / 3600.0
-                        within_window = diff_hours <= cutoff_hours
-
-                    if keyword.lower() in title.lower() and within_window:
-                        results.append({
-                            'title': title,
-                            'url': link,
-                            'source': 'YouTube',
-                            'publish_time': publish_time_iso,
-                            'publish_time_readable': publish_time_readable,
-                            'keyword': keyword
-                        })
+                results.extend(self._match_youtube_entries(feed, keyword))
 
             logging.info(f"YouTube RSS 搜索完成，找到 {len(results)} 条结果")
             return results
@@ -461,30 +622,41 @@ class VVNewsBot:
             logging.error(f"搜索YouTube时出错: {e}")
             return results
 
-    def _resolve_youtube_channel_id(self, handle_or_url: str) -> str:
-        """解析 @handle 或 URL 到 channel_id。"""
-        ident = handle_or_url.strip()
+    async def _fetch_youtube_feed_async(self, channel_id, fetcher):
+        rss_url = youtube_rss_url(channel_id)
         try:
-            if ident.startswith('UC') and len(ident) > 10:
-                return ident
-            if 'youtube.com/channel/' in ident:
-                m = re.search(r"/channel/([A-Za-z0-9_-]+)", ident)
-                return m.group(1) if m else ''
-            if ident.startswith('http'):
-                url = ident
-            elif ident.startswith('@'):
-                url = f"https://www.youtube.com/{ident}"
-            else:
-                url = f"https://www.youtube.com/@{ident}"
+            response = await fetcher.get(rss_url, timeout=15)
+            return feedparser.parse(response.content) if response.status_code == 200 else None
+        except Exception as e:
+            logging.warning(f"[异步] 解析RSS失败: {rss_url} -> {e}")
+            return None
+
+    async def search_youtube_async(self, keyword, fetcher):
+        """搜索YouTube（异步版本）- 频道ID解析与各频道RSS并发抓取"""
+        results = []
+        try:
+            resolved = await asyncio.gather(
+                *(self.channel_resolver.resolve_async(ident, fetcher) for ident in self._youtube_channel_handles()))
+            channel_ids = [cid for cid in resolved if cid]
+
+            if not channel_ids:
+                logging.warning("未解析到有效的YouTube频道ID，跳过YouTube搜索")
+                return results
+
+            feeds = await asyncio.gather(*(self._fetch_youtube_feed_async(cid, fetcher) for cid in channel_ids))
+            for feed in feeds:
+                if feed is not None:
+                    results.extend(self._match_youtube_entries(feed, keyword))
 
-            resp = self.session.get(url, timeout=10)
-            if resp.status_code == 200:
-                m = re.search(r'"channelId":"(UC[^"]+)"', resp.text)
-                if m:
-                    return m.group(1)
+            logging.info(f"[异步] YouTube RSS 搜索完成，找到 {len(results)} 条结果")
+            return results
         except Exception as e:
-            logging.warning(f"解析频道ID失败: {ident} -> {e}")
-        return ''
+            logging.error(f"[异步] 搜索YouTube时出错: {e}")
+            return results
+
+    def _resolve_youtube_channel_id(self, handle_or_url: str) -> str:
+        """解析 @handle 或 URL 到 channel_id（持久化缓存，未缓存时下载频道页面）。"""
+        return self.channel_resolver.resolve(handle_or_url)
 
     def get_youtube_video_real_title(self, video_url, video_id):
         """获取YouTube视频的真实标题"""
@@ -616,1208 +788,709 @@ class VVNewsBot:
             logging.error(f"获取YouTube视频发布时间失败: {e}")
             return None
     
+    def _oncc_listing_links(self, keyword, content, dates_to_check):
+        """返回列表页中包含关键词的新闻链接 (链接文本, 完整URL)，每个链接取第一个匹配的文本"""
+        links = []
+        soup = BeautifulSoup(content, 'html.parser')
+
+        for link in soup.find_all('a', href=True):
+            # 获取链接文本和属性
+            texts_to_check = [
+                link.get_text().strip(),
+                link.get('title', '').strip(),
+                link.get('alt', '').strip()
+            ]
+
+            href = link.get('href', '')
+
+            for text in texts_to_check:
+                if (text and keyword.lower() in text.lower() and
+                    len(text) > 8 and len(text) < 300):
+
+                    # 检查是否是有效的新闻链接（增强版）
+                    if (href and
+                        any(pattern in href.lower() for pattern in
+                            ['/bkn/', '/cnt/', '/news/', '/entertainment/', '/hk/', '.html']) and
+                        'index.html' not in href and 'search' not in href and
+                        # 特别匹配目标新闻的URL模式
+                        (any(date_pattern in href for date_pattern in dates_to_check) or
+                         'bkn-' in href or '/cnt/' in href)):
+
+                        # 构建完整URL
+                        if href.startswith('/'):
+                            full_url = 'https://hk.on.cc' + href
+                        elif href.startswith('http'):
+                            full_url = href
+                        else:
+                            full_url = f'https://hk.on.cc/{href}'
+
+                        links.append((text, full_url))
+                        break
+
+        return links
+
+    def _oncc_page_title(self, keyword, content, strip_site_suffix=False):
+        """从文章页提取包含关键词的标题，找不到返回 None"""
+        detail_soup = BeautifulSoup(content, 'html.parser')
+        title_selectors = ['h1', 'title', '.headline', '.article-title']
+
+        for selector in title_selectors:
+            title_elem = detail_soup.select_one(selector)
+            if title_elem:
+                candidate = title_elem.get_text().strip()
+                if keyword.lower() in candidate.lower() and len(candidate) > 10:
+                    if strip_site_suffix and selector == 'title':
+                        # 清理title标签中的网站后缀
+                        candidate = candidate.split('｜')[0].split('|')[0].strip()
+                    return candidate
+        return None
+
+    def _oncc_listing_result(self, keyword, text, full_url, detail_response):
+        """列表页链接的结果：能打开详情页时优先使用页面标题；详情页不可访问返回 None"""
+        if detail_response.status_code != 200:
+            return None
+        page_title = self._oncc_page_title(keyword, detail_response.content)
+        final_title = page_title if page_title else text
+        logging.info(f"找到东网新闻: {final_title[:40]}...")
+        return {
+            'title': final_title,
+            'url': full_url,
+            'source': '東網on.cc',
+            'keyword': keyword
+        }
+
+    def _oncc_fallback_result(self, keyword, text, full_url):
+        # 如果无法获取详情，使用原始信息
+        return {
+            'title': text,
+            'url': full_url,
+            'source': '東網on.cc',
+            'keyword': keyword
+        }
+
+    def _oncc_sitemap_candidates(self, sitemap_content):
+        """解析东网Sitemap，返回待检查的娱乐新闻 (URL, 时间)：最近3天的优先，其他最多20个"""
+        import xml.etree.ElementTree as ET
+        from datetime import timezone, timedelta
+
+        # 解析Sitemap XML
+        root = ET.fromstring(sitemap_content)
+
+        # 获取当前时间用于时间过滤 (使用北京时区)
+        beijing_tz = timezone(timedelta(hours=8))
+        current_time = datetime.now(beijing_tz)
+        time_threshold = current_time - timedelta(hours=self.search_hours)
+
+        # 生成最近几天的日期用于搜索
+        dates_to_check = []
+        for i in range(7):  # 检查最近7天
+            date = current_time - timedelta(days=i)
+            dates_to_check.append(date.strftime('%Y%m%d'))
+
+        # 查找最近的entertainment URLs
+        entertainment_urls = []
+        for url_elem in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url'):
+            loc_elem = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
+            lastmod_elem = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
+
+            if loc_elem is not None:
+                url = loc_elem.text
+                lastmod = lastmod_elem.text if lastmod_elem is not None else None
+
+                # 过滤entertainment URL和时间范围
+                if ('entertainment' in url.lower() and lastmod):
+                    try:
+                        # 解析时间: 2025-08-21T14:47:10+08:00
+                        url_time = datetime.fromisoformat(lastmod.replace('Z', '+00:00'))
+
+                        # 转换为北京时间进行比较
+                        if url_time.tzinfo is None:
+                            url_time = url_time.replace(tzinfo=beijing_tz)
+                        else:
+                            url_time = url_time.astimezone(beijing_tz)
+
+                        # 检查是否在时间范围内（使用aware datetime比较）
+                        if url_time >= time_threshold:
+                            entertainment_urls.append((url, url_time))
+                    except:
+                        # 如果时间解析失败，仍然包含最近几天的URL
+                        if any(date_str in url for date_str in dates_to_check[:3]):
+                            entertainment_urls.append((url, current_time))
+
+        # 按时间排序，最新的在前
+        entertainment_urls.sort(key=lambda x: x[1], reverse=True)
+
+        logging.info(f"Sitemap找到 {len(entertainment_urls)} 个最近的娱乐新闻URL")
+
+        # 优先检查最近几天的URL
+        recent_dates = [
+            (current_time - timedelta(days=i)).strftime('%Y%m%d')
+            for i in range(3)
+        ]
+        priority_urls = []
+        other_urls = []
+
+        for url, url_time in entertainment_urls:
+            if any(date_str in url for date_str in recent_dates):
+                priority_urls.append((url, url_time))
+            else:
+                other_urls.append((url, url_time))
+
+        logging.info(f"优先检查最近新闻 {len(priority_urls)} 条，其他 {len(other_urls[:20])} 条")
+
+        # 合并：先检查最近几天的，再检查其他的
+        return priority_urls + other_urls[:20]  # 优先最近 + 其他20个
+
+    def _oncc_sitemap_result(self, keyword, url, detail_response):
+        """Sitemap文章页包含关键词时返回结果，否则返回 None"""
+        if detail_response.status_code != 200:
+            return None
+        detail_content = decoded_text(detail_response)
+        if keyword.lower() not in detail_content.lower():
+            return None
+
+        title = self._oncc_page_title(keyword, detail_content, strip_site_suffix=True)
+        if not title:
+            title = f"東網娱乐新闻 - {keyword}相关"
+
+        logging.info(f"通过Sitemap找到东网新闻: {title[:40]}...")
+        return {
+            'title': title,
+            'url': url,
+            'source': '東網on.cc (Sitemap)',
+            'keyword': keyword
+        }
+
+    def _parse_oncc_text(self, keyword, main_response):
+        """在东网主页文本节点中查找关键词，返回第一个位于新闻链接中的文本"""
+        results = []
+        content = decoded_text(main_response)
+        if keyword not in content:
+            return results
+
+        soup = BeautifulSoup(main_response.content, 'html.parser')
+
+        # 查找包含关键词的文本节点
+        for text_node in soup.find_all(text=True):
+            if keyword.lower() in str(text_node).lower():
+                text_content = str(text_node).strip()
+                if len(text_content) > 10 and len(text_content) < 200:
+
+                    # 查找父链接
+                    parent = text_node.parent
+                    while parent and parent.name != 'a':
+                        parent = parent.parent
+
+                    if parent and parent.get('href'):
+                        href = parent.get('href')
+                        if any(pattern in href for pattern in ['/bkn/', '/news/', '/hk/']):
+                            full_url = 'https://hk.on.cc' + href if href.startswith('/') else href
+
+                            results.append({
+                                'title': text_content,
+                                'url': full_url,
+                                'source': '東網on.cc (文本)',
+                                'keyword': keyword
+                            })
+                            break
+        return results
+
     def search_oncc(self, keyword):
         """搜索東網on.cc - 增强版：包含基于日期的搜索策略"""
         results = []
-        
+
         try:
             logging.info(f"搜索東網: {keyword}")
-            
-            # 生成最近几天的日期用于搜索
-            from datetime import datetime, timedelta
-            today = datetime.now()
-            dates_to_check = []
-            for i in range(7):  # 检查最近7天
-                date = today - timedelta(days=i)
-                dates_to_check.append(date.strftime('%Y%m%d'))
-            
-            # 策略1: 检查多个可能的东网页面（增强版）
-            oncc_urls = [
-                "https://hk.on.cc/hk/entertainment/index.html",  # 娱乐首页
-                "https://hk.on.cc/hk/bkn/cnt/entertainment/",    # BKN娱乐目录 - 重点
-                "https://hk.on.cc/hk/bkn/cnt/",                  # BKN内容目录
-                "https://hk.on.cc/hk/bkn/",                      # BKN主页 
-                "https://hk.on.cc/hk/news/",                     # 新闻主页
-                "https://hk.on.cc/"                              # 主页
-            ]
-            
-            # 策略1.5: 基于日期的直接搜索（新增）
-            date_based_urls = []
-            for date_str in dates_to_check[:3]:  # 只检查最近3天，避免过多请求
-                date_based_urls.extend([
-                    f"https://hk.on.cc/hk/bkn/cnt/entertainment/{date_str}/",
-                    f"https://hk.on.cc/hk/bkn/cnt/news/{date_str}/",
-                ])
-            
-            # 合并所有URL
-            all_urls = oncc_urls + date_based_urls
-            
-            for base_url in all_urls:
+
+            dates_to_check = oncc_dates_to_check()
+
+            for base_url in oncc_listing_urls(dates_to_check):
                 try:
                     logging.info(f"检查东网页面: {base_url}")
                     response = self.session.get(base_url, timeout=10)
-                    
+
                     if response.status_code == 200:
-                        # 处理编码问题
-                        if response.encoding == 'ISO-8859-1':
-                            response.encoding = 'utf-8'
-                        
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        
-                        # 查找新闻容器
-                        news_containers = soup.find_all(['div', 'section'], 
-                                                       class_=re.compile(r'news|article|content|story', re.I))
-                        
-                        # 检查所有链接
-                        all_links = soup.find_all('a', href=True)
-                        
-                        for link in all_links:
-                            # 获取链接文本和属性
-                            texts_to_check = [
-                                link.get_text().strip(),
-                                link.get('title', '').strip(),
-                                link.get('alt', '').strip()
-                            ]
-                            
-                            href = link.get('href', '')
-                            
-                            for text in texts_to_check:
-                                if (text and keyword.lower() in text.lower() and 
-                                    len(text) > 8 and len(text) < 300):
-                                    
-                                    # 检查是否是有效的新闻链接（增强版）
-                                    if (href and 
-                                        any(pattern in href.lower() for pattern in 
-                                            ['/bkn/', '/cnt/', '/news/', '/entertainment/', '/hk/', '.html']) and
-                                        'index.html' not in href and 'search' not in href and
-                                        # 特别匹配目标新闻的URL模式
-                                        (any(date_pattern in href for date_pattern in dates_to_check) or
-                                         'bkn-' in href or '/cnt/' in href)):
-                                        
-                                        # 构建完整URL
-                                        if href.startswith('/'):
-                                            full_url = 'https://hk.on.cc' + href
-                                        elif href.startswith('http'):
-                                            full_url = href
-                                        else:
-                                            full_url = f'https://hk.on.cc/{href}'
-                                        
-                                        # 尝试获取更详细的信息
-                                        try:
-                                            detail_response = self.session.get(full_url, timeout=8)
-                                            if detail_response.status_code == 200:
-                                                if detail_response.encoding == 'ISO-8859-1':
-                                                    detail_response.encoding = 'utf-8'
-                                                    
-                                                detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
-                                                
-                                                # 获取页面标题
-                                                page_title = None
-                                                title_selectors = ['h1', 'title', '.headline', '.article-title']
-                                                
-                                                for selector in title_selectors:
-                                                    title_elem = detail_soup.select_one(selector)
-                                                    if title_elem:
-                                                        candidate = title_elem.get_text().strip()
-                                                        if keyword.lower() in candidate.lower() and len(candidate) > 10:
-                                                            page_title = candidate
-                                                            break
-                                                
-                                                final_title = page_title if page_title else text
-                                                
-                                                results.append({
-                                                    'title': final_title,
-                                                    'url': full_url,
-                                                    'source': '東網on.cc',
-                                                    'keyword': keyword
-                                                })
-                                                
-                                                logging.info(f"找到东网新闻: {final_title[:40]}...")
-                                                break  # 找到一个就跳出文本检查循环
-                                        except:
-                                            # 如果无法获取详情，使用原始信息
-                                            results.append({
-                                                'title': text,
-                                                'url': full_url,
-                                                'source': '東網on.cc',
-                                                'keyword': keyword
-                                            })
-                                            break
-                        
+                        for text, full_url in self._oncc_listing_links(keyword, response.content, dates_to_check):
+                            # 尝试获取更详细的信息
+                            try:
+                                result = self._oncc_listing_result(
+                                    keyword, text, full_url, self.session.get(full_url, timeout=8))
+                            except:
+                                result = self._oncc_fallback_result(keyword, text, full_url)
+                            if result is not None:
+                                results.append(result)
+
                         # 如果找到结果就停止检查其他页面
                         if results:
                             break
-                            
+
                 except Exception as e:
                     logging.warning(f"检查东网页面 {base_url} 失败: {str(e)}")
                     continue
-            
-            # 策略2: 基于Sitemap的精确搜索（新增高效策略）
+
+            # 策略2: 基于Sitemap的精确搜索
             if not results:
                 logging.info("尝试东网Sitemap策略...")
-                
+
                 try:
-                    sitemap_url = "https://hk.on.cc/sitemap.xml"
-                    sitemap_response = self.session.get(sitemap_url, timeout=15)
-                    
+                    sitemap_response = self.session.get("https://hk.on.cc/sitemap.xml", timeout=15)
+
                     if sitemap_response.status_code == 200:
-                        import xml.etree.ElementTree as ET
-                        from datetime import datetime, timedelta
-                        
-                        # 解析Sitemap XML
-                        root = ET.fromstring(sitemap_response.text)
-                        
-                        # 获取当前时间用于时间过滤 (使用北京时区)
-                        from datetime import timezone
-                        beijing_tz = timezone(timedelta(hours=8))
-                        current_time = datetime.now(beijing_tz)
-                        time_threshold = current_time - timedelta(hours=self.search_hours)
-                        
-                        # 生成最近几天的日期用于搜索
-                        dates_to_check = []
-                        for i in range(7):  # 检查最近7天
-                            date = current_time - timedelta(days=i)
-                            dates_to_check.append(date.strftime('%Y%m%d'))
-                        
-                        # 查找最近的entertainment URLs
-                        entertainment_urls = []
-                        for url_elem in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url'):
-                            loc_elem = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                            lastmod_elem = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-                            
-                            if loc_elem is not None:
-                                url = loc_elem.text
-                                lastmod = lastmod_elem.text if lastmod_elem is not None else None
-                                
-                                # 过滤entertainment URL和时间范围
-                                if ('entertainment' in url.lower() and lastmod):
-                                    try:
-                                        # 解析时间: 2025-08-21T14:47:10+08:00
-                                        url_time = datetime.fromisoformat(lastmod.replace('Z', '+00:00'))
-                                        
-                                        # 转换为北京时间进行比较
-                                        if url_time.tzinfo is None:
-                                            url_time = url_time.replace(tzinfo=beijing_tz)
-                                        else:
-                                            # 转换到北京时区
-                                            url_time = url_time.astimezone(beijing_tz)
-                                        
-                                        # 检查是否在时间范围内（使用aware datetime比较）
-                                        if url_time >= time_threshold:
-                                            entertainment_urls.append((url, url_time))
-                                    except:
-                                        # 如果时间解析失败，仍然包含最近几天的URL
-                                        if any(date_str in url for date_str in dates_to_check[:3]):
-                                            entertainment_urls.append((url, current_time))
-                        
-                        # 按时间排序，最新的在前
-                        entertainment_urls.sort(key=lambda x: x[1], reverse=True)
-                        
-                        logging.info(f"Sitemap找到 {len(entertainment_urls)} 个最近的娱乐新闻URL")
-                        
-                        # 检查这些URL是否包含关键词
-                        # 优先检查最近几天的URL
-                        priority_urls = []
-                        other_urls = []
-                        
-                        for url, url_time in entertainment_urls:
-                            # 检查最近3天的新闻
-                            recent_dates = [
-                                (current_time - timedelta(days=i)).strftime('%Y%m%d') 
-                                for i in range(3)
-                            ]
-                            if any(date_str in url for date_str in recent_dates):
-                                priority_urls.append((url, url_time))
-                            else:
-                                other_urls.append((url, url_time))
-                        
-                        # 合并：先检查最近几天的，再检查其他的
-                        urls_to_check = priority_urls + other_urls[:20]  # 优先最近 + 其他20个
-                        
-                        logging.info(f"优先检查最近新闻 {len(priority_urls)} 条，其他 {len(other_urls[:20])} 条")
-                        
-                        for url, url_time in urls_to_check:
+                        for url, url_time in self._oncc_sitemap_candidates(sitemap_response.text):
                             try:
                                 logging.info(f"检查Sitemap URL: {url[-60:]}...")
-                                
-                                detail_response = self.session.get(url, timeout=8)
-                                if detail_response.status_code == 200:
-                                    if detail_response.encoding == 'ISO-8859-1':
-                                        detail_response.encoding = 'utf-8'
-                                    
-                                    detail_content = detail_response.text
-                                    
-                                    if keyword.lower() in detail_content.lower():
-                                        # 提取标题
-                                        detail_soup = BeautifulSoup(detail_content, 'html.parser')
-                                        
-                                        title = None
-                                        title_selectors = ['h1', 'title', '.headline', '.article-title']
-                                        for selector in title_selectors:
-                                            title_elem = detail_soup.select_one(selector)
-                                            if title_elem:
-                                                candidate = title_elem.get_text().strip()
-                                                if keyword.lower() in candidate.lower() and len(candidate) > 10:
-                                                    title = candidate
-                                                    if selector == 'title':
-                                                        # 清理title标签中的网站后缀
-                                                        title = title.split('｜')[0].split('|')[0].strip()
-                                                    break
-                                        
-                                        if not title:
-                                            title = f"東網娱乐新闻 - {keyword}相关"
-                                        
-                                        results.append({
-                                            'title': title,
-                                            'url': url,
-                                            'source': '東網on.cc (Sitemap)',
-                                            'keyword': keyword
-                                        })
-                                        
-                                        logging.info(f"通过Sitemap找到东网新闻: {title[:40]}...")
-                                        
-                                        # 找到一定数量就停止
-                                        if len(results) >= 3:
-                                            break
+                                result = self._oncc_sitemap_result(keyword, url, self.session.get(url, timeout=8))
+                                if result is not None:
+                                    results.append(result)
+
+                                    # 找到一定数量就停止
+                                    if len(results) >= 3:
+                                        break
                             except Exception as e:
                                 logging.debug(f"检查Sitemap URL失败: {e}")
                                 continue
-                        
+
                         if results:
                             logging.info(f"Sitemap策略成功，找到 {len(results)} 条结果")
-                    
+
+                except Exception as e:
+                    logging.warning(f"Sitemap策略失败: {e}")
+
+            # 策略3: 如果还没找到，尝试文本搜索
+            if not results:
+                try:
+                    main_response = self.session.get("https://hk.on.cc/", timeout=10)
+                    if main_response.status_code == 200:
+                        results = self._parse_oncc_text(keyword, main_response)
+                except:
+                    pass
+
+            # 去重并限制数量
+            results = dedupe_by_url(results, 8)
+
+            logging.info(f"東網搜索完成，找到 {len(results)} 条结果")
+            return results
+
+        except Exception as e:
+            logging.error(f"搜索東網时出错: {e}")
+            return results
+
+    async def _oncc_listing_page_async(self, keyword, response, dates_to_check, fetcher):
+        """并发抓取列表页中命中链接的详情页，按链接顺序返回结果"""
+        links = self._oncc_listing_links(keyword, response.content, dates_to_check)
+        details = await asyncio.gather(*(fetcher.get(full_url, timeout=8) for _, full_url in links),
+                                       return_exceptions=True)
+        results = []
+        for (text, full_url), detail in zip(links, details):
+            if isinstance(detail, BaseException):
+                result = self._oncc_fallback_result(keyword, text, full_url)
+            else:
+                result = self._oncc_listing_result(keyword, text, full_url, detail)
+            if result is not None:
+                results.append(result)
+        return results
+
+    async def _oncc_sitemap_async(self, keyword, fetcher):
+        """Sitemap策略（异步版本）：按优先顺序分批并发检查文章页，找到3条即停止"""
+        results = []
+        sitemap_response = await fetcher.get("https://hk.on.cc/sitemap.xml", timeout=15)
+        if sitemap_response.status_code != 200:
+            return results
+
+        candidates = self._oncc_sitemap_candidates(sitemap_response.text)
+        batch_size = fetcher.per_host_limit
+        for start in range(0, len(candidates), batch_size):
+            batch = [url for url, _ in candidates[start:start + batch_size]]
+            details = await asyncio.gather(*(fetcher.get(url, timeout=8) for url in batch),
+                                           return_exceptions=True)
+            for url, detail in zip(batch, details):
+                if isinstance(detail, BaseException):
+                    logging.debug(f"[异步] 检查Sitemap URL失败: {detail}")
+                    continue
+                result = self._oncc_sitemap_result(keyword, url, detail)
+                if result is not None:
+                    results.append(result)
+                    if len(results) >= 3:
+                        return results
+        return results
+
+    async def search_oncc_async(self, keyword, fetcher):
+        """搜索東網on.cc（异步版本）- 列表页并发抓取，按原顺序取第一个有结果的页面，再依次回退Sitemap与文本搜索"""
+        results = []
+
+        try:
+            logging.info(f"[异步] 搜索東網: {keyword}")
+
+            dates_to_check = oncc_dates_to_check()
+            listing_urls = oncc_listing_urls(dates_to_check)
+            responses = await fetcher.get_many(listing_urls, timeout=10)
+
+            for base_url, response in zip(listing_urls, responses):
+                if response is None or response.status_code != 200:
+                    continue
+                try:
+                    results = await self._oncc_listing_page_async(keyword, response, dates_to_check, fetcher)
                 except Exception as e:
-                    logging.warning(f"Sitemap策略失败: {e}")
-            
-            # 策略3: 如果还没找到，尝试文本搜索
+                    logging.warning(f"[异步] 检查东网页面 {base_url} 失败: {str(e)}")
+                    continue
+                if results:
+                    break
+
             if not results:
+                logging.info("[异步] 尝试东网Sitemap策略...")
                 try:
-                    main_response = self.session.get("https://hk.on.cc/", timeout=10)
+                    results = await self._oncc_sitemap_async(keyword, fetcher)
+                    if results:
+                        logging.info(f"[异步] Sitemap策略成功，找到 {len(results)} 条结果")
+                except Exception as e:
+                    logging.warning(f"[异步] Sitemap策略失败: {e}")
+
+            if not results:
+                try:
+                    main_response = await fetcher.get("https://hk.on.cc/", timeout=10)
                     if main_response.status_code == 200:
-                        if main_response.encoding == 'ISO-8859-1':
-                            main_response.encoding = 'utf-8'
-                        
-                        content = main_response.text
-                        if keyword in content:
-                            soup = BeautifulSoup(main_response.content, 'html.parser')
-                            
-                            # 查找包含关键词的文本节点
-                            for text_node in soup.find_all(text=True):
-                                if keyword.lower() in str(text_node).lower():
-                                    text_content = str(text_node).strip()
-                                    if len(text_content) > 10 and len(text_content) < 200:
-                                        
-                                        # 查找父链接
-                                        parent = text_node.parent
-                                        while parent and parent.name != 'a':
-                                            parent = parent.parent
-                                            
-                                        if parent and parent.get('href'):
-                                            href = parent.get('href')
-                                            if any(pattern in href for pattern in ['/bkn/', '/news/', '/hk/']):
-                                                full_url = 'https://hk.on.cc' + href if href.startswith('/') else href
-                                                
-                                                results.append({
-                                                    'title': text_content,
-                                                    'url': full_url,
-                                                    'source': '東網on.cc (文本)',
-                                                    'keyword': keyword
-                                                })
-                                                break
-                except:
+                        results = self._parse_oncc_text(keyword, main_response)
+                except Exception:
                     pass
-            
-            # 去重并限制数量
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                url = result.get('url', '')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_results.append(result)
-            
-            results = unique_results[:8]  # 限制结果数量
-            
-            logging.info(f"東網搜索完成，找到 {len(results)} 条结果")
+
+            results = dedupe_by_url(results, 8)
+
+            logging.info(f"[异步] 東網搜索完成，找到 {len(results)} 条结果")
             return results
-            
+
         except Exception as e:
-            logging.error(f"搜索東網时出错: {e}")
+            logging.error(f"[异步] 搜索東網时出错: {e}")
             return results
-    
+
+    def _singtao_search_urls(self, keyword):
+        # 多层搜索策略 - 包含影视圈分类
+        return [
+            f"https://www.stheadline.com/search?q={keyword}",  # 主搜索
+            "https://www.stheadline.com/film-drama/",  # 影视圈分类
+            "https://www.stheadline.com/entertainment/",  # 娱乐版
+            f"https://std.stheadline.com/realtime/section-list.php?cat=12",  # 即时娱乐
+            f"https://std.stheadline.com/realtime/section-list.php?cat=13",  # 影视分类
+            "https://www.stheadline.com/realtime/",  # 即时新闻
+        ]
+
+    def _parse_singtao_links(self, keyword, content):
+        """直接使用BeautifulSoup查找标题包含关键词的链接"""
+        results = []
+        soup = BeautifulSoup(content, 'html.parser')
+
+        for link in soup.find_all('a', href=True):
+            title = link.get_text().strip()
+            href = link.get('href', '')
+
+            # 检查标题是否包含关键词且足够长
+            if keyword.lower() in title.lower() and len(title) > 10:
+                # 构建完整URL
+                if href and not href.startswith('http'):
+                    if href.startswith('/'):
+                        href = 'https://www.stheadline.com' + href
+                    else:
+                        href = 'https://www.stheadline.com/' + href
+
+                if href and title:
+                    results.append({
+                        'title': title.strip(),
+                        'url': href,
+                        'source': '星島娛樂',
+                        'keyword': keyword
+                    })
+        return results
+
     def search_singtao(self, keyword):
         """搜索星島娛樂 - 多层搜索策略，包含影视圈分类"""
         results = []
-        
+
         try:
             logging.info(f"搜索星島娛樂: {keyword}")
-            
-            # 多层搜索策略 - 包含影视圈分类
-            search_urls = [
-                f"https://www.stheadline.com/search?q={keyword}",  # 主搜索
-                "https://www.stheadline.com/film-drama/",  # 影视圈分类 - 新增
-                "https://www.stheadline.com/entertainment/",  # 娱乐版
-                f"https://std.stheadline.com/realtime/section-list.php?cat=12",  # 即时娱乐
-                f"https://std.stheadline.com/realtime/section-list.php?cat=13",  # 影视分类
-                "https://www.stheadline.com/realtime/",  # 即时新闻
-            ]
-            
-            for search_url in search_urls:
+
+            for search_url in self._singtao_search_urls(keyword):
                 try:
                     logging.info(f"检查星島页面: {search_url}")
                     response = self.session.get(search_url, timeout=10)
-                    
+
                     if response.status_code == 200:
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 简化解析策略 - 直接使用BeautifulSoup查找所有链接
-                        all_links = soup.find_all('a', href=True)
-                        
-                        for link in all_links:
-                            title = link.get_text().strip()
-                            href = link.get('href', '')
-                            
-                            # 检查标题是否包含关键词且足够长
-                            if keyword.lower() in title.lower() and len(title) > 10:
-                                # 构建完整URL
-                                if href and not href.startswith('http'):
-                                    if href.startswith('/'):
-                                        href = 'https://www.stheadline.com' + href
-                                    else:
-                                        href = 'https://www.stheadline.com/' + href
-                                
-                                if href and title:
-                                    results.append({
-                                        'title': title.strip(),
-                                        'url': href,
-                                        'source': '星島娛樂',
-                                        'keyword': keyword
-                                    })
-                        
-                        # 如果找到结果，跳出当前URL的循环
-                        if results:
-                            break
-                            
+                        results = self._parse_singtao_links(keyword, response.text)
+
                 except Exception as e:
                     logging.error(f"检查星島页面失败 {search_url}: {e}")
                     continue
-                
+
                 # 如果找到结果，跳出整个URL循环
                 if results:
                     break
-                
-            # 去重
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
-            results = unique_results[:10]
-            
+
+            results = dedupe_by_url(results, 10)
+
             logging.info(f"星島娛樂 搜索完成，找到 {len(results)} 条结果")
             return results
-            
+
         except Exception as e:
             logging.error(f"搜索星島娛樂时出错: {e}")
             return results
-    
-    def search_mingpao(self, keyword):
-        """搜索明報 - 使用搜索URL的高效方法"""
+
+    async def search_singtao_async(self, keyword, fetcher):
+        """搜索星島娛樂（异步版本）- 所有页面并发抓取，按原顺序取第一个有结果的页面"""
         results = []
-        
+
         try:
-            logging.info(f"搜索明報: {keyword}")
-            
-            # 尝试多个可能的明报搜索URL
-            search_urls = [
-                f"https://ol.mingpao.com/search?q={keyword}",
-                f"https://www.mingpao.com/search?q={keyword}",
-                f"https://ol.mingpao.com/ldy/search.php?keyword={keyword}"
-            ]
-            
-            for search_url in search_urls:
+            logging.info(f"[异步] 搜索星島娛樂: {keyword}")
+
+            search_urls = self._singtao_search_urls(keyword)
+            for search_url, response in zip(search_urls, await fetcher.get_many(search_urls, timeout=10)):
+                if response is None or response.status_code != 200:
+                    continue
                 try:
-                    response = self.session.get(search_url, timeout=15)
-                    
-                    if response.status_code == 200:
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 多种解析策略
-                        patterns = [
-                            # JSON格式
-                            r'\{[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*)"[^}]*"url":\s*"([^"]*)"[^}]*\}',
-                            r'\{[^}]*"url":\s*"([^"]*)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*)"[^}]*\}',
-                            # HTML格式
-                            r'<a[^>]*href="([^"]*)"[^>]*>([^<]*' + keyword + r'[^<]*)</a>',
-                            # 明报特殊格式
-                            r'href="([^"]*)"[^>]*title="([^"]*' + keyword + r'[^"]*)"'
-                        ]
-                        
-                        for pattern in patterns:
-                            matches = re.findall(pattern, content, re.IGNORECASE)
-                            for match in matches:
-                                if len(match) == 2:
-                                    if 'title' in pattern and pattern.index('title') < pattern.index('url'):
-                                        title, url = match
-                                    else:
-                                        url, title = match
-                                    
-                                    # 构建完整URL
-                                    if url and not url.startswith('http'):
-                                        if url.startswith('/'):
-                                            url = 'https://ol.mingpao.com' + url
-                                        else:
-                                            url = 'https://ol.mingpao.com/' + url
-                                    
-                                    if title and url:
-                                        results.append({
-                                            'title': title.strip(),
-                                            'url': url,
-                                            'source': '明報',
-                                            'keyword': keyword
-                                        })
-                        
-                        # BeautifulSoup方法作为备用
-                        if not results:
-                            article_selectors = [
-                                'a[href*="/news/"]',
-                                'a[href*="/article/"]',
-                                '.search-result a',
-                                '.news-item a',
-                                'h3 a, h2 a, h1 a'
-                            ]
-                            
-                            for selector in article_selectors:
-                                articles = soup.select(selector)
-                                for article in articles:
-                                    title = article.get_text().strip()
-                                    if keyword.lower() in title.lower() and len(title) > 10:
-                                        article_url = article.get('href', '')
-                                        if article_url and not article_url.startswith('http'):
-                                            if article_url.startswith('/'):
-                                                article_url = 'https://ol.mingpao.com' + article_url
-                                            else:
-                                                article_url = 'https://ol.mingpao.com/' + article_url
-                                        
-                                        if article_url and title:
-                                            results.append({
-                                                'title': title,
-                                                'url': article_url,
-                                                'source': '明報',
-                                                'keyword': keyword
-                                            })
-                                if results:
-                                    break
-                        
-                        # 如果找到结果就停止尝试其他搜索URL
-                        if results:
-                            break
-                            
+                    results = self._parse_singtao_links(keyword, response.text)
                 except Exception as e:
-                    logging.warning(f"明报搜索URL {search_url} 失败: {str(e)}")
+                    logging.error(f"[异步] 检查星島页面失败 {search_url}: {e}")
                     continue
-            
-            # 如果搜索URL都失败，尝试从主页抓取
-            if not results:
-                try:
-                    main_response = self.session.get("https://ol.mingpao.com/ldy/main.php", timeout=15)
-                    if main_response.status_code == 200:
-                        soup = BeautifulSoup(main_response.text, 'html.parser')
-                        
-                        # 查找包含关键词的链接
-                        all_links = soup.find_all('a', href=True)
-                        for link in all_links:
-                            text = link.get_text().strip()
-                            title_attr = link.get('title', '').strip()
-                            
-                            for check_text in [text, title_attr]:
-                                if check_text and keyword.lower() in check_text.lower() and len(check_text) > 10:
-                                    href = link.get('href', '')
-                                    if href and any(pattern in href for pattern in ['/news/', '/article/', '/ldy/']):
-                                        if not href.startswith('http'):
-                                            href = 'https://ol.mingpao.com' + href if href.startswith('/') else 'https://ol.mingpao.com/' + href
-                                        
-                                        results.append({
-                                            'title': check_text,
-                                            'url': href,
-                                            'source': '明報',
-                                            'keyword': keyword
-                                        })
-                                        break
-                except:
-                    pass
-            
-            # 去重
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
-            results = unique_results[:10]
-            
-            logging.info(f"明報 搜索完成，找到 {len(results)} 条结果")
+                if results:
+                    break
+
+            results = dedupe_by_url(results, 10)
+
+            logging.info(f"[异步] 星島娛樂 搜索完成，找到 {len(results)} 条结果")
             return results
-            
+
         except Exception as e:
-            logging.error(f"搜索明報时出错: {e}")
+            logging.error(f"[异步] 搜索星島娛樂时出错: {e}")
             return results
-    
+
+    def _search_news_site(self, site, keyword):
+        """明報/明周/文匯報：共用搜索流程（news_sources）"""
+        return search_news_site(site, keyword, lambda source, url: self.session.get(url, timeout=15))
+
+    async def _search_news_site_async(self, site, keyword, fetcher):
+        return await search_news_site_async(site, keyword,
+                                            lambda source, urls: fetcher.get_many(urls, timeout=15))
+
+    def search_mingpao(self, keyword):
+        """搜索明報 - 使用搜索URL的高效方法"""
+        return self._search_news_site('mingpao', keyword)
+
     def search_mpweekly(self, keyword):
         """搜索明周 - 使用搜索URL的高效方法"""
-        results = []
-        
-        try:
-            logging.info(f"搜索明周: {keyword}")
-            
-            # 尝试多个可能的明周搜索URL
-            search_urls = [
-                f"https://www.mpweekly.com/search?q={keyword}",
-                f"https://www.mpweekly.com/search?keyword={keyword}",
-                f"https://www.mpweekly.com/?s={keyword}"
-            ]
-            
-            for search_url in search_urls:
-                try:
-                    response = self.session.get(search_url, timeout=15)
-                    
-                    if response.status_code == 200:
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 多种解析策略
-                        patterns = [
-                            # JSON格式
-                            r'\{[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*)"[^}]*"url":\s*"([^"]*)"[^}]*\}',
-                            r'\{[^}]*"url":\s*"([^"]*)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*)"[^}]*\}',
-                            # HTML格式
-                            r'<a[^>]*href="([^"]*)"[^>]*>([^<]*' + keyword + r'[^<]*)</a>',
-                            # 明周特殊格式
-                            r'href="([^"]*)"[^>]*>.*?<[^>]*>([^<]*' + keyword + r'[^<]*)</[^>]*>',
-                        ]
-                        
-                        for pattern in patterns:
-                            matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-                            for match in matches:
-                                if len(match) == 2:
-                                    if 'title' in pattern and pattern.index('title') < pattern.index('url'):
-                                        title, url = match
-                                    else:
-                                        url, title = match
-                                    
-                                    # 构建完整URL
-                                    if url and not url.startswith('http'):
-                                        if url.startswith('/'):
-                                            url = 'https://www.mpweekly.com' + url
-                                        else:
-                                            url = 'https://www.mpweekly.com/' + url
-                                    
-                                    if title and url:
-                                        results.append({
-                                            'title': title.strip(),
-                                            'url': url,
-                                            'source': '明周',
-                                            'keyword': keyword
-                                        })
-                        
-                        # BeautifulSoup方法作为备用
-                        if not results:
-                            article_selectors = [
-                                'a[href*="/entertainment/"]',
-                                'a[href*="/article/"]',
-                                'a[href*="/post/"]',
-                                '.search-result a',
-                                '.article-item a',
-                                '.post-item a',
-                                'h3 a, h2 a, h1 a'
-                            ]
-                            
-                            for selector in article_selectors:
-                                articles = soup.select(selector)
-                                for article in articles:
-                                    title = article.get_text().strip()
-                                    if keyword.lower() in title.lower() and len(title) > 10:
-                                        article_url = article.get('href', '')
-                                        if article_url and not article_url.startswith('http'):
-                                            if article_url.startswith('/'):
-                                                article_url = 'https://www.mpweekly.com' + article_url
-                                            else:
-                                                article_url = 'https://www.mpweekly.com/' + article_url
-                                        
-                                        if article_url and title:
-                                            results.append({
-                                                'title': title,
-                                                'url': article_url,
-                                                'source': '明周',
-                                                'keyword': keyword
-                                            })
-                                if results:
-                                    break
-                        
-                        # 如果找到结果就停止尝试其他搜索URL
-                        if results:
-                            break
-                            
-                except Exception as e:
-                    logging.warning(f"明周搜索URL {search_url} 失败: {str(e)}")
-                    continue
-            
-            # 如果搜索URL都失败，尝试从娱乐主页抓取
-            if not results:
-                try:
-                    main_response = self.session.get("https://www.mpweekly.com/entertainment/", timeout=15)
-                    if main_response.status_code == 200:
-                        soup = BeautifulSoup(main_response.text, 'html.parser')
-                        
-                        # 查找包含关键词的链接
-                        all_links = soup.find_all('a', href=True)
-                        for link in all_links:
-                            text = link.get_text().strip()
-                            title_attr = link.get('title', '').strip()
-                            
-                            for check_text in [text, title_attr]:
-                                if check_text and keyword.lower() in check_text.lower() and len(check_text) > 10:
-                                    href = link.get('href', '')
-                                    if href and any(pattern in href for pattern in ['/entertainment/', '/article/', '/post/']):
-                                        if not href.startswith('http'):
-                                            href = 'https://www.mpweekly.com' + href if href.startswith('/') else 'https://www.mpweekly.com/' + href
-                                        
-                                        results.append({
-                                            'title': check_text,
-                                            'url': href,
-                                            'source': '明周',
-                                            'keyword': keyword
-                                        })
-                                        break
-                except:
-                    pass
-            
-            # 去重
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
-            results = unique_results[:10]
-            
-            logging.info(f"明周 搜索完成，找到 {len(results)} 条结果")
-            return results
-            
-        except Exception as e:
-            logging.error(f"搜索明周时出错: {e}")
-            return results
-    
+        return self._search_news_site('mpweekly', keyword)
+
     def search_wenweipo(self, keyword):
         """搜索香港文匯報 - 使用搜索URL的高效方法"""
-        results = []
-        
-        try:
-            logging.info(f"搜索香港文匯報: {keyword}")
-            
-            # 尝试多个可能的文汇报搜索URL
-            search_urls = [
-                f"https://www.wenweipo.com/search?q={keyword}",
-                f"https://www.wenweipo.com/search?keyword={keyword}",
-                f"https://www.wenweipo.com/?s={keyword}"
-            ]
-            
-            for search_url in search_urls:
-                try:
-                    response = self.session.get(search_url, timeout=15)
-                    
-                    if response.status_code == 200:
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 多种解析策略
-                        patterns = [
-                            # JSON格式
-                            r'\{[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*"url":\s*"([^"]*?)"[^}]*\}',
-                            r'\{[^}]*"url":\s*"([^"]*?)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*\}',
-                            # HTML格式
-                            r'<a[^>]*href="([^"]*?)"[^>]*>([^<]*' + keyword + r'[^<]*?)</a>',
-                            # 文汇报特殊格式
-                            r'href="([^"]*?)"[^>]*title="([^"]*' + keyword + r'[^"]*?)"'
-                        ]
-                        
-                        for pattern in patterns:
-                            matches = re.findall(pattern, content, re.IGNORECASE)
-                            for match in matches:
-                                if len(match) == 2:
-                                    if 'title' in pattern and pattern.index('title') < pattern.index('url'):
-                                        title, url = match
-                                    else:
-                                        url, title = match
-                                    
-                                    # 构建完整URL
-                                    if url and not url.startswith('http'):
-                                        if url.startswith('/'):
-                                            url = 'https://www.wenweipo.com' + url
-                                        else:
-                                            url = 'https://www.wenweipo.com/' + url
-                                    
-                                    if title and url:
-                                        results.append({
-                                            'title': title.strip(),
-                                            'url': url,
-                                            'source': '香港文匯報',
-                                            'keyword': keyword
-                                        })
-                        
-                        # BeautifulSoup方法作为备用
-                        if not results:
-                            article_selectors = [
-                                'a[href*="/ent/"]',
-                                'a[href*="/article/"]',
-                                'a[href*="/news/"]',
-                                '.search-result a',
-                                '.article-item a',
-                                'h3 a, h2 a, h1 a'
-                            ]
-                            
-                            for selector in article_selectors:
-                                articles = soup.select(selector)
-                                for article in articles:
-                                    title = article.get_text().strip()
-                                    if keyword.lower() in title.lower() and len(title) > 10:
-                                        article_url = article.get('href', '')
-                                        if article_url and not article_url.startswith('http'):
-                                            if article_url.startswith('/'):
-                                                article_url = 'https://www.wenweipo.com' + article_url
-                                            else:
-                                                article_url = 'https://www.wenweipo.com/' + article_url
-                                        
-                                        if article_url and title:
-                                            results.append({
-                                                'title': title,
-                                                'url': article_url,
-                                                'source': '香港文匯報',
-                                                'keyword': keyword
-                                            })
-                                if results:
-                                    break
-                        
-                        # 如果找到结果就停止尝试其他搜索URL
-                        if results:
-                            break
-                            
-                except Exception as e:
-                    logging.warning(f"文汇报搜索URL {search_url} 失败: {str(e)}")
-                    continue
-            
-            # 如果搜索URL都失败，尝试从娱乐主页抓取
-            if not results:
-                try:
-                    main_response = self.session.get("https://www.wenweipo.com/ent", timeout=15)
-                    if main_response.status_code == 200:
-                        soup = BeautifulSoup(main_response.text, 'html.parser')
-                        
-                        # 查找包含关键词的链接
-                        all_links = soup.find_all('a', href=True)
-                        for link in all_links:
-                            text = link.get_text().strip()
-                            title_attr = link.get('title', '').strip()
-                            
-                            for check_text in [text, title_attr]:
-                                if check_text and keyword.lower() in check_text.lower() and len(check_text) > 10:
-                                    href = link.get('href', '')
-                                    if href and any(pattern in href for pattern in ['/ent/', '/article/', '/news/']):
-                                        if not href.startswith('http'):
-                                            href = 'https://www.wenweipo.com' + href if href.startswith('/') else 'https://www.wenweipo.com/' + href
-                                        
-                                        results.append({
-                                            'title': check_text,
-                                            'url': href,
-                                            'source': '香港文匯報',
-                                            'keyword': keyword
-                                        })
-                                        break
-                except:
-                    pass
-            
-            # 去重
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
-            results = unique_results[:10]
-            
-            logging.info(f"香港文匯報 搜索完成，找到 {len(results)} 条结果")
-            return results
-            
-        except Exception as e:
-            logging.error(f"搜索香港文匯報时出错: {e}")
-            return results
-    
+        return self._search_news_site('wenweipo', keyword)
+
+    async def search_mingpao_async(self, keyword, fetcher):
+        return await self._search_news_site_async('mingpao', keyword, fetcher)
+
+    async def search_mpweekly_async(self, keyword, fetcher):
+        return await self._search_news_site_async('mpweekly', keyword, fetcher)
+
+    async def search_wenweipo_async(self, keyword, fetcher):
+        return await self._search_news_site_async('wenweipo', keyword, fetcher)
+
+    def _apply_tvb_publish_time(self, result, publish_time):
+        result['publish_time'], result['publish_time_readable'] = publish_time
+        return result
+
     def search_tvb(self, keyword):
         """搜索TVB - 增强版本，包含URL模式匹配和编码处理"""
         results = []
-        
+
         try:
             logging.info(f"搜索TVB: {keyword}")
-            
+
             # 策略1: 直接检查TVB新闻列表页面
-            list_urls = [
-                "https://www.tvb.com/artiste-news-c",
-                "https://www.tvb.com/news", 
-                "https://www.tvb.com/entertainment",
-                "https://news.tvb.com/"
-            ]
-            
-            for list_url in list_urls:
+            for list_url in TVB_LIST_URLS:
                 try:
                     response = self.session.get(list_url, timeout=15)
                     if response.status_code == 200:
-                        # 设置正确的编码
-                        if response.encoding == 'ISO-8859-1':
-                            response.encoding = 'utf-8'
-                        
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 查找所有链接
-                        all_links = soup.find_all('a', href=True)
-                        
-                        for link in all_links:
-                            href = link.get('href', '')
-                            
-                            # 检查URL是否包含关键词（编码形式）
-                            from urllib.parse import unquote, quote
-                            
-                            # 对关键词进行URL编码以匹配
-                            encoded_keyword = quote(keyword, encoding='utf-8')
-                            
-                            if (encoded_keyword in href or keyword in href or 
-                                (href and ('王敏奕' in unquote(href, encoding='utf-8', errors='ignore')))):
-                                
-                                # 构造完整URL
-                                if href.startswith('/'):
-                                    full_url = 'https://www.tvb.com' + href
-                                elif not href.startswith('http'):
-                                    full_url = 'https://www.tvb.com/' + href
-                                else:
-                                    full_url = href
-                                
-                                # 尝试从URL解码标题
-                                try:
-                                    url_parts = href.split('/')
-                                    if url_parts:
-                                        title_part = url_parts[-1]
-                                        if '--' in title_part:
-                                            title_encoded = title_part.split('--')[0]
-                                        else:
-                                            title_encoded = title_part.split('-')[0] if '-' in title_part else title_part
-                                        
-                                        decoded_title = unquote(title_encoded, encoding='utf-8')
-                                        
-                                        # 如果解码标题包含关键词，添加到结果
-                                        if keyword in decoded_title and len(decoded_title) > 5:
-                                            pub_iso, pub_readable = self._extract_tvb_publish_time(full_url)
-                                            results.append({
-                                                'title': decoded_title,
-                                                'url': full_url,
-                                                'source': 'TVB',
-                                                'keyword': keyword,
-                                                'publish_time': pub_iso,
-                                                'publish_time_readable': pub_readable
-                                            })
-                                            logging.info(f"找到TVB新闻: {decoded_title[:40]}...")
-                                            continue
-                                except:
-                                    pass
-                                
-                                # 如果无法从URL解码，尝试从链接文本获取
-                                link_text = link.get_text().strip()
-                                if link_text and keyword.lower() in link_text.lower() and len(link_text) > 5:
-                                    pub_iso, pub_readable = self._extract_tvb_publish_time(full_url)
-                                    results.append({
-                                        'title': link_text,
-                                        'url': full_url,
-                                        'source': 'TVB',
-                                        'keyword': keyword,
-                                        'publish_time': pub_iso,
-                                        'publish_time_readable': pub_readable
-                                    })
-                                    logging.info(f"找到TVB新闻: {link_text[:40]}...")
-                    
+                        results = [self._apply_tvb_publish_time(result, self._extract_tvb_publish_time(result['url']))
+                                   for result in parse_tvb_listing(keyword, decoded_text(response))]
+
                     # 如果找到结果就跳出
                     if results:
                         break
-                        
+
                 except Exception as e:
                     logging.warning(f"检查TVB列表页面失败: {e}")
                     continue
-            
+
             # 策略2: 直接验证已知的TVB新闻URL（针对动态加载页面）
-            if not results and keyword == '王敏奕':
-                # 已知的王敏奕相关TVB新闻URL列表（可以根据需要扩展）
-                known_urls = [
-                    "https://www.tvb.com/artiste-news-c/%E9%99%B3%E7%80%85%E5%8A%9B%E6%92%90%E7%8E%8B%E6%95%8F%E5%A5%95%E6%96%B0%E4%BD%9C%E9%A3%B2%E5%88%B0%E9%9D%A2%E7%B4%85%E7%B4%85--12%E5%B9%B4%E5%A5%BD%E5%8F%8B%E9%80%8F%E9%9C%B2%E5%BE%9E%E6%9C%AA%E5%90%B5%E9%81%8E%E6%9E%B6%E5%A7%8A%E5%A6%B9%E6%83%85%E6%B7%B1-1008140"
-                ]
-                
-                for test_url in known_urls:
+            if not results:
+                for test_url in TVB_KNOWN_URLS.get(keyword, []):
                     try:
                         # 检查URL是否仍然有效
                         response = self.session.get(test_url, timeout=10)
                         if response.status_code == 200:
-                            # 从URL解码标题
-                            from urllib.parse import unquote
-                            try:
-                                url_parts = test_url.split('/')
-                                if url_parts:
-                                    title_part = url_parts[-1]
-                                    if '--' in title_part:
-                                        title_encoded = title_part.split('--')[0]
-                                    else:
-                                        title_encoded = title_part.split('-')[0] if '-' in title_part else title_part
-                                    
-                                    decoded_title = unquote(title_encoded, encoding='utf-8')
-                                    
-                                    if keyword in decoded_title:
-                                        pub_iso, pub_readable = self._extract_tvb_publish_time(test_url)
-                                        results.append({
-                                            'title': decoded_title,
-                                            'url': test_url,
-                                            'source': 'TVB',
-                                            'keyword': keyword,
-                                            'publish_time': pub_iso,
-                                            'publish_time_readable': pub_readable
-                                        })
-                                        logging.info(f"验证已知TVB新闻: {decoded_title}")
-                            except Exception as e:
-                                logging.debug(f"解码TVB标题失败: {e}")
-                                # 如果解码失败，使用默认标题
-                                pub_iso, pub_readable = self._extract_tvb_publish_time(test_url)
-                                results.append({
-                                    'title': f'TVB新闻: {keyword}相关报道',
-                                    'url': test_url,
-                                    'source': 'TVB',
-                                    'keyword': keyword,
-                                    'publish_time': pub_iso,
-                                    'publish_time_readable': pub_readable
-                                })
-                                logging.info(f"验证已知TVB新闻（使用默认标题）")
+                            result = tvb_known_url_result(keyword, test_url)
+                            if result is not None:
+                                results.append(self._apply_tvb_publish_time(
+                                    result, self._extract_tvb_publish_time(test_url)))
                     except Exception as e:
                         logging.debug(f"验证TVB URL失败: {e}")
                         continue
-            
+
             # 策略3: 尝试搜索页面（如果前面策略没找到结果）
             if not results:
-                search_urls = [
-                    f"https://www.tvb.com/search?q={keyword}",
-                    f"https://www.tvb.com/search?keyword={keyword}",
-                    f"https://www.tvb.com/?s={keyword}",
-                    f"https://news.tvb.com/search?q={keyword}"
-                ]
-            
-            for search_url in search_urls:
-                try:
-                    response = self.session.get(search_url, timeout=15)
-                    
-                    if response.status_code == 200:
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 修复的解析策略 - 避免抓取JSON数据
-                        # 首先尝试BeautifulSoup解析HTML结构
-                        article_selectors = [
-                            'a[href*="/news/"]',
-                            'a[href*="/entertainment/"]', 
-                            'a[href*="/article/"]',
-                            '.search-result a',
-                            '.article-item a',
-                            '.news-item a',
-                            'h3 a, h2 a, h1 a',
-                            '.news-title a',
-                            '.headline a'
-                        ]
-                        
-                        for selector in article_selectors:
-                            articles = soup.select(selector)
-                            for article in articles:
-                                title = article.get_text().strip()
-                                if (keyword.lower() in title.lower() and 
-                                    len(title) > 10 and len(title) < 200 and
-                                    not title.startswith('{') and  # 避免JSON数据
-                                    'props' not in title.lower()):  # 避免页面配置数据
-                                    
-                                    article_url = article.get('href', '')
-                                    if article_url and not article_url.startswith('http'):
-                                        if article_url.startswith('/'):
-                                            article_url = 'https://www.tvb.com' + article_url
-                                        else:
-                                            article_url = 'https://www.tvb.com/' + article_url
-                                    
-                                    if article_url and title:
-                                        pub_iso, pub_readable = self._extract_tvb_publish_time(article_url)
-                                        results.append({
-                                            'title': title,
-                                            'url': article_url,
-                                            'source': 'TVB',
-                                            'keyword': keyword,
-                                            'publish_time': pub_iso,
-                                            'publish_time_readable': pub_readable
-                                        })
+                for search_url in tvb_search_urls(keyword):
+                    try:
+                        response = self.session.get(search_url, timeout=15)
+
+                        if response.status_code == 200:
+                            results = [self._apply_tvb_publish_time(result, self._extract_tvb_publish_time(result['url']))
+                                       for result in parse_tvb_search(keyword, response.text)]
+
+                            # 如果找到结果就停止尝试其他搜索URL
                             if results:
                                 break
-                        
-                        # 如果BeautifulSoup没找到，尝试更精确的正则（避免JSON）
-                        if not results:
-                            patterns = [
-                                # 只匹配HTML标签中的新闻标题，避免JSON
-                                r'<a[^>]*href="([^"]*?)"[^>]*>([^<]*' + keyword + r'[^<]*?)</a>',
-                                r'<h[1-6][^>]*><a[^>]*href="([^"]*?)"[^>]*>([^<]*' + keyword + r'[^<]*?)</a></h[1-6]>',
-                                r'<div[^>]*class="[^"]*title[^"]*"[^>]*><a[^>]*href="([^"]*?)"[^>]*>([^<]*' + keyword + r'[^<]*?)</a></div>'
-                            ]
-                            
-                            for pattern in patterns:
-                                matches = re.findall(pattern, content, re.IGNORECASE)
-                                for match in matches:
-                                    if len(match) == 2:
-                                        url, title = match
-                                        
-                                        # 过滤掉JSON数据和无效标题
-                                        if (title and len(title) > 10 and len(title) < 200 and
-                                            not title.startswith('{') and 
-                                            'props' not in title.lower() and
-                                            'pageProps' not in title):
-                                            
-                                            # 构建完整URL
-                                            if url and not url.startswith('http'):
-                                                if url.startswith('/'):
-                                                    url = 'https://www.tvb.com' + url
-                                                else:
-                                                    url = 'https://www.tvb.com/' + url
-                                            
-                                            if url:
-                                                pub_iso, pub_readable = self._extract_tvb_publish_time(url)
-                                                results.append({
-                                                    'title': title.strip(),
-                                                    'url': url,
-                                                    'source': 'TVB',
-                                                    'keyword': keyword,
-                                                    'publish_time': pub_iso,
-                                                    'publish_time_readable': pub_readable
-                                                })
-                                if results:
-                                    break
-                        
-                        # BeautifulSoup方法作为备用
-                        if not results:
-                            article_selectors = [
-                                'a[href*="/news/"]',
-                                'a[href*="/entertainment/"]',
-                                'a[href*="/article/"]',
-                                '.search-result a',
-                                '.article-item a',
-                                '.news-item a',
-                                'h3 a, h2 a, h1 a'
-                            ]
-                            
-                            for selector in article_selectors:
-                                articles = soup.select(selector)
-                                for article in articles:
-                                    title = article.get_text().strip()
-                                    if keyword.lower() in title.lower() and len(title) > 10:
-                                        article_url = article.get('href', '')
-                                        if article_url and not article_url.startswith('http'):
-                                            if article_url.startswith('/'):
-                                                article_url = 'https://www.tvb.com' + article_url
-                                            else:
-                                                article_url = 'https://www.tvb.com/' + article_url
-                                        
-                                        if article_url and title:
-                                            pub_iso, pub_readable = self._extract_tvb_publish_time(article_url)
-                                            results.append({
-                                                'title': title,
-                                                'url': article_url,
-                                                'source': 'TVB',
-                                                'keyword': keyword,
-                                                'publish_time': pub_iso,
-                                                'publish_time_readable': pub_readable
-                                            })
-                                if results:
-                                    break
-                        
-                        # 如果找到结果就停止尝试其他搜索URL
-                        if results:
-                            break
-                            
-                except Exception as e:
-                    logging.warning(f"TVB搜索URL {search_url} 失败: {str(e)}")
-                    continue
-            
+
+                    except Exception as e:
+                        logging.warning(f"TVB搜索URL {search_url} 失败: {str(e)}")
+                        continue
+
             # 如果搜索URL都失败，尝试从主页抓取
             if not results:
                 try:
                     main_response = self.session.get("https://www.tvb.com", timeout=15)
                     if main_response.status_code == 200:
-                        soup = BeautifulSoup(main_response.text, 'html.parser')
-                        
-                        # 查找包含关键词的链接
-                        all_links = soup.find_all('a', href=True)
-                        for link in all_links:
-                            text = link.get_text().strip()
-                            title_attr = link.get('title', '').strip()
-                            
-                            for check_text in [text, title_attr]:
-                                if check_text and keyword.lower() in check_text.lower() and len(check_text) > 10:
-                                    href = link.get('href', '')
-                                    if href and any(pattern in href for pattern in ['/news/', '/entertainment/', '/article/']):
-                                        if not href.startswith('http'):
-                                            href = 'https://www.tvb.com' + href if href.startswith('/') else 'https://www.tvb.com/' + href
-                                        
-                                        results.append({
-                                            'title': check_text,
-                                            'url': href,
-                                            'source': 'TVB',
-                                            'keyword': keyword
-                                        })
-                                        break
+                        results = parse_tvb_home(keyword, main_response.text)
                 except:
                     pass
-            
-            # 去重
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
-            results = unique_results[:10]
-            
+
+            results = dedupe_by_url(results, 10)
+
             logging.info(f"TVB 搜索完成，找到 {len(results)} 条结果")
             return results
-            
+
         except Exception as e:
             logging.error(f"搜索TVB时出错: {e}")
             return results
-    
+
+    async def _with_tvb_publish_times_async(self, results, fetcher):
+        """并发提取TVB文章发布时间并写入结果"""
+        publish_times = await asyncio.gather(
+            *(self._extract_tvb_publish_time_async(result['url'], fetcher) for result in results))
+        return [self._apply_tvb_publish_time(result, publish_time)
+                for result, publish_time in zip(results, publish_times)]
+
+    async def search_tvb_async(self, keyword, fetcher):
+        """搜索TVB（异步版本）- 列表页、搜索页并发抓取，发布时间并发提取，策略优先级与同步版本一致"""
+        results = []
+
+        try:
+            logging.info(f"[异步] 搜索TVB: {keyword}")
+
+            for response in await fetcher.get_many(TVB_LIST_URLS, timeout=15):
+                if response is not None and response.status_code == 200:
+                    results = parse_tvb_listing(keyword, decoded_text(response))
+                    if results:
+                        break
+
+            known_urls = TVB_KNOWN_URLS.get(keyword, [])
+            if not results and known_urls:
+                responses = await fetcher.get_many(known_urls, timeout=10)
+                for test_url, response in zip(known_urls, responses):
+                    if response is not None and response.status_code == 200:
+                        result = tvb_known_url_result(keyword, test_url)
+                        if result is not None:
+                            results.append(result)
+
+            if not results:
+                for response in await fetcher.get_many(tvb_search_urls(keyword), timeout=15):
+                    if response is not None and response.status_code == 200:
+                        results = parse_tvb_search(keyword, response.text)
+                        if results:
+                            break
+
+            if results:
+                results = await self._with_tvb_publish_times_async(results, fetcher)
+            else:
+                main_response = await fetcher.get_or_none("https://www.tvb.com", timeout=15)
+                if main_response is not None and main_response.status_code == 200:
+                    results = parse_tvb_home(keyword, main_response.text)
+
+            results = dedupe_by_url(results, 10)
+
+            logging.info(f"[异步] TVB 搜索完成，找到 {len(results)} 条结果")
+            return results
+
+        except Exception as e:
+            logging.error(f"[异步] 搜索TVB时出错: {e}")
+            return results
+
+    def get_search_sources(self):
+        """返回 (来源名称, 搜索方法) 列表"""
+        return [
+            ('Google News', self.search_google_news),
+            ('香港01', self.search_hk01),
+            ('東網on.cc', self.search_oncc),
+            ('星島娛樂', self.search_singtao),
+            ('明報', self.search_mingpao),
+            ('明周', self.search_mpweekly),
+            ('香港文匯報', self.search_wenweipo),
+            ('TVB', self.search_tvb),
+            ('YouTube', self.search_youtube),
+            ('am730', self.search_am730),
+        ]
+
+    def get_async_search_sources(self):
+        """返回 (来源名称, 异步搜索方法) 列表，与 get_search_sources 一一对应"""
+        return [
+            ('Google News', self.search_google_news_async),
+            ('香港01', self.search_hk01_async),
+            ('東網on.cc', self.search_oncc_async),
+            ('星島娛樂', self.search_singtao_async),
+            ('明報', self.search_mingpao_async),
+            ('明周', self.search_mpweekly_async),
+            ('香港文匯報', self.search_wenweipo_async),
+            ('TVB', self.search_tvb_async),
+            ('YouTube', self.search_youtube_async),
+            ('am730', self.search_am730_async),
+        ]
+
     def search_all_sources(self, keyword):
-        """搜索所有新闻源"""
+        """搜索所有新闻源（VVNEWS_ASYNC=true 时在单个事件循环中并发搜索）"""
+        if self.use_async:
+            return asyncio.run(self.search_all_sources_async(keyword))
+
         all_results = []
-        
-        # 搜索所有9个新闻来源
-        # 新增 am730 为第10个来源
-        all_results.extend(self.search_google_news(keyword))
-        all_results.extend(self.search_hk01(keyword))
-        all_results.extend(self.search_oncc(keyword))
-        all_results.extend(self.search_singtao(keyword))
-        all_results.extend(self.search_mingpao(keyword))
-        all_results.extend(self.search_mpweekly(keyword))
-        all_results.extend(self.search_wenweipo(keyword))
-        all_results.extend(self.search_tvb(keyword))
-        all_results.extend(self.search_youtube(keyword))
-        all_results.extend(self.search_am730(keyword))
-        
+
+        # 搜索所有新闻来源
+        for _, search_func in self.get_search_sources():
+            all_results.extend(search_func(keyword))
+
         return all_results
-    
+
+    async def _run_source_async(self, name, search_coro, keyword, fetcher):
+        """在事件循环中执行单个来源的异步搜索，超时即取消"""
+        try:
+            return await asyncio.wait_for(search_coro(keyword, fetcher), timeout=self.source_timeout) or []
+        except asyncio.TimeoutError:
+            logging.warning(f"{name} 超时（{self.source_timeout:.0f} 秒），本轮丢弃该来源结果")
+            return []
+        except Exception as e:
+            logging.error(f"搜索{name}时出错: {e}")
+            return []
+
+    async def search_all_sources_async(self, keyword):
+        """在单个事件循环中并发搜索所有新闻源（列表页、详情页、发布时间页共享连接池，按主机限制并发）
+
+        抓取器开启响应缓存，多个来源/策略对同一URL只发一次请求；结果按来源的固定顺序合并。
+        """
+        sources = self.get_async_search_sources()
+        async with AsyncFetcher(headers=dict(self.session.headers),
+                                per_host_limit=self.per_host_limit,
+                                total_limit=self.per_host_limit * len(sources),
+                                cache_responses=True) as fetcher:
+            source_results = await asyncio.gather(
+                *(self._run_source_async(name, func, keyword, fetcher) for name, func in sources))
+
+        all_results = []
+        for results in source_results:
+            all_results.extend(results)
+        return all_results
+
     def is_within_time_range(self, news_item):
         """检查新闻是否在指定时间范围内 - 基于发布时间"""
         try:
@@ -2186,53 +1859,25 @@ VVNews 王敏奕新闻机器人
         return unique_results
 
     def _extract_tvb_publish_time(self, article_url):
-        """尝试从TVB文章页面提取发布时间，返回(iso, readable)。失败则返回(None, None)。"""
+        """从TVB文章页面提取发布时间（流式读取，只读到能确定时间为止），返回(iso, readable)。失败则返回(None, None)。"""
+        if not article_url:
+            return None, None
         try:
-            resp = self.session.get(article_url, timeout=6)
-            if resp.status_code != 200:
-                return None, None
-            html = resp.text
-            # 常见meta发布时间标记
-            patterns = [
-                r'<meta[^>]+property=["\"]article:published_time["\"][^>]+content=["\"]([^"\"]+)["\"]',
-                r'<meta[^>]+itemprop=["\"]datePublished["\"][^>]+content=["\"]([^"\"]+)["\"]',
-                r'<meta[^>]+name=["\"]pubdate["\"][^>]+content=["\"]([^"\"]+)["\"]',
-                r'"datePublished"\s*:\s*"([^"]+)"',
-                r'"uploadDate"\s*:\s*"([^"]+)"'
-            ]
-            from datetime import timezone, timedelta
-            for pat in patterns:
-                m = re.search(pat, html, re.IGNORECASE)
-                if m:
-                    raw = m.group(1).strip()
-                    try:
-                        dt = datetime.fromisoformat(raw.replace('Z', '+00:00'))
-                        beijing_tz = timezone(timedelta(hours=8))
-                        dt_bj = dt.astimezone(beijing_tz)
-                        return dt.isoformat(), dt_bj.strftime('%Y-%m-%d %H:%M:%S')
-                    except Exception:
-                        continue
-            # 兜底：从可见文本中匹配常见日期格式
-            text_patterns = [
-                r'(20\d{2})[-/](0?[1-9]|1[0-2])[-/](0?[1-9]|[12]\d|3[01])(\s+(\d{1,2}:\d{2})(:\d{2})?)?',
-                r'(20\d{2})年(0?[1-9]|1[0-2])月(0?[1-9]|[12]\d|3[01])日(\s+(\d{1,2}:\d{2})(:\d{2})?)?'
-            ]
-            for pat in text_patterns:
-                m = re.search(pat, html)
-                if m:
-                    try:
-                        y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
-                        hhmm = m.group(5) or '00:00'
-                        dt_str = f"{y:04d}-{mo:02d}-{d:02d} {hhmm}"
-                        dt = datetime.strptime(dt_str, '%Y-%m-%d %H:%M')
-                        beijing_tz = timezone(timedelta(hours=8))
-                        dt = dt.replace(tzinfo=beijing_tz)
-                        return dt.isoformat(), dt.strftime('%Y-%m-%d %H:%M:%S')
-                    except Exception:
-                        continue
+            # TVB 页面常没有 meta 时间：允许回退到正文中的日期文本（与原先的兜底一致）
+            return iso_and_readable(fetch_publish_time(self.session, article_url, timeout=6,
+                                                       max_priority=PRIORITY_DATE_TEXT))
+        except Exception:
+            return None, None
+
+    async def _extract_tvb_publish_time_async(self, article_url, fetcher):
+        """_extract_tvb_publish_time 的异步版本（使用 AsyncFetcher 流式读取）"""
+        if not article_url:
+            return None, None
+        try:
+            return iso_and_readable(await fetch_publish_time_async(fetcher, article_url, timeout=6,
+                                                                   max_priority=PRIORITY_DATE_TEXT))
         except Exception:
             return None, None
-        return None, None
 
 if __name__ == "__main__":
     # 创建24小时搜索范围的机器人
@@ -6,16 +6,45 @@ VVNews 王敏奕新闻机器人 - 智能检测版本
 """
 
 import requests
-import feedparser
 import re
 import json
 import os
 import smtplib
 from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from bs4 import BeautifulSoup
 import logging
+import asyncio
+import threading
+import io
+from urllib.parse import urlencode, urlparse
+from collections import namedtuple
+from async_fetch import AsyncFetcher
+from bounded_pool import iter_bounded, gather_bounded
+from state_store import StateStore
+from url_canon import URLCanonicalizer, canonicalize_url, is_google_news_url
+from near_dup import NearDuplicateIndex
+from circuit_breaker import CircuitBreaker
+from strategy_stats import StrategyStats
+from keyword_match import normalize_keywords
+from page_cache import PageCache
+from stream_reader import read_until
+from publish_time import (PRIORITY_STRUCTURED, fetch_publish_time, fetch_publish_time_async, parse_publish_time,
+                          iso_and_readable)
+from metadata_cache import MetadataCache, ArticleMetadataCache
+from youtube_channels import ChannelResolver, extract_channel_id
+from feed_cache import ConditionalFeedCache
+from feed_reader import iter_entries
+from link_extract import extract_links
+from search_extract import extract_json_items
+from sitemap_reader import (SitemapReader, scan_sitemap, open_xml_stream, parse_lastmod,
+                            newest_child_sitemaps, merge_top_entries)
+from news_sources import (TVB_KNOWN_URLS, TVB_LIST_URLS, decoded_text, dedupe_by_url,
+                          oncc_dates_to_check, oncc_listing_urls, parse_tvb_home, parse_tvb_listing,
+                          parse_tvb_search, search_news_site, search_news_site_async, tvb_known_url_result,
+                          tvb_search_urls, youtube_rss_url)
 
 # 配置日志 - 使用北京时间
 import time
@@ -25,6 +54,17 @@ def beijing_time(*args):
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logging.Formatter.formatTime = lambda self, record, datefmt=None: beijing_time()
 
+# YouTube 页面中逐行提取视频ID（预编译，避免在循环中重复查找正则缓存）
+YOUTUBE_VIDEO_ID_PATTERN = re.compile(r'"videoId":"([a-zA-Z0-9_-]{11})"')
+
+# 流式读取YouTube页面时需要等到的标记（按顺序出现的开始/结束字节串），全部读到后即关闭连接：
+# 视频页只需要 <title>、publishDate 和 channelId；频道页/搜索页只需要 ytInitialData 脚本
+YOUTUBE_WATCH_MARKERS = [(b'<title>', b'</title>'), (b'"publishDate":"', b'"'), (b'"channelId":"UC', b'"')]
+YOUTUBE_INITIAL_DATA_MARKERS = [(b'ytInitialData = ', b'</script>')]
+
+# 一次抓取视频页面得到的元数据（publish_time 为北京时间 datetime，解析失败为 None）
+VideoMetadata = namedtuple('VideoMetadata', ['video_id', 'title', 'publish_time', 'channel_id'])
+
 class VVNewsBotAuto:
     def __init__(self, search_hours=0.33):  # 默认搜索20分钟内的新闻
         self.session = requests.Session()
@@ -33,7 +73,34 @@ class VVNewsBotAuto:
         })
         
         self.search_hours = search_hours
-        self.current_run_news = []  # 当前运行中发现的新闻，用于去重
+        # 监控的关键词列表（逗号分隔），所有关键词共享同一轮页面抓取
+        self.keywords = normalize_keywords(os.getenv('VVNEWS_KEYWORDS', '王敏奕'))
+        self.page_cache = PageCache(self.session, self.keywords)  # 本轮运行内每个URL只抓取一次
+        self._round_keywords = self.keywords  # 本轮搜索的关键词（Google News 按批合并查询）
+        self.current_run_news = []  # 当前运行中发现的新闻
+        self.seen_ttl = float(os.getenv('VVNEWS_SEEN_TTL_DAYS', '7')) * 86400  # 已通知新闻的保留时间(秒)
+        
+        # 并发搜索配置：各来源在有限线程池中并行执行，单个来源超时即丢弃
+        self.max_workers = int(os.getenv('VVNEWS_MAX_WORKERS', '6'))
+        self.source_timeout = float(os.getenv('VVNEWS_SOURCE_TIMEOUT', '120'))  # 单个来源默认超时(秒)
+        self.source_timeouts = {  # 策略较多的来源单独放宽
+            '東網on.cc': float(os.getenv('VVNEWS_SOURCE_TIMEOUT_ONCC', '180')),
+            'YouTube': float(os.getenv('VVNEWS_SOURCE_TIMEOUT_YOUTUBE', '150')),
+        }
+        self.search_deadline = float(os.getenv('VVNEWS_SEARCH_DEADLINE', '300'))  # 整轮搜索的总时限(秒)
+        
+        # 异步抓取引擎（可选）：所有来源在一个事件循环中运行，按主机限制并发连接
+        self.use_async = os.getenv('VVNEWS_ASYNC', 'false').lower() == 'true'
+        self.per_host_limit = int(os.getenv('VVNEWS_PER_HOST_LIMIT', '4'))
+        
+        # 详情页并发检查：单个来源内的并发数与结果配额
+        self.detail_workers = int(os.getenv('VVNEWS_DETAIL_WORKERS', '4'))
+        self.oncc_result_quota = 3
+        # 文章发布时间并发查询：各来源的并发上限（未列出的来源使用 detail_workers）与单页候选的总时限(秒)
+        self.publish_time_workers = {
+            '星島娛樂': int(os.getenv('VVNEWS_SINGTAO_TIME_WORKERS', '4')),
+        }
+        self.publish_time_deadline = float(os.getenv('VVNEWS_PUBLISH_TIME_DEADLINE', '30'))
         
         # 邮件配置
         try:
@@ -54,6 +121,36 @@ class VVNewsBotAuto:
         
         # 确保results目录存在
         os.makedirs('./results', exist_ok=True)
+        
+        # 跨运行的持久化状态（Sitemap水位线等）
+        self.state = StateStore()
+        self.canonicalizer = URLCanonicalizer(self.session, self.state)
+        self.near_dup = NearDuplicateIndex(self.state)  # 各媒体转载的同一新闻合并为一条
+        self.breaker = CircuitBreaker(self.state)  # 持续失败的搜索端点暂时跳过
+        self._breaker_lock = threading.Lock()
+        self._breaker_recorded = set()  # 本轮已计入熔断器的URL：多个关键词共享同一次请求，只记录一次结果
+        self.strategy_stats = StrategyStats(self.state)  # 各来源策略按历史每秒命中数排序
+        # 已解析的YouTube视频元数据（标题/发布时间/频道），跨运行复用，避免重复抓取约1MB的视频页面；
+        # 没有解析到发布时间的记录不缓存，下次重新抓取（否则该视频会一直按"24小时前发布"处理）
+        self.video_cache = MetadataCache(self.state, 'youtube_video',
+                                         ttl=float(os.getenv('VVNEWS_VIDEO_CACHE_DAYS', '30')) * 86400,
+                                         cacheable=lambda record: bool(record.get('publish_time')))
+        # 各来源文章页的元数据（发布时间/标题/是否含关键词）：正结果长期缓存，页面上没有元数据的短期负缓存后再重试
+        self.article_cache = ArticleMetadataCache(
+            self.state, ttl=float(os.getenv('VVNEWS_ARTICLE_CACHE_DAYS', '30')) * 86400,
+            negative_ttl=float(os.getenv('VVNEWS_ARTICLE_NEGATIVE_HOURS', '6')) * 3600)
+        self.channel_resolver = ChannelResolver(self.session, self.state)  # @handle → channel_id 长期缓存
+        self.feed_cache = ConditionalFeedCache(self.state)  # 频道RSS的 ETag/Last-Modified 与已解析条目
+        self._youtube_feed_lock = threading.Lock()
+        self._youtube_feed_entries = {}  # 本轮运行已获取的频道RSS条目，所有关键词共用
+        self._oncc_sitemap_lock = threading.Lock()
+        self._tvb_publish_time_lock = threading.Lock()
+        self._tvb_publish_times = {}  # 本轮运行中各TVB URL的发布时间解析结果（Future），时间过滤时复用
+        self._oncc_sitemap_entries = None  # 本轮运行已选出的Sitemap URL，所有关键词共用
+        self._oncc_sitemap_task = None  # 异步版本：本轮读取Sitemap的任务，所有关键词共用
+        self._oncc_sitemap_checks = {}  # 本轮各Sitemap URL的检查结果 {URL: {关键词: 是否无错误完成}}
+        self._oncc_sitemap_skipped = set()  # 本轮在Sitemap策略之前就已找到结果、没有检查Sitemap URL的关键词
+        self._oncc_fallback_urls = set()  # 本轮Sitemap中缺少 lastmod、使用替代时间的URL
     
     def get_beijing_time(self):
         """获取北京时间"""
@@ -80,7 +177,7 @@ class VVNewsBotAuto:
                     logging.info(f"新闻超出发布时间范围: {news_item.get('title', '')}")
                 return in_range
             
-            # 若无发布时间：对TVB来源更严格，尝试现场提取；失败则排除
+            # 若无发布时间：对TVB来源更严格，获取真实发布时间（本轮已解析过的URL直接复用）；失败则排除
             url = news_item.get('url', '') or ''
             source = news_item.get('source', '') or ''
             if ('tvb.com' in url.lower()) or (source.upper() == 'TVB'):
@@ -103,65 +200,63 @@ class VVNewsBotAuto:
             logging.warning(f"时间范围检查失败: {e}")
             return True
     
+    def _seen_key(self, news_item):
+        """去重键：规范化后的URL（合并阶段已计算的优先）"""
+        return news_item.get('canonical_url') or canonicalize_url(news_item.get('url', ''))
+    
     def is_duplicate(self, news_item):
-        """检查是否为重复新闻（本次运行中）"""
-        url = news_item.get('url', '')
+        """检查是否为重复新闻（跨运行、跨进程）；未见过的新闻会被原子登记到状态数据库"""
+        url = self._seen_key(news_item)
         title = news_item.get('title', '')
         
-        for existing_news in self.current_run_news:
-            if existing_news.get('url') == url:
-                logging.info(f"发现重复新闻: {title}")
-                return True
+        if not self.state.claim_seen(url, self.seen_ttl, title=title, source=news_item.get('source', '')):
+            logging.info(f"发现重复新闻: {title}")
+            return True
         
         return False
     
+    def _load_article_publish_time(self, article_url, timeout):
+        publish_time = fetch_publish_time(self.session, article_url, timeout=timeout)
+        return {'publish_time': publish_time.isoformat()} if publish_time else None
+    
+    async def _load_article_publish_time_async(self, article_url, fetcher, timeout):
+        publish_time = await fetch_publish_time_async(fetcher, article_url, timeout=timeout)
+        return {'publish_time': publish_time.isoformat()} if publish_time else None
+    
+    def _article_publish_time(self, article_url, timeout=10):
+        """经文章元数据缓存获取发布时间（北京时间）；页面上没有时间返回 None，网络错误向上抛出"""
+        record = self.article_cache.get_or_load(
+            article_url, lambda: self._load_article_publish_time(article_url, timeout))
+        return datetime.fromisoformat(record['publish_time']) if record else None
+    
+    async def _article_publish_time_async(self, article_url, fetcher, timeout=10):
+        """_article_publish_time 的异步版本"""
+        record = await self.article_cache.get_or_load_async(
+            article_url, lambda: self._load_article_publish_time_async(article_url, fetcher, timeout))
+        return datetime.fromisoformat(record['publish_time']) if record else None
+    
     def get_stheadline_publish_time(self, article_url):
-        """获取星島娛樂文章的真实发布时间"""
+        """获取星島娛樂文章的真实发布时间（经文章元数据缓存；未命中时流式读取，通常读到 </head> 即可确定）"""
         try:
-            response = self.session.get(article_url, timeout=10)
-            if response.status_code == 200:
-                content = response.text
-                
-                # 查找 meta property="article:published_time"
-                import re
-                time_pattern = r'<meta\s+property="article:published_time"\s+content="([^"]+)"'
-                match = re.search(time_pattern, content)
-                
-                if match:
-                    time_str = match.group(1)
-                    logging.info(f"找到星島发布时间: {time_str}")
-                    
-                    # 解析时间格式: 2025-08-23T03:00:00+0800
-                    publish_time = datetime.fromisoformat(time_str)
-                    
-                    # 转换为北京时间
-                    beijing_tz = timezone(timedelta(hours=8))
-                    if publish_time.tzinfo is None:
-                        publish_time = publish_time.replace(tzinfo=beijing_tz)
-                    else:
-                        publish_time = publish_time.astimezone(beijing_tz)
-                    
-                    logging.info(f"解析星島时间成功: {publish_time}")
-                    return publish_time
-                
-                # 备用方案：查找页面中的时间文本
-                time_patterns = [
-                    r'發佈時間：(\d{2}:\d{2})\s+(\d{4}-\d{2}-\d{2})',
-                    r'更新時間：(\d{2}:\d{2})\s+(\d{4}-\d{2}-\d{2})',
-                ]
-                
-                for pattern in time_patterns:
-                    matches = re.findall(pattern, content)
-                    if matches:
-                        time_part, date_part = matches[0]
-                        datetime_str = f"{date_part} {time_part}:00"
-                        
-                        publish_time = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-                        beijing_tz = timezone(timedelta(hours=8))
-                        publish_time = publish_time.replace(tzinfo=beijing_tz)
-                        
-                        logging.info(f"解析星島时间成功(备用): {publish_time}")
-                        return publish_time
+            publish_time = self._article_publish_time(article_url, timeout=10)
+            if publish_time:
+                logging.info(f"解析星島时间成功: {publish_time}")
+                return publish_time
+            
+            logging.warning(f"无法获取星島文章时间: {article_url}")
+            return None
+            
+        except Exception as e:
+            logging.warning(f"解析星島发布时间失败: {e}")
+            return None
+    
+    async def get_stheadline_publish_time_async(self, article_url, fetcher):
+        """获取星島娛樂文章的真实发布时间（异步版本）"""
+        try:
+            publish_time = await self._article_publish_time_async(article_url, fetcher, timeout=10)
+            if publish_time:
+                logging.info(f"解析星島时间成功: {publish_time}")
+                return publish_time
             
             logging.warning(f"无法获取星島文章时间: {article_url}")
             return None
@@ -170,54 +265,55 @@ class VVNewsBotAuto:
             logging.warning(f"解析星島发布时间失败: {e}")
             return None
     
+    GOOGLE_NEWS_RSS_URL = "https://news.google.com/rss/search"
+    GOOGLE_NEWS_BATCH_SIZE = 5  # 每个 OR 查询合并的关键词数
+    
+    def _google_news_batch(self, keyword):
+        """本轮关键词按顺序每 GOOGLE_NEWS_BATCH_SIZE 个合并为一个查询，返回 keyword 所在的一批"""
+        keywords = self._round_keywords if keyword in self._round_keywords else [keyword]
+        start = keywords.index(keyword) // self.GOOGLE_NEWS_BATCH_SIZE * self.GOOGLE_NEWS_BATCH_SIZE
+        return keywords[start:start + self.GOOGLE_NEWS_BATCH_SIZE]
+    
+    def _google_news_url(self, keywords):
+        # 搜索过去1小时的新闻，然后按 pubDate 进一步过滤到搜索窗口；同一批关键词用 OR 合并为一次请求
+        query = keywords[0] if len(keywords) == 1 else '(' + ' OR '.join(keywords) + ')'
+        params = {'q': f'{query} when:1h', 'hl': 'zh-TW', 'gl': 'HK', 'ceid': 'HK:zh-TW'}
+        return f"{self.GOOGLE_NEWS_RSS_URL}?{urlencode(params)}"
+    
+    def _parse_google_news(self, keyword, content):
+        """解析Google News RSS：标题含关键词且 pubDate 在搜索窗口内的条目（跳转链接留到时间过滤后再解析）"""
+        results = []
+        beijing_tz = timezone(timedelta(hours=8))
+        time_threshold = self.get_beijing_time() - timedelta(hours=self.search_hours)
+        
+        for entry in iter_entries(content):
+            if keyword.lower() not in entry.title.lower() or not entry.link:
+                continue
+            publish_time = entry.published.astimezone(beijing_tz)
+            if publish_time < time_threshold:
+                continue
+            results.append({
+                'title': entry.title,
+                'url': entry.link,
+                'source': 'Google News',
+                'publish_time': publish_time.isoformat(),
+                'publish_time_readable': publish_time.strftime('%Y-%m-%d %H:%M:%S')
+            })
+        
+        return results
+    
     def search_google_news(self, keyword):
-        """搜索Google News - 带时间过滤"""
+        """搜索Google News（RSS搜索接口）- 按 pubDate 时间过滤，多个关键词合并为 OR 查询"""
         results = []
         
         try:
             logging.info(f"搜索Google新闻: {keyword}")
             
-            # 搜索过去1小时的新闻，然后在代码中进一步过滤到20分钟
-            url = f"https://news.google.com/search?q={keyword}+when:1h&hl=zh-TW&gl=HK&ceid=HK:zh-TW"
-            response = self.session.get(url, timeout=15)
+            # 同一批关键词的请求URL相同，经本轮页面缓存只抓取一次
+            response = self._fetch_page(self._google_news_url(self._google_news_batch(keyword)), timeout=15)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                articles = soup.find_all('article')
-                
-                for article in articles[:10]:
-                    title_elem = article.find('h3')
-                    if title_elem and keyword.lower() in title_elem.get_text().lower():
-                        title = title_elem.get_text().strip()
-                        link_elem = article.find('a')
-                        
-                        # 尝试提取发布时间
-                        time_elem = article.find('time')
-                        publish_time = None
-                        if time_elem:
-                            datetime_attr = time_elem.get('datetime')
-                            if datetime_attr:
-                                try:
-                                    publish_time = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
-                                    beijing_tz = timezone(timedelta(hours=8))
-                                    publish_time = publish_time.astimezone(beijing_tz)
-                                except:
-                                    pass
-                        
-                        if link_elem:
-                            article_url = 'https://news.google.com' + link_elem.get('href', '')
-                            
-                            result = {
-                                'title': title,
-                                'url': article_url,
-                                'source': 'Google News'
-                            }
-                            
-                            if publish_time:
-                                result['publish_time'] = publish_time.isoformat()
-                                result['publish_time_readable'] = publish_time.strftime('%Y-%m-%d %H:%M:%S')
-                            
-                            results.append(result)
+                results = self._parse_google_news(keyword, response.content)
             
             logging.info(f"Google News 搜索完成，找到 {len(results)} 条结果")
             return results
@@ -226,1399 +322,1152 @@ class VVNewsBotAuto:
             logging.error(f"搜索Google News时出错: {e}")
             return results
     
-    def search_hk01(self, keyword):
-        """搜索香港01 - 使用即时娱乐频道的优化方法"""
+    async def search_google_news_async(self, keyword, fetcher):
+        """搜索Google News（异步版本）"""
         results = []
         
         try:
-            logging.info(f"搜索香港01: {keyword}")
+            logging.info(f"[异步] 搜索Google新闻: {keyword}")
             
-            # 方法1: 搜索娱乐版块（用户指定的新URL）
-            entertainment_url = "https://www.hk01.com/zone/2/娛樂"
-            logging.info(f"检查香港01娱乐版块: {entertainment_url}")
-            
-            response = self.session.get(entertainment_url, timeout=15)
+            response = await fetcher.get(self._google_news_url(self._google_news_batch(keyword)), timeout=15)
             
             if response.status_code == 200:
-                content = response.text
-                current_time = self.get_beijing_time()
-                
-                # 检查页面是否包含关键词
-                if keyword in content:
-                    logging.info(f"在娱乐版块找到关键词: {keyword}")
-                    soup = BeautifulSoup(content, 'html.parser')
-                    
-                    # 查找包含关键词的文章链接
-                    links = soup.find_all('a', href=True)
-                    seen_urls = set()
-                    
-                    for link in links:
-                        href = link.get('href', '')
-                        text = link.get_text().strip()
-                        title_attr = link.get('title', '').strip()
-                        
-                        # 检查链接文本或标题属性是否包含关键词
-                        for check_text in [text, title_attr]:
-                            if (check_text and 
-                                keyword.lower() in check_text.lower() and 
-                                len(check_text) > 10 and
-                                ('/article/' in href or '/news/' in href)):
-                                
-                                # 构建完整URL
-                                if href.startswith('/'):
-                                    full_url = f'https://www.hk01.com{href}'
-                                elif href.startswith('http'):
-                                    full_url = href
-                                else:
-                                    continue
-                                
-                                # 去重检查
-                                if full_url in seen_urls:
-                                    continue
-                                seen_urls.add(full_url)
-                                
-                                result = {
-                                    'title': check_text,
-                                    'url': full_url,
-                                    'source': '香港01',
-                                    'keyword': keyword,
-                                    'discovered_at': current_time.isoformat(),
-                                    'publish_time': current_time.isoformat(),
-                                    'publish_time_readable': current_time.strftime('%Y-%m-%d %H:%M:%S')
-                                }
-                                
-                                results.append(result)
-                                logging.info(f"找到香港01娱乐文章: {check_text[:50]}...")
-                                break
-                        
-                        # 限制结果数量
-                        if len(results) >= 5:
-                            break
-                else:
-                    logging.info("娱乐版块未包含关键词，尝试其他频道")
-            
-            # 方法2: 如果娱乐版块没有找到，尝试其他相关频道
-            if not results:
-                other_channels = [
-                    ("https://www.hk01.com/channel/22/即時娛樂", "即时娱乐频道"),
-                    ("https://www.hk01.com/zone/1/港闻", "港闻版块"),
-                    ("https://www.hk01.com/latest", "最新新闻"),
-                    ("https://www.hk01.com/hot", "热门新闻")
-                ]
-                
-                for channel_url, channel_name in other_channels:
-                    try:
-                        logging.info(f"检查香港01{channel_name}: {channel_url}")
-                        channel_response = self.session.get(channel_url, timeout=10)
-                        
-                        if channel_response.status_code == 200 and keyword in channel_response.text:
-                            soup = BeautifulSoup(channel_response.text, 'html.parser')
-                            links = soup.find_all('a', href=True)
-                            
-                            current_time = self.get_beijing_time()
-                            for link in links:
-                                href = link.get('href', '')
-                                text = link.get_text().strip()
-                                
-                                if (keyword.lower() in text.lower() and 
-                                    len(text) > 10 and
-                                    ('/article/' in href or '/news/' in href)):
-                                    
-                                    if href.startswith('/'):
-                                        full_url = f'https://www.hk01.com{href}'
-                                    else:
-                                        full_url = href
-                                    
-                                    # 简单去重
-                                    if not any(r['url'] == full_url for r in results):
-                                        result = {
-                                            'title': text,
-                                            'url': full_url,
-                                            'source': '香港01',
-                                            'keyword': keyword,
-                                            'discovered_at': current_time.isoformat(),
-                                            'publish_time': current_time.isoformat(),
-                                            'publish_time_readable': current_time.strftime('%Y-%m-%d %H:%M:%S')
-                                        }
-                                        
-                                        results.append(result)
-                                        logging.info(f"在{channel_name}找到文章: {text[:50]}...")
-                                        
-                                        if len(results) >= 3:
-                                            break
-                            
-                            # 如果找到结果就不再搜索其他频道
-                            if results:
-                                break
-                                
-                    except Exception as e:
-                        logging.warning(f"搜索{channel_name}失败: {e}")
-                        continue
-            
-            # 方法3: 最后尝试搜索页面（作为备用）
-            if not results:
-                logging.info("尝试香港01搜索页面作为备用")
-                search_url = f"https://www.hk01.com/search?q={keyword}"
-                search_response = self.session.get(search_url, timeout=10)
-                
-                if search_response.status_code == 200:
-                    # 使用正则表达式查找JSON数据中的文章
-                    patterns = [
-                        r'"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*"canonicalUrl":\s*"([^"]*?)"',
-                        r'"canonicalUrl":\s*"([^"]*?)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"'
-                    ]
-                    
-                    current_time = self.get_beijing_time()
-                    for pattern in patterns:
-                        matches = re.findall(pattern, search_response.text, re.IGNORECASE)
-                        for match in matches:
-                            if len(match) == 2:
-                                if 'title' in pattern and pattern.index('title') < pattern.index('canonicalUrl'):
-                                    title, article_url = match
-                                else:
-                                    article_url, title = match
-                                
-                                if article_url and not article_url.startswith('http'):
-                                    if article_url.startswith('/'):
-                                        article_url = f'https://www.hk01.com{article_url}'
-                                    else:
-                                        article_url = f'https://www.hk01.com/{article_url}'
-                                
-                                if title and article_url:
-                                    result = {
-                                        'title': title.strip(),
-                                        'url': article_url,
-                                        'source': '香港01',
-                                        'keyword': keyword,
-                                        'discovered_at': current_time.isoformat(),
-                                        'publish_time': current_time.isoformat(),
-                                        'publish_time_readable': current_time.strftime('%Y-%m-%d %H:%M:%S')
-                                    }
-                                    results.append(result)
-                        
-                        if results:
-                            break
+                results = self._parse_google_news(keyword, response.content)
             
-            logging.info(f"香港01 搜索完成，找到 {len(results)} 条结果")
+            logging.info(f"[异步] Google News 搜索完成，找到 {len(results)} 条结果")
             return results
             
         except Exception as e:
-            logging.error(f"搜索香港01时出错: {e}")
+            logging.error(f"[异步] 搜索Google News时出错: {e}")
             return results
     
-    def search_oncc(self, keyword):
-        """搜索東網on.cc - 增强版：包含基于日期的搜索策略"""
+    HK01_ZONE_URL = "https://www.hk01.com/zone/2/娛樂"
+    HK01_CHANNELS = [
+        ("https://www.hk01.com/channel/22/即時娛樂", "即时娱乐频道"),
+        ("https://www.hk01.com/zone/1/港闻", "港闻版块"),
+        ("https://www.hk01.com/latest", "最新新闻"),
+        ("https://www.hk01.com/hot", "热门新闻")
+    ]
+    
+    def _make_hk01_result(self, title, url, keyword, current_time):
+        return {
+            'title': title,
+            'url': url,
+            'source': '香港01',
+            'keyword': keyword,
+            'discovered_at': current_time.isoformat(),
+            'publish_time': current_time.isoformat(),
+            'publish_time_readable': current_time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    def _parse_hk01_zone(self, keyword, content):
+        """方法1: 解析香港01娱乐版块页面，检查链接文本和标题属性"""
         results = []
+        if keyword not in content:
+            logging.info("娱乐版块未包含关键词，尝试其他频道")
+            return results
         
-        try:
-            logging.info(f"搜索東網: {keyword}")
-            
-            # 生成最近几天的日期用于搜索
-            from datetime import datetime, timedelta, timezone
-            beijing_tz = timezone(timedelta(hours=8))
-            today = datetime.now(beijing_tz)
-            dates_to_check = []
-            for i in range(7):  # 检查最近7天
-                date = today - timedelta(days=i)
-                dates_to_check.append(date.strftime('%Y%m%d'))
-            
-            # 策略1: 检查多个可能的东网页面（增强版）
-            oncc_urls = [
-                "https://hk.on.cc/hk/entertainment/index.html",  # 娱乐首页
-                "https://hk.on.cc/hk/bkn/cnt/entertainment/",    # BKN娱乐目录 - 重点
-                "https://hk.on.cc/hk/bkn/cnt/",                  # BKN内容目录
-                "https://hk.on.cc/hk/bkn/",                      # BKN主页 
-                "https://hk.on.cc/hk/news/",                     # 新闻主页
-                "https://hk.on.cc/"                              # 主页
-            ]
-            
-            # 策略1.5: 基于日期的直接搜索（新增）
-            date_based_urls = []
-            for date_str in dates_to_check[:3]:  # 只检查最近3天，避免过多请求
-                date_based_urls.extend([
-                    f"https://hk.on.cc/hk/bkn/cnt/entertainment/{date_str}/",
-                    f"https://hk.on.cc/hk/bkn/cnt/news/{date_str}/",
-                ])
-            
-            # 合并所有URL
-            all_urls = oncc_urls + date_based_urls
-            
-            for base_url in all_urls:
-                try:
-                    logging.info(f"检查东网页面: {base_url}")
-                    response = self.session.get(base_url, timeout=10)
+        logging.info(f"在娱乐版块找到关键词: {keyword}")
+        current_time = self.get_beijing_time()
+        
+        # 查找包含关键词的文章链接
+        seen_urls = set()
+        
+        for link in extract_links(content):
+            href = link.href
+            text = link.text.strip()
+            title_attr = link.title.strip()
+            
+            # 检查链接文本或标题属性是否包含关键词
+            for check_text in [text, title_attr]:
+                if (check_text and 
+                    keyword.lower() in check_text.lower() and 
+                    len(check_text) > 10 and
+                    ('/article/' in href or '/news/' in href)):
                     
-                    if response.status_code == 200:
-                        # 处理编码问题
-                        if response.encoding == 'ISO-8859-1':
-                            response.encoding = 'utf-8'
-                        
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        
-                        # 查找新闻容器
-                        news_containers = soup.find_all(['div', 'section'], 
-                                                       class_=re.compile(r'news|article|content|story', re.I))
-                        
-                        # 检查所有链接
-                        all_links = soup.find_all('a', href=True)
-                        
-                        for link in all_links:
-                            # 获取链接文本和属性
-                            texts_to_check = [
-                                link.get_text().strip(),
-                                link.get('title', '').strip(),
-                                link.get('alt', '').strip()
-                            ]
-                            
-                            href = link.get('href', '')
-                            
-                            for text in texts_to_check:
-                                if (text and keyword.lower() in text.lower() and 
-                                    len(text) > 8 and len(text) < 300):
-                                    
-                                    # 检查是否是有效的新闻链接（增强版）
-                                    if (href and 
-                                        any(pattern in href.lower() for pattern in 
-                                            ['/bkn/', '/cnt/', '/news/', '/entertainment/', '/hk/', '.html']) and
-                                        'index.html' not in href and 'search' not in href and
-                                        # 特别匹配目标新闻的URL模式
-                                        (any(date_pattern in href for date_pattern in dates_to_check) or
-                                         'bkn-' in href or '/cnt/' in href)):
-                                        
-                                        # 构建完整URL
-                                        if href.startswith('/'):
-                                            full_url = 'https://hk.on.cc' + href
-                                        elif href.startswith('http'):
-                                            full_url = href
-                                        else:
-                                            full_url = f'https://hk.on.cc/{href}'
-                                        
-                                        # 尝试获取更详细的信息
-                                        try:
-                                            detail_response = self.session.get(full_url, timeout=8)
-                                            if detail_response.status_code == 200:
-                                                if detail_response.encoding == 'ISO-8859-1':
-                                                    detail_response.encoding = 'utf-8'
-                                                    
-                                                detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
-                                                
-                                                # 获取页面标题
-                                                page_title = None
-                                                title_selectors = ['h1', 'title', '.headline', '.article-title']
-                                                
-                                                for selector in title_selectors:
-                                                    title_elem = detail_soup.select_one(selector)
-                                                    if title_elem:
-                                                        candidate = title_elem.get_text().strip()
-                                                        if keyword.lower() in candidate.lower() and len(candidate) > 10:
-                                                            page_title = candidate
-                                                            break
-                                                
-                                                final_title = page_title if page_title else text
-                                                
-                                                results.append({
-                                                    'title': final_title,
-                                                    'url': full_url,
-                                                    'source': '東網on.cc',
-                                                    'keyword': keyword,
-                                                    'discovered_at': self.get_beijing_time().isoformat(),
-                                                    'publish_time': self.get_beijing_time().isoformat(),
-                                                    'publish_time_readable': self.get_beijing_time().strftime('%Y-%m-%d %H:%M:%S')
-                                                })
-                                                
-                                                logging.info(f"找到东网新闻: {final_title[:40]}...")
-                                                break  # 找到一个就跳出文本检查循环
-                                        except:
-                                            # 如果无法获取详情，使用原始信息
-                                            results.append({
-                                                'title': text,
-                                                'url': full_url,
-                                                'source': '東網on.cc',
-                                                'keyword': keyword,
-                                                'discovered_at': self.get_beijing_time().isoformat(),
-                                                'publish_time': self.get_beijing_time().isoformat(),
-                                                'publish_time_readable': self.get_beijing_time().strftime('%Y-%m-%d %H:%M:%S')
-                                            })
-                                            break
-                        
-                        # 如果找到结果就停止检查其他页面
-                        if results:
-                            break
-                            
-                except Exception as e:
-                    logging.warning(f"检查东网页面 {base_url} 失败: {str(e)}")
-                    continue
-            
-            # 策略2: 基于Sitemap的精确搜索（新增高效策略）
-            if not results:
-                logging.info("尝试东网Sitemap策略...")
-                
-                try:
-                    sitemap_url = "https://hk.on.cc/sitemap.xml"
-                    sitemap_response = self.session.get(sitemap_url, timeout=15)
+                    # 构建完整URL
+                    if href.startswith('/'):
+                        full_url = f'https://www.hk01.com{href}'
+                    elif href.startswith('http'):
+                        full_url = href
+                    else:
+                        continue
                     
-                    if sitemap_response.status_code == 200:
-                        import xml.etree.ElementTree as ET
-                        from datetime import datetime, timedelta
-                        
-                        # 解析Sitemap XML
-                        root = ET.fromstring(sitemap_response.text)
-                        
-                        # 获取当前时间用于时间过滤 (使用北京时区)
-                        from datetime import timezone
-                        beijing_tz = timezone(timedelta(hours=8))
-                        current_time = datetime.now(beijing_tz)
-                        time_threshold = current_time - timedelta(hours=self.search_hours)
-                        
-                        # 查找最近的entertainment URLs
-                        entertainment_urls = []
-                        for url_elem in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url'):
-                            loc_elem = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                            lastmod_elem = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-                            
-                            if loc_elem is not None:
-                                url = loc_elem.text
-                                lastmod = lastmod_elem.text if lastmod_elem is not None else None
-                                
-                                # 过滤entertainment URL和时间范围
-                                if ('entertainment' in url.lower() and lastmod):
-                                    try:
-                                        # 解析时间: 2025-08-21T14:47:10+08:00
-                                        url_time = datetime.fromisoformat(lastmod.replace('Z', '+00:00'))
-                                        
-                                        # 转换为北京时间进行比较
-                                        if url_time.tzinfo is None:
-                                            url_time = url_time.replace(tzinfo=beijing_tz)
-                                        else:
-                                            # 转换到北京时区
-                                            url_time = url_time.astimezone(beijing_tz)
-                                        
-                                        # 检查是否在时间范围内（使用aware datetime比较）
-                                        if url_time >= time_threshold:
-                                            entertainment_urls.append((url, url_time))
-                                    except:
-                                        # 如果时间解析失败，仍然包含最近几天的URL
-                                        if any(date_str in url for date_str in dates_to_check[:3]):
-                                            entertainment_urls.append((url, current_time))
-                        
-                        # 按时间排序，最新的在前
-                        entertainment_urls.sort(key=lambda x: x[1], reverse=True)
-                        
-                        logging.info(f"Sitemap找到 {len(entertainment_urls)} 个最近的娱乐新闻URL")
-                        
-                        # 检查这些URL是否包含关键词
-                        # 优先检查8月20日的URL，因为可能有目标新闻
-                        priority_urls = []
-                        other_urls = []
-                        
-                        for url, url_time in entertainment_urls:
-                            if '20250820' in url:
-                                priority_urls.append((url, url_time))
-                            else:
-                                other_urls.append((url, url_time))
-                        
-                        # 合并：先检查8月20日的，再检查其他的
-                        urls_to_check = priority_urls + other_urls[:20]  # 优先8月20日 + 最新20个
-                        
-                        logging.info(f"优先检查8月20日新闻 {len(priority_urls)} 条，其他 {len(other_urls[:20])} 条")
-                        
-                        for url, url_time in urls_to_check:
-                            try:
-                                logging.info(f"检查Sitemap URL: {url[-60:]}...")
-                                
-                                detail_response = self.session.get(url, timeout=8)
-                                if detail_response.status_code == 200:
-                                    if detail_response.encoding == 'ISO-8859-1':
-                                        detail_response.encoding = 'utf-8'
-                                    
-                                    detail_content = detail_response.text
-                                    
-                                    if keyword.lower() in detail_content.lower():
-                                        # 提取标题
-                                        detail_soup = BeautifulSoup(detail_content, 'html.parser')
-                                        
-                                        title = None
-                                        title_selectors = ['h1', 'title', '.headline', '.article-title']
-                                        for selector in title_selectors:
-                                            title_elem = detail_soup.select_one(selector)
-                                            if title_elem:
-                                                candidate = title_elem.get_text().strip()
-                                                if keyword.lower() in candidate.lower() and len(candidate) > 10:
-                                                    title = candidate
-                                                    if selector == 'title':
-                                                        # 清理title标签中的网站后缀
-                                                        title = title.split('｜')[0].split('|')[0].strip()
-                                                    break
-                                        
-                                        if not title:
-                                            title = f"東網娱乐新闻 - {keyword}相关"
-                                        
-                                        results.append({
-                                            'title': title,
-                                            'url': url,
-                                            'source': '東網on.cc (Sitemap)',
-                                            'keyword': keyword,
-                                            'discovered_at': self.get_beijing_time().isoformat(),
-                                            'publish_time': url_time.isoformat(),
-                                            'publish_time_readable': url_time.strftime('%Y-%m-%d %H:%M:%S')
-                                        })
-                                        
-                                        logging.info(f"通过Sitemap找到东网新闻: {title[:40]}...")
-                                        
-                                        # 找到一定数量就停止
-                                        if len(results) >= 3:
-                                            break
-                            except Exception as e:
-                                logging.debug(f"检查Sitemap URL失败: {e}")
-                                continue
-                        
-                        if results:
-                            logging.info(f"Sitemap策略成功，找到 {len(results)} 条结果")
+                    # 去重检查
+                    if full_url in seen_urls:
+                        continue
+                    seen_urls.add(full_url)
                     
-                except Exception as e:
-                    logging.warning(f"Sitemap策略失败: {e}")
+                    results.append(self._make_hk01_result(check_text, full_url, keyword, current_time))
+                    logging.info(f"找到香港01娱乐文章: {check_text[:50]}...")
+                    break
             
-            # 策略3: 如果还没找到，尝试直接URL构造（保留原有策略）
-            if not results:
-                logging.info("尝试东网直接URL构造策略...")
-                
-                # 基于目标新闻的URL模式构造可能的URL
-                direct_urls = []
-                for date_str in dates_to_check[:5]:  # 检查最近5天
-                    # 模拟东网URL模式: bkn-YYYYMMDDHHMMSS-MMDD_XXXXX_XXX.html
-                    # 为了简化，我们尝试几个常见的时间点
-                    times = ['180100', '120000', '090000', '150000', '210000']  # 18:01, 12:00, 09:00, 15:00, 21:00
-                    
-                    for time_str in times:
-                        for seq in ['001', '002', '003']:  # 尝试几个序号
-                            url_pattern = f"https://hk.on.cc/hk/bkn/cnt/entertainment/{date_str}/bkn-{date_str}{time_str}*-{date_str[-4:]}_*_{seq}.html"
-                            # 这里我们只是记录模式，实际实现中可以扫描
+            # 限制结果数量
+            if len(results) >= 5:
+                break
+        
+        return results
+    
+    def _parse_hk01_channel(self, keyword, content, channel_name):
+        """方法2: 解析香港01其他频道页面（仅检查链接文本）"""
+        results = []
+        if keyword not in content:
+            return results
+        
+        current_time = self.get_beijing_time()
+        for link in extract_links(content):
+            href = link.href
+            text = link.text.strip()
+            
+            if (keyword.lower() in text.lower() and 
+                len(text) > 10 and
+                ('/article/' in href or '/news/' in href)):
                 
-                # 由于无法精确构造所有URL，我们改为尝试搜索引擎方法
-                search_engine_urls = [
-                    f"https://hk.on.cc/search?q={keyword}",
-                    f"https://hk.on.cc/hk/search.html?keyword={keyword}",
-                ]
+                if href.startswith('/'):
+                    full_url = f'https://www.hk01.com{href}'
+                else:
+                    full_url = href
                 
-                for search_url in search_engine_urls:
-                    try:
-                        logging.info(f"检查东网搜索页面: {search_url}")
-                        search_response = self.session.get(search_url, timeout=10)
-                        
-                        if search_response.status_code == 200:
-                            if search_response.encoding == 'ISO-8859-1':
-                                search_response.encoding = 'utf-8'
-                            
-                            search_content = search_response.text
-                            search_soup = BeautifulSoup(search_content, 'html.parser')
-                            
-                            # 查找搜索结果链接
-                            for link in search_soup.find_all('a', href=True):
-                                text = link.get_text().strip()
-                                href = link.get('href', '')
-                                
-                                if (keyword.lower() in text.lower() and len(text) > 10 and
-                                    ('bkn-' in href or '/cnt/' in href or '/entertainment/' in href)):
-                                    
-                                    if not href.startswith('http'):
-                                        if href.startswith('/'):
-                                            href = 'https://hk.on.cc' + href
-                                    
-                                    results.append({
-                                        'title': text,
-                                        'url': href,
-                                        'source': '東網on.cc (搜索)',
-                                        'keyword': keyword,
-                                        'discovered_at': self.get_beijing_time().isoformat(),
-                                        'publish_time': self.get_beijing_time().isoformat(),
-                                        'publish_time_readable': self.get_beijing_time().strftime('%Y-%m-%d %H:%M:%S')
-                                    })
-                                    
-                                    logging.info(f"通过搜索找到东网新闻: {text[:40]}...")
-                                    break
-                            
-                            if results:
-                                break
-                                
-                    except Exception as e:
-                        logging.warning(f"东网搜索页面失败 {search_url}: {e}")
-                        continue
+                # 简单去重
+                if not any(r['url'] == full_url for r in results):
+                    results.append(self._make_hk01_result(text, full_url, keyword, current_time))
+                    logging.info(f"在{channel_name}找到文章: {text[:50]}...")
+                    
+                    if len(results) >= 3:
+                        break
+        
+        return results
+    
+    def _parse_hk01_search(self, keyword, content):
+        """方法3: 查找香港01搜索页JSON数据中的文章（title 与 canonicalUrl 字段，线性时间扫描）"""
+        results = []
+        
+        current_time = self.get_beijing_time()
+        for title, article_url in extract_json_items(content, keyword, url_key='canonicalUrl', require_object=False):
+            if article_url and not article_url.startswith('http'):
+                if article_url.startswith('/'):
+                    article_url = f'https://www.hk01.com{article_url}'
+                else:
+                    article_url = f'https://www.hk01.com/{article_url}'
             
-            # 策略4: 如果还没找到，尝试文本搜索
-            if not results:
-                try:
-                    main_response = self.session.get("https://hk.on.cc/", timeout=10)
-                    if main_response.status_code == 200:
-                        if main_response.encoding == 'ISO-8859-1':
-                            main_response.encoding = 'utf-8'
+            if title and article_url:
+                results.append(self._make_hk01_result(title.strip(), article_url, keyword, current_time))
+        
+        return results
+    
+    def _hk01_zone_strategy(self, keyword):
+        """方法1: 搜索娱乐版块（用户指定的新URL）"""
+        logging.info(f"检查香港01娱乐版块: {self.HK01_ZONE_URL}")
+        response = self._fetch_page(self.HK01_ZONE_URL, timeout=15)
+        
+        if response.status_code == 200 and self._page_has_keyword(response, keyword):
+            return self._parse_hk01_zone(keyword, response.text)
+        return []
+    
+    def _hk01_channels_strategy(self, keyword):
+        """方法2: 尝试其他相关频道"""
+        for channel_url, channel_name in self.HK01_CHANNELS:
+            try:
+                logging.info(f"检查香港01{channel_name}: {channel_url}")
+                channel_response = self._fetch_page(channel_url, timeout=10)
+                
+                if channel_response.status_code == 200 and self._page_has_keyword(channel_response, keyword):
+                    results = self._parse_hk01_channel(keyword, channel_response.text, channel_name)
+                    
+                    # 如果找到结果就不再搜索其他频道
+                    if results:
+                        return results
                         
-                        content = main_response.text
-                        if keyword in content:
-                            soup = BeautifulSoup(main_response.content, 'html.parser')
-                            
-                            # 查找包含关键词的文本节点
-                            for text_node in soup.find_all(text=True):
-                                if keyword.lower() in str(text_node).lower():
-                                    text_content = str(text_node).strip()
-                                    if len(text_content) > 10 and len(text_content) < 200:
-                                        
-                                        # 查找父链接
-                                        parent = text_node.parent
-                                        while parent and parent.name != 'a':
-                                            parent = parent.parent
-                                            
-                                        if parent and parent.get('href'):
-                                            href = parent.get('href')
-                                            if any(pattern in href for pattern in ['/bkn/', '/news/', '/hk/']):
-                                                full_url = 'https://hk.on.cc' + href if href.startswith('/') else href
-                                                
-                                                results.append({
-                                                    'title': text_content,
-                                                    'url': full_url,
-                                                    'source': '東網on.cc (文本)'
-                                                })
-                                                break
-                except:
-                    pass
-            
-            # 去重并限制数量
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                url = result.get('url', '')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_results.append(result)
+            except Exception as e:
+                logging.warning(f"搜索{channel_name}失败: {e}")
+                continue
+        return []
+    
+    def _hk01_search_strategy(self, keyword):
+        """方法3: 搜索页面"""
+        logging.info("尝试香港01搜索页面")
+        search_response = self.session.get(f"https://www.hk01.com/search?q={keyword}", timeout=10)
+        
+        if search_response.status_code == 200 and self._page_has_keyword(search_response, keyword):
+            return self._parse_hk01_search(keyword, search_response.text)
+        return []
+    
+    def search_hk01(self, keyword):
+        """搜索香港01 - 娱乐版块、其他频道、搜索页面按历史效率排序依次尝试"""
+        results = []
+        
+        try:
+            logging.info(f"搜索香港01: {keyword}")
             
-            results = unique_results[:8]  # 限制结果数量
+            results = self._run_strategy_cascade('香港01', [
+                ('zone', lambda: self._hk01_zone_strategy(keyword)),
+                ('channels', lambda: self._hk01_channels_strategy(keyword)),
+                ('search', lambda: self._hk01_search_strategy(keyword)),
+            ])
             
-            logging.info(f"東網搜索完成，找到 {len(results)} 条结果")
+            logging.info(f"香港01 搜索完成，找到 {len(results)} 条结果")
             return results
             
         except Exception as e:
-            logging.error(f"搜索東網时出错: {e}")
+            logging.error(f"搜索香港01时出错: {e}")
             return results
     
-    def search_singtao(self, keyword):
-        """搜索星島娛樂 - 使用搜索URL的高效方法"""
+    async def _hk01_zone_strategy_async(self, keyword, fetcher):
+        response = await fetcher.get(self.HK01_ZONE_URL, timeout=15)
+        if response.status_code == 200 and self._page_has_keyword(response, keyword):
+            return self._parse_hk01_zone(keyword, response.text)
+        return []
+    
+    async def _hk01_channels_strategy_async(self, keyword, fetcher):
+        """其他频道并发抓取，按优先级取第一个有结果的频道"""
+        responses = await fetcher.get_many([url for url, _ in self.HK01_CHANNELS], timeout=10)
+        for (channel_url, channel_name), channel_response in zip(self.HK01_CHANNELS, responses):
+            if (channel_response is not None and channel_response.status_code == 200 and
+                    self._page_has_keyword(channel_response, keyword)):
+                results = self._parse_hk01_channel(keyword, channel_response.text, channel_name)
+                if results:
+                    return results
+        return []
+    
+    async def _hk01_search_strategy_async(self, keyword, fetcher):
+        search_response = await fetcher.get(f"https://www.hk01.com/search?q={keyword}", timeout=10)
+        if search_response.status_code == 200 and self._page_has_keyword(search_response, keyword):
+            return self._parse_hk01_search(keyword, search_response.text)
+        return []
+    
+    async def search_hk01_async(self, keyword, fetcher):
+        """搜索香港01（异步版本）- 备用频道并发抓取，策略顺序与同步版本共享统计"""
         results = []
         
         try:
-            logging.info(f"搜索星島娛樂: {keyword}")
+            logging.info(f"[异步] 搜索香港01: {keyword}")
+            
+            results = await self._run_strategy_cascade_async('香港01', [
+                ('zone', lambda: self._hk01_zone_strategy_async(keyword, fetcher)),
+                ('channels', lambda: self._hk01_channels_strategy_async(keyword, fetcher)),
+                ('search', lambda: self._hk01_search_strategy_async(keyword, fetcher)),
+            ])
+            
+            logging.info(f"[异步] 香港01 搜索完成，找到 {len(results)} 条结果")
+            return results
             
-            # 多层搜索策略 - 包含影视圈分类
-            search_urls = [
-                f"https://www.stheadline.com/search?q={keyword}",  # 主搜索
-                "https://www.stheadline.com/film-drama/",  # 影视圈分类 - 新增
-                "https://www.stheadline.com/entertainment/",  # 娱乐版
-                f"https://std.stheadline.com/realtime/section-list.php?cat=12",  # 即时娱乐
-                f"https://std.stheadline.com/realtime/section-list.php?cat=13",  # 影视分类
-                "https://www.stheadline.com/realtime/",  # 即时新闻
+        except Exception as e:
+            logging.error(f"[异步] 搜索香港01时出错: {e}")
+            return results
+    
+    def _oncc_search_urls(self, keyword):
+        return [
+            f"https://hk.on.cc/search?q={keyword}",
+            f"https://hk.on.cc/hk/search.html?keyword={keyword}",
+        ]
+    
+    def _make_oncc_result(self, title, url, keyword, source='東網on.cc', publish_time=None):
+        current_time = self.get_beijing_time()
+        publish_time = publish_time or current_time
+        return {
+            'title': title,
+            'url': url,
+            'source': source,
+            'keyword': keyword,
+            'discovered_at': current_time.isoformat(),
+            'publish_time': publish_time.isoformat(),
+            'publish_time_readable': publish_time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    def _find_oncc_candidates(self, keyword, content, dates_to_check):
+        """策略1: 从东网列表页中找出包含关键词的新闻链接，返回 [(链接文本, 完整URL)]"""
+        candidates = []
+        seen_urls = set()
+        
+        for link in extract_links(content):
+            # 获取链接文本和属性
+            texts_to_check = [
+                link.text.strip(),
+                link.title.strip(),
+                link.alt.strip()
             ]
             
-            for search_url in search_urls:
-                try:
-                    logging.info(f"检查星島页面: {search_url}")
-                    response = self.session.get(search_url, timeout=10)
+            href = link.href
+            
+            for text in texts_to_check:
+                if (text and keyword.lower() in text.lower() and 
+                    len(text) > 8 and len(text) < 300):
                     
-                    if response.status_code == 200:
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
+                    # 检查是否是有效的新闻链接（增强版）
+                    if (href and 
+                        any(pattern in href.lower() for pattern in 
+                            ['/bkn/', '/cnt/', '/news/', '/entertainment/', '/hk/', '.html']) and
+                        'index.html' not in href and 'search' not in href and
+                        # 特别匹配目标新闻的URL模式
+                        (any(date_pattern in href for date_pattern in dates_to_check) or
+                         'bkn-' in href or '/cnt/' in href)):
                         
-                                                # 简化解析策略 - 直接使用BeautifulSoup查找所有链接
-                        all_links = soup.find_all('a', href=True)
-                        
-                        for link in all_links:
-                            title = link.get_text().strip()
-                            href = link.get('href', '')
-                            
-                            # 检查标题是否包含关键词且足够长
-                            if keyword.lower() in title.lower() and len(title) > 10:
-                                # 构建完整URL
-                                if href and not href.startswith('http'):
-                                    if href.startswith('/'):
-                                        href = 'https://www.stheadline.com' + href
-                                    else:
-                                        href = 'https://www.stheadline.com/' + href
-                                
-                                if href and title:
-                                    # 获取真实发布时间
-                                    publish_time = self.get_stheadline_publish_time(href)
-                                    
-                                    results.append({
-                                        'title': title.strip(),
-                                        'url': href,
-                                        'source': '星島娛樂',
-                                        'keyword': keyword,
-                                        'discovered_at': self.get_beijing_time().isoformat(),
-                                        'publish_time': publish_time.isoformat() if publish_time else None,
-                                        'publish_time_readable': publish_time.strftime('%Y-%m-%d %H:%M:%S') if publish_time else None
-                                    })
+                        # 构建完整URL
+                        if href.startswith('/'):
+                            full_url = 'https://hk.on.cc' + href
+                        elif href.startswith('http'):
+                            full_url = href
+                        else:
+                            full_url = f'https://hk.on.cc/{href}'
                         
-                        # 如果找到结果，跳出当前URL的循环
-                        if results:
-                            break
-                            
-                except Exception as e:
-                    logging.error(f"检查星島页面失败 {search_url}: {e}")
+                        # 同一篇文章的不同链接写法只抓取一次详情页
+                        canonical = canonicalize_url(full_url)
+                        if canonical not in seen_urls:
+                            seen_urls.add(canonical)
+                            candidates.append((text, full_url))
+                        break  # 每个链接只取第一个匹配的文本
+        
+        return candidates
+    
+    def _oncc_detail_title(self, keyword, content, clean_suffix=False):
+        """从东网文章页提取包含关键词的标题，找不到返回 None"""
+        detail_soup = BeautifulSoup(content, 'html.parser')
+        
+        title_selectors = ['h1', 'title', '.headline', '.article-title']
+        for selector in title_selectors:
+            title_elem = detail_soup.select_one(selector)
+            if title_elem:
+                candidate = title_elem.get_text().strip()
+                if keyword.lower() in candidate.lower() and len(candidate) > 10:
+                    if clean_suffix and selector == 'title':
+                        # 清理title标签中的网站后缀
+                        candidate = candidate.split('｜')[0].split('|')[0].strip()
+                    return candidate
+        return None
+    
+    ONCC_SITEMAP_URL = "https://hk.on.cc/sitemap.xml"
+    ONCC_SITEMAP_TOP_K = 20  # 只检查最新的20条娱乐新闻
+    ONCC_WATERMARK_LAG = timedelta(minutes=5)  # 容忍Sitemap收录延迟，水位线向前回退5分钟
+    
+    def _oncc_sitemap_options(self, dates_to_check):
+        """策略2: 流式扫描Sitemap的过滤条件 - 只要娱乐URL，且晚于搜索窗口起点和上次水位线"""
+        current_time = self.get_beijing_time()
+        since = current_time - timedelta(hours=self.search_hours)
+        
+        watermark = parse_lastmod(self.state.get('sitemap_watermark', 'oncc'))
+        if watermark and watermark - self.ONCC_WATERMARK_LAG > since:
+            since = watermark - self.ONCC_WATERMARK_LAG
+            logging.info(f"使用东网Sitemap水位线: {since}")
+        
+        def fallback_time(url):
+            # 如果时间解析失败，仍然包含最近几天的URL（替代时间不是真实的 lastmod，水位线不越过这些URL）
+            if any(date_str in url for date_str in dates_to_check[:3]):
+                self._oncc_fallback_urls.add(url)
+                return current_time
+            return None
+        
+        return {
+            'url_filter': lambda url: 'entertainment' in url.lower(),
+            'since': since,
+            'fallback_time': fallback_time,
+        }
+    
+    def _read_oncc_sitemap(self, dates_to_check):
+        """策略2: 流式读取东网Sitemap，返回需要检查的 [(URL, 时间)]，按时间倒序（同一轮运行只读取一次）"""
+        with self._oncc_sitemap_lock:
+            if self._oncc_sitemap_entries is None:
+                self._oncc_sitemap_entries = self._scan_oncc_sitemap(dates_to_check)
+            return self._oncc_sitemap_entries
+    
+    def _scan_oncc_sitemap(self, dates_to_check):
+        reader = SitemapReader(self.session, timeout=15)
+        urls_to_check = reader.read_top(self.ONCC_SITEMAP_URL, self.ONCC_SITEMAP_TOP_K,
+                                        **self._oncc_sitemap_options(dates_to_check))
+        logging.info(f"Sitemap找到 {len(urls_to_check)} 个最近的娱乐新闻URL")
+        return urls_to_check
+    
+    def _record_oncc_sitemap_check(self, keyword, url, ok):
+        """记录某个关键词对Sitemap URL的检查结果（ok=False 表示检查出错）"""
+        with self._oncc_sitemap_lock:
+            self._oncc_sitemap_checks.setdefault(url, {})[keyword] = ok
+    
+    def _record_oncc_keyword_done(self, keyword, results):
+        """关键词的策略级联结束：在Sitemap策略之前就已找到结果的关键词不检查Sitemap URL，推进水位线时不再等待它"""
+        if not results:
+            return
+        with self._oncc_sitemap_lock:
+            if not any(keyword in checks for checks in self._oncc_sitemap_checks.values()):
+                self._oncc_sitemap_skipped.add(keyword)
+    
+    def _advance_oncc_watermark(self, keywords):
+        """本轮所有关键词任务结束后推进水位线（每轮最多一次）
+        
+        从最旧的候选URL开始，只推进到"每个关键词都已无错误检查过"的连续部分中最新的lastmod；
+        某个关键词因达到配额提前停止、检查出错或超时而未检查的URL，下次运行会重新检查。
+        由列表页等更早的策略满足、没有运行Sitemap策略的关键词不参与判断；
+        缺少 lastmod（使用替代时间）的URL不作为水位线，也不越过。
+        """
+        entries = self._oncc_sitemap_entries
+        if not entries:
+            return
+        required = [keyword for keyword in keywords if keyword not in self._oncc_sitemap_skipped]
+        newest = None
+        for url, url_time in sorted(entries, key=lambda entry: entry[1]):
+            if url in self._oncc_fallback_urls:
+                break
+            checks = self._oncc_sitemap_checks.get(url, {})
+            if not all(checks.get(keyword) for keyword in required):
+                break
+            newest = url_time
+        if newest is not None:
+            self.state.set('sitemap_watermark', 'oncc', newest.isoformat())
+            logging.info(f"东网Sitemap水位线推进到: {newest}")
+    
+    def _oncc_article_record(self, keyword, response):
+        """从东网文章页响应中提取可缓存的信息：是否包含关键词、含关键词的标题（原样/去掉网站后缀）"""
+        if response.status_code != 200:
+            return None
+        if not self._page_has_keyword(response, keyword):
+            return {'has_keyword': False}
+        return {
+            'has_keyword': True,
+            'title': self._oncc_detail_title(keyword, response.content),
+            'clean_title': self._oncc_detail_title(keyword, response.content, clean_suffix=True),
+        }
+    
+    def _oncc_article(self, keyword, url):
+        """经文章元数据缓存（按关键词分区）获取东网文章信息；非200返回 None，网络错误向上抛出"""
+        return self.article_cache.get_or_load(
+            url, lambda: self._oncc_article_record(keyword, self._fetch_page(url, timeout=8)), scope=keyword)
+    
+    async def _oncc_article_async(self, keyword, url, fetcher):
+        """_oncc_article 的异步版本"""
+        async def load():
+            return self._oncc_article_record(keyword, await fetcher.get(url, timeout=8))
+        return await self.article_cache.get_or_load_async(url, load, scope=keyword)
+    
+    def _make_oncc_sitemap_result(self, keyword, url, url_time, article):
+        """策略2: Sitemap文章页包含关键词时返回结果"""
+        if not article or not article['has_keyword']:
+            return None
+        
+        title = article.get('clean_title') or f"東網娱乐新闻 - {keyword}相关"
+        
+        logging.info(f"通过Sitemap找到东网新闻: {title[:40]}...")
+        return self._make_oncc_result(title, url, keyword, source='東網on.cc (Sitemap)', publish_time=url_time)
+    
+    def _enrich_oncc_candidate(self, keyword, text, full_url):
+        """策略1: 获取候选链接的详情页完整标题（经文章元数据缓存）；非200返回 None，网络错误向上抛出"""
+        article = self._oncc_article(keyword, full_url)
+        if article is None:
+            return None
+        
+        # 详情页不含关键词或没有合适的标题时，直接使用链接文本
+        final_title = article.get('title') or text
+        logging.info(f"找到东网新闻: {final_title[:40]}...")
+        return self._make_oncc_result(final_title, full_url, keyword)
+    
+    def _check_oncc_sitemap_url(self, keyword, url, url_time):
+        """策略2: 检查Sitemap中的文章页是否包含关键词（经文章元数据缓存）"""
+        logging.info(f"检查Sitemap URL: {url[-60:]}...")
+        return self._make_oncc_sitemap_result(keyword, url, url_time, self._oncc_article(keyword, url))
+    
+    def _parse_oncc_search(self, keyword, content):
+        """策略3: 解析东网搜索页面，返回第一条匹配结果"""
+        # 查找搜索结果链接
+        for link in extract_links(content):
+            text = link.text.strip()
+            href = link.href
+            
+            if (keyword.lower() in text.lower() and len(text) > 10 and
+                ('bkn-' in href or '/cnt/' in href or '/entertainment/' in href)):
+                
+                if not href.startswith('http'):
+                    if href.startswith('/'):
+                        href = 'https://hk.on.cc' + href
+                
+                logging.info(f"通过搜索找到东网新闻: {text[:40]}...")
+                return [self._make_oncc_result(text, href, keyword, source='東網on.cc (搜索)')]
+        
+        return []
+    
+    def _parse_oncc_text_nodes(self, keyword, content):
+        """策略4: 在东网主页链接内的文本节点中查找关键词"""
+        # 查找包含关键词的文本节点（只有位于链接内的节点才可能产生结果）
+        for link in extract_links(content):
+            for text_node in link.parts:
+                if keyword.lower() not in text_node.lower():
                     continue
+                text_content = text_node.strip()
+                if len(text_content) > 10 and len(text_content) < 200:
+                    href = link.href
+                    if href:
+                        if any(pattern in href for pattern in ['/bkn/', '/news/', '/hk/']):
+                            full_url = 'https://hk.on.cc' + href if href.startswith('/') else href
+                            
+                            return [{
+                                'title': text_content,
+                                'url': full_url,
+                                'source': '東網on.cc (文本)'
+                            }]
+        return []
+    
+    def _oncc_listing_strategy(self, keyword, dates_to_check):
+        """策略1: 检查多个可能的东网页面（含基于日期的目录）"""
+        results = []
+        for base_url in oncc_listing_urls(dates_to_check):
+            try:
+                logging.info(f"检查东网页面: {base_url}")
+                response = self._fetch_page(base_url, timeout=10)
                 
-                # 如果找到结果，跳出整个URL循环
-                if results:
+                if response.status_code == 200 and self._page_has_keyword(response, keyword):
+                    candidates = self._find_oncc_candidates(keyword, response.content, dates_to_check)
+                    
+                    # 并发获取详情页标题，达到配额即停止
+                    for (text, full_url), result, error in iter_bounded(
+                            lambda candidate: self._enrich_oncc_candidate(keyword, *candidate),
+                            candidates, max_workers=self.detail_workers):
+                        if error is not None:
+                            # 如果无法获取详情，使用原始信息
+                            result = self._make_oncc_result(text, full_url, keyword)
+                        if result:
+                            results.append(result)
+                            if len(results) >= self.oncc_result_quota:
+                                break
+                    
+                    # 如果找到结果就停止检查其他页面
+                    if results:
+                        break
+                        
+            except Exception as e:
+                logging.warning(f"检查东网页面 {base_url} 失败: {str(e)}")
+                continue
+        return results
+    
+    def _oncc_sitemap_strategy(self, keyword, dates_to_check):
+        """策略2: 基于Sitemap的精确搜索"""
+        results = []
+        logging.info("尝试东网Sitemap策略...")
+        
+        urls_to_check = self._read_oncc_sitemap(dates_to_check)
+        
+        # 并发检查文章页是否包含关键词，按时间顺序取结果，达到配额即停止
+        # （未检查和出错的URL不记录为已检查，水位线在本轮结束时统一推进，见 _advance_oncc_watermark）
+        for (url, url_time), result, error in iter_bounded(
+                lambda entry: self._check_oncc_sitemap_url(keyword, *entry),
+                urls_to_check, max_workers=self.detail_workers):
+            self._record_oncc_sitemap_check(keyword, url, error is None)
+            if error is not None:
+                logging.debug(f"检查Sitemap URL失败: {error}")
+                continue
+            if result:
+                results.append(result)
+                if len(results) >= self.oncc_result_quota:
                     break
+        
+        if results:
+            logging.info(f"Sitemap策略成功，找到 {len(results)} 条结果")
+        return results
+    
+    def _oncc_search_strategy(self, keyword):
+        """策略3: 东网搜索页面"""
+        logging.info("尝试东网搜索页面策略...")
+        
+        for search_url in self._oncc_search_urls(keyword):
+            try:
+                logging.info(f"检查东网搜索页面: {search_url}")
+                search_response = self.session.get(search_url, timeout=10)
                 
-                # 去重
-                seen_urls = set()
-                unique_results = []
-                for result in results:
-                    if result['url'] not in seen_urls:
-                        seen_urls.add(result['url'])
-                        unique_results.append(result)
-                results = unique_results[:10]
-            
-            logging.info(f"星島娛樂 搜索完成，找到 {len(results)} 条结果")
-            return results
-            
-        except Exception as e:
-            logging.error(f"搜索星島娛樂时出错: {e}")
-            return results
+                if search_response.status_code == 200 and self._page_has_keyword(search_response, keyword):
+                    if search_response.encoding == 'ISO-8859-1':
+                        search_response.encoding = 'utf-8'
+                    
+                    results = self._parse_oncc_search(keyword, search_response.text)
+                    
+                    if results:
+                        return results
+                        
+            except Exception as e:
+                logging.warning(f"东网搜索页面失败 {search_url}: {e}")
+                continue
+        return []
     
-    def search_mingpao(self, keyword):
-        """搜索明報 - 使用搜索URL的高效方法"""
+    def _oncc_text_strategy(self, keyword):
+        """策略4: 主页文本搜索"""
+        main_response = self._fetch_page("https://hk.on.cc/", timeout=10)
+        if main_response.status_code == 200:
+            # 字节预过滤（与其他策略一致）；响应来自页面缓存，其他关键词共用，不修改其编码
+            if self._page_has_keyword(main_response, keyword):
+                return self._parse_oncc_text_nodes(keyword, main_response.content)
+        return []
+    
+    def search_oncc(self, keyword):
+        """搜索東網on.cc - 增强版：包含基于日期的搜索策略，策略按历史效率排序"""
         results = []
         
         try:
-            logging.info(f"搜索明報: {keyword}")
+            logging.info(f"搜索東網: {keyword}")
             
-            # 尝试多个可能的明报搜索URL
-            search_urls = [
-                f"https://ol.mingpao.com/search?q={keyword}",
-                f"https://www.mingpao.com/search?q={keyword}",
-                f"https://ol.mingpao.com/ldy/search.php?keyword={keyword}"
-            ]
+            # 生成最近几天的日期用于搜索
+            dates_to_check = oncc_dates_to_check()
             
-            for search_url in search_urls:
-                try:
-                    response = self.session.get(search_url, timeout=15)
-                    
-                    if response.status_code == 200:
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 多种解析策略
-                        patterns = [
-                            # JSON格式
-                            r'\{[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*)"[^}]*"url":\s*"([^"]*)"[^}]*\}',
-                            r'\{[^}]*"url":\s*"([^"]*)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*)"[^}]*\}',
-                            # HTML格式
-                            r'<a[^>]*href="([^"]*)"[^>]*>([^<]*' + keyword + r'[^<]*)</a>',
-                            # 明报特殊格式
-                            r'href="([^"]*)"[^>]*title="([^"]*' + keyword + r'[^"]*)"'
-                        ]
-                        
-                        for pattern in patterns:
-                            matches = re.findall(pattern, content, re.IGNORECASE)
-                            for match in matches:
-                                if len(match) == 2:
-                                    if 'title' in pattern and pattern.index('title') < pattern.index('url'):
-                                        title, url = match
-                                    else:
-                                        url, title = match
-                                    
-                                    # 构建完整URL
-                                    if url and not url.startswith('http'):
-                                        if url.startswith('/'):
-                                            url = 'https://ol.mingpao.com' + url
-                                        else:
-                                            url = 'https://ol.mingpao.com/' + url
-                                    
-                                    if title and url:
-                                        results.append({
-                                            'title': title.strip(),
-                                            'url': url,
-                                            'source': '明報'
-                                        })
-                        
-                        # BeautifulSoup方法作为备用
-                        if not results:
-                            article_selectors = [
-                                'a[href*="/news/"]',
-                                'a[href*="/article/"]',
-                                '.search-result a',
-                                '.news-item a',
-                                'h3 a, h2 a, h1 a'
-                            ]
-                            
-                            for selector in article_selectors:
-                                articles = soup.select(selector)
-                                for article in articles:
-                                    title = article.get_text().strip()
-                                    if keyword.lower() in title.lower() and len(title) > 10:
-                                        article_url = article.get('href', '')
-                                        if article_url and not article_url.startswith('http'):
-                                            if article_url.startswith('/'):
-                                                article_url = 'https://ol.mingpao.com' + article_url
-                                            else:
-                                                article_url = 'https://ol.mingpao.com/' + article_url
-                                        
-                                        if article_url and title:
-                                            results.append({
-                                                'title': title,
-                                                'url': article_url,
-                                                'source': '明報'
-                                            })
-                                if results:
-                                    break
-                        
-                        # 如果找到结果就停止尝试其他搜索URL
-                        if results:
-                            break
-                            
-                except Exception as e:
-                    logging.warning(f"明报搜索URL {search_url} 失败: {str(e)}")
-                    continue
+            results = self._run_strategy_cascade('東網on.cc', [
+                ('listing', lambda: self._oncc_listing_strategy(keyword, dates_to_check)),
+                ('sitemap', lambda: self._oncc_sitemap_strategy(keyword, dates_to_check)),
+                ('search', lambda: self._oncc_search_strategy(keyword)),
+                ('text', lambda: self._oncc_text_strategy(keyword)),
+            ])
             
-            # 如果搜索URL都失败，尝试从主页抓取
-            if not results:
-                try:
-                    main_response = self.session.get("https://ol.mingpao.com/ldy/main.php", timeout=15)
-                    if main_response.status_code == 200:
-                        soup = BeautifulSoup(main_response.text, 'html.parser')
-                        
-                        # 查找包含关键词的链接
-                        all_links = soup.find_all('a', href=True)
-                        for link in all_links:
-                            text = link.get_text().strip()
-                            title_attr = link.get('title', '').strip()
-                            
-                            for check_text in [text, title_attr]:
-                                if check_text and keyword.lower() in check_text.lower() and len(check_text) > 10:
-                                    href = link.get('href', '')
-                                    if href and any(pattern in href for pattern in ['/news/', '/article/', '/ldy/']):
-                                        if not href.startswith('http'):
-                                            href = 'https://ol.mingpao.com' + href if href.startswith('/') else 'https://ol.mingpao.com/' + href
-                                        
-                                        results.append({
-                                            'title': check_text,
-                                            'url': href,
-                                            'source': '明報'
-                                        })
-                                        break
-                except:
-                    pass
+            self._record_oncc_keyword_done(keyword, results)
             
-            # 去重
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
-            results = unique_results[:10]
+            # 去重并限制数量
+            results = dedupe_by_url(results, 8)
             
-            logging.info(f"明報 搜索完成，找到 {len(results)} 条结果")
+            logging.info(f"東網搜索完成，找到 {len(results)} 条结果")
             return results
             
         except Exception as e:
-            logging.error(f"搜索明報时出错: {e}")
+            logging.error(f"搜索東網时出错: {e}")
             return results
     
-    def search_mpweekly(self, keyword):
-        """搜索明周 - 使用搜索URL的高效方法"""
+    async def _scan_oncc_sitemap_async(self, sitemap_response, dates_to_check, fetcher):
+        """策略2（异步版本）: 增量扫描已下载的Sitemap；若为索引文件则并发抓取最新的子Sitemap"""
+        options = self._oncc_sitemap_options(dates_to_check)
+        k = self.ONCC_SITEMAP_TOP_K
+        
+        top_entries, child_sitemaps = scan_sitemap(
+            open_xml_stream(io.BytesIO(sitemap_response.content), self.ONCC_SITEMAP_URL), k, **options)
+        
+        if child_sitemaps:
+            child_urls = [url for url, _ in newest_child_sitemaps(child_sitemaps, 5)]
+            entry_lists = [top_entries]
+            for child_url, child_response in zip(child_urls, await fetcher.get_many(child_urls, timeout=15)):
+                if child_response is not None and child_response.status_code == 200:
+                    entry_lists.append(scan_sitemap(
+                        open_xml_stream(io.BytesIO(child_response.content), child_url), k, **options)[0])
+            top_entries = merge_top_entries(entry_lists, k)
+        
+        logging.info(f"Sitemap找到 {len(top_entries)} 个最近的娱乐新闻URL")
+        return top_entries
+    
+    async def _oncc_listing_strategy_async(self, keyword, dates_to_check, fetcher, pages):
+        """策略1（异步版本）: 并发抓取所有列表页，按原优先级取第一个有候选链接的页面"""
+        results = []
+        listing_urls = oncc_listing_urls(dates_to_check)
+        pages.update(zip(listing_urls, await fetcher.get_many(listing_urls, timeout=10)))
+        
+        for base_url in listing_urls:
+            response = pages[base_url]
+            if response is None or response.status_code != 200 or not self._page_has_keyword(response, keyword):
+                continue
+            candidates = self._find_oncc_candidates(keyword, response.content, dates_to_check)
+            if not candidates:
+                continue
+            
+            batch_size = fetcher.per_host_limit
+            for start in range(0, len(candidates), batch_size):
+                batch = candidates[start:start + batch_size]
+                articles = await asyncio.gather(
+                    *(self._oncc_article_async(keyword, url, fetcher) for _, url in batch), return_exceptions=True)
+                for (text, full_url), article in zip(batch, articles):
+                    if len(results) >= self.oncc_result_quota:
+                        break
+                    if isinstance(article, BaseException):
+                        # 如果无法获取详情，使用原始信息
+                        results.append(self._make_oncc_result(text, full_url, keyword))
+                    elif article is not None:
+                        results.append(self._make_oncc_result(article.get('title') or text, full_url, keyword))
+                if len(results) >= self.oncc_result_quota:
+                    break
+            if results:
+                break
+        return results
+    
+    async def _read_oncc_sitemap_async(self, dates_to_check, fetcher):
+        """策略2（异步版本）: 同一轮运行只下载和扫描一次Sitemap，所有关键词共用同一批候选URL"""
+        if self._oncc_sitemap_task is None:
+            self._oncc_sitemap_task = asyncio.ensure_future(self._load_oncc_sitemap_async(dates_to_check, fetcher))
+        # shield: 某个关键词任务超时被取消时不影响其他关键词
+        return await asyncio.shield(self._oncc_sitemap_task)
+    
+    async def _load_oncc_sitemap_async(self, dates_to_check, fetcher):
+        sitemap_response = await fetcher.get_or_none(self.ONCC_SITEMAP_URL, timeout=15)
+        if sitemap_response is None or sitemap_response.status_code != 200:
+            return []
+        try:
+            self._oncc_sitemap_entries = await self._scan_oncc_sitemap_async(sitemap_response, dates_to_check, fetcher)
+        except Exception as e:
+            logging.warning(f"[异步] Sitemap解析失败: {e}")
+            return []
+        return self._oncc_sitemap_entries
+    
+    async def _oncc_sitemap_strategy_async(self, keyword, dates_to_check, fetcher):
+        """策略2（异步版本）: Sitemap文章页按批并发检查，达到配额即停止（水位线在本轮结束时统一推进）"""
+        results = []
+        urls_to_check = await self._read_oncc_sitemap_async(dates_to_check, fetcher)
+        
+        batch_size = fetcher.per_host_limit
+        for start in range(0, len(urls_to_check), batch_size):
+            batch = urls_to_check[start:start + batch_size]
+            articles = await asyncio.gather(
+                *(self._oncc_article_async(keyword, url, fetcher) for url, _ in batch), return_exceptions=True)
+            for (url, url_time), article in zip(batch, articles):
+                self._record_oncc_sitemap_check(keyword, url, not isinstance(article, BaseException))
+                if isinstance(article, BaseException):
+                    continue
+                result = self._make_oncc_sitemap_result(keyword, url, url_time, article)
+                if result and len(results) < self.oncc_result_quota:
+                    results.append(result)
+            if len(results) >= self.oncc_result_quota:
+                break
+        return results
+    
+    async def _oncc_search_strategy_async(self, keyword, fetcher):
+        """策略3（异步版本）: 并发抓取搜索页面"""
+        for search_response in await fetcher.get_many(self._oncc_search_urls(keyword), timeout=10):
+            if (search_response is not None and search_response.status_code == 200 and
+                    self._page_has_keyword(search_response, keyword)):
+                results = self._parse_oncc_search(keyword, search_response.text)
+                if results:
+                    return results
+        return []
+    
+    async def _oncc_text_strategy_async(self, keyword, fetcher, pages):
+        """策略4（异步版本）: 主页文本节点（策略1已抓取主页时直接复用）"""
+        main_response = pages.get("https://hk.on.cc/")
+        if main_response is None:
+            main_response = await fetcher.get_or_none("https://hk.on.cc/", timeout=10)
+        if (main_response is not None and main_response.status_code == 200
+                and self._page_has_keyword(main_response, keyword)):
+            return self._parse_oncc_text_nodes(keyword, main_response.content)
+        return []
+    
+    async def search_oncc_async(self, keyword, fetcher):
+        """搜索東網on.cc（异步版本）- 列表页、详情页和Sitemap文章页均并发抓取"""
         results = []
         
         try:
-            logging.info(f"搜索明周: {keyword}")
+            logging.info(f"[异步] 搜索東網: {keyword}")
             
-            # 尝试多个可能的明周搜索URL
-            search_urls = [
-                f"https://www.mpweekly.com/search?q={keyword}",
-                f"https://www.mpweekly.com/search?keyword={keyword}",
-                f"https://www.mpweekly.com/?s={keyword}"
-            ]
+            dates_to_check = oncc_dates_to_check()
+            pages = {}  # 策略1抓取的列表页，供策略4复用
             
-            for search_url in search_urls:
-                try:
-                    response = self.session.get(search_url, timeout=15)
-                    
-                    if response.status_code == 200:
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 多种解析策略
-                        patterns = [
-                            # JSON格式
-                            r'\{[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*"url":\s*"([^"]*?)"[^}]*\}',
-                            r'\{[^}]*"url":\s*"([^"]*?)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*\}',
-                            # HTML格式
-                            r'<a[^>]*href="([^"]*?)"[^>]*>([^<]*' + keyword + r'[^<]*?)</a>',
-                            # 明周特殊格式
-                            r'href="([^"]*?)"[^>]*>.*?<[^>]*>([^<]*' + keyword + r'[^<]*?)</[^>]*>',
-                        ]
-                        
-                        for pattern in patterns:
-                            matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-                            for match in matches:
-                                if len(match) == 2:
-                                    if 'title' in pattern and pattern.index('title') < pattern.index('url'):
-                                        title, url = match
-                                    else:
-                                        url, title = match
-                                    
-                                    # 构建完整URL
-                                    if url and not url.startswith('http'):
-                                        if url.startswith('/'):
-                                            url = 'https://www.mpweekly.com' + url
-                                        else:
-                                            url = 'https://www.mpweekly.com/' + url
-                                    
-                                    if title and url:
-                                        results.append({
-                                            'title': title.strip(),
-                                            'url': url,
-                                            'source': '明周'
-                                        })
-                        
-                        # BeautifulSoup方法作为备用
-                        if not results:
-                            article_selectors = [
-                                'a[href*="/entertainment/"]',
-                                'a[href*="/article/"]',
-                                'a[href*="/post/"]',
-                                '.search-result a',
-                                '.article-item a',
-                                '.post-item a',
-                                'h3 a, h2 a, h1 a'
-                            ]
-                            
-                            for selector in article_selectors:
-                                articles = soup.select(selector)
-                                for article in articles:
-                                    title = article.get_text().strip()
-                                    if keyword.lower() in title.lower() and len(title) > 10:
-                                        article_url = article.get('href', '')
-                                        if article_url and not article_url.startswith('http'):
-                                            if article_url.startswith('/'):
-                                                article_url = 'https://www.mpweekly.com' + article_url
-                                            else:
-                                                article_url = 'https://www.mpweekly.com/' + article_url
-                                        
-                                        if article_url and title:
-                                            results.append({
-                                                'title': title,
-                                                'url': article_url,
-                                                'source': '明周'
-                                            })
-                                if results:
-                                    break
-                        
-                        # 如果找到结果就停止尝试其他搜索URL
-                        if results:
-                            break
-                            
-                except Exception as e:
-                    logging.warning(f"明周搜索URL {search_url} 失败: {str(e)}")
-                    continue
+            results = await self._run_strategy_cascade_async('東網on.cc', [
+                ('listing', lambda: self._oncc_listing_strategy_async(keyword, dates_to_check, fetcher, pages)),
+                ('sitemap', lambda: self._oncc_sitemap_strategy_async(keyword, dates_to_check, fetcher)),
+                ('search', lambda: self._oncc_search_strategy_async(keyword, fetcher)),
+                ('text', lambda: self._oncc_text_strategy_async(keyword, fetcher, pages)),
+            ])
             
-            # 如果搜索URL都失败，尝试从娱乐主页抓取
-            if not results:
-                try:
-                    main_response = self.session.get("https://www.mpweekly.com/entertainment/", timeout=15)
-                    if main_response.status_code == 200:
-                        soup = BeautifulSoup(main_response.text, 'html.parser')
-                        
-                        # 查找包含关键词的链接
-                        all_links = soup.find_all('a', href=True)
-                        for link in all_links:
-                            text = link.get_text().strip()
-                            title_attr = link.get('title', '').strip()
-                            
-                            for check_text in [text, title_attr]:
-                                if check_text and keyword.lower() in check_text.lower() and len(check_text) > 10:
-                                    href = link.get('href', '')
-                                    if href and any(pattern in href for pattern in ['/entertainment/', '/article/', '/post/']):
-                                        if not href.startswith('http'):
-                                            href = 'https://www.mpweekly.com' + href if href.startswith('/') else 'https://www.mpweekly.com/' + href
-                                        
-                                        results.append({
-                                            'title': check_text,
-                                            'url': href,
-                                            'source': '明周'
-                                        })
-                                        break
-                except:
-                    pass
+            self._record_oncc_keyword_done(keyword, results)
             
-            # 去重
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
-            results = unique_results[:10]
+            results = dedupe_by_url(results, 8)
             
-            logging.info(f"明周 搜索完成，找到 {len(results)} 条结果")
+            logging.info(f"[异步] 東網搜索完成，找到 {len(results)} 条结果")
             return results
             
         except Exception as e:
-            logging.error(f"搜索明周时出错: {e}")
+            logging.error(f"[异步] 搜索東網时出错: {e}")
             return results
     
-    def search_wenweipo(self, keyword):
-        """搜索香港文匯報 - 使用搜索URL的高效方法"""
+    def _singtao_urls(self, keyword):
+        """星島多层搜索页面 - 包含影视圈分类"""
+        return [
+            f"https://www.stheadline.com/search?q={keyword}",  # 主搜索
+            "https://www.stheadline.com/film-drama/",  # 影视圈分类
+            "https://www.stheadline.com/entertainment/",  # 娱乐版
+            f"https://std.stheadline.com/realtime/section-list.php?cat=12",  # 即时娱乐
+            f"https://std.stheadline.com/realtime/section-list.php?cat=13",  # 影视分类
+            "https://www.stheadline.com/realtime/",  # 即时新闻
+        ]
+    
+    def _find_singtao_links(self, keyword, content):
+        """从星島页面中找出包含关键词的链接，返回 [(标题, 完整URL)]"""
+        links = []
+        
+        # 简化解析策略 - 只提取页面中的链接
+        for link in extract_links(content):
+            title = link.text.strip()
+            href = link.href
+            
+            # 检查标题是否包含关键词且足够长
+            if keyword.lower() in title.lower() and len(title) > 10:
+                # 构建完整URL
+                if href and not href.startswith('http'):
+                    if href.startswith('/'):
+                        href = 'https://www.stheadline.com' + href
+                    else:
+                        href = 'https://www.stheadline.com/' + href
+                
+                if href and title:
+                    links.append((title.strip(), href))
+        
+        return links
+    
+    def _make_singtao_result(self, title, href, keyword, publish_time):
+        return {
+            'title': title,
+            'url': href,
+            'source': '星島娛樂',
+            'keyword': keyword,
+            'discovered_at': self.get_beijing_time().isoformat(),
+            'publish_time': publish_time.isoformat() if publish_time else None,
+            'publish_time_readable': publish_time.strftime('%Y-%m-%d %H:%M:%S') if publish_time else None
+        }
+    
+    def _unique_singtao_links(self, links):
+        """同一篇文章的多个链接（图片/标题）按规范化URL去重，保留首个标题"""
+        unique = {}
+        for title, href in links:
+            unique.setdefault(canonicalize_url(href), (title, href))
+        return list(unique.values())
+    
+    def _singtao_results(self, keyword, links):
+        """并发获取星島链接的发布时间（来源并发上限 + 总时限），按链接顺序返回结果；超时未完成的链接丢弃"""
+        results = []
+        for (title, href), publish_time, error in iter_bounded(
+                lambda link: self.get_stheadline_publish_time(link[1]), self._unique_singtao_links(links),
+                max_workers=self.publish_time_workers.get('星島娛樂', self.detail_workers),
+                deadline=self.publish_time_deadline):
+            results.append(self._make_singtao_result(title, href, keyword, None if error else publish_time))
+        return results
+    
+    async def _singtao_results_async(self, keyword, links, fetcher):
+        """_singtao_results 的异步版本"""
+        lookups = await gather_bounded(
+            lambda link: self.get_stheadline_publish_time_async(link[1], fetcher), self._unique_singtao_links(links),
+            max_workers=self.publish_time_workers.get('星島娛樂', self.detail_workers),
+            deadline=self.publish_time_deadline)
+        return [self._make_singtao_result(title, href, keyword, None if error else publish_time)
+                for (title, href), publish_time, error in lookups]
+    
+    def search_singtao(self, keyword):
+        """搜索星島娛樂 - 使用搜索URL的高效方法"""
         results = []
         
         try:
-            logging.info(f"搜索香港文匯報: {keyword}")
-            
-            # 尝试多个可能的文汇报搜索URL
-            search_urls = [
-                f"https://www.wenweipo.com/search?q={keyword}",
-                f"https://www.wenweipo.com/search?keyword={keyword}",
-                f"https://www.wenweipo.com/?s={keyword}"
-            ]
+            logging.info(f"搜索星島娛樂: {keyword}")
             
-            for search_url in search_urls:
+            for search_url in self._singtao_urls(keyword):
                 try:
-                    response = self.session.get(search_url, timeout=15)
+                    logging.info(f"检查星島页面: {search_url}")
+                    response = self._fetch_page(search_url, timeout=10)
                     
-                    if response.status_code == 200:
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 多种解析策略
-                        patterns = [
-                            # JSON格式
-                            r'\{[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*"url":\s*"([^"]*?)"[^}]*\}',
-                            r'\{[^}]*"url":\s*"([^"]*?)"[^}]*"title":\s*"([^"]*' + keyword + r'[^"]*?)"[^}]*\}',
-                            # HTML格式
-                            r'<a[^>]*href="([^"]*?)"[^>]*>([^<]*' + keyword + r'[^<]*?)</a>',
-                            # 文汇报特殊格式
-                            r'href="([^"]*?)"[^>]*title="([^"]*' + keyword + r'[^"]*?)"'
-                        ]
+                    if response.status_code == 200 and self._page_has_keyword(response, keyword):
+                        # 先收集本页所有匹配链接，再并发获取真实发布时间
+                        results.extend(self._singtao_results(keyword, self._find_singtao_links(keyword, response.text)))
                         
-                        for pattern in patterns:
-                            matches = re.findall(pattern, content, re.IGNORECASE)
-                            for match in matches:
-                                if len(match) == 2:
-                                    if 'title' in pattern and pattern.index('title') < pattern.index('url'):
-                                        title, url = match
-                                    else:
-                                        url, title = match
-                                    
-                                    # 构建完整URL
-                                    if url and not url.startswith('http'):
-                                        if url.startswith('/'):
-                                            url = 'https://www.wenweipo.com' + url
-                                        else:
-                                            url = 'https://www.wenweipo.com/' + url
-                                    
-                                    if title and url:
-                                        results.append({
-                                            'title': title.strip(),
-                                            'url': url,
-                                            'source': '香港文匯報'
-                                        })
-                        
-                        # BeautifulSoup方法作为备用
-                        if not results:
-                            article_selectors = [
-                                'a[href*="/ent/"]',
-                                'a[href*="/article/"]',
-                                'a[href*="/news/"]',
-                                '.search-result a',
-                                '.article-item a',
-                                'h3 a, h2 a, h1 a'
-                            ]
-                            
-                            for selector in article_selectors:
-                                articles = soup.select(selector)
-                                for article in articles:
-                                    title = article.get_text().strip()
-                                    if keyword.lower() in title.lower() and len(title) > 10:
-                                        article_url = article.get('href', '')
-                                        if article_url and not article_url.startswith('http'):
-                                            if article_url.startswith('/'):
-                                                article_url = 'https://www.wenweipo.com' + article_url
-                                            else:
-                                                article_url = 'https://www.wenweipo.com/' + article_url
-                                        
-                                        if article_url and title:
-                                            results.append({
-                                                'title': title,
-                                                'url': article_url,
-                                                'source': '香港文匯報'
-                                            })
-                                if results:
-                                    break
-                        
-                        # 如果找到结果就停止尝试其他搜索URL
+                        # 如果找到结果，跳出当前URL的循环
                         if results:
                             break
                             
                 except Exception as e:
-                    logging.warning(f"文汇报搜索URL {search_url} 失败: {str(e)}")
+                    logging.error(f"检查星島页面失败 {search_url}: {e}")
                     continue
             
-            # 如果搜索URL都失败，尝试从娱乐主页抓取
-            if not results:
-                try:
-                    main_response = self.session.get("https://www.wenweipo.com/ent", timeout=15)
-                    if main_response.status_code == 200:
-                        soup = BeautifulSoup(main_response.text, 'html.parser')
-                        
-                        # 查找包含关键词的链接
-                        all_links = soup.find_all('a', href=True)
-                        for link in all_links:
-                            text = link.get_text().strip()
-                            title_attr = link.get('title', '').strip()
-                            
-                            for check_text in [text, title_attr]:
-                                if check_text and keyword.lower() in check_text.lower() and len(check_text) > 10:
-                                    href = link.get('href', '')
-                                    if href and any(pattern in href for pattern in ['/ent/', '/article/', '/news/']):
-                                        if not href.startswith('http'):
-                                            href = 'https://www.wenweipo.com' + href if href.startswith('/') else 'https://www.wenweipo.com/' + href
-                                        
-                                        results.append({
-                                            'title': check_text,
-                                            'url': href,
-                                            'source': '香港文匯報'
-                                        })
-                                        break
-                except:
-                    pass
-            
-            # 去重
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
-            results = unique_results[:10]
-            
-            logging.info(f"香港文匯報 搜索完成，找到 {len(results)} 条结果")
+            logging.info(f"星島娛樂 搜索完成，找到 {len(results)} 条结果")
             return results
             
         except Exception as e:
-            logging.error(f"搜索香港文匯報时出错: {e}")
+            logging.error(f"搜索星島娛樂时出错: {e}")
             return results
     
-    def extract_tvb_publish_time(self, url):
-        """从TVB新闻URL提取发布时间"""
+    async def search_singtao_async(self, keyword, fetcher):
+        """搜索星島娛樂（异步版本）- 页面并发抓取，发布时间并发解析"""
+        results = []
+        
         try:
-            import re
-            from datetime import datetime, timezone, timedelta
-            
-            beijing_tz = timezone(timedelta(hours=8))
-            
-            # 对于已知的URL，使用实际的估计发布时间
-            if '1008140' in url:
-                # 这个陈瀅新闻应该是前几天发布的，不是现在
-                # 基于URL ID和上下文，估计是2-3天前发布
-                estimated_time = datetime.now(beijing_tz) - timedelta(days=2)
-                return estimated_time.isoformat()
-            
-            # 尝试从URL路径提取日期信息
-            # TVB URL可能包含日期信息 artiste-news-c/title--date-id
-            date_match = re.search(r'(\d{8})', url)
-            if date_match:
-                try:
-                    date_str = date_match.group(1)
-                    # 尝试解析 YYYYMMDD 格式
-                    if len(date_str) == 8:
-                        parsed_date = datetime.strptime(date_str, '%Y%m%d')
-                        # 转换为北京时区
-                        parsed_date = parsed_date.replace(tzinfo=beijing_tz)
-                        return parsed_date.isoformat()
-                except:
-                    pass
+            logging.info(f"[异步] 搜索星島娛樂: {keyword}")
             
-            # 如果URL包含明显过时的标识，返回较老的时间
-            # 这样时间过滤可以正确工作
-            if any(pattern in url.lower() for pattern in ['old', 'archive', 'past']):
-                old_time = datetime.now(beijing_tz) - timedelta(days=7)
-                return old_time.isoformat()
+            for response in await fetcher.get_many(self._singtao_urls(keyword), timeout=10):
+                if response is None or response.status_code != 200 or not self._page_has_keyword(response, keyword):
+                    continue
+                links = self._find_singtao_links(keyword, response.text)
+                if not links:
+                    continue
+                
+                results.extend(await self._singtao_results_async(keyword, links, fetcher))
+                break
             
-            # 默认情况：假设是几小时前的新闻
-            # 这样可以被正确的时间过滤处理
-            default_time = datetime.now(beijing_tz) - timedelta(hours=2)
-            return default_time.isoformat()
+            logging.info(f"[异步] 星島娛樂 搜索完成，找到 {len(results)} 条结果")
+            return results
             
         except Exception as e:
-            logging.debug(f"提取TVB发布时间失败: {e}")
-            # 返回稍旧的时间，避免总是通过过滤
-            from datetime import datetime, timezone, timedelta
-            beijing_tz = timezone(timedelta(hours=8))
-            default_time = datetime.now(beijing_tz) - timedelta(hours=2)
-            return default_time.isoformat()
-
-    def search_tvb(self, keyword):
-        """搜索TVB - 增强版本，包含URL模式匹配和编码处理"""
-        results = []
+            logging.error(f"[异步] 搜索星島娛樂时出错: {e}")
+            return results
+    
+    def _fetch_page(self, url, timeout=15):
+        """抓取页面（经本轮页面缓存，多个关键词/来源共享同一次请求）"""
+        return self.page_cache.get(url, timeout=timeout)
+    
+    def _page_has_keyword(self, response, keyword):
+        """字节预过滤：在未解码的响应中查找关键词的各种编码形式，未命中的页面不再解码和解析"""
+        return self.page_cache.has_keyword(response, keyword)
+    
+    def _run_strategy_cascade(self, source, strategies):
+        """按历史效率排序依次执行 [(策略名, 函数)]，记录命中数与耗时，首个有结果的策略即返回"""
+        for name, strategy in self.strategy_stats.order(source, strategies):
+            started = time.monotonic()
+            try:
+                results = strategy() or []
+            except Exception as e:
+                logging.warning(f"{source} 策略 {name} 失败: {e}")
+                results = []
+            self.strategy_stats.record(source, name, len(results), time.monotonic() - started)
+            if results:
+                return results
+        return []
+    
+    async def _run_strategy_cascade_async(self, source, strategies):
+        """_run_strategy_cascade 的异步版本，strategies 中的函数返回协程"""
+        for name, strategy in self.strategy_stats.order(source, strategies):
+            started = time.monotonic()
+            try:
+                results = await strategy() or []
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"[异步] {source} 策略 {name} 失败: {e}")
+                results = []
+            self.strategy_stats.record(source, name, len(results), time.monotonic() - started)
+            if results:
+                return results
+        return []
+    
+    def _claim_breaker_record(self, url):
+        """本轮首次请求该URL时返回 True；之后的调用命中页面缓存，不是新的网络请求，不再计入熔断器"""
+        with self._breaker_lock:
+            if url in self._breaker_recorded:
+                return False
+            self._breaker_recorded.add(url)
+            return True
+    
+    def _guarded_get(self, source, url, timeout=15):
+        """经熔断器保护的请求：端点熔断中返回 None；请求异常计入失败后原样抛出
         
+        每轮每个URL只按实际的网络请求记录一次结果，其他关键词命中页面缓存时不重复计数。
+        """
+        if not self.breaker.allow(source, url):
+            return None
         try:
-            logging.info(f"搜索TVB: {keyword}")
-            
-            # 策略1: 直接检查TVB新闻列表页面
-            list_urls = [
-                "https://www.tvb.com/artiste-news-c",
-                "https://www.tvb.com/news", 
-                "https://www.tvb.com/entertainment",
-                "https://news.tvb.com/"
-            ]
-            
-            for list_url in list_urls:
+            response = self._fetch_page(url, timeout=timeout)
+        except Exception as e:
+            if self._claim_breaker_record(url):
+                self.breaker.record_failure(source, url, type(e).__name__)
+            raise
+        if self._claim_breaker_record(url):
+            self.breaker.record_response(source, url, response.status_code)
+        return response
+    
+    async def _guarded_get_many(self, source, urls, fetcher, timeout=15):
+        """熔断器保护的并发抓取：熔断中的端点不发请求，对应位置返回 None；每轮每个URL只记录一次结果"""
+        allowed = [url for url in urls if self.breaker.allow(source, url)]
+        responses = dict(zip(allowed, await fetcher.get_many(allowed, timeout=timeout)))
+        for url, response in responses.items():
+            if not self._claim_breaker_record(url):
+                continue
+            if response is None:
+                self.breaker.record_failure(source, url, '请求失败')
+            else:
+                self.breaker.record_response(source, url, response.status_code)
+        return [responses.get(url) for url in urls]
+    
+    def _search_news_site(self, site, keyword):
+        """明報/明周/文匯報：共用搜索流程（news_sources），经熔断器抓取并做字节预过滤"""
+        return search_news_site(site, keyword,
+                                lambda source, url: self._guarded_get(source, url, timeout=15),
+                                page_filter=self._page_has_keyword)
+    
+    async def _search_news_site_async(self, site, keyword, fetcher):
+        return await search_news_site_async(
+            site, keyword,
+            lambda source, urls: self._guarded_get_many(source, urls, fetcher, timeout=15),
+            page_filter=self._page_has_keyword)
+    
+    def search_mingpao(self, keyword):
+        """搜索明報 - 使用搜索URL的高效方法"""
+        return self._search_news_site('mingpao', keyword)
+    
+    def search_mpweekly(self, keyword):
+        """搜索明周 - 使用搜索URL的高效方法"""
+        return self._search_news_site('mpweekly', keyword)
+    
+    def search_wenweipo(self, keyword):
+        """搜索香港文匯報 - 使用搜索URL的高效方法"""
+        return self._search_news_site('wenweipo', keyword)
+    
+    async def search_mingpao_async(self, keyword, fetcher):
+        return await self._search_news_site_async('mingpao', keyword, fetcher)
+    
+    async def search_mpweekly_async(self, keyword, fetcher):
+        return await self._search_news_site_async('mpweekly', keyword, fetcher)
+    
+    async def search_wenweipo_async(self, keyword, fetcher):
+        return await self._search_news_site_async('wenweipo', keyword, fetcher)
+    
+    TVB_URL_DATE = re.compile(r'/(20\d{6})(?=/|$)')  # 独占一个路径段的 YYYYMMDD，如 /tc/entertainment/20250821/...
+    
+    def _tvb_url_date(self, url):
+        """TVB文章URL路径中的 YYYYMMDD 日期（北京时间零点）；没有、不是合法日期或晚于今天时返回 None
+        
+        只接受独占一个路径段的日期，文章ID（如 /20241234、标题--20250821123）不算。
+        """
+        match = self.TVB_URL_DATE.search(urlparse(url).path)
+        if not match:
+            return None
+        try:
+            url_date = datetime.strptime(match.group(1), '%Y%m%d').replace(tzinfo=timezone(timedelta(hours=8)))
+        except ValueError:
+            return None
+        if url_date.date() > self.get_beijing_time().date():
+            return None
+        return url_date
+    
+    def _tvb_publish_time_slot(self, url):
+        """本轮每个TVB URL只解析一次：返回 (Future, 是否由调用方负责解析)，并发调用共享同一个 Future"""
+        with self._tvb_publish_time_lock:
+            future = self._tvb_publish_times.get(url)
+            if future is not None:
+                return future, False
+            future = self._tvb_publish_times[url] = Future()
+            return future, True
+    
+    def _load_tvb_publish_time(self, url):
+        try:
+            publish_time = self._article_publish_time(url, timeout=8)
+        except Exception as e:
+            logging.debug(f"获取TVB发布时间失败 {url}: {e}")
+            publish_time = None
+        return publish_time or self._tvb_url_date(url)
+    
+    def extract_tvb_publish_time(self, url):
+        """获取TVB文章的真实发布时间（ISO）：文章页的 meta / JSON-LD（经文章元数据缓存），页面上没有时使用URL中的日期
+
+        无法确定时返回 None。本轮运行中每个URL只解析一次，时间过滤时再次调用直接复用结果。
+        """
+        future, owner = self._tvb_publish_time_slot(url)
+        if owner:
+            try:
+                future.set_result(self._load_tvb_publish_time(url))
+            except BaseException as e:
+                # 解析中途出错：释放该URL（之后的调用重新解析），正在等待的调用方收到同一个异常而不是一直阻塞
+                with self._tvb_publish_time_lock:
+                    self._tvb_publish_times.pop(url, None)
+                future.set_exception(e)
+                raise
+        publish_time = future.result()
+        return publish_time.isoformat() if publish_time else None
+    
+    async def extract_tvb_publish_time_async(self, url, fetcher):
+        """extract_tvb_publish_time 的异步版本，与同步版本共享本轮的解析结果"""
+        future, owner = self._tvb_publish_time_slot(url)
+        if owner:
+            try:
                 try:
-                    response = self.session.get(list_url, timeout=15)
-                    if response.status_code == 200:
-                        # 设置正确的编码
-                        if response.encoding == 'ISO-8859-1':
-                            response.encoding = 'utf-8'
-                        
-                        content = response.text
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 查找所有链接
-                        all_links = soup.find_all('a', href=True)
-                        
-                        for link in all_links:
-                            href = link.get('href', '')
-                            
-                            # 检查URL是否包含关键词（编码形式）
-                            from urllib.parse import unquote, quote
-                            
-                            # 对关键词进行URL编码以匹配
-                            encoded_keyword = quote(keyword, encoding='utf-8')
-                            
-                            if (encoded_keyword in href or keyword in href or 
-                                (href and ('王敏奕' in unquote(href, encoding='utf-8', errors='ignore')))):
-                                
-                                # 构造完整URL
-                                if href.startswith('/'):
-                                    full_url = 'https://www.tvb.com' + href
-                                elif not href.startswith('http'):
-                                    full_url = 'https://www.tvb.com/' + href
-                                else:
-                                    full_url = href
-                                
-                                # 尝试从URL解码标题
-                                try:
-                                    url_parts = href.split('/')
-                                    if url_parts:
-                                        title_part = url_parts[-1]
-                                        if '--' in title_part:
-                                            title_encoded = title_part.split('--')[0]
-                                        else:
-                                            title_encoded = title_part.split('-')[0] if '-' in title_part else title_part
-                                        
-                                        decoded_title = unquote(title_encoded, encoding='utf-8')
-                                        
-                                        # 如果解码标题包含关键词，添加到结果
-                                        if keyword in decoded_title and len(decoded_title) > 5:
-                                            # 尝试从URL提取发布时间
-                                            publish_time = self.extract_tvb_publish_time(full_url)
-                                            
-                                            results.append({
-                                                'title': decoded_title,
-                                                'url': full_url,
-                                                'source': 'TVB',
-                                                'keyword': keyword,
-                                                'publish_time': publish_time
-                                            })
-                                            logging.info(f"找到TVB新闻: {decoded_title[:40]}...")
-                                            continue
-                                except:
-                                    pass
-                                
-                                # 如果无法从URL解码，尝试从链接文本获取
-                                link_text = link.get_text().strip()
-                                if link_text and keyword.lower() in link_text.lower() and len(link_text) > 5:
-                                    results.append({
-                                        'title': link_text,
-                                        'url': full_url,
-                                        'source': 'TVB',
-                                        'keyword': keyword
-                                    })
-                                    logging.info(f"找到TVB新闻: {link_text[:40]}...")
+                    publish_time = await self._article_publish_time_async(url, fetcher, timeout=8)
+                except Exception as e:
+                    logging.debug(f"获取TVB发布时间失败 {url}: {e}")
+                    publish_time = None
+                future.set_result(publish_time or self._tvb_url_date(url))
+            finally:
+                if not future.done():
+                    # 被取消（如超过总时限）：释放该URL，之后的调用重新解析
+                    with self._tvb_publish_time_lock:
+                        self._tvb_publish_times.pop(url, None)
+                    future.set_result(None)
+        publish_time = await asyncio.wrap_future(future)
+        return publish_time.isoformat() if publish_time else None
+    
+    def _apply_tvb_publish_time(self, result, pub_iso):
+        if pub_iso:
+            result['publish_time'] = pub_iso
+            result['publish_time_readable'] = datetime.fromisoformat(pub_iso).strftime('%Y-%m-%d %H:%M:%S')
+    
+    def _resolve_tvb_publish_times(self, results):
+        """并发获取TVB结果的真实发布时间（来源并发上限 + 总时限）；无法确定时间的结果在时间过滤中被排除"""
+        pending = [result for result in results if not result.get('publish_time')]
+        for result, pub_iso, error in iter_bounded(
+                lambda result: self.extract_tvb_publish_time(result['url']), pending,
+                max_workers=self.publish_time_workers.get('TVB', self.detail_workers),
+                deadline=self.publish_time_deadline):
+            self._apply_tvb_publish_time(result, None if error else pub_iso)
+        return results
+    
+    async def _resolve_tvb_publish_times_async(self, results, fetcher):
+        """_resolve_tvb_publish_times 的异步版本"""
+        pending = [result for result in results if not result.get('publish_time')]
+        for result, pub_iso, error in await gather_bounded(
+                lambda result: self.extract_tvb_publish_time_async(result['url'], fetcher), pending,
+                max_workers=self.publish_time_workers.get('TVB', self.detail_workers),
+                deadline=self.publish_time_deadline):
+            self._apply_tvb_publish_time(result, None if error else pub_iso)
+        return results
+
+    def _tvb_listing_strategy(self, keyword):
+        """策略1: 直接检查TVB新闻列表页面"""
+        for list_url in TVB_LIST_URLS:
+            try:
+                response = self._guarded_get('TVB', list_url, timeout=15)
+                if response is not None and response.status_code == 200 and self._page_has_keyword(response, keyword):
+                    results = parse_tvb_listing(keyword, decoded_text(response))
+                    
+                    # 如果找到结果就跳出
+                    if results:
+                        return results
+                    
+            except Exception as e:
+                logging.warning(f"检查TVB列表页面失败: {e}")
+                continue
+        return []
+    
+    def _tvb_known_urls_strategy(self, keyword):
+        """策略2: 直接验证已知的TVB新闻URL（针对动态加载页面）"""
+        results = []
+        for test_url in TVB_KNOWN_URLS.get(keyword, []):
+            try:
+                # 检查URL是否仍然有效
+                response = self._fetch_page(test_url, timeout=10)
+                if response.status_code == 200:
+                    result = tvb_known_url_result(keyword, test_url)
+                    if result:
+                        results.append(result)
+            except Exception as e:
+                logging.debug(f"验证TVB URL失败: {e}")
+                continue
+        return results
+    
+    def _tvb_search_strategy(self, keyword):
+        """策略3: 搜索页面，都失败时从主页抓取"""
+        for search_url in tvb_search_urls(keyword):
+            try:
+                response = self._guarded_get('TVB', search_url, timeout=15)
+                
+                if response is not None and response.status_code == 200 and self._page_has_keyword(response, keyword):
+                    results = parse_tvb_search(keyword, response.text)
                     
-                    # 如果找到结果就跳出
+                    # 如果找到结果就停止尝试其他搜索URL
                     if results:
-                        break
+                        return results
                         
-                except Exception as e:
-                    logging.warning(f"检查TVB列表页面失败: {e}")
-                    continue
-            
-            # 策略2: 直接验证已知的TVB新闻URL（针对动态加载页面）
-            if not results and keyword == '王敏奕':
-                # 已知的王敏奕相关TVB新闻URL列表（可以根据需要扩展）
-                known_urls = [
-                    "https://www.tvb.com/artiste-news-c/%E9%99%B3%E7%80%85%E5%8A%9B%E6%92%90%E7%8E%8B%E6%95%8F%E5%A5%95%E6%96%B0%E4%BD%9C%E9%A3%B2%E5%88%B0%E9%9D%A2%E7%B4%85%E7%B4%85--12%E5%B9%B4%E5%A5%BD%E5%8F%8B%E9%80%8F%E9%9C%B2%E5%BE%9E%E6%9C%AA%E5%90%B5%E9%81%8E%E6%9E%B6%E5%A7%8A%E5%A6%B9%E6%83%85%E6%B7%B1-1008140"
-                ]
-                
-                for test_url in known_urls:
-                    try:
-                        # 检查URL是否仍然有效
-                        response = self.session.get(test_url, timeout=10)
-                        if response.status_code == 200:
-                            # 从URL解码标题
-                            from urllib.parse import unquote
-                            try:
-                                url_parts = test_url.split('/')
-                                if url_parts:
-                                    title_part = url_parts[-1]
-                                    if '--' in title_part:
-                                        title_encoded = title_part.split('--')[0]
-                                    else:
-                                        title_encoded = title_part.split('-')[0] if '-' in title_part else title_part
-                                    
-                                    decoded_title = unquote(title_encoded, encoding='utf-8')
-                                    
-                                    if keyword in decoded_title:
-                                        # 尝试从URL提取发布时间
-                                        publish_time = self.extract_tvb_publish_time(test_url)
-                                        
-                                        results.append({
-                                            'title': decoded_title,
-                                            'url': test_url,
-                                            'source': 'TVB',
-                                            'keyword': keyword,
-                                            'publish_time': publish_time
-                                        })
-                                        logging.info(f"验证已知TVB新闻: {decoded_title}")
-                            except Exception as e:
-                                logging.debug(f"解码TVB标题失败: {e}")
-                                # 如果解码失败，使用默认标题
-                                publish_time = self.extract_tvb_publish_time(test_url)
-                                
-                                results.append({
-                                    'title': f'TVB新闻: {keyword}相关报道',
-                                    'url': test_url,
-                                    'source': 'TVB',
-                                    'keyword': keyword,
-                                    'publish_time': publish_time
-                                })
-                                logging.info(f"验证已知TVB新闻（使用默认标题）")
-                    except Exception as e:
-                        logging.debug(f"验证TVB URL失败: {e}")
-                        continue
-            
-            # 策略3: 尝试搜索页面（如果前面策略没找到结果）
-            if not results:
-                search_urls = [
-                    f"https://www.tvb.com/search?q={keyword}",
-                    f"https://www.tvb.com/search?keyword={keyword}",
-                    f"https://www.tvb.com/?s={keyword}",
-                    f"https://news.tvb.com/search?q={keyword}"
-                ]
+            except Exception as e:
+                logging.warning(f"TVB搜索URL {search_url} 失败: {str(e)}")
+                continue
+        
+        # 如果搜索URL都失败，尝试从主页抓取
+        try:
+            main_response = self._guarded_get('TVB', "https://www.tvb.com", timeout=15)
+            if (main_response is not None and main_response.status_code == 200 and
+                    self._page_has_keyword(main_response, keyword)):
+                return parse_tvb_home(keyword, main_response.text)
+        except:
+            pass
+        return []
+    
+    def search_tvb(self, keyword):
+        """搜索TVB - 增强版本，包含URL模式匹配和编码处理，策略按历史效率排序"""
+        results = []
+        
+        try:
+            logging.info(f"搜索TVB: {keyword}")
             
-                for search_url in search_urls:
-                    try:
-                        response = self.session.get(search_url, timeout=15)
-                        
-                        if response.status_code == 200:
-                            content = response.text
-                            soup = BeautifulSoup(content, 'html.parser')
-                            
-                            # 修复的解析策略 - 避免抓取JSON数据
-                            # 首先尝试BeautifulSoup解析HTML结构
-                            article_selectors = [
-                                'a[href*="/news/"]',
-                                'a[href*="/entertainment/"]', 
-                                'a[href*="/article/"]',
-                                '.search-result a',
-                                '.article-item a',
-                                '.news-item a',
-                                'h3 a, h2 a, h1 a',
-                                '.news-title a',
-                                '.headline a'
-                            ]
-                            
-                            for selector in article_selectors:
-                                articles = soup.select(selector)
-                                for article in articles:
-                                    title = article.get_text().strip()
-                                    if (keyword.lower() in title.lower() and 
-                                        len(title) > 10 and len(title) < 200 and
-                                        not title.startswith('{') and  # 避免JSON数据
-                                        'props' not in title.lower()):  # 避免页面配置数据
-                                        
-                                        article_url = article.get('href', '')
-                                        if article_url and not article_url.startswith('http'):
-                                            if article_url.startswith('/'):
-                                                article_url = 'https://www.tvb.com' + article_url
-                                            else:
-                                                article_url = 'https://www.tvb.com/' + article_url
-                                        
-                                        if article_url and title:
-                                            publish_time = self.extract_tvb_publish_time(article_url)
-                                            
-                                            results.append({
-                                                'title': title,
-                                                'url': article_url,
-                                                'source': 'TVB',
-                                                'keyword': keyword,
-                                                'publish_time': publish_time
-                                            })
-                                if results:
-                                    break
-                            
-                            # 如果找到结果就停止尝试其他搜索URL
-                            if results:
-                                break
-                                
-                    except Exception as e:
-                        logging.warning(f"TVB搜索URL {search_url} 失败: {str(e)}")
-                        continue
-                
-                # 如果搜索URL都失败，尝试从主页抓取
-                if not results:
-                    try:
-                        main_response = self.session.get("https://www.tvb.com", timeout=15)
-                        if main_response.status_code == 200:
-                            soup = BeautifulSoup(main_response.text, 'html.parser')
-                            
-                            # 查找包含关键词的链接，避免JSON数据
-                            all_links = soup.find_all('a', href=True)
-                            for link in all_links:
-                                text = link.get_text().strip()
-                                title_attr = link.get('title', '').strip()
-                                
-                                for check_text in [text, title_attr]:
-                                    if (check_text and keyword.lower() in check_text.lower() and 
-                                        len(check_text) > 10 and len(check_text) < 200 and
-                                        not check_text.startswith('{') and
-                                        'props' not in check_text.lower()):
-                                        
-                                        href = link.get('href', '')
-                                        if href and any(pattern in href for pattern in ['/news/', '/entertainment/', '/article/']):
-                                            if not href.startswith('http'):
-                                                href = 'https://www.tvb.com' + href if href.startswith('/') else 'https://www.tvb.com/' + href
-                                            
-                                            publish_time = self.extract_tvb_publish_time(href)
-                                            
-                                            results.append({
-                                                'title': check_text,
-                                                'url': href,
-                                                'source': 'TVB',
-                                                'keyword': keyword,
-                                                'publish_time': publish_time
-                                            })
-                                            break
-                    except:
-                        pass
+            results = self._run_strategy_cascade('TVB', [
+                ('listing', lambda: self._tvb_listing_strategy(keyword)),
+                ('known_urls', lambda: self._tvb_known_urls_strategy(keyword)),
+                ('search', lambda: self._tvb_search_strategy(keyword)),
+            ])
             
-            # 去重
-            seen_urls = set()
-            unique_results = []
-            for result in results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
-            results = unique_results[:10]
+            # 去重后并发获取真实发布时间
+            results = self._resolve_tvb_publish_times(dedupe_by_url(results, 10))
             
             logging.info(f"TVB 搜索完成，找到 {len(results)} 条结果")
             return results
@@ -1627,65 +1476,190 @@ class VVNewsBotAuto:
             logging.error(f"搜索TVB时出错: {e}")
             return results
     
-    def _resolve_youtube_channel_id(self, handle_or_url: str) -> str:
-        """根据 @handle 或频道URL 解析 channel_id（从页面源码中抓取）。失败返回空串。"""
+    async def _tvb_listing_strategy_async(self, keyword, fetcher):
+        for response in await self._guarded_get_many('TVB', TVB_LIST_URLS, fetcher, timeout=15):
+            if response is not None and response.status_code == 200 and self._page_has_keyword(response, keyword):
+                results = parse_tvb_listing(keyword, response.text)
+                if results:
+                    return results
+        return []
+    
+    async def _tvb_known_urls_strategy_async(self, keyword, fetcher):
+        results = []
+        known_urls = TVB_KNOWN_URLS.get(keyword, [])
+        for test_url, response in zip(known_urls, await fetcher.get_many(known_urls, timeout=10)):
+            if response is not None and response.status_code == 200:
+                result = tvb_known_url_result(keyword, test_url)
+                if result:
+                    results.append(result)
+        return results
+    
+    async def _tvb_search_strategy_async(self, keyword, fetcher):
+        """搜索页面与主页并发抓取，按原优先级解析"""
+        search_urls = tvb_search_urls(keyword)
+        responses = await self._guarded_get_many('TVB', search_urls + ["https://www.tvb.com"], fetcher, timeout=15)
+        for response in responses[:-1]:
+            if response is not None and response.status_code == 200 and self._page_has_keyword(response, keyword):
+                results = parse_tvb_search(keyword, response.text)
+                if results:
+                    return results
+        
+        main_response = responses[-1]
+        if main_response is not None and main_response.status_code == 200 and self._page_has_keyword(main_response, keyword):
+            return parse_tvb_home(keyword, main_response.text)
+        return []
+    
+    async def search_tvb_async(self, keyword, fetcher):
+        """搜索TVB（异步版本）- 每个策略内的页面并发抓取，策略顺序与同步版本共享统计"""
+        results = []
+        
         try:
-            # 规范化为页面URL
-            handle = handle_or_url.strip()
-            if handle.startswith('http'):
-                page_url = handle
-            else:
-                page_url = f"https://www.youtube.com/{handle}"
-
-            resp = self.session.get(page_url, timeout=10)
-            if resp.status_code != 200:
-                return ""
-            m = re.search(r'"channelId":"(UC[^"]+)"', resp.text)
-            return m.group(1) if m else ""
-        except Exception:
-            return ""
-
-    def _search_youtube_via_rss(self, channel_ids: list, keyword: str):
-        """用RSS读取多个频道的最新视频，返回匹配窗口与关键词的结果。"""
+            logging.info(f"[异步] 搜索TVB: {keyword}")
+            
+            results = await self._run_strategy_cascade_async('TVB', [
+                ('listing', lambda: self._tvb_listing_strategy_async(keyword, fetcher)),
+                ('known_urls', lambda: self._tvb_known_urls_strategy_async(keyword, fetcher)),
+                ('search', lambda: self._tvb_search_strategy_async(keyword, fetcher)),
+            ])
+            
+            results = await self._resolve_tvb_publish_times_async(dedupe_by_url(results, 10), fetcher)
+            
+            logging.info(f"[异步] TVB 搜索完成，找到 {len(results)} 条结果")
+            return results
+            
+        except Exception as e:
+            logging.error(f"[异步] 搜索TVB时出错: {e}")
+            return results
+    
+    def _extract_youtube_channel_id(self, content):
+        return extract_channel_id(content)
+    
+    def _resolve_youtube_channel_id(self, handle_or_url: str) -> str:
+        """根据 @handle 或频道URL 解析 channel_id（持久化缓存，未缓存时从页面源码中抓取）。失败返回空串。"""
+        return self.channel_resolver.resolve(handle_or_url)
+    
+    async def _resolve_youtube_channel_id_async(self, handle_or_url, fetcher):
+        """解析 channel_id（异步版本）。失败返回空串。"""
+        return await self.channel_resolver.resolve_async(handle_or_url, fetcher)
+    
+    def _parse_youtube_feed_entries(self, content):
+        """流式读取频道RSS最新10条为可缓存的 [{'title', 'link', 'published'}]（published 为 ISO 时间）
+        
+        频道RSS按发布时间倒序，遇到早于搜索窗口的条目即停止；这些条目以后也不会再进入窗口，不缓存不影响结果。
+        """
+        since = self.get_beijing_time() - timedelta(hours=self.search_hours)
+        return [{'title': entry.title, 'link': entry.link, 'published': entry.published.isoformat()}
+                for entry in iter_entries(content, limit=10, since=since)]
+    
+    def _match_youtube_entries(self, entries, keyword):
+        """返回标题含关键词且在时间窗口内的频道RSS条目"""
         results = []
         beijing_now = self.get_beijing_time()
         time_threshold = beijing_now - timedelta(hours=self.search_hours)
-        for cid in channel_ids:
-            if not cid:
-                continue
-            try:
-                rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={cid}"
-                feed = feedparser.parse(rss_url)
-                for entry in feed.entries[:10]:
-                    title = entry.title
-                    link = entry.link
-                    published_raw = entry.get('published', entry.get('updated', ''))
-                    if not published_raw:
-                        continue
-                    published_iso = published_raw.replace('Z', '+00:00')
-                    try:
-                        published_dt = datetime.fromisoformat(published_iso)
-                    except Exception:
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            published_dt = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                        else:
-                            continue
-                    published_bj = published_dt.astimezone(timezone(timedelta(hours=8)))
-
-                    if keyword in title and published_bj >= time_threshold:
-                        results.append({
-                            'title': title,
-                            'url': link,
-                            'source': 'TVB娱乐新闻台(YouTube-RSS)',
-                            'keyword': keyword,
-                            'discovered_at': beijing_now.isoformat(),
-                            'publish_time': published_bj.isoformat(),
-                            'publish_time_readable': published_bj.strftime('%Y-%m-%d %H:%M:%S')
-                        })
-            except Exception:
+        for entry in entries:
+            title = entry['title']
+            published_bj = datetime.fromisoformat(entry['published']).astimezone(timezone(timedelta(hours=8)))
+            
+            if keyword in title and published_bj >= time_threshold:
+                results.append({
+                    'title': title,
+                    'url': entry['link'],
+                    'source': 'TVB娱乐新闻台(YouTube-RSS)',
+                    'keyword': keyword,
+                    'discovered_at': beijing_now.isoformat(),
+                    'publish_time': published_bj.isoformat(),
+                    'publish_time_readable': published_bj.strftime('%Y-%m-%d %H:%M:%S')
+                })
+        return results
+    
+    def _remember_youtube_feed(self, cid, entries):
+        if entries is not None:
+            with self._youtube_feed_lock:
+                self._youtube_feed_entries[cid] = entries
+        return entries
+    
+    def _fetch_youtube_feed(self, cid):
+        """条件请求一个频道RSS（共享连接池）；304 时复用已解析条目。失败返回 None"""
+        with self._youtube_feed_lock:
+            entries = self._youtube_feed_entries.get(cid)
+        if entries is not None:
+            return entries
+        url = youtube_rss_url(cid)
+        response = self.session.get(url, headers=self.feed_cache.request_headers(url), timeout=10)
+        return self._remember_youtube_feed(cid, self.feed_cache.entries_from(url, response, self._parse_youtube_feed_entries))
+    
+    def _search_youtube_via_rss(self, channel_ids: list, keyword: str):
+        """并发读取多个频道RSS的最新视频，返回匹配窗口与关键词的结果。"""
+        results = []
+        channel_ids = list(dict.fromkeys(cid for cid in channel_ids if cid))
+        for cid, entries, error in iter_bounded(self._fetch_youtube_feed, channel_ids, max_workers=8):
+            if error is not None:
+                logging.debug(f"获取频道RSS失败 {cid}: {error}")
                 continue
+            if entries:
+                results.extend(self._match_youtube_entries(entries, keyword))
         return results
-
+    
+    async def _fetch_youtube_feed_async(self, cid, fetcher):
+        with self._youtube_feed_lock:
+            entries = self._youtube_feed_entries.get(cid)
+        if entries is not None:
+            return entries
+        url = youtube_rss_url(cid)
+        response = await fetcher.get_or_none(url, timeout=10, headers=self.feed_cache.request_headers(url))
+        if response is None:
+            return None
+        return self._remember_youtube_feed(cid, self.feed_cache.entries_from(url, response, self._parse_youtube_feed_entries))
+    
+    async def _search_youtube_via_rss_async(self, channel_ids, keyword, fetcher):
+        """并发条件请求多个频道RSS（异步版本）"""
+        results = []
+        channel_ids = list(dict.fromkeys(cid for cid in channel_ids if cid))
+        feeds = await asyncio.gather(*(self._fetch_youtube_feed_async(cid, fetcher) for cid in channel_ids),
+                                     return_exceptions=True)
+        for entries in feeds:
+            if entries and not isinstance(entries, BaseException):
+                results.extend(self._match_youtube_entries(entries, keyword))
+        return results
+    
+    def _youtube_configured_handles(self):
+        """返回 (已配置的channel_id列表, 需要解析的handle列表)"""
+        env_ids = os.getenv('YOUTUBE_CHANNEL_IDS', '').strip()
+        if env_ids:
+            return [i.strip() for i in env_ids.split(',') if i.strip()], []
+        # 若未设置环境变量，自动解析两个handle
+        return [], ['@TVBENews', '@TVB']
+    
+    def _youtube_video_ids_in_lines(self, lines, marker):
+        """在包含 marker 和 videoId 的行中提取视频ID（按出现顺序）"""
+        video_ids = []
+        for line in lines:
+            if marker in line and 'videoId' in line:
+                video_ids.extend(YOUTUBE_VIDEO_ID_PATTERN.findall(line))
+        return video_ids
+    
+    def _make_youtube_result(self, title, video_url, keyword, current_time, publish_time):
+        result = {
+            'title': title,
+            'url': video_url,  # 这里已经是完整的视频URL
+            'source': 'TVB娱乐新闻台(YouTube)',
+            'keyword': keyword,
+            'discovered_at': current_time.isoformat()
+        }
+        
+        if publish_time:
+            result['publish_time'] = publish_time.isoformat()
+            result['publish_time_readable'] = publish_time.strftime('%Y-%m-%d %H:%M:%S')
+            logging.info(f"YouTube视频真实发布时间: {result['publish_time_readable']}")
+        else:
+            # 如果无法获取发布时间，保守地假设视频是很久以前发布的
+            old_time = current_time - timedelta(hours=24)  # 假设24小时前发布，确保被过滤
+            result['publish_time'] = old_time.isoformat()
+            result['publish_time_readable'] = old_time.strftime('%Y-%m-%d %H:%M:%S')
+            logging.warning(f"YouTube视频无法获取发布时间，标记为24小时前: {result['publish_time_readable']}")
+        
+        return result
+    
     def search_youtube(self, keyword):
         """搜索YouTube - 优先RSS，失败降级页面解析（保留原逻辑）"""
         results = []
@@ -1694,16 +1668,11 @@ class VVNewsBotAuto:
             logging.info(f"搜索TVB娱乐新闻台YouTube: {keyword}")
 
             # 1) 优先RSS：支持两个频道 @TVBENews 与 @TVB
-            configured_ids = []
-            env_ids = os.getenv('YOUTUBE_CHANNEL_IDS', '').strip()
-            if env_ids:
-                configured_ids = [i.strip() for i in env_ids.split(',') if i.strip()]
-            else:
-                # 若未设置环境变量，自动解析两个handle
-                for handle in ['@TVBENews', '@TVB']:
-                    cid = self._resolve_youtube_channel_id(handle)
-                    if cid:
-                        configured_ids.append(cid)
+            configured_ids, handles = self._youtube_configured_handles()
+            for handle in handles:
+                cid = self._resolve_youtube_channel_id(handle)
+                if cid:
+                    configured_ids.append(cid)
             rss_results = self._search_youtube_via_rss(configured_ids, keyword)
             if rss_results:
                 logging.info(f"TVB YouTube RSS 匹配 {len(rss_results)} 条")
@@ -1711,7 +1680,7 @@ class VVNewsBotAuto:
             
             # 搜索TVB娱乐新闻台频道
             channel_url = "https://www.youtube.com/@TVBENews/videos"
-            response = self.session.get(channel_url, timeout=15)
+            response = self.page_cache.get_until(channel_url, YOUTUBE_INITIAL_DATA_MARKERS, timeout=15)
             
             if response.status_code == 200:
                 content = response.text
@@ -1724,10 +1693,7 @@ class VVNewsBotAuto:
                 for line in lines:
                     if keyword in line and 'videoId' in line:
                         # 在这行中查找所有videoId
-                        video_ids = re.findall(r'"videoId":"([a-zA-Z0-9_-]{11})"', line)
-                        
-                        # 在这行中查找包含关键词的标题
-                        title_matches = re.findall(r'"text":"([^"]*' + keyword + r'[^"]*)"}', line)
+                        video_ids = YOUTUBE_VIDEO_ID_PATTERN.findall(line)
                         
                         # 只处理videoId，不依赖可能错误的title匹配
                         if video_ids:
@@ -1762,7 +1728,7 @@ class VVNewsBotAuto:
                         for line in lines:
                             if target in line and 'videoId' in line:
                                 # 提取videoId
-                                video_ids = re.findall(r'"videoId":"([a-zA-Z0-9_-]{11})"', line)
+                                video_ids = YOUTUBE_VIDEO_ID_PATTERN.findall(line)
                                 for video_id in video_ids:
                                     if video_id not in seen_video_ids:
                                         video_url = f'https://www.youtube.com/watch?v={video_id}'
@@ -1782,14 +1748,13 @@ class VVNewsBotAuto:
                 if not found_videos:
                     logging.info("频道页面未找到相关视频，尝试搜索页面...")
                     search_url = f"https://www.youtube.com/results?search_query=TVB娱乐新闻台+{keyword}"
-                    search_response = self.session.get(search_url, timeout=15)
+                    search_response = read_until(self.session, search_url, YOUTUBE_INITIAL_DATA_MARKERS, timeout=15)
                     
                     if search_response.status_code == 200:
                         search_lines = search_response.text.split('\n')
                         for line in search_lines:
                             if keyword in line and 'videoId' in line:
-                                video_ids = re.findall(r'"videoId":"([a-zA-Z0-9_-]{11})"', line)
-                                title_matches = re.findall(r'"text":"([^"]*' + keyword + r'[^"]*)"}', line)
+                                video_ids = YOUTUBE_VIDEO_ID_PATTERN.findall(line)
                                 
                                 if video_ids:
                                     for video_id in video_ids:
@@ -1815,29 +1780,9 @@ class VVNewsBotAuto:
                     # 从URL提取video_id用于日志
                     video_id = video_url.split('v=')[-1].split('&')[0] if 'v=' in video_url else 'unknown'
                     
-                    result = {
-                        'title': title,
-                        'url': video_url,  # 这里已经是完整的视频URL
-                        'source': 'TVB娱乐新闻台(YouTube)',
-                        'keyword': keyword,
-                        'discovered_at': current_time.isoformat()
-                    }
-                    
                     # 点击进入视频页面获取准确的发布时间
                     publish_time = self.get_youtube_video_publish_time(video_url, video_id)
-                    
-                    if publish_time:
-                        result['publish_time'] = publish_time.isoformat()
-                        result['publish_time_readable'] = publish_time.strftime('%Y-%m-%d %H:%M:%S')
-                        logging.info(f"YouTube视频真实发布时间: {result['publish_time_readable']}")
-                    else:
-                        # 如果无法获取发布时间，保守地假设视频是很久以前发布的
-                        old_time = current_time - timedelta(hours=24)  # 假设24小时前发布，确保被过滤
-                        result['publish_time'] = old_time.isoformat()
-                        result['publish_time_readable'] = old_time.strftime('%Y-%m-%d %H:%M:%S')
-                        logging.warning(f"YouTube视频无法获取发布时间，标记为24小时前: {result['publish_time_readable']}")
-                    
-                    results.append(result)
+                    results.append(self._make_youtube_result(title, video_url, keyword, current_time, publish_time))
             
             logging.info(f"TVB娱乐新闻台YouTube 搜索完成，找到 {len(results)} 条去重结果")
             return results
@@ -1846,176 +1791,456 @@ class VVNewsBotAuto:
             logging.error(f"搜索TVB娱乐新闻台YouTube时出错: {e}")
             return results
     
-    def get_youtube_video_real_title(self, video_url, video_id):
-        """获取YouTube视频的真实标题"""
+    def _parse_youtube_title(self, content):
+        """从YouTube视频页面解析真实标题，找不到返回 None"""
+        # 查找真实标题的多种模式
+        title_patterns = [
+            r'<title>([^<]*?)</title>',
+            r'"title":"([^"]*?)",?"lengthText"',
+            r'<meta name="title" content="([^"]*?)">',
+            r'<meta property="og:title" content="([^"]*?)">',
+            r'"videoDetails":{"videoId":"[^"]*","title":"([^"]*?)"'
+        ]
+        
+        for pattern in title_patterns:
+            matches = re.findall(pattern, content)
+            if matches:
+                title = matches[0].strip()
+                # 清理YouTube后缀
+                if title.endswith(' - YouTube'):
+                    title = title[:-10]
+                if len(title) > 10:
+                    logging.info(f"找到真实标题: {title}")
+                    return title
+        
+        return None
+    
+    def _parse_youtube_metadata(self, video_id, content):
+        """从一次抓取的视频页面中同时解析标题、发布时间和频道，返回可缓存的 dict；标题和时间都没找到返回 None"""
+        title = self._parse_youtube_title(content)
+        publish_time = self._parse_youtube_publish_time(content)
+        if title is None and publish_time is None:
+            logging.warning(f"无法从YouTube视频页面提取标题和发布时间: {video_id}")
+            return None
+        return {
+            'video_id': video_id,
+            'title': title,
+            'publish_time': publish_time.isoformat() if publish_time else None,
+            'channel_id': self._extract_youtube_channel_id(content),
+        }
+    
+    def _video_metadata(self, video_id, record):
+        if record is None:
+            return VideoMetadata(video_id, None, None, '')
+        publish_time = datetime.fromisoformat(record['publish_time']) if record.get('publish_time') else None
+        return VideoMetadata(video_id, record.get('title'), publish_time, record.get('channel_id', ''))
+    
+    def _load_youtube_metadata(self, video_url, video_id):
         try:
-            logging.info(f"正在验证YouTube视频标题: {video_id}")
-            
-            response = self.session.get(video_url, timeout=10)
-            
-            if response.status_code == 200:
-                content = response.text
-                
-                # 查找真实标题的多种模式
-                title_patterns = [
-                    r'<title>([^<]*?)</title>',
-                    r'"title":"([^"]*?)",?"lengthText"',
-                    r'<meta name="title" content="([^"]*?)">',
-                    r'<meta property="og:title" content="([^"]*?)">',
-                    r'"videoDetails":{"videoId":"[^"]*","title":"([^"]*?)"'
-                ]
-                
-                for pattern in title_patterns:
-                    matches = re.findall(pattern, content)
-                    if matches:
-                        title = matches[0].strip()
-                        # 清理YouTube后缀
-                        if title.endswith(' - YouTube'):
-                            title = title[:-10]
-                        if len(title) > 10:
-                            logging.info(f"找到真实标题: {title}")
-                            return title
-                
+            logging.info(f"正在获取YouTube视频元数据: {video_id}")
+            response = read_until(self.session, video_url, YOUTUBE_WATCH_MARKERS, timeout=15)
+            if response.status_code != 200:
+                logging.warning(f"无法访问YouTube视频页面: {response.status_code}")
+                return None
+            return self._parse_youtube_metadata(video_id, response.text)
+        except Exception as e:
+            logging.error(f"获取YouTube视频元数据失败: {e}")
             return None
-            
+    
+    def get_youtube_video_metadata(self, video_url, video_id):
+        """获取视频元数据：先查缓存（内存LRU + 状态存储），未命中时抓取一次视频页面（多个线程同时请求同一视频时只抓取一次）"""
+        record = self.video_cache.get_or_load(video_id, lambda: self._load_youtube_metadata(video_url, video_id))
+        return self._video_metadata(video_id, record)
+    
+    async def _load_youtube_metadata_async(self, video_url, video_id, fetcher):
+        try:
+            logging.info(f"[异步] 正在获取YouTube视频元数据: {video_id}")
+            response = await fetcher.get_until(video_url, YOUTUBE_WATCH_MARKERS, timeout=15)
+            if response.status_code != 200:
+                logging.warning(f"无法访问YouTube视频页面: {response.status_code}")
+                return None
+            return self._parse_youtube_metadata(video_id, response.text)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logging.error(f"获取YouTube视频真实标题失败: {e}")
+            logging.error(f"获取YouTube视频元数据失败: {e}")
             return None
-
+    
+    async def get_youtube_video_metadata_async(self, video_url, video_id, fetcher):
+        """获取视频元数据（异步版本）：与同步版本共用缓存，多个关键词同时请求同一视频时只抓取一次"""
+        record = await self.video_cache.get_or_load_async(
+            video_id, lambda: self._load_youtube_metadata_async(video_url, video_id, fetcher))
+        return self._video_metadata(video_id, record)
+    
+    def get_youtube_video_real_title(self, video_url, video_id):
+        """获取YouTube视频的真实标题"""
+        return self.get_youtube_video_metadata(video_url, video_id).title
+    
+    async def get_youtube_video_real_title_async(self, video_url, video_id, fetcher):
+        """获取YouTube视频的真实标题（异步版本）"""
+        return (await self.get_youtube_video_metadata_async(video_url, video_id, fetcher)).title
+    
+    def _parse_youtube_publish_time(self, content):
+        """从YouTube视频页面解析发布时间（publishDate / 相对时间等，见 publish_time），找不到返回 None"""
+        # 只接受 publishDate / publishedTimeText 等结构化字段：推荐视频旁的"3小时前"不是本视频的时间
+        publish_time = parse_publish_time(content, now=self.get_beijing_time(), max_priority=PRIORITY_STRUCTURED)
+        if publish_time:
+            logging.info(f"解析YouTube发布时间成功: {publish_time}")
+        return publish_time
+    
     def get_youtube_video_publish_time(self, video_url, video_id):
-        """点击进入YouTube视频页面获取准确的发布时间"""
+        """YouTube视频的准确发布时间（与标题共用同一次页面抓取和缓存）"""
+        return self.get_youtube_video_metadata(video_url, video_id).publish_time
+    
+    async def get_youtube_video_publish_time_async(self, video_url, video_id, fetcher):
+        """获取YouTube视频发布时间（异步版本）"""
+        return (await self.get_youtube_video_metadata_async(video_url, video_id, fetcher)).publish_time
+    
+    async def _verify_youtube_candidates_async(self, video_ids, keyword, fetcher, found_videos, seen_video_ids, limit=3):
+        """并发验证候选视频的真实标题，按候选顺序保留前 limit 个标题含关键词的视频"""
+        candidates = []
+        for video_id in video_ids:
+            if video_id not in seen_video_ids and video_id not in candidates:
+                candidates.append(video_id)
+        
+        batch_size = fetcher.per_host_limit
+        for start in range(0, len(candidates), batch_size):
+            if len(found_videos) >= limit:
+                break
+            batch = candidates[start:start + batch_size]
+            video_urls = [f'https://www.youtube.com/watch?v={video_id}' for video_id in batch]
+            titles = await asyncio.gather(*(self.get_youtube_video_real_title_async(url, video_id, fetcher)
+                                            for url, video_id in zip(video_urls, batch)))
+            for video_id, video_url, real_title in zip(batch, video_urls, titles):
+                seen_video_ids.add(video_id)
+                if real_title and keyword.lower() in real_title.lower() and len(found_videos) < limit:
+                    found_videos.append((real_title, video_url))
+                    logging.info(f"验证真实YouTube视频: {real_title[:50]}... -> {video_id}")
+    
+    async def search_youtube_async(self, keyword, fetcher):
+        """搜索YouTube（异步版本）- RSS并发抓取，降级页面解析时并发验证候选视频"""
+        results = []
+        
         try:
-            logging.info(f"正在获取YouTube视频发布时间: {video_id}")
+            logging.info(f"[异步] 搜索TVB娱乐新闻台YouTube: {keyword}")
+            
+            # 1) 优先RSS
+            configured_ids, handles = self._youtube_configured_handles()
+            resolved = await asyncio.gather(*(self._resolve_youtube_channel_id_async(h, fetcher) for h in handles))
+            configured_ids.extend(cid for cid in resolved if cid)
             
-            # 访问视频页面
-            response = self.session.get(video_url, timeout=15)
+            rss_results = await self._search_youtube_via_rss_async(configured_ids, keyword, fetcher)
+            if rss_results:
+                logging.info(f"[异步] TVB YouTube RSS 匹配 {len(rss_results)} 条")
+                return rss_results
+            
+            # 2) 频道页面：关键词所在行优先，其次备用关键词所在行
+            response = await fetcher.get_until("https://www.youtube.com/@TVBENews/videos",
+                                               YOUTUBE_INITIAL_DATA_MARKERS, timeout=15)
             if response.status_code != 200:
-                logging.warning(f"无法访问YouTube视频页面: {response.status_code}")
-                return None
+                return results
             
-            content = response.text
-            current_time = self.get_beijing_time()
+            lines = response.text.split('\n')
+            found_videos = []
+            seen_video_ids = set()
+            for marker in [keyword, '電影泉攻略', 'TVB']:
+                video_ids = self._youtube_video_ids_in_lines(lines, marker)
+                await self._verify_youtube_candidates_async(video_ids, keyword, fetcher, found_videos, seen_video_ids)
+                if len(found_videos) >= 3:
+                    break
             
-            # 多种发布时间提取模式
-            time_patterns = [
-                # 标准的发布时间模式
-                r'"publishDate":"([^"]+)"',
-                r'"uploadDate":"([^"]+)"',
-                r'"datePublished":"([^"]+)"',
-                # 相对时间模式
-                r'"publishedTimeText":{"simpleText":"([^"]+)"}',
-                r'"publishedTimeText":"([^"]+)"',
-                # 元数据模式
-                r'<meta property="video:release_date" content="([^"]+)"',
-                r'<meta itemprop="datePublished" content="([^"]+)"',
-                r'<meta itemprop="uploadDate" content="([^"]+)"',
-                # JSON-LD模式
-                r'"datePublished":\s*"([^"]+)"',
-                r'"uploadDate":\s*"([^"]+)"',
-            ]
+            # 3) 搜索页面
+            if not found_videos:
+                search_url = f"https://www.youtube.com/results?search_query=TVB娱乐新闻台+{keyword}"
+                try:
+                    search_response = await fetcher.get_until(search_url, YOUTUBE_INITIAL_DATA_MARKERS, timeout=15)
+                except Exception as e:
+                    logging.warning(f"异步抓取失败 {search_url}: {e}")
+                    search_response = None
+                if search_response is not None and search_response.status_code == 200:
+                    video_ids = self._youtube_video_ids_in_lines(search_response.text.split('\n'), keyword)
+                    await self._verify_youtube_candidates_async(video_ids, keyword, fetcher, found_videos, seen_video_ids)
             
-            for pattern in time_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    time_text = matches[0].strip()
-                    logging.info(f"找到时间文本: {time_text}")
-                    
-                    # 尝试解析ISO格式时间
-                    try:
-                        # 处理ISO格式 (2024-08-15T10:30:00Z 或 2024-08-15T10:30:00+08:00)
-                        if 'T' in time_text and ('Z' in time_text or '+' in time_text or '-' in time_text[-6:]):
-                            publish_time = datetime.fromisoformat(time_text.replace('Z', '+00:00'))
-                            # 转换为北京时间
-                            beijing_tz = timezone(timedelta(hours=8))
-                            publish_time = publish_time.astimezone(beijing_tz)
-                            logging.info(f"解析ISO格式时间成功: {publish_time}")
-                            return publish_time
-                    except Exception as e:
-                        logging.debug(f"ISO时间解析失败: {e}")
-                    
-                    # 尝试解析相对时间
-                    try:
-                        if '小时前' in time_text or 'hours ago' in time_text.lower():
-                            hours_match = re.search(r'(\d+)', time_text)
-                            if hours_match:
-                                hours_ago = int(hours_match.group(1))
-                                publish_time = current_time - timedelta(hours=hours_ago)
-                                logging.info(f"解析相对时间成功: {hours_ago}小时前 = {publish_time}")
-                                return publish_time
-                        elif '天前' in time_text or 'days ago' in time_text.lower():
-                            days_match = re.search(r'(\d+)', time_text)
-                            if days_match:
-                                days_ago = int(days_match.group(1))
-                                publish_time = current_time - timedelta(days=days_ago)
-                                logging.info(f"解析相对时间成功: {days_ago}天前 = {publish_time}")
-                                return publish_time
-                        elif '分钟前' in time_text or 'minutes ago' in time_text.lower():
-                            minutes_match = re.search(r'(\d+)', time_text)
-                            if minutes_match:
-                                minutes_ago = int(minutes_match.group(1))
-                                publish_time = current_time - timedelta(minutes=minutes_ago)
-                                logging.info(f"解析相对时间成功: {minutes_ago}分钟前 = {publish_time}")
-                                return publish_time
-                        elif '周前' in time_text or 'weeks ago' in time_text.lower():
-                            weeks_match = re.search(r'(\d+)', time_text)
-                            if weeks_match:
-                                weeks_ago = int(weeks_match.group(1))
-                                publish_time = current_time - timedelta(weeks=weeks_ago)
-                                logging.info(f"解析相对时间成功: {weeks_ago}周前 = {publish_time}")
-                                return publish_time
-                    except Exception as e:
-                        logging.debug(f"相对时间解析失败: {e}")
+            # 并发获取发布时间
+            current_time = self.get_beijing_time()
+            video_ids = [video_url.split('v=')[-1].split('&')[0] for _, video_url in found_videos]
+            publish_times = await asyncio.gather(*(self.get_youtube_video_publish_time_async(video_url, video_id, fetcher)
+                                                   for (_, video_url), video_id in zip(found_videos, video_ids)))
+            for (title, video_url), publish_time in zip(found_videos, publish_times):
+                results.append(self._make_youtube_result(title, video_url, keyword, current_time, publish_time))
             
-            logging.warning(f"无法从YouTube视频页面提取发布时间: {video_id}")
-            return None
+            logging.info(f"[异步] TVB娱乐新闻台YouTube 搜索完成，找到 {len(results)} 条去重结果")
+            return results
             
         except Exception as e:
-            logging.error(f"获取YouTube视频发布时间时出错: {e}")
-            return None
+            logging.error(f"[异步] 搜索TVB娱乐新闻台YouTube时出错: {e}")
+            return results
+    
+    def get_search_sources(self):
+        """返回 (来源名称, 搜索方法) 列表，顺序即结果合并顺序"""
+        return [
+            ('Google News', self.search_google_news),
+            ('香港01', self.search_hk01),
+            ('東網on.cc', self.search_oncc),
+            ('星島娛樂', self.search_singtao),
+            ('明報', self.search_mingpao),
+            ('明周', self.search_mpweekly),
+            ('香港文匯報', self.search_wenweipo),
+            ('TVB', self.search_tvb),
+            ('YouTube', self.search_youtube),
+        ]
+    
+    def get_async_search_sources(self):
+        """返回 (来源名称, 异步搜索方法) 列表，与 get_search_sources 一一对应"""
+        return [
+            ('Google News', self.search_google_news_async),
+            ('香港01', self.search_hk01_async),
+            ('東網on.cc', self.search_oncc_async),
+            ('星島娛樂', self.search_singtao_async),
+            ('明報', self.search_mingpao_async),
+            ('明周', self.search_mpweekly_async),
+            ('香港文匯報', self.search_wenweipo_async),
+            ('TVB', self.search_tvb_async),
+            ('YouTube', self.search_youtube_async),
+        ]
+    
+    def _run_source(self, task, search_func, keyword, started_at):
+        """在工作线程中执行单个来源的搜索，并记录实际开始时间（用于计算该来源的超时）"""
+        started_at[task] = time.monotonic()
+        return search_func(keyword) or []
+    
+    def _start_search_round(self, keywords):
+        """开始新一轮搜索：重置页面缓存与Sitemap选择，返回关键词列表"""
+        keywords = normalize_keywords(keywords) or self.keywords
+        self.page_cache.reset(keywords)
+        self._round_keywords = keywords
+        self._oncc_sitemap_entries = None
+        self._oncc_sitemap_task = None
+        with self._oncc_sitemap_lock:
+            self._oncc_sitemap_checks = {}
+            self._oncc_sitemap_skipped = set()
+            self._oncc_fallback_urls = set()
+        with self._youtube_feed_lock:
+            self._youtube_feed_entries = {}
+        with self._tvb_publish_time_lock:
+            self._tvb_publish_times = {}
+        with self._breaker_lock:
+            self._breaker_recorded = set()
+        return keywords
+    
+    def _task_label(self, name, keyword, keywords):
+        return name if len(keywords) == 1 else f"{name}({keyword})"
+    
+    def search_all_sources(self, keywords=None):
+        """并发搜索所有新闻源 - 每个 (来源, 关键词) 独立超时，超时的任务直接丢弃
+        
+        超时（VVNEWS_SOURCE_TIMEOUT，東網和YouTube分别为 VVNEWS_SOURCE_TIMEOUT_ONCC / VVNEWS_SOURCE_TIMEOUT_YOUTUBE）
+        只是不再等待该任务的结果：已在运行的线程无法取消，会在后台继续执行完该来源的搜索，
+        期间仍使用共享的 requests.Session；尚未开始的任务则直接取消。
+        
+        多个关键词共享同一轮页面缓存：列表页、Sitemap和详情页只抓取一次，
+        关键词用 Aho-Corasick 在页面上一次匹配完成。
+        """
+        keywords = self._start_search_round(keywords)
+        if self.use_async:
+            return asyncio.run(self.search_all_sources_async(keywords))
+        
+        sources = self.get_search_sources()
+        results_by_source = {}
+        started_at = {}
+        run_start = time.monotonic()
+        
+        tasks = [(name, func, keyword) for keyword in keywords for name, func in sources]
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(tasks))),
+                                      thread_name_prefix='vvnews-source')
+        futures = {
+            executor.submit(self._run_source, (name, keyword), func, keyword, started_at): (name, keyword)
+            for name, func, keyword in tasks
+        }
+        pending = set(futures)
+        
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    task = futures[future]
+                    label = self._task_label(*task, keywords)
+                    try:
+                        results_by_source[task] = future.result()
+                        elapsed = time.monotonic() - started_at.get(task, run_start)
+                        logging.info(f"{label} 完成，用时 {elapsed:.1f} 秒")
+                    except Exception as e:
+                        logging.error(f"搜索{label}时出错: {e}")
+                
+                # 检查超时：已开始的任务按来源时限计算，未开始的任务受整轮时限约束
+                now = time.monotonic()
+                for future in list(pending):
+                    task = futures[future]
+                    limit = self.source_timeouts.get(task[0], self.source_timeout)
+                    if task in started_at:
+                        overdue = now - started_at[task] > limit
+                    else:
+                        overdue = now - run_start > self.search_deadline
+                    if overdue or now - run_start > self.search_deadline:
+                        future.cancel()
+                        pending.discard(future)
+                        logging.warning(f"{self._task_label(*task, keywords)} 超时（{limit:.0f} 秒），本轮丢弃该来源结果")
+        finally:
+            # 不等待被丢弃的来源，未开始的任务直接取消
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        logging.info(f"所有来源搜索结束，总用时 {time.monotonic() - run_start:.1f} 秒")
+        self._advance_oncc_watermark(keywords)
+        
+        return self._merge_source_results(sources, results_by_source, keywords)
     
-    def search_all_sources(self, keyword):
-        """搜索所有新闻源"""
+    def _merge_source_results(self, sources, results_by_source, keywords):
+        """按来源、关键词的固定顺序合并结果，计算规范URL并合并重复，为所有新闻添加发现时间戳
+        
+        同一新闻命中多个关键词时只保留一条，keywords 字段列出所有命中的关键词。
+        """
+        merged_results = []
+        for name, _ in sources:
+            for keyword in keywords:
+                for result in results_by_source.get((name, keyword), []):
+                    result['keyword'] = keyword
+                    merged_results.append(result)
+        
+        # Google News 链接此处只查缓存/离线解码，需要请求的跳转留到时间过滤之后（见 _resolve_google_news_links）
         all_results = []
+        by_url = {}
+        for result, canonical, error in iter_bounded(
+                lambda r: self.canonicalizer.canonicalize(r.get('url', ''), follow_redirects=False),
+                merged_results, max_workers=self.detail_workers):
+            if error is not None:
+                logging.debug(f"URL规范化失败: {error}")
+                canonical = canonicalize_url(result.get('url', ''))
+            if canonical in by_url:
+                existing = by_url[canonical]
+                if result['keyword'] not in existing['keywords']:
+                    existing['keywords'].append(result['keyword'])
+                else:
+                    logging.info(f"跨来源重复新闻: {result.get('title', '')}")
+                continue
+            result['canonical_url'] = canonical
+            result['keywords'] = [result['keyword']]
+            by_url[canonical] = result
+            all_results.append(result)
         
-        # 搜索各个来源
-        all_results.extend(self.search_google_news(keyword))
-        all_results.extend(self.search_hk01(keyword))
-        all_results.extend(self.search_oncc(keyword))
-        all_results.extend(self.search_singtao(keyword))
-        all_results.extend(self.search_mingpao(keyword))
-        all_results.extend(self.search_mpweekly(keyword))
-        all_results.extend(self.search_wenweipo(keyword))
-        all_results.extend(self.search_tvb(keyword))
-        all_results.extend(self.search_youtube(keyword))
-        
-        # 为所有新闻添加发现时间戳
         current_time = self.get_beijing_time()
         for result in all_results:
             result['discovered_at'] = current_time.isoformat()
         
         return all_results
     
+    async def _run_source_async(self, name, search_coro, keyword, fetcher, label=None):
+        """在事件循环中执行单个来源的异步搜索，超时即取消"""
+        label = label or name
+        limit = self.source_timeouts.get(name, self.source_timeout)
+        started = time.monotonic()
+        try:
+            results = await asyncio.wait_for(search_coro(keyword, fetcher), timeout=limit)
+            logging.info(f"{label} 完成，用时 {time.monotonic() - started:.1f} 秒")
+            return results or []
+        except asyncio.TimeoutError:
+            logging.warning(f"{label} 超时（{limit:.0f} 秒），本轮丢弃该来源结果")
+            return []
+        except Exception as e:
+            logging.error(f"搜索{label}时出错: {e}")
+            return []
+    
+    async def search_all_sources_async(self, keywords):
+        """在单个事件循环中并发搜索所有新闻源（列表页、详情页、发布时间页共享连接池）
+        
+        抓取器开启响应缓存，多个关键词对同一URL只发一次请求。
+        """
+        keywords = normalize_keywords(keywords) or self.keywords
+        sources = self.get_async_search_sources()
+        tasks = [(name, func, keyword) for keyword in keywords for name, func in sources]
+        run_start = time.monotonic()
+        
+        async with AsyncFetcher(headers=dict(self.session.headers),
+                                per_host_limit=self.per_host_limit,
+                                total_limit=self.per_host_limit * len(sources),
+                                cache_responses=True) as fetcher:
+            task_results = await asyncio.gather(
+                *(self._run_source_async(name, func, keyword, fetcher, self._task_label(name, keyword, keywords))
+                  for name, func, keyword in tasks))
+        
+        logging.info(f"所有来源异步搜索结束，总用时 {time.monotonic() - run_start:.1f} 秒")
+        self._advance_oncc_watermark(keywords)
+        
+        results_by_source = {(name, keyword): results for (name, _, keyword), results in zip(tasks, task_results)}
+        return self._merge_source_results(sources, results_by_source, keywords)
+    
     def filter_and_dedupe_news(self, all_results):
-        """过滤时间范围并去重"""
+        """过滤时间范围并去重（URL去重 + 近似标题合并）"""
         filtered_news = []
+        self.state.purge_expired()
+        self.near_dup.reset()
         
-        for result in all_results:
-            # 时间过滤
-            if not self.is_within_time_range(result):
-                continue
-                
+        # 时间过滤
+        within_range = [result for result in all_results if self.is_within_time_range(result)]
+        self._resolve_google_news_links(within_range)
+        
+        for result in within_range:
             # 去重检查
             if self.is_duplicate(result):
                 continue
+            
+            # 本轮其他媒体已报道的同一新闻：合并到已有条目
+            result.setdefault('canonical_url', self._seen_key(result))
+            title = result.get('title', '')
+            primary = self.near_dup.find_in_run(title)
+            if primary is not None:
+                self._merge_near_duplicate(primary, result)
+                continue
+            
+            # 之前运行已通知过的同一新闻
+            notified = self.near_dup.find_in_history(title)
+            if notified is not None:
+                logging.info(f"发现近似重复新闻（已通知过）: {title} ≈ {notified[1]}")
+                continue
                 
             # 添加到当前运行记录和结果中
+            self.near_dup.add(result)
             self.current_run_news.append(result)
             filtered_news.append(result)
             
-            logging.info(f"发现新新闻: {result.get('title', '')}")
+            logging.info(f"发现新新闻: {title}")
         
+        self.near_dup.persist(filtered_news, self.seen_ttl)
         return filtered_news
     
+    def _resolve_google_news_links(self, results):
+        """只为通过时间过滤、规范URL仍是 Google News 的条目解析跳转（结果持久缓存），并发执行"""
+        pending = [r for r in results if is_google_news_url(r.get('canonical_url') or r.get('url', ''))]
+        for result, canonical, error in iter_bounded(
+                lambda r: self.canonicalizer.canonicalize(r.get('url', '')),
+                pending, max_workers=self.detail_workers):
+            if error is None:
+                result['canonical_url'] = canonical
+    
+    def _merge_near_duplicate(self, primary, duplicate):
+        """把近似重复新闻记录到主条目的 also_reported_by 中"""
+        primary.setdefault('also_reported_by', []).append({
+            'source': duplicate.get('source', ''),
+            'title': duplicate.get('title', ''),
+            'url': duplicate.get('url', ''),
+            'canonical_url': duplicate['canonical_url'],
+        })
+        logging.info(f"合并近似重复新闻: {duplicate.get('title', '')} -> {primary.get('title', '')}")
+    
+    def _release_notified(self, results):
+        """邮件未发出时撤销登记（含合并进来的其他来源），下次运行重新通知"""
+        urls = []
+        for result in results:
+            urls.append(self._seen_key(result))
+            urls.extend(other['canonical_url'] for other in result.get('also_reported_by', []))
+        self.state.release_seen(urls)
+        self.state.release_titles(urls)
+    
     def send_email(self, results):
         """发送邮件通知"""
         if not results:
@@ -2058,6 +2283,12 @@ class VVNewsBotAuto:
                     body += f"{i}. {result['title']}\n"
                     body += f"   链接: {result['url']}\n"
                     
+                    if len(self.page_cache.matcher.keywords) > 1 and result.get('keywords'):
+                        body += f"   关键词: {'、'.join(result['keywords'])}\n"
+                    
+                    for other in result.get('also_reported_by', []):
+                        body += f"   其他来源: {other['source']} - {other['url']}\n"
+                    
                     if result.get('publish_time_readable'):
                         body += f"   发布时间: {result['publish_time_readable']} (北京时间)\n"
                     
@@ -2114,48 +2345,53 @@ VVNews 王敏奕新闻机器人 (智能检测版本)
             return False
 
     def _extract_am730_publish_time(self, article_url):
+        """返回 (ISO时间, 北京时间可读格式)，经文章元数据缓存，已查询过的文章不再抓取"""
         try:
-            resp = self.session.get(article_url, timeout=8)
-            if resp.status_code != 200:
-                return None, None
-            html = resp.text
-            patterns = [
-                r'<meta[^>]+property=["\']article:published_time["\'][^>]+content=["\']([^"\']+)["\']',
-                r'"datePublished"\s*:\s*"([^"]+)"',
-                r'<meta[^>]+name=["\']pubdate["\'][^>]+content=["\']([^"\']+)["\']',
-            ]
-            from datetime import timezone, timedelta
-            for pat in patterns:
-                m = re.search(pat, html, re.IGNORECASE)
-                if m:
-                    raw = m.group(1).strip()
-                    try:
-                        dt = datetime.fromisoformat(raw.replace('Z', '+00:00'))
-                    except Exception:
-                        try:
-                            dt = datetime.strptime(raw[:16], '%Y-%m-%d %H:%M')
-                            dt = dt.replace(tzinfo=timezone(timedelta(hours=8)))
-                        except Exception:
-                            continue
-                    beijing_tz = timezone(timedelta(hours=8))
-                    dt_bj = dt.astimezone(beijing_tz)
-                    return dt.isoformat(), dt_bj.strftime('%Y-%m-%d %H:%M:%S')
-        except Exception:
+            return iso_and_readable(self._article_publish_time(article_url, timeout=8))
+        except Exception as e:
+            logging.debug(f"获取 am730 发布时间失败 {article_url}: {e}")
             return None, None
-        return None, None
+
+    def _collect_am730_results(self, keyword, candidates, need):
+        """并发获取候选文章 (标题, URL) 的发布时间，按候选顺序返回时间范围内的结果，达到 need 条即停止"""
+        results = []
+        if need <= 0:
+            return results
+        for (title, url), publish_time, error in iter_bounded(
+                lambda candidate: self._extract_am730_publish_time(candidate[1]),
+                candidates, max_workers=self.publish_time_workers.get('am730', self.detail_workers),
+                deadline=self.publish_time_deadline):
+            if error is not None:
+                continue
+            pub_iso, pub_readable = publish_time
+            if not pub_iso:
+                continue
+            if not self.is_within_time_range({'publish_time': pub_iso}):
+                continue
+            results.append({
+                'title': title,
+                'url': url,
+                'source': 'am730',
+                'keyword': keyword,
+                'publish_time': pub_iso,
+                'publish_time_readable': pub_readable
+            })
+            if len(results) >= need:
+                break
+        return results
 
     def _search_am730_via_google(self, keyword, need=3, seen=None):
         if seen is None:
             seen = set()
-        results = []
         try:
             q = f"site:am730.com.hk {keyword}"
             url = "https://www.google.com/search"
             headers = {'User-Agent': self.session.headers.get('User-Agent', '')}
             resp = self.session.get(url, params={'q': q, 'hl': 'zh-TW'}, headers=headers, timeout=8)
             if resp.status_code != 200:
-                return results
+                return []
             soup = BeautifulSoup(resp.text, 'lxml')
+            candidates = []
             for a in soup.select('a'):
                 href = a.get('href') or ''
                 text = (a.get_text() or '').strip()
@@ -2176,25 +2412,11 @@ VVNews 王敏奕新闻机器人 (智能检测版本)
                     continue
                 if real in seen:
                     continue
-                pub_iso, pub_readable = self._extract_am730_publish_time(real)
-                if not pub_iso:
-                    continue
-                if not self.is_within_time_range({'publish_time': pub_iso}):
-                    continue
                 seen.add(real)
-                results.append({
-                    'title': text[:120],
-                    'url': real,
-                    'source': 'am730',
-                    'keyword': keyword,
-                    'publish_time': pub_iso,
-                    'publish_time_readable': pub_readable
-                })
-                if len(results) >= need:
-                    break
-            return results
+                candidates.append((text[:120], real))
+            return self._collect_am730_results(keyword, candidates, need)
         except Exception:
-            return results
+            return []
 
     def search_am730(self, keyword):
         results = []
@@ -2213,6 +2435,7 @@ VVNews 王敏奕新闻机器人 (智能检测版本)
                     if resp.status_code != 200:
                         continue
                     soup = BeautifulSoup(resp.text, 'lxml')
+                    candidates = []
                     for a in soup.find_all('a'):
                         title = (a.get_text() or '').strip()
                         href = a.get('href') or ''
@@ -2230,20 +2453,10 @@ VVNews 王敏奕新闻机器人 (智能检测版本)
                             continue
                         if url in seen:
                             continue
-                        pub_iso, pub_readable = self._extract_am730_publish_time(url)
-                        if not pub_iso or not self.is_within_time_range({'publish_time': pub_iso}):
-                            continue
                         seen.add(url)
-                        results.append({
-                            'title': title,
-                            'url': url,
-                            'source': 'am730',
-                            'keyword': keyword,
-                            'publish_time': pub_iso,
-                            'publish_time_readable': pub_readable
-                        })
-                        if len(results) >= max_items:
-                            break
+                        candidates.append((title, url))
+                    # 本页候选的发布时间并发获取（已缓存的文章不再请求）
+                    results.extend(self._collect_am730_results(keyword, candidates, max_items - len(results)))
                 except Exception:
                     continue
                 if len(results) >= max_items:
@@ -2316,10 +2529,8 @@ VVNews 王敏奕新闻机器人 (智能检测版本)
                 'email_sent': len(filtered_results) > 0
             },
             'source_breakdown': source_stats,
-            'search_sources': [
-                'Google News', '香港01', '東網on.cc', '星島娛樂', 
-                '明報', '明周', '香港文匯報', 'TVB', 'YouTube'
-            ]
+            'search_sources': [name for name, _ in self.get_search_sources()],
+            'article_cache': self.article_cache.stats()
         }
         
         try:
@@ -2331,8 +2542,9 @@ VVNews 王敏奕新闻机器人 (智能检测版本)
             logging.error(f"保存运行日志时出错: {str(e)}")
             return None
     
-    def run(self, keyword='王敏奕'):
-        """运行机器人"""
+    def run(self, keywords=None):
+        """运行机器人；keywords 为关键词或关键词列表，默认使用 VVNEWS_KEYWORDS 配置"""
+        keywords = normalize_keywords(keywords) or self.keywords
         # 显示配置信息
         beijing_time = self.get_beijing_time()
         minutes = int(self.search_hours * 60)
@@ -2345,9 +2557,12 @@ VVNews 王敏奕新闻机器人 (智能检测版本)
         print("=" * 60)
         
         # 搜索所有来源
-        print(f"🔍 开始搜索关于 {keyword} 的最新新闻...")
-        all_results = self.search_all_sources(keyword)
+        print(f"🔍 开始搜索关于 {'、'.join(keywords)} 的最新新闻...")
+        all_results = self.search_all_sources(keywords)
         print(f"📊 总共搜索到: {len(all_results)} 条新闻")
+        cache_stats = self.article_cache.stats()
+        logging.info(f"文章元数据缓存: 命中 {cache_stats['hits']} 次，负缓存命中 {cache_stats['negative_hits']} 次，"
+                     f"未命中 {cache_stats['misses']} 次，抓取失败 {cache_stats['errors']} 次")
         
         # 过滤和去重
         filtered_results = self.filter_and_dedupe_news(all_results)
@@ -2364,7 +2579,8 @@ VVNews 王敏奕新闻机器人 (智能检测版本)
         # 发送邮件
         if filtered_results:
             print("📧 发送新新闻邮件通知...")
-            self.send_email(filtered_results)
+            if not self.send_email(filtered_results):
+                self._release_notified(filtered_results)
         else:
             print("ℹ️ 没有发现新新闻，不发送邮件")
         
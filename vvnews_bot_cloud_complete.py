@@ -16,6 +16,9 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from bs4 import BeautifulSoup
 import logging
+from state_store import StateStore
+from youtube_channels import ChannelResolver
+from publish_time import fetch_publish_time, iso_and_readable
 
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -26,6 +29,8 @@ class VVNewsBotCloudComplete:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # @handle → channel_id 长期缓存（与其他版本共用同一状态数据库）
+        self.channel_resolver = ChannelResolver(self.session, StateStore())
         
         # 邮件配置 - 从环境变量获取
         self.email_config = {
@@ -185,28 +190,8 @@ class VVNewsBotCloudComplete:
             return results
 
     def _resolve_youtube_channel_id(self, handle_or_url: str) -> str:
-        ident = handle_or_url.strip()
-        try:
-            if ident.startswith('UC') and len(ident) > 10:
-                return ident
-            if 'youtube.com/channel/' in ident:
-                m = re.search(r"/channel/([A-Za-z0-9_-]+)", ident)
-                return m.group(1) if m else ''
-            if ident.startswith('http'):
-                url = ident
-            elif ident.startswith('@'):
-                url = f"https://www.youtube.com/{ident}"
-            else:
-                url = f"https://www.youtube.com/@{ident}"
-
-            resp = self.session.get(url, timeout=10)
-            if resp.status_code == 200:
-                m = re.search(r'"channelId":"(UC[^"]+)"', resp.text)
-                if m:
-                    return m.group(1)
-        except Exception as e:
-            logging.warning(f"解析频道ID失败: {ident} -> {e}")
-        return ''
+        """解析 @handle 或 URL 到 channel_id（持久化缓存，未缓存时下载频道页面）。"""
+        return self.channel_resolver.resolve(handle_or_url)
     
     def search_oncc(self, keyword):
         """搜索東網on.cc"""
@@ -481,55 +466,13 @@ class VVNewsBotCloudComplete:
             return True
 
     def _extract_tvb_publish_time(self, article_url):
-        """从 TVB 页面提取发布时间，返回(iso, readable)，失败返回(None, None)。"""
+        """从TVB文章页面提取发布时间（流式读取，只读到能确定时间为止），返回(iso, readable)。失败则返回(None, None)。"""
         if not article_url:
             return None, None
         try:
-            resp = self.session.get(article_url, timeout=6)
-            if resp.status_code != 200:
-                return None, None
-            html = resp.text
-            # 常见 meta/JSON-LD 时间
-            patterns = [
-                r'<meta[^>]+property=["\"]article:published_time["\"][^>]+content=["\"]([^"\"]+)["\"]',
-                r'<meta[^>]+itemprop=["\"]datePublished["\"][^>]+content=["\"]([^"\"]+)["\"]',
-                r'<meta[^>]+name=["\"]pubdate["\"][^>]+content=["\"]([^"\"]+)["\"]',
-                r'"datePublished"\s*:\s*"([^"]+)"',
-                r'"uploadDate"\s*:\s*"([^"]+)"'
-            ]
-            from datetime import timezone, timedelta
-            for pat in patterns:
-                m = re.search(pat, html, re.IGNORECASE)
-                if m:
-                    raw = m.group(1).strip()
-                    try:
-                        dt = datetime.fromisoformat(raw.replace('Z', '+00:00'))
-                        beijing_tz = timezone(timedelta(hours=8))
-                        dt_bj = dt.astimezone(beijing_tz)
-                        return dt.isoformat(), dt_bj.strftime('%Y-%m-%d %H:%M:%S')
-                    except Exception:
-                        continue
-            # 兜底：中文/数字日期文本
-            text_patterns = [
-                r'(20\d{2})[-/](0?[1-9]|1[0-2])[-/](0?[1-9]|[12]\d|3[01])(\s+(\d{1,2}:\d{2})(:\d{2})?)?',
-                r'(20\d{2})年(0?[1-9]|1[0-2])月(0?[1-9]|[12]\d|3[01])日(\s+(\d{1,2}:\d{2})(:\d{2})?)?'
-            ]
-            for pat in text_patterns:
-                m = re.search(pat, html)
-                if m:
-                    try:
-                        y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
-                        hhmm = m.group(5) or '00:00'
-                        from datetime import datetime as _dt
-                        dt = _dt.strptime(f"{y:04d}-{mo:02d}-{d:02d} {hhmm}", '%Y-%m-%d %H:%M')
-                        beijing_tz = timezone(timedelta(hours=8))
-                        dt = dt.replace(tzinfo=beijing_tz)
-                        return dt.isoformat(), dt.strftime('%Y-%m-%d %H:%M:%S')
-                    except Exception:
-                        continue
+            return iso_and_readable(fetch_publish_time(self.session, article_url, timeout=6))
         except Exception:
             return None, None
-        return None, None
     
     def remove_duplicates(self, results):
         """去除重复结果"""
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VVNews YouTube 频道ID解析
+功能: @handle / 频道URL → channel_id，结果持久化到状态存储（长期有效）；
+      缓存超过刷新间隔时先返回旧值，再在后台线程重新解析，频道页面不再在每轮运行中下载
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+
+CHANNEL_ID_PATTERN = re.compile(r'"channelId":"(UC[^"]+)"')
+
+
+def channel_page_url(handle_or_url):
+    """@handle、裸 handle 或频道URL 规范化为频道页面URL"""
+    ident = handle_or_url.strip()
+    if ident.startswith('http'):
+        return ident
+    if ident.startswith('@'):
+        return f"https://www.youtube.com/{ident}"
+    return f"https://www.youtube.com/@{ident}"
+
+
+def direct_channel_id(handle_or_url):
+    """无需请求即可得到的 channel_id（本身就是 UC… 或 /channel/UC… 链接），否则返回 None"""
+    ident = handle_or_url.strip()
+    if ident.startswith('UC') and len(ident) > 10:
+        return ident
+    if 'youtube.com/channel/' in ident:
+        m = re.search(r"/channel/([A-Za-z0-9_-]+)", ident)
+        return m.group(1) if m else ''
+    return None
+
+
+def extract_channel_id(content):
+    m = CHANNEL_ID_PATTERN.search(content)
+    return m.group(1) if m else ''
+
+
+class ChannelResolver:
+    """带持久化缓存的频道ID解析器，供各版本机器人共用"""
+
+    NAMESPACE = 'youtube_channel'
+
+    def __init__(self, session, state, ttl=None, refresh_after=None, timeout=10):
+        self.session = session
+        self.state = state
+        self.ttl = ttl or float(os.getenv('VVNEWS_CHANNEL_CACHE_DAYS', '180')) * 86400
+        self.refresh_after = refresh_after or float(os.getenv('VVNEWS_CHANNEL_REFRESH_DAYS', '7')) * 86400
+        self.timeout = timeout
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def _key(self, handle_or_url):
+        return channel_page_url(handle_or_url)
+
+    def _store(self, handle_or_url, channel_id):
+        self.state.set(self.NAMESPACE, self._key(handle_or_url), {
+            'channel_id': channel_id, 'resolved_at': time.time()}, ttl=self.ttl)
+
+    def _fetch(self, handle_or_url):
+        """下载频道页面解析 channel_id，成功后写入缓存；失败返回空串"""
+        try:
+            resp = self.session.get(channel_page_url(handle_or_url), timeout=self.timeout)
+            if resp.status_code != 200:
+                return ''
+            channel_id = extract_channel_id(resp.text)
+        except Exception as e:
+            logging.warning(f"解析频道ID失败: {handle_or_url} -> {e}")
+            return ''
+        if channel_id:
+            self._store(handle_or_url, channel_id)
+        return channel_id
+
+    def _background_refresh(self, handle_or_url):
+        key = self._key(handle_or_url)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                if self._fetch(handle_or_url):
+                    logging.info(f"已刷新YouTube频道ID缓存: {handle_or_url}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f'channel-refresh-{key}', daemon=True).start()
+
+    def cached(self, handle_or_url):
+        """返回缓存中的 channel_id（必要时触发后台刷新）；未缓存返回 None"""
+        direct = direct_channel_id(handle_or_url)
+        if direct is not None:
+            return direct
+        record = self.state.get(self.NAMESPACE, self._key(handle_or_url))
+        if not record:
+            return None
+        if time.time() - record.get('resolved_at', 0) > self.refresh_after:
+            self._background_refresh(handle_or_url)
+        return record['channel_id']
+
+    def resolve(self, handle_or_url):
+        """解析 channel_id：优先缓存，未缓存时同步下载频道页面。失败返回空串。"""
+        channel_id = self.cached(handle_or_url)
+        if channel_id is None:
+            channel_id = self._fetch(handle_or_url)
+        return channel_id
+
+    async def resolve_async(self, handle_or_url, fetcher):
+        """解析 channel_id（异步版本，未缓存时通过 AsyncFetcher 下载）"""
+        channel_id = self.cached(handle_or_url)
+        if channel_id is not None:
+            return channel_id
+        try:
+            resp = await fetcher.get(channel_page_url(handle_or_url), timeout=self.timeout)
+            if resp.status_code != 200:
+                return ''
+            channel_id = extract_channel_id(resp.text)
+        except Exception:
+            return ''
+        if channel_id:
+            self._store(handle_or_url, channel_id)
+        return channel_id